@@ -0,0 +1,308 @@
+"""
+BENCHMARK DAS PÁGINAS
+Roda o dashboard sem navegador (streamlit.testing AppTest) para cada período de
+Resultados/indice_periodos.csv e cada página do menu, e grava um relatório JSON.
+
+Por período:
+- leitura completa: primeira materialização de todas as tabelas do período por um
+  CachePeriodos novo (o mesmo caminho da primeira visita no dashboard)
+- leitura do cache: a mesma materialização de novo, com o período já no cache
+- filtro de shoppings (filtrar_shoppings + leitura de todas as tabelas filtradas)
+Por página: tempo de parede do rerun, total/pagina/plotly da instrumentação e a
+construção das figuras Plotly (px.*, make_subplots, go.Figure e update_*/add_*),
+cronometrada como etapa 'figuras'.
+
+Com --dados, roda sobre outra pasta que contenha Resultados/ (ex.: a árvore gerada
+por dados_sinteticos.py); o relatório e a base continuam relativos ao repositório.
+
+Com --baseline, cada métrica é comparada ao relatório salvo: é regressão quando
+fica mais de --tolerancia acima da base e mais de --limiar-ms em valor absoluto.
+
+    python benchmark_paginas.py [--periodos "Ano 2024,Jan/2025"] [--paginas RFV,Evolução]
+                                [--repeticoes 3] [--baseline benchmark_baseline.json]
+                                [--salvar-baseline] [--falhar-se-regredir] [--dados Sintetico]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import functools
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import desempenho
+from dados_periodo import carregar_periodo, filtrar_shoppings, CachePeriodos, OTIMIZAR_TIPOS
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(DIRETORIO, 'dashboard_perfil_cliente.py')
+ETAPA_FIGURAS = 'figuras'
+ROTULO_PERIODO = 'Selecione período(s):'
+TIMEOUT_RERUN = 300
+
+# Métodos de go.Figure cronometrados como construção de figura
+METODOS_FIGURA = ['__init__', 'add_trace', 'update_layout', 'update_traces', 'update_xaxes',
+                  'update_yaxes', 'add_annotation', 'add_shape', 'add_hline', 'add_vline']
+
+_profundidade = threading.local()
+
+
+# =============================================================================
+# INSTRUMENTAÇÃO DAS FIGURAS
+# =============================================================================
+
+def _cronometrar_figura(funcao):
+    """Soma o tempo da chamada na etapa 'figuras' (chamadas aninhadas contam uma vez)"""
+    @functools.wraps(funcao)
+    def envolvida(*args, **kwargs):
+        if getattr(_profundidade, 'nivel', 0):
+            return funcao(*args, **kwargs)
+        _profundidade.nivel = 1
+        try:
+            with desempenho.medir(ETAPA_FIGURAS, acumular=True):
+                return funcao(*args, **kwargs)
+        finally:
+            _profundidade.nivel = 0
+    return envolvida
+
+
+def instrumentar_figuras():
+    """Envolve os construtores do Plotly usados pelo dashboard (só neste processo)"""
+    import plotly.express as px
+    import plotly.subplots
+    import plotly.graph_objects as go
+
+    for nome in px.__all__:
+        funcao = getattr(px, nome)
+        if callable(funcao) and not isinstance(funcao, type) and not nome.startswith('_'):
+            setattr(px, nome, _cronometrar_figura(funcao))
+    plotly.subplots.make_subplots = _cronometrar_figura(plotly.subplots.make_subplots)
+    for nome in METODOS_FIGURA:
+        setattr(go.Figure, nome, _cronometrar_figura(getattr(go.Figure, nome)))
+
+
+# =============================================================================
+# MEDIÇÕES
+# =============================================================================
+
+def _ms(inicio):
+    return (time.perf_counter() - inicio) * 1000
+
+
+def medir_leitura(pasta, shoppings):
+    """Leitura completa do período pelo cache de períodos (fria e quente) e filtro de shoppings
+
+    O cache é novo a cada período, aberto como no dashboard (cache_periodos), então
+    a primeira leitura vem do disco e a segunda só das tabelas já guardadas.
+    """
+    cache = CachePeriodos(lambda p: carregar_periodo(f'Resultados/{p}', otimizar=OTIMIZAR_TIPOS))
+    t0 = time.perf_counter()
+    dados = cache.obter(pasta).carregar()
+    leitura = _ms(t0)
+    t0 = time.perf_counter()
+    cache.obter(pasta).carregar()
+    leitura_cache = _ms(t0)
+    t0 = time.perf_counter()
+    filtrar_shoppings(dados, shoppings).carregar()
+    return {'leitura_completa_ms': leitura, 'leitura_cache_ms': leitura_cache, 'filtro_shoppings_ms': _ms(t0)}
+
+
+class Motor:
+    """AppTest do dashboard com as durações de cada rerun capturadas"""
+
+    def __init__(self):
+        from streamlit.testing.v1 import AppTest
+        self.reruns = []
+        desempenho.OBSERVADORES.append(lambda pagina, duracoes: self.reruns.append(duracoes))
+        self.app = AppTest.from_file(SCRIPT, default_timeout=TIMEOUT_RERUN)
+        self.app.secrets['benchmark'] = {'ativo': True}  # Administração exige secrets
+        self.rodar(self.app.run)
+
+    def rodar(self, acao):
+        """Executa um rerun; retorna (ms de parede, etapas ou None, erro ou None)"""
+        antes = len(self.reruns)
+        t0 = time.perf_counter()
+        acao()
+        parede = _ms(t0)
+        etapas = self.reruns[-1] if len(self.reruns) > antes else None
+        erro = '; '.join(e.message for e in self.app.exception)[:500] if self.app.exception else None
+        return parede, etapas, erro
+
+    def paginas(self):
+        return list(self.app.sidebar.radio[0].options)
+
+    def ir_para(self, pagina):
+        return self.rodar(lambda: self.app.sidebar.radio[0].set_value(pagina).run())
+
+    def selecionar_periodo(self, nome):
+        seletor = next(m for m in self.app.sidebar.multiselect if m.label == ROTULO_PERIODO)
+        return self.rodar(lambda: seletor.set_value([nome]).run())
+
+    def repetir(self):
+        return self.rodar(self.app.run)
+
+
+def medir_periodo(motor, nome, pasta, paginas, repeticoes, shoppings):
+    resultado = {'pasta': pasta, **medir_leitura(pasta, shoppings)}
+
+    motor.ir_para(paginas[0])
+    motor.selecionar_periodo(nome)
+
+    resultado['paginas'] = {}
+    for pagina in paginas:
+        medicoes = [motor.ir_para(pagina)] + [motor.repetir() for _ in range(repeticoes - 1)]
+        erros = [erro for _, _, erro in medicoes if erro]
+        completas = [etapas for _, etapas, _ in medicoes if etapas is not None]
+        linha = {'parede_ms': float(np.median([parede for parede, _, _ in medicoes])), 'excecao': erros[0] if erros else None}
+        for etapa in [desempenho.ETAPA_TOTAL, 'pagina', ETAPA_FIGURAS, 'plotly']:
+            linha[f'{etapa}_ms'] = float(np.median([e.get(etapa, 0.0) for e in completas])) if completas else None
+        resultado['paginas'][pagina] = linha
+    return resultado
+
+
+# =============================================================================
+# RELATÓRIO E COMPARAÇÃO
+# =============================================================================
+
+def metricas_planas(relatorio):
+    """{'periodo|pagina|metrica': ms} com todas as métricas numéricas do relatório"""
+    planas = {}
+    for periodo, dados in relatorio['periodos'].items():
+        for chave, valor in dados.items():
+            if chave.endswith('_ms') and valor is not None:
+                planas[f'{periodo}||{chave}'] = valor
+        for pagina, linha in dados['paginas'].items():
+            for chave, valor in linha.items():
+                if chave.endswith('_ms') and valor is not None:
+                    planas[f'{periodo}|{pagina}|{chave}'] = valor
+    return planas
+
+
+def comparar(relatorio, base, tolerancia, limiar_ms):
+    """Regressões e melhorias de cada métrica em relação ao relatório base"""
+    atuais, anteriores = metricas_planas(relatorio), metricas_planas(base)
+    regressoes, melhorias = [], []
+    for chave, valor in atuais.items():
+        anterior = anteriores.get(chave)
+        if anterior is None:
+            continue
+        item = {'metrica': chave, 'base_ms': anterior, 'atual_ms': valor,
+                'variacao': (valor - anterior) / anterior if anterior else None}
+        if valor > anterior * (1 + tolerancia) and valor - anterior > limiar_ms:
+            regressoes.append(item)
+        elif valor < anterior * (1 - tolerancia) and anterior - valor > limiar_ms:
+            melhorias.append(item)
+    ordem = lambda item: -abs(item['atual_ms'] - item['base_ms'])
+    return {
+        'tolerancia': tolerancia,
+        'limiar_ms': limiar_ms,
+        'metricas_comparadas': len(atuais.keys() & anteriores.keys()),
+        'sem_base': len(atuais.keys() - anteriores.keys()),
+        'regressoes': sorted(regressoes, key=ordem),
+        'melhorias': sorted(melhorias, key=ordem),
+    }
+
+
+def _versoes():
+    import streamlit
+    import plotly
+    import pyarrow
+    return {'python': platform.python_version(), 'streamlit': streamlit.__version__,
+            'pandas': pd.__version__, 'pyarrow': pyarrow.__version__, 'plotly': plotly.__version__}
+
+
+def _escolher(opcoes, filtro):
+    """Opções que contêm algum dos termos separados por vírgula (todas sem filtro)"""
+    if not filtro:
+        return list(opcoes)
+    termos = [t.strip() for t in filtro.split(',') if t.strip()]
+    return [o for o in opcoes if any(t in o for t in termos)]
+
+
+def benchmark(periodos=None, paginas=None, repeticoes=1, shoppings=('BS', 'CS')):
+    instrumentar_figuras()
+    indice = pd.read_csv('Resultados/indice_periodos.csv')
+    indice = indice[indice['pasta'].map(lambda p: os.path.exists(f'Resultados/{p}'))]
+    nomes = dict(zip(indice['nome'], indice['pasta']))
+
+    t0 = time.perf_counter()
+    motor = Motor()
+    inicializacao = _ms(t0)
+    lista_paginas = _escolher(motor.paginas(), paginas)
+
+    relatorio = {
+        'gerado_em': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'ambiente': _versoes(),
+        'parametros': {'repeticoes': repeticoes, 'shoppings': list(shoppings), 'dados': os.getcwd()},
+        'inicializacao_ms': inicializacao,
+        'periodos': {},
+    }
+    for nome in _escolher(nomes, periodos):
+        t0 = time.perf_counter()
+        relatorio['periodos'][nome] = medir_periodo(motor, nome, nomes[nome], lista_paginas, repeticoes, list(shoppings))
+        print(f'{nome}: {time.perf_counter() - t0:.1f}s', file=sys.stderr)
+    return relatorio
+
+
+def imprimir(relatorio):
+    linhas = []
+    for periodo, dados in relatorio['periodos'].items():
+        for pagina, linha in dados['paginas'].items():
+            linhas.append({'periodo': periodo, 'pagina': pagina, **{k: v for k, v in linha.items() if k != 'excecao'},
+                           'erro': 'sim' if linha['excecao'] else ''})
+    df = pd.DataFrame(linhas)
+    pd.set_option('display.width', 200)
+    print(df.to_string(index=False, float_format=lambda x: f'{x:.1f}'))
+    carga = pd.DataFrame([
+        {'periodo': p, **{k: v for k, v in d.items() if k.endswith('_ms')}} for p, d in relatorio['periodos'].items()
+    ])
+    print()
+    print(carga.to_string(index=False, float_format=lambda x: f'{x:.1f}'))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark de carga, filtro e renderização das páginas do dashboard')
+    parser.add_argument('--periodos', help='Termos separados por vírgula (nome do período); padrão: todos')
+    parser.add_argument('--paginas', help='Termos separados por vírgula (nome da página); padrão: todas')
+    parser.add_argument('--repeticoes', type=int, default=1, help='Reruns por página (mediana)')
+    parser.add_argument('--shoppings', default='BS,CS', help='Shoppings usados no teste do filtro')
+    parser.add_argument('--saida', default='benchmark_paginas.json', help='Arquivo JSON do relatório')
+    parser.add_argument('--baseline', default='benchmark_baseline.json', help='Relatório base para comparação')
+    parser.add_argument('--salvar-baseline', action='store_true', help='Grava este relatório como nova base')
+    parser.add_argument('--tolerancia', type=float, default=0.25, help='Aumento relativo aceito (0.25 = 25%%)')
+    parser.add_argument('--limiar-ms', type=float, default=20.0, help='Diferença absoluta mínima para contar')
+    parser.add_argument('--falhar-se-regredir', action='store_true', help='Código de saída 1 se houver regressões')
+    parser.add_argument('--dados', help='Pasta com Resultados/ a usar no lugar da do repositório')
+    args = parser.parse_args()
+
+    dados = os.path.abspath(args.dados) if args.dados else DIRETORIO
+    os.chdir(DIRETORIO)
+    args.saida, args.baseline = os.path.abspath(args.saida), os.path.abspath(args.baseline)
+    os.chdir(dados)
+    relatorio = benchmark(args.periodos, args.paginas, max(args.repeticoes, 1), args.shoppings.split(','))
+
+    if os.path.exists(args.baseline) and not args.salvar_baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            relatorio['comparacao'] = {'baseline': args.baseline, **comparar(relatorio, json.load(f), args.tolerancia, args.limiar_ms)}
+
+    with open(args.saida, 'w', encoding='utf-8') as f:
+        json.dump(relatorio, f, ensure_ascii=False, indent=2)
+    if args.salvar_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+
+    imprimir(relatorio)
+    print(f'\nRelatório: {args.saida}' + (f' (base salva em {args.baseline})' if args.salvar_baseline else ''))
+    comparacao = relatorio.get('comparacao')
+    if comparacao:
+        print(f"Comparado com {comparacao['baseline']}: {comparacao['metricas_comparadas']} métricas, "
+              f"{len(comparacao['regressoes'])} regressões, {len(comparacao['melhorias'])} melhorias")
+        for item in comparacao['regressoes'][:20]:
+            print(f"  REGRESSÃO {item['metrica']}: {item['base_ms']:.1f} -> {item['atual_ms']:.1f} ms")
+        if args.falhar_se_regredir and comparacao['regressoes']:
+            sys.exit(1)
@@ -0,0 +1,97 @@
+"""
+CACHE DE FIGURAS
+Figuras Plotly memorizadas pelo processo, compartilhadas entre sessões.
+
+Cada gráfico é guardado já serializado (JSON do Plotly) sob a chave
+(período(s), página, gráfico, filtros, escopo de shoppings do usuário); uma
+nova visita ao mesmo gráfico só desserializa o JSON, sem o trabalho do pandas
+nem a montagem da figura. Os JSONs ficam num LRU com orçamento de bytes
+(ORCAMENTO_FIGURAS_MB).
+
+Uso:
+    cache = CacheFiguras()
+    chave = chave_figura(pastas, pagina, 'genero_por_shopping', filtros, shoppings_permitidos)
+    fig = cache.obter(chave, construir)   # construir() -> go.Figure, só chamado na falta
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+ORCAMENTO_FIGURAS_MB = int(os.environ.get('ORCAMENTO_FIGURAS_MB', 64))
+
+
+def chave_figura(pastas, pagina, grafico, filtros=(), shoppings_permitidos=None):
+    """Chave de um gráfico: pasta(s) do período, página, nome do gráfico, filtros e escopo de shoppings"""
+    escopo = tuple(sorted(shoppings_permitidos)) if shoppings_permitidos is not None else None
+    return (pastas, pagina, grafico, tuple(filtros), escopo)
+
+
+class CacheFiguras:
+    """LRU de figuras serializadas com orçamento de bytes, seguro entre threads/sessões"""
+
+    def __init__(self, orcamento_bytes=ORCAMENTO_FIGURAS_MB * 1024 ** 2):
+        self.orcamento_bytes = orcamento_bytes
+        self._figuras = OrderedDict()  # chave -> JSON (mais recente no fim)
+        self._bytes = 0
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.faltas = 0
+        self.remocoes = 0
+
+    def obter(self, chave, construir):
+        """Figura guardada para a chave; na falta, construir() e guarda o JSON
+
+        A montagem fica fora da trava: duas sessões pedindo o mesmo gráfico ao
+        mesmo tempo constroem cada uma a sua, e o último JSON fica.
+        """
+        with self._trava:
+            json_figura = self._figuras.get(chave)
+            if json_figura is not None:
+                self.acertos += 1
+                self._figuras.move_to_end(chave)
+            else:
+                self.faltas += 1
+        if json_figura is not None:
+            return pio.from_json(json_figura)
+
+        figura = construir()
+        json_figura = figura.to_json()
+        with self._trava:
+            anterior = self._figuras.pop(chave, None)
+            if anterior is not None:
+                self._bytes -= len(anterior)
+            self._figuras[chave] = json_figura
+            self._bytes += len(json_figura)
+            self._respeitar_orcamento()
+        return figura
+
+    def _respeitar_orcamento(self):
+        """Remove as figuras menos usadas até caber no orçamento (a mais recente fica)"""
+        while self._bytes > self.orcamento_bytes and len(self._figuras) > 1:
+            _, json_figura = self._figuras.popitem(last=False)
+            self._bytes -= len(json_figura)
+            self.remocoes += 1
+
+    def limpar(self):
+        with self._trava:
+            self._figuras.clear()
+            self._bytes = 0
+
+    def estatisticas(self):
+        """Contadores e ocupação atual do cache, com o total de figuras por página"""
+        with self._trava:
+            por_pagina = {}
+            for chave in self._figuras:
+                por_pagina[chave[1]] = por_pagina.get(chave[1], 0) + 1
+            return {
+                'acertos': self.acertos,
+                'faltas': self.faltas,
+                'remocoes': self.remocoes,
+                'figuras': len(self._figuras),
+                'bytes': self._bytes,
+                'orcamento_bytes': self.orcamento_bytes,
+                'por_pagina': por_pagina,
+            }
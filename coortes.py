@@ -0,0 +1,268 @@
+"""
+COORTES DE RETENÇÃO
+Mapa de atividade cliente x mês em bits (np.packbits) montado a partir dos
+arquivos de clientes mensais (Por_Mes/AAAA_MM/RFV/rfv_quintis_global.csv).
+
+Cada cliente pertence à coorte do primeiro mês em que aparece; shopping e perfil
+(perfil_quintis) da coorte são os daquele mês. Com o mapa, a retenção de uma
+coorte no mês relativo k é a fração dos clientes ativos k meses depois.
+
+O mapa é gravado em Resultados/coortes_clientes.npz com um manifesto (assinatura
+do arquivo de clientes de cada mês). Meses novos são acrescentados sem reler os
+anteriores; se um mês já gravado mudar ou sumir, o mapa é reconstruído.
+
+Meses sem arquivo de clientes (ex.: 2024_12) ficam sem dados: a retenção nesses
+meses relativos é NaN. A primeira coorte contém toda a base ativa no primeiro mês
+disponível (não só clientes novos) e fica fora das curvas médias.
+
+Uso offline:
+    python coortes.py [--forcar] [--raiz Resultados]
+"""
+
+import os
+import json
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from dados_periodo import carregar_periodo
+from cubo_mensal import meses_disponiveis
+
+ARQUIVO_COORTES = 'coortes_clientes.npz'
+ARQUIVO_CLIENTES = 'RFV/rfv_quintis_global.csv'
+PERFIS = ['VIP', 'Premium', 'Potencial', 'Pontual']
+# Dimensão de agrupamento -> lista de rótulos dos códigos
+DIMENSOES_COORTE = {'shopping': 'shoppings', 'perfil': 'perfis'}
+SEM_COORTE = -1  # Cliente sem nenhum mês ativo (não ocorre após a construção)
+
+
+def assinatura_clientes(raiz, mes):
+    """Assinatura do arquivo de clientes de um mês (None se o mês não tem clientes)"""
+    caminho = f'{raiz}/Por_Mes/{mes}/{ARQUIVO_CLIENTES}'
+    if not os.path.exists(caminho):
+        return None
+    estado = os.stat(caminho)
+    return [estado.st_mtime_ns, estado.st_size]
+
+
+def _ler_clientes(raiz, mes):
+    """cliente_id, shopping_principal e perfil_quintis de um mês"""
+    df = carregar_periodo(f'{raiz}/Por_Mes/{mes}')['rfv_quintis']['clientes_global']
+    return (
+        df['cliente_id'].to_numpy(dtype=np.int64),
+        df['shopping_principal'].astype(str).to_numpy(),
+        df['perfil_quintis'].astype(str).to_numpy(),
+    )
+
+
+def _codigos(valores, categorias):
+    """Códigos inteiros de `valores` em `categorias` (acrescenta categorias novas)"""
+    for v in pd.unique(valores):
+        if v not in categorias:
+            categorias.append(v)
+    return pd.Categorical(valores, categories=categorias).codes.astype(np.int16)
+
+
+def primeiro_mes(bits, qtd_meses):
+    """Índice do primeiro mês ativo de cada cliente a partir do mapa compactado"""
+    if qtd_meses == 0:
+        return np.full(len(bits), SEM_COORTE, dtype=np.int16)
+    ativo = np.unpackbits(bits, axis=1, count=qtd_meses).astype(bool)
+    primeiro = ativo.argmax(axis=1).astype(np.int16)
+    primeiro[~ativo.any(axis=1)] = SEM_COORTE
+    return primeiro
+
+
+def ler_coortes(caminho):
+    """Lê o mapa gravado (dict de arrays + manifesto)"""
+    with np.load(caminho, allow_pickle=False) as arquivo:
+        coortes = {chave: arquivo[chave] for chave in arquivo.files}
+    coortes['manifesto'] = json.loads(str(coortes['manifesto']))
+    coortes['meses'] = [str(m) for m in coortes['meses']]
+    coortes['shoppings'] = [str(s) for s in coortes['shoppings']]
+    coortes['perfis'] = [str(p) for p in coortes['perfis']]
+    return coortes
+
+
+def salvar_coortes(coortes, caminho):
+    """Grava o mapa num .npz compactado (escrita atômica)"""
+    arrays = dict(coortes)
+    arrays['manifesto'] = np.array(json.dumps(coortes['manifesto']))
+    arrays['meses'] = np.array(coortes['meses'], dtype=str)
+    arrays['shoppings'] = np.array(coortes['shoppings'], dtype=str)
+    arrays['perfis'] = np.array(coortes['perfis'], dtype=str)
+    temporario = caminho + '.tmp'
+    with open(temporario, 'wb') as f:
+        np.savez_compressed(f, **arrays)
+    os.replace(temporario, caminho)
+
+
+def _vazio(meses):
+    return {
+        'ids': np.empty(0, dtype=np.int64),
+        'bits': np.zeros((0, (len(meses) + 7) // 8), dtype=np.uint8),
+        'meses': list(meses),
+        'com_dados': np.zeros(len(meses), dtype=bool),
+        'shopping': np.empty(0, dtype=np.int16),
+        'perfil': np.empty(0, dtype=np.int16),
+        'shoppings': [],
+        'perfis': list(PERFIS),
+        'manifesto': {},
+    }
+
+
+def construir_coortes(raiz='Resultados', forcar=False, salvar=True):
+    """Constrói (ou atualiza) o mapa de atividade cliente x mês
+
+    Retorna (coortes, meses_lidos). coortes é um dict com:
+    ids (cliente_id ordenado), bits (clientes x bytes, 1 bit por mês), meses,
+    com_dados (mês tem arquivo de clientes), shopping / perfil (códigos da coorte)
+    e as listas de rótulos shoppings / perfis.
+    """
+    caminho = f'{raiz}/{ARQUIVO_COORTES}'
+    meses = meses_disponiveis(raiz)
+    manifesto = {mes: assinatura_clientes(raiz, mes) for mes in meses}
+
+    anterior = None
+    if not forcar and os.path.exists(caminho):
+        try:
+            anterior = ler_coortes(caminho)
+        except Exception:
+            anterior = None  # Arquivo corrompido: reconstruir
+    # Incremental só se os meses já gravados continuam iguais
+    if anterior is not None and any(manifesto.get(m) != a for m, a in anterior['manifesto'].items()):
+        anterior = None
+
+    if anterior is not None and anterior['meses'] == meses:
+        return anterior, []
+
+    base = anterior if anterior is not None else _vazio([])
+    meses_lidos = [m for m in meses if m not in base['manifesto'] and manifesto[m] is not None]
+
+    # Reposiciona as colunas já gravadas na nova lista de meses
+    ativo_base = np.unpackbits(base['bits'], axis=1, count=len(base['meses'])).astype(bool)
+    novos = [_ler_clientes(raiz, mes) for mes in meses_lidos]
+    ids = base['ids']
+    for ids_mes, _, _ in novos:
+        ids = np.union1d(ids, ids_mes)
+
+    ativo = np.zeros((len(ids), len(meses)), dtype=bool)
+    linhas_base = np.searchsorted(ids, base['ids'])
+    for j, mes in enumerate(base['meses']):
+        ativo[linhas_base, meses.index(mes)] = ativo_base[:, j]
+
+    shoppings, perfis = list(base['shoppings']), list(base['perfis'])
+    shopping = np.full(len(ids), -1, dtype=np.int16)
+    perfil = np.full(len(ids), -1, dtype=np.int16)
+    shopping[linhas_base] = base['shopping']
+    perfil[linhas_base] = base['perfil']
+    primeiro = np.full(len(ids), len(meses), dtype=np.int64)
+    primeiro[linhas_base] = [meses.index(base['meses'][p]) if p >= 0 else len(meses)
+                             for p in primeiro_mes(base['bits'], len(base['meses']))]
+
+    # Atributos da coorte vêm do mês mais antigo em que o cliente aparece
+    for mes, (ids_mes, shopping_mes, perfil_mes) in zip(meses_lidos, novos):
+        j = meses.index(mes)
+        linhas = np.searchsorted(ids, ids_mes)
+        ativo[linhas, j] = True
+        mais_antigo = j < primeiro[linhas]
+        alvo = linhas[mais_antigo]
+        shopping[alvo] = _codigos(shopping_mes, shoppings)[mais_antigo]
+        perfil[alvo] = _codigos(perfil_mes, perfis)[mais_antigo]
+        primeiro[alvo] = j
+
+    coortes = {
+        'ids': ids,
+        'bits': np.packbits(ativo, axis=1),
+        'meses': meses,
+        'com_dados': np.array([manifesto[m] is not None for m in meses], dtype=bool),
+        'shopping': shopping,
+        'perfil': perfil,
+        'shoppings': shoppings,
+        'perfis': perfis,
+        'manifesto': manifesto,
+    }
+    if salvar:
+        try:
+            salvar_coortes(coortes, caminho)
+        except OSError:
+            pass  # Sistema de arquivos somente leitura: o mapa fica só em memória
+    return coortes, meses_lidos
+
+
+def ativos_no_mes(coortes, j):
+    """Vetor booleano dos clientes ativos no mês de índice j (lido direto dos bits)"""
+    return ((coortes['bits'][:, j // 8] >> (7 - j % 8)) & 1).astype(bool)
+
+
+def retencao(coortes, por=None, shoppings=None):
+    """Tabela longa de retenção: grupo, coorte, mes_relativo, clientes, ativos, retencao
+
+    por: None (todos), 'shopping' ou 'perfil' (atributos do mês da coorte).
+    shoppings: nomes de shopping_principal a considerar (None para todos).
+    """
+    meses = coortes['meses']
+    qtd_meses = len(meses)
+    primeiro = primeiro_mes(coortes['bits'], qtd_meses).astype(np.int64)
+
+    validos = primeiro >= 0
+    if shoppings is not None:
+        codigos = [i for i, s in enumerate(coortes['shoppings']) if s in set(shoppings)]
+        validos &= np.isin(coortes['shopping'], codigos)
+
+    if por is None:
+        grupo, rotulos = np.zeros(len(primeiro), dtype=np.int64), ['Todos']
+    else:
+        grupo, rotulos = coortes[por].astype(np.int64), coortes[DIMENSOES_COORTE[por]]
+    grupo = np.where(validos, grupo, 0)
+    qtd_grupos = len(rotulos)
+
+    # Contagens por (coorte, grupo): uma passada de bincount por mês
+    chave = primeiro * qtd_grupos + grupo
+    tamanho = np.bincount(chave[validos], minlength=qtd_meses * qtd_grupos)
+    ativos = np.zeros((qtd_meses, qtd_meses * qtd_grupos), dtype=np.int64)
+    for j in range(qtd_meses):
+        ativos[j] = np.bincount(chave[validos & ativos_no_mes(coortes, j)], minlength=qtd_meses * qtd_grupos)
+
+    c, g, j = np.meshgrid(np.arange(qtd_meses), np.arange(qtd_grupos), np.arange(qtd_meses), indexing='ij')
+    c, g, j = c.ravel(), g.ravel(), j.ravel()
+    df = pd.DataFrame({
+        'grupo': np.array(rotulos, dtype=object)[g],
+        'coorte': np.array(meses, dtype=object)[c],
+        'mes_relativo': j - c,
+        'clientes': tamanho[c * qtd_grupos + g],
+        'ativos': ativos[j, c * qtd_grupos + g],
+    })
+    df = df[(df['mes_relativo'] >= 0) & (df['clientes'] > 0)].reset_index(drop=True)
+    df['retencao'] = df['ativos'] / df['clientes']
+    sem_dados = ~coortes['com_dados'][np.array([meses.index(m) for m in df['coorte']]) + df['mes_relativo'].to_numpy()]
+    df.loc[sem_dados, ['ativos', 'retencao']] = np.nan
+    return df
+
+
+def curva_retencao(tabela, incluir_primeira=False):
+    """Retenção média por mês relativo (ponderada pelo tamanho das coortes)
+
+    Retorna DataFrame (índice: mes_relativo, colunas: grupo). A primeira coorte
+    (base já existente) fica de fora, salvo incluir_primeira=True.
+    """
+    if not incluir_primeira:
+        tabela = tabela[tabela['coorte'] != tabela['coorte'].min()]
+    tabela = tabela.dropna(subset=['retencao'])
+    somas = tabela.groupby(['mes_relativo', 'grupo'])[['ativos', 'clientes']].sum()
+    return (somas['ativos'] / somas['clientes']).unstack('grupo')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Constrói o mapa de coortes a partir de Resultados/Por_Mes')
+    parser.add_argument('--raiz', default='Resultados', help='Pasta raiz dos resultados')
+    parser.add_argument('--forcar', action='store_true', help='Reconstrói todos os meses')
+    args = parser.parse_args()
+
+    coortes, meses_lidos = construir_coortes(args.raiz, args.forcar)
+    sem_clientes = [m for m, ok in zip(coortes['meses'], coortes['com_dados']) if not ok]
+    print(f'{len(coortes["ids"]):,} clientes x {len(coortes["meses"])} meses | '
+          f'{coortes["bits"].nbytes / 1024:,.0f} KB em bits | lidos agora: {", ".join(meses_lidos) or "nenhum"}')
+    if sem_clientes:
+        print(f'Meses sem arquivo de clientes: {", ".join(sem_clientes)}')
@@ -0,0 +1,225 @@
+"""
+CUBO MENSAL
+Série temporal de todos os meses de Resultados/Por_Mes num único DataFrame longo:
+uma linha por (mes, sigla, genero, faixa_etaria, metrica).
+
+Fontes de cada mês: resumo_por_shopping, consolidado_genero_por_shopping e
+consolidado_faixa_etaria_por_shopping. Linhas do resumo usam genero='Todos' e
+faixa_etaria='Todas'; linhas de gênero usam faixa_etaria='Todas' e vice-versa.
+
+O cubo é gravado em Resultados/cubo_mensal.parquet junto com um manifesto
+(assinatura dos CSVs de cada mês). A reconstrução é incremental: só os meses
+novos ou alterados são lidos novamente.
+
+Uso offline:
+    python cubo_mensal.py [--forcar] [--raiz Resultados]
+"""
+
+import os
+import re
+import json
+import argparse
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dados_periodo import ler_csv
+
+ARQUIVO_CUBO = 'cubo_mensal.parquet'
+CHAVE_MANIFESTO = b'cubo_mensal'
+PADRAO_MES = re.compile(r'^\d{4}_\d{2}$')
+
+FONTES_CUBO = {
+    'resumo': 'resumo_por_shopping.csv',
+    'genero': 'consolidado_genero_por_shopping.csv',
+    'faixa': 'consolidado_faixa_etaria_por_shopping.csv',
+}
+
+TODOS_GENEROS = 'Todos'
+TODAS_FAIXAS = 'Todas'
+
+# Coluna do CSV -> nome da métrica no cubo
+METRICAS_RESUMO = {
+    'transacoes': 'transacoes',
+    'clientes': 'clientes',
+    'valor_total': 'valor_total',
+    'ticket_medio': 'ticket_medio',
+    'idade_media': 'idade_media',
+    'threshold_hs': 'threshold_hs',
+    'qtd_high_spenders': 'qtd_high_spenders',
+}
+METRICAS_DEMOGRAFICAS = {
+    'qtd_clientes': 'clientes',
+    'valor_total': 'valor_total',
+    'pct_clientes': 'pct_clientes',
+}
+
+# Métricas que podem ser somadas entre shoppings (clientes: soma com duplicação)
+METRICAS_SOMAVEIS = ['transacoes', 'clientes', 'valor_total', 'qtd_high_spenders']
+
+COLUNAS_CUBO = ['mes', 'sigla', 'genero', 'faixa_etaria', 'metrica', 'valor']
+DIMENSOES_CUBO = ['sigla', 'genero', 'faixa_etaria']
+
+
+def meses_disponiveis(raiz='Resultados'):
+    """Lista as pastas de mês (AAAA_MM) de Por_Mes em ordem cronológica"""
+    pasta = f'{raiz}/Por_Mes'
+    if not os.path.exists(pasta):
+        return []
+    return sorted(m for m in os.listdir(pasta) if PADRAO_MES.match(m) and os.path.isdir(f'{pasta}/{m}'))
+
+
+def assinatura_mes(raiz, mes, arquivos=None):
+    """Assinatura dos CSVs de origem de um mês (muda quando algum é regravado)
+
+    arquivos: caminhos relativos à pasta do mês (padrão: as fontes do cubo)
+    """
+    assinatura = []
+    for arquivo in (FONTES_CUBO.values() if arquivos is None else arquivos):
+        caminho = f'{raiz}/Por_Mes/{mes}/{arquivo}'
+        if os.path.exists(caminho):
+            estado = os.stat(caminho)
+            assinatura.append([arquivo, estado.st_mtime_ns, estado.st_size])
+    return assinatura
+
+
+def _formato_longo(df, metricas, genero=None, faixa=None):
+    """Converte uma tabela larga (por sigla) para linhas do cubo"""
+    ids = ['sigla'] + [c for c in ('genero', 'faixa_etaria') if c in df.columns]
+    longo = df[ids + list(metricas)].rename(columns=metricas).melt(
+        id_vars=ids, var_name='metrica', value_name='valor'
+    )
+    if genero is not None:
+        longo['genero'] = genero
+    if faixa is not None:
+        longo['faixa_etaria'] = faixa
+    return longo
+
+
+def linhas_mes(raiz, mes):
+    """Linhas do cubo para um mês"""
+    base_path = f'{raiz}/Por_Mes/{mes}'
+    partes = []
+
+    caminho = f'{base_path}/{FONTES_CUBO["resumo"]}'
+    if os.path.exists(caminho):
+        partes.append(_formato_longo(ler_csv(caminho), METRICAS_RESUMO, TODOS_GENEROS, TODAS_FAIXAS))
+    caminho = f'{base_path}/{FONTES_CUBO["genero"]}'
+    if os.path.exists(caminho):
+        partes.append(_formato_longo(ler_csv(caminho), METRICAS_DEMOGRAFICAS, faixa=TODAS_FAIXAS))
+    caminho = f'{base_path}/{FONTES_CUBO["faixa"]}'
+    if os.path.exists(caminho):
+        partes.append(_formato_longo(ler_csv(caminho), METRICAS_DEMOGRAFICAS, genero=TODOS_GENEROS))
+
+    if not partes:
+        return pd.DataFrame(columns=COLUNAS_CUBO)
+    linhas = pd.concat(partes, ignore_index=True)
+    linhas['mes'] = mes
+    return linhas[COLUNAS_CUBO]
+
+
+def ler_cubo(caminho):
+    """Lê o cubo gravado e seu manifesto (mes -> assinatura)"""
+    tabela = pq.read_table(caminho)
+    metadados = tabela.schema.metadata or {}
+    manifesto = json.loads(metadados.get(CHAVE_MANIFESTO, b'{}').decode('utf-8'))
+    return tabela.to_pandas(), manifesto
+
+
+def salvar_cubo(cubo, manifesto, caminho):
+    """Grava o cubo e o manifesto num único parquet (escrita atômica)"""
+    tabela = pa.Table.from_pandas(cubo, preserve_index=False)
+    metadados = dict(tabela.schema.metadata or {})
+    metadados[CHAVE_MANIFESTO] = json.dumps(manifesto).encode('utf-8')
+    temporario = caminho + '.tmp'
+    pq.write_table(tabela.replace_schema_metadata(metadados), temporario)
+    os.replace(temporario, caminho)
+
+
+def _organizar(cubo):
+    """Ordena o cubo e guarda as dimensões como categóricas (consultas rápidas)"""
+    cubo = cubo.sort_values(['metrica', 'mes', 'sigla', 'genero', 'faixa_etaria'], ignore_index=True)
+    for col in ['mes', 'metrica'] + DIMENSOES_CUBO:
+        cubo[col] = cubo[col].astype(str).astype('category')
+    cubo['valor'] = cubo['valor'].astype('float64')
+    return cubo
+
+
+def construir_cubo(raiz='Resultados', forcar=False, salvar=True):
+    """Constrói (ou atualiza) o cubo mensal
+
+    Meses cuja assinatura não mudou são reaproveitados do cubo gravado; meses
+    novos ou alterados são lidos dos CSVs e meses removidos saem do cubo.
+    Retorna (cubo, meses_lidos).
+    """
+    caminho = f'{raiz}/{ARQUIVO_CUBO}'
+    cubo_anterior, manifesto_anterior = None, {}
+    if not forcar and os.path.exists(caminho):
+        try:
+            cubo_anterior, manifesto_anterior = ler_cubo(caminho)
+        except Exception:
+            cubo_anterior, manifesto_anterior = None, {}  # Arquivo corrompido: reconstruir
+
+    manifesto = {mes: assinatura_mes(raiz, mes) for mes in meses_disponiveis(raiz)}
+    reaproveitados = [m for m in manifesto if cubo_anterior is not None and manifesto_anterior.get(m) == manifesto[m]]
+    meses_lidos = [m for m in manifesto if m not in reaproveitados]
+
+    if not meses_lidos and set(manifesto_anterior) == set(manifesto) and cubo_anterior is not None:
+        return _organizar(cubo_anterior), []
+
+    partes = [linhas_mes(raiz, mes) for mes in meses_lidos]
+    if reaproveitados:
+        partes.append(cubo_anterior[cubo_anterior['mes'].astype(str).isin(reaproveitados)].astype({'mes': str}))
+    partes = [p.astype({c: str for c in ['mes', 'metrica'] + DIMENSOES_CUBO}) for p in partes if len(p)]
+    cubo = _organizar(pd.concat(partes, ignore_index=True) if partes else pd.DataFrame(columns=COLUNAS_CUBO))
+
+    if salvar:
+        try:
+            salvar_cubo(cubo, manifesto, caminho)
+        except OSError:
+            pass  # Sistema de arquivos somente leitura: o cubo fica só em memória
+    return cubo, meses_lidos
+
+
+def consultar_cubo(cubo, metrica, por='sigla', siglas=None):
+    """Série mensal de uma métrica (índice: mes, colunas: valores da dimensão `por`)
+
+    por='sigla': um valor por shopping, direto do resumo mensal.
+    por='genero' / 'faixa_etaria': soma entre os shoppings de `siglas`; ticket_medio
+    é derivado de valor_total / clientes. Métricas não somáveis só existem por shopping.
+    """
+    if por not in DIMENSOES_CUBO:
+        raise ValueError(f'Dimensão inválida: {por}')
+
+    filtro = cubo['sigla'].isin(siglas) if siglas is not None else pd.Series(True, index=cubo.index)
+    if por == 'sigla':
+        filtro &= (cubo['genero'] == TODOS_GENEROS) & (cubo['faixa_etaria'] == TODAS_FAIXAS)
+    elif por == 'genero':
+        filtro &= (cubo['genero'] != TODOS_GENEROS) & (cubo['faixa_etaria'] == TODAS_FAIXAS)
+    else:
+        filtro &= (cubo['genero'] == TODOS_GENEROS) & (cubo['faixa_etaria'] != TODAS_FAIXAS)
+
+    if por == 'sigla':
+        linhas = cubo[filtro & (cubo['metrica'] == metrica)]
+        return linhas.pivot_table(index='mes', columns='sigla', values='valor', aggfunc='sum', observed=True)
+
+    if metrica == 'ticket_medio':
+        valor = consultar_cubo(cubo, 'valor_total', por, siglas)
+        clientes = consultar_cubo(cubo, 'clientes', por, siglas)
+        return valor / clientes.where(clientes > 0)
+    if metrica not in METRICAS_SOMAVEIS:
+        raise ValueError(f'A métrica {metrica} não pode ser somada entre shoppings')
+
+    linhas = cubo[filtro & (cubo['metrica'] == metrica)]
+    return linhas.pivot_table(index='mes', columns=por, values='valor', aggfunc='sum', observed=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Constrói o cubo mensal a partir de Resultados/Por_Mes')
+    parser.add_argument('--raiz', default='Resultados', help='Pasta raiz dos resultados')
+    parser.add_argument('--forcar', action='store_true', help='Reconstrói todos os meses')
+    args = parser.parse_args()
+
+    cubo, meses_lidos = construir_cubo(args.raiz, args.forcar)
+    print(f'{len(cubo):,} linhas | {cubo["mes"].nunique()} meses | lidos agora: {", ".join(meses_lidos) or "nenhum"}')
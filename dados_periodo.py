@@ -0,0 +1,741 @@
+"""
+DADOS POR PERÍODO
+Leitura das tabelas de um período (Resultados/<pasta>) a partir da árvore de CSVs
+ou de um bundle colunar compilado (um único arquivo Arrow mapeado em memória).
+
+Uso offline (compila os bundles de todos os períodos de indice_periodos.csv):
+    python dados_periodo.py [--forcar] [--raiz Resultados]
+"""
+
+import os
+import json
+import struct
+import argparse
+import time
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from derivados import DERIVADOS, DERIVADOS_SHOPPING_NAS_COLUNAS, VERSAO_DERIVADOS, calcular_derivados, filtrar_colunas_shopping
+
+SIGLAS_SHOPPING = ['BS', 'CS', 'GS', 'NK', 'NR', 'NS']
+
+# Tabelas da raiz do período: chave em `dados` -> arquivo CSV
+TABELAS_PERIODO = {
+    'resumo': 'resumo_por_shopping.csv',
+    'genero': 'consolidado_genero_por_shopping.csv',
+    'faixa': 'consolidado_faixa_etaria_por_shopping.csv',
+    'segmentos': 'consolidado_segmentos_por_shopping.csv',
+    'personas': 'personas_clientes.csv',
+    'comparacao_hs': 'comparacao_high_spenders.csv',
+    'hs_por_genero': 'high_spenders_por_genero.csv',
+    'hs_por_faixa': 'high_spenders_por_faixa.csv',
+    'matriz_clientes': 'matriz_clientes_genero_idade.csv',
+    'matriz_valor': 'matriz_valor_genero_idade.csv',
+    'matriz_ticket': 'matriz_ticket_genero_idade.csv',
+    'segmentos_por_genero': 'top_segmentos_por_genero.csv',
+    'segmentos_por_faixa': 'top_segmentos_por_faixa.csv',
+    'comportamento_periodo': 'comportamento_periodo_dia.csv',
+    'comportamento_dia': 'comportamento_dia_semana.csv',
+}
+
+# Tabelas de Por_Shopping/<sigla>
+TABELAS_SHOPPING = {
+    'genero': 'perfil_genero.csv',
+    'faixa': 'perfil_faixa_etaria.csv',
+    'segmentos': 'top_segmentos.csv',
+    'lojas': 'top_lojas.csv',
+    'periodo': 'comportamento_periodo.csv',
+    'dia_semana': 'comportamento_dia_semana.csv',
+}
+TABELAS_SHOPPING_OPCIONAIS = {
+    'hs_stats': 'high_spenders_stats.csv',
+}
+
+# Tabelas de RFV/ (as obrigatórias definem se o período tem RFV)
+TABELAS_RFV = {
+    'perfil_historico': 'metricas_perfil_historico.csv',
+    'perfil_periodo': 'metricas_perfil_periodo.csv',
+    'shopping': 'metricas_shopping_rfv.csv',
+}
+TABELAS_RFV_OPCIONAIS = {
+    'seg_perfil_shop': 'TOP10_SEGMENTOS_POR_PERFIL_SHOPPING.csv',
+    'lojas': 'TOP10_LOJAS_POR_GENERO_SHOPPING_PERFIL.csv',
+    'resumo': 'resumo_rfv.csv',
+}
+TABELAS_RFV_QUINTIS = {
+    'clientes_global': 'rfv_quintis_global.csv',
+    'clientes_shopping': 'rfv_quintis_por_shopping.csv',
+    'perfil_global': 'metricas_perfil_quintis_global.csv',
+    'perfil_shopping': 'metricas_perfil_quintis_shopping.csv',
+    'shopping_global': 'metricas_shopping_quintis_global.csv',
+    'shopping_shopping': 'metricas_shopping_quintis_shopping.csv',
+    'thresholds_global': 'quintile_thresholds_global.csv',
+    'thresholds_shopping': 'quintile_thresholds_shopping.csv',
+}
+
+# Parâmetros de leitura específicos de alguns arquivos
+OPCOES_LEITURA = {
+    'TOP10_LOJAS_POR_GENERO_SHOPPING_PERFIL.csv': {'sep': ';', 'decimal': ','},
+}
+
+# Colunas de baixa cardinalidade armazenadas como categóricas no bundle
+COLUNAS_CATEGORICAS = ['sigla', 'genero', 'faixa_etaria', 'segmento']
+
+# Pré-carga paralela de vários períodos (modo comparativo)
+TABELAS_PRECARGA = list(TABELAS_PERIODO)  # RFV fica sob demanda (arquivos grandes)
+MAX_WORKERS_CARGA = 8
+
+# Orçamento de memória do cache de períodos compartilhado entre sessões (MB)
+ORCAMENTO_CACHE_MB = int(os.environ.get('ORCAMENTO_CACHE_MB', 1024))
+
+# Modo de carga com tipos compactos (OTIMIZAR_TIPOS=1): texto repetitivo vira categórica,
+# inteiros de 64 bits vão para int32 e floats para float32 só quando a conversão é exata
+OTIMIZAR_TIPOS = os.environ.get('OTIMIZAR_TIPOS', '0') == '1'
+FRACAO_MAX_CATEGORICA = 0.5  # valores distintos / linhas
+
+ARQUIVO_BUNDLE = 'periodo.bundle'
+MAGICO_BUNDLE = b'AJBUNDLE'
+VERSAO_BUNDLE = 1
+ALINHAMENTO = 64
+COMPRESSAO_BUNDLE = 'lz4'  # None grava sem compressão (leitura zero-copy do mapa)
+
+
+def ler_csv(caminho):
+    """Lê um CSV de resultados com os parâmetros corretos para o arquivo"""
+    return pd.read_csv(caminho, **OPCOES_LEITURA.get(os.path.basename(caminho), {}))
+
+
+def completar_totais(dados):
+    """Calcula os totais derivados (clientes únicos e soma por shopping)"""
+    # Um cliente que compra em múltiplos shoppings é contado apenas uma vez
+    dados['clientes_unicos'] = int(dados['personas']['qtd_clientes'].sum())
+    dados['clientes_por_shopping'] = int(dados['resumo']['clientes'].sum())  # soma com duplicação
+    return dados
+
+
+# =============================================================================
+# LEITURA DA ÁRVORE DE CSVs
+# =============================================================================
+
+def siglas_periodo(base_path):
+    """Siglas com pasta em Por_Shopping: as de SIGLAS_SHOPPING (nessa ordem) e depois as demais"""
+    pasta = f'{base_path}/Por_Shopping'
+    if not os.path.isdir(pasta):
+        return []
+    existentes = {entrada.name for entrada in os.scandir(pasta) if entrada.is_dir()}
+    return [s for s in SIGLAS_SHOPPING if s in existentes] + sorted(existentes - set(SIGLAS_SHOPPING))
+
+
+def ler_periodo_csv(base_path):
+    """Carrega todas as tabelas de um período a partir da árvore de CSVs"""
+    dados = {}
+
+    for chave, arquivo in TABELAS_PERIODO.items():
+        dados[chave] = ler_csv(f'{base_path}/{arquivo}')
+
+    # Por shopping
+    dados['por_shopping'] = {}
+    for sigla in siglas_periodo(base_path):
+        shop_path = f'{base_path}/Por_Shopping/{sigla}'
+        dados['por_shopping'][sigla] = {
+            chave: ler_csv(f'{shop_path}/{arquivo}') for chave, arquivo in TABELAS_SHOPPING.items()
+        }
+        # High spenders (pode não existir)
+        for chave, arquivo in TABELAS_SHOPPING_OPCIONAIS.items():
+            if os.path.exists(f'{shop_path}/{arquivo}'):
+                dados['por_shopping'][sigla][chave] = ler_csv(f'{shop_path}/{arquivo}')
+
+    # Dados RFV (se existirem para este período)
+    rfv_path = f'{base_path}/RFV'
+    dados['rfv'] = None
+    dados['rfv_quintis'] = None
+    if os.path.exists(rfv_path):
+        try:
+            rfv = {chave: ler_csv(f'{rfv_path}/{arquivo}') for chave, arquivo in TABELAS_RFV.items()}
+            for chave, arquivo in TABELAS_RFV_OPCIONAIS.items():
+                if os.path.exists(f'{rfv_path}/{arquivo}'):
+                    rfv[chave] = ler_csv(f'{rfv_path}/{arquivo}')
+
+            quintis = {}
+            for chave, arquivo in TABELAS_RFV_QUINTIS.items():
+                if os.path.exists(f'{rfv_path}/{arquivo}'):
+                    quintis[chave] = ler_csv(f'{rfv_path}/{arquivo}')
+
+            dados['rfv'] = rfv
+            dados['rfv_quintis'] = quintis or None
+        except Exception:
+            dados['rfv'] = None
+            dados['rfv_quintis'] = None
+
+    return completar_totais(dados)
+
+
+def arquivos_csv_periodo(base_path):
+    """Lista os CSVs de um período que alimentam o bundle"""
+    arquivos = [f'{base_path}/{a}' for a in TABELAS_PERIODO.values()]
+    for sigla in siglas_periodo(base_path):
+        shop_path = f'{base_path}/Por_Shopping/{sigla}'
+        for a in list(TABELAS_SHOPPING.values()) + list(TABELAS_SHOPPING_OPCIONAIS.values()):
+            arquivos.append(f'{shop_path}/{a}')
+    rfv_path = f'{base_path}/RFV'
+    for tabelas in (TABELAS_RFV, TABELAS_RFV_OPCIONAIS, TABELAS_RFV_QUINTIS):
+        arquivos.extend(f'{rfv_path}/{a}' for a in tabelas.values())
+    return [a for a in arquivos if os.path.exists(a)]
+
+
+# =============================================================================
+# BUNDLE COLUNAR
+# =============================================================================
+# Layout do arquivo:
+#   MAGICO_BUNDLE | uint32 versão | uint64 tamanho do manifesto | manifesto JSON
+#   | segmentos Arrow IPC (um por tabela, alinhados em 64 bytes)
+# O manifesto mapeia o caminho da tabela ('resumo', 'por_shopping/BS/genero',
+# 'rfv/perfil_historico', 'derivados/resumo_por_valor', ...) para (offset, tamanho)
+# na área de dados.
+
+def _tabelas_planas(dados):
+    """Achata o dict de um período em {caminho: DataFrame}"""
+    planas = {}
+    for chave, valor in dados.items():
+        if isinstance(valor, pd.DataFrame):
+            planas[chave] = valor
+        elif chave == 'por_shopping':
+            for sigla, tabelas in valor.items():
+                for nome, df in tabelas.items():
+                    planas[f'por_shopping/{sigla}/{nome}'] = df
+        elif isinstance(valor, dict):
+            for nome, df in valor.items():
+                planas[f'{chave}/{nome}'] = df
+    return planas
+
+
+def _tipar_colunas(df):
+    """Converte as colunas de baixa cardinalidade para categóricas"""
+    df = df.copy()
+    for col in COLUNAS_CATEGORICAS:
+        if col in df.columns and pd.api.types.is_string_dtype(df[col]):
+            df[col] = df[col].astype('category')
+    return df
+
+
+def compactar_coluna(serie):
+    """Coluna com tipo compacto sem perda de informação, ou None se não há ganho"""
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        return None
+    if not isinstance(serie.dtype, np.dtype) and not pd.api.types.is_string_dtype(serie):
+        return None  # tipos de extensão (Int64, boolean...) ficam como estão
+    if pd.api.types.is_string_dtype(serie) or serie.dtype == object:
+        if serie.nunique(dropna=False) > FRACAO_MAX_CATEGORICA * len(serie):
+            return None
+        nova = serie.astype('category')
+    elif pd.api.types.is_integer_dtype(serie) and serie.dtype.itemsize > 4:
+        limites = np.iinfo(np.int32)
+        if len(serie) and (serie.min() < limites.min or serie.max() > limites.max):
+            return None
+        nova = serie.astype(np.int32)
+    elif pd.api.types.is_float_dtype(serie) and serie.dtype.itemsize > 4:
+        nova = serie.astype(np.float32)
+        if not np.array_equal(nova.to_numpy(np.float64), serie.to_numpy(), equal_nan=True):
+            return None
+    else:
+        return None
+    if nova.memory_usage(index=False, deep=True) >= serie.memory_usage(index=False, deep=True):
+        return None
+    return nova
+
+
+def compactar_tabela(df):
+    """(DataFrame com tipos compactos, bytes antes, bytes depois)"""
+    antes = int(df.memory_usage(index=True, deep=True).sum())
+    novas = {}
+    for coluna in df.columns:
+        nova = compactar_coluna(df[coluna])
+        if nova is not None:
+            novas[coluna] = nova
+    if novas:
+        df = df.assign(**novas)
+    return df, antes, int(df.memory_usage(index=True, deep=True).sum())
+
+
+def _serializar_tabela(df):
+    """Serializa um DataFrame em um segmento Arrow IPC"""
+    tabela = pa.Table.from_pandas(_tipar_colunas(df), preserve_index=False)
+    sink = pa.BufferOutputStream()
+    opcoes = pa.ipc.IpcWriteOptions(compression=COMPRESSAO_BUNDLE)
+    with pa.ipc.new_file(sink, tabela.schema, options=opcoes) as writer:
+        writer.write_table(tabela)
+    return sink.getvalue()
+
+
+def salvar_bundle(dados, caminho):
+    """Grava o dict de um período como bundle colunar em um único arquivo"""
+    manifesto = {
+        'versao': VERSAO_BUNDLE,
+        'gerado_em': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'rfv': dados.get('rfv') is not None,
+        'rfv_quintis': dados.get('rfv_quintis') is not None,
+        'derivados': VERSAO_DERIVADOS if dados.get('derivados') else None,
+        'tabelas': {},
+    }
+
+    segmentos = []
+    offset = 0
+    for chave, df in _tabelas_planas(dados).items():
+        buf = _serializar_tabela(df)
+        manifesto['tabelas'][chave] = [offset, buf.size]
+        segmentos.append(buf)
+        offset += buf.size
+        resto = offset % ALINHAMENTO
+        if resto:
+            segmentos.append(b'\x00' * (ALINHAMENTO - resto))
+            offset += ALINHAMENTO - resto
+
+    cabecalho = json.dumps(manifesto, ensure_ascii=False).encode('utf-8')
+    prefixo = MAGICO_BUNDLE + struct.pack('<IQ', VERSAO_BUNDLE, len(cabecalho)) + cabecalho
+    # Alinhar o início da área de dados
+    prefixo += b'\x00' * ((-len(prefixo)) % ALINHAMENTO)
+
+    temporario = f'{caminho}.tmp'
+    with open(temporario, 'wb') as f:
+        f.write(prefixo)
+        for seg in segmentos:
+            f.write(seg)
+    os.replace(temporario, caminho)
+
+
+class BundlePeriodo:
+    """Acesso às tabelas de um bundle compilado, mapeado em memória"""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._mapa = pa.memory_map(caminho, 'r')
+        inicio = self._mapa.read(len(MAGICO_BUNDLE) + 12)
+        if inicio[:len(MAGICO_BUNDLE)] != MAGICO_BUNDLE:
+            raise ValueError(f'Arquivo não é um bundle de período: {caminho}')
+        versao, tamanho = struct.unpack('<IQ', inicio[len(MAGICO_BUNDLE):])
+        if versao != VERSAO_BUNDLE:
+            raise ValueError(f'Versão de bundle não suportada ({versao}): {caminho}')
+        self.manifesto = json.loads(self._mapa.read(tamanho).decode('utf-8'))
+        fim_cabecalho = len(MAGICO_BUNDLE) + 12 + tamanho
+        self._inicio_dados = fim_cabecalho + ((-fim_cabecalho) % ALINHAMENTO)
+        # Buffer do arquivo inteiro: fatias são zero-copy e seguras entre threads
+        self._mapa.seek(0)
+        self._buffer = self._mapa.read_buffer()
+
+    def __contains__(self, chave):
+        return chave in self.manifesto['tabelas']
+
+    def chaves(self, prefixo=''):
+        """Lista os caminhos de tabelas do bundle com o prefixo informado"""
+        return [c for c in self.manifesto['tabelas'] if c.startswith(prefixo)]
+
+    def ler(self, chave):
+        """Lê uma tabela do bundle sem copiar o arquivo inteiro"""
+        offset, tamanho = self.manifesto['tabelas'][chave]
+        buf = self._buffer.slice(self._inicio_dados + offset, tamanho)
+        return pa.ipc.open_file(buf).read_all().to_pandas()
+
+
+# =============================================================================
+# CARREGAMENTO SOB DEMANDA
+# =============================================================================
+# `dados` é um mapeamento somente leitura com a mesma API de dict: cada tabela
+# só é lida (do bundle ou do CSV) no primeiro acesso e fica guardada depois.
+
+class TabelasLazy(Mapping):
+    """Mapeamento de tabelas carregadas no primeiro acesso e guardadas individualmente"""
+
+    def __init__(self, carregadores, valores=None):
+        self._carregadores = dict(carregadores)  # chave -> função sem argumentos
+        self._valores = dict(valores or {})      # chaves já materializadas
+        self._travas = {chave: threading.Lock() for chave in self._carregadores}
+        # Modo de tipos compactos: caminho da tabela -> (bytes lidos, bytes compactos)
+        self.economia_tipos = None
+
+    def __getitem__(self, chave):
+        if chave in self._valores:
+            return self._valores[chave]
+        carregador = self._carregadores[chave]
+        with self._travas[chave]:
+            if chave not in self._valores:
+                self._valores[chave] = carregador()
+        return self._valores[chave]
+
+    def __iter__(self):
+        yield from self._valores
+        yield from (c for c in self._carregadores if c not in self._valores)
+
+    def __len__(self):
+        return len(self._valores.keys() | self._carregadores.keys())
+
+    def __contains__(self, chave):
+        return chave in self._valores or chave in self._carregadores
+
+    def __repr__(self):
+        return f'TabelasLazy(carregadas={self.carregadas()}, pendentes={self.pendentes()})'
+
+    def carregadas(self):
+        """Chaves já materializadas"""
+        return list(self._valores)
+
+    def pendentes(self):
+        """Chaves ainda não lidas"""
+        return [c for c in self._carregadores if c not in self._valores]
+
+    def carregar(self, chaves=None):
+        """Materializa as chaves informadas (ou todas) e devolve o próprio mapeamento"""
+        for chave in (self if chaves is None else chaves):
+            if chave in self:
+                self[chave]
+        return self
+
+    def transformar(self, funcao):
+        """Novo mapeamento sob demanda com `funcao(chave, valor)` aplicada a cada entrada"""
+        return TabelasLazy({chave: partial(_aplicar_transformacao, self, chave, funcao) for chave in self})
+
+
+def _aplicar_transformacao(origem, chave, funcao):
+    return funcao(chave, origem[chave])
+
+
+COLUNAS_SHOPPING = ['sigla', 'shopping_principal', 'Shopping']
+
+
+def _filtrar_tabela_shoppings(shoppings, chave, valor):
+    # Dados por_shopping: só as chaves permitidas
+    if chave == 'por_shopping' and valor is not None:
+        return {k: v for k, v in valor.items() if k in shoppings}
+
+    # Derivadas: mesmo filtro, por coluna quando os shoppings são as colunas
+    if chave == 'derivados' and valor is not None:
+        return valor.transformar(partial(_filtrar_derivado, shoppings))
+
+    # Resumo e outras tabelas que têm coluna de shopping
+    if isinstance(valor, pd.DataFrame):
+        for col in COLUNAS_SHOPPING:
+            if col in valor.columns:
+                return valor[valor[col].isin(shoppings)]
+    return valor
+
+
+def _filtrar_derivado(shoppings, nome, df):
+    if nome in DERIVADOS_SHOPPING_NAS_COLUNAS:
+        return filtrar_colunas_shopping(df, shoppings)
+    return _filtrar_tabela_shoppings(shoppings, nome, df)
+
+
+def filtrar_shoppings(dados, shoppings):
+    """Período restrito aos shoppings informados (None: sem filtro)
+
+    O filtro é aplicado sob demanda, só nas tabelas que forem acessadas.
+    """
+    if shoppings is None:
+        return dados
+    return dados.transformar(partial(_filtrar_tabela_shoppings, shoppings))
+
+
+def _ler_compacto(ler, economia, caminho):
+    df, antes, depois = compactar_tabela(ler(caminho))
+    economia[caminho] = (antes, depois)
+    return df
+
+
+def _montar_periodo(caminhos, ler, tem_rfv, tem_quintis, otimizar=False):
+    """Monta o `dados` sob demanda a partir dos caminhos de tabela disponíveis
+
+    caminhos: caminhos no formato do manifesto ('resumo', 'por_shopping/BS/genero', ...)
+    ler: função que recebe um caminho e devolve o DataFrame
+    otimizar: compacta os tipos de cada tabela lida e registra a economia em `economia_tipos`
+    As derivadas (derivados.DERIVADOS) sem caminho são calculadas no primeiro acesso.
+    """
+    economia = {}
+    if otimizar:
+        ler = partial(_ler_compacto, ler, economia)
+    raiz, por_shopping, grupos = {}, {}, {'rfv': {}, 'rfv_quintis': {}, 'derivados': {}}
+    for caminho in caminhos:
+        partes = caminho.split('/')
+        if len(partes) == 1:
+            raiz[caminho] = partial(ler, caminho)
+        elif partes[0] == 'por_shopping':
+            por_shopping.setdefault(partes[1], {})[partes[2]] = partial(ler, caminho)
+        else:
+            grupos[partes[0]][partes[1]] = partial(ler, caminho)
+
+    dados = TabelasLazy(
+        {
+            **raiz,
+            # Um cliente que compra em múltiplos shoppings é contado apenas uma vez
+            'clientes_unicos': lambda: int(dados['personas']['qtd_clientes'].sum()),
+            'clientes_por_shopping': lambda: int(dados['resumo']['clientes'].sum()),  # soma com duplicação
+            # Derivadas do bundle quando compiladas; as demais calculadas a partir de `dados`
+            'derivados': lambda: TabelasLazy({
+                **{nome: partial(funcao, dados) for nome, funcao in DERIVADOS.items()},
+                **grupos['derivados'],
+            }),
+        },
+        valores={
+            'por_shopping': {sigla: TabelasLazy(tabelas) for sigla, tabelas in por_shopping.items()},
+            'rfv': TabelasLazy(grupos['rfv']) if tem_rfv else None,
+            'rfv_quintis': TabelasLazy(grupos['rfv_quintis']) if tem_quintis and grupos['rfv_quintis'] else None,
+        },
+    )
+    if otimizar:
+        dados.economia_tipos = economia
+    return dados
+
+
+def caminhos_csv_periodo(base_path):
+    """Mapeia os caminhos de tabela de um período para os CSVs existentes"""
+    caminhos = {chave: f'{base_path}/{arquivo}' for chave, arquivo in TABELAS_PERIODO.items()}
+
+    for sigla in siglas_periodo(base_path):
+        shop_path = f'{base_path}/Por_Shopping/{sigla}'
+        for chave, arquivo in TABELAS_SHOPPING.items():
+            caminhos[f'por_shopping/{sigla}/{chave}'] = f'{shop_path}/{arquivo}'
+        for chave, arquivo in TABELAS_SHOPPING_OPCIONAIS.items():
+            if os.path.exists(f'{shop_path}/{arquivo}'):
+                caminhos[f'por_shopping/{sigla}/{chave}'] = f'{shop_path}/{arquivo}'
+
+    # RFV só é considerado quando todas as tabelas obrigatórias existem
+    rfv_path = f'{base_path}/RFV'
+    if all(os.path.exists(f'{rfv_path}/{a}') for a in TABELAS_RFV.values()):
+        for chave, arquivo in {**TABELAS_RFV, **TABELAS_RFV_OPCIONAIS}.items():
+            if os.path.exists(f'{rfv_path}/{arquivo}'):
+                caminhos[f'rfv/{chave}'] = f'{rfv_path}/{arquivo}'
+        for chave, arquivo in TABELAS_RFV_QUINTIS.items():
+            if os.path.exists(f'{rfv_path}/{arquivo}'):
+                caminhos[f'rfv_quintis/{chave}'] = f'{rfv_path}/{arquivo}'
+
+    return caminhos
+
+
+def periodo_lazy_csv(base_path, otimizar=False):
+    """Abre um período da árvore de CSVs; cada arquivo é lido no primeiro acesso"""
+    caminhos = caminhos_csv_periodo(base_path)
+    tem_rfv = any(c.startswith('rfv/') for c in caminhos)
+    tem_quintis = any(c.startswith('rfv_quintis/') for c in caminhos)
+    return _montar_periodo(caminhos, lambda c: ler_csv(caminhos[c]), tem_rfv, tem_quintis, otimizar)
+
+
+def periodo_lazy_bundle(caminho, otimizar=False):
+    """Abre um período do bundle compilado; cada tabela é decodificada no primeiro acesso"""
+    bundle = BundlePeriodo(caminho)
+    caminhos = bundle.chaves()
+    if bundle.manifesto.get('derivados') != VERSAO_DERIVADOS:
+        # Derivadas de outra versão (ou ausentes): recalculadas a partir das tabelas
+        caminhos = [c for c in caminhos if not c.startswith('derivados/')]
+    return _montar_periodo(caminhos, bundle.ler, bundle.manifesto['rfv'], bundle.manifesto['rfv_quintis'], otimizar)
+
+
+def bundle_atualizado(base_path):
+    """Indica se o bundle do período existe e é mais novo que todos os CSVs"""
+    caminho = f'{base_path}/{ARQUIVO_BUNDLE}'
+    if not os.path.exists(caminho):
+        return False
+    mtime_bundle = os.path.getmtime(caminho)
+    return all(os.path.getmtime(a) <= mtime_bundle for a in arquivos_csv_periodo(base_path))
+
+
+def carregar_periodo(base_path, otimizar=False):
+    """Abre um período (sob demanda) pelo bundle quando atualizado, senão pela árvore de CSVs
+
+    otimizar: modo de tipos compactos (ver compactar_tabela)
+    """
+    if bundle_atualizado(base_path):
+        try:
+            return periodo_lazy_bundle(f'{base_path}/{ARQUIVO_BUNDLE}', otimizar)
+        except Exception:
+            pass  # Bundle corrompido ou de outra versão: usar CSVs
+    return periodo_lazy_csv(base_path, otimizar)
+
+
+def carregar_periodos(pastas, abrir=carregar_periodo, tabelas=None, max_workers=MAX_WORKERS_CARGA):
+    """Abre vários períodos e pré-carrega suas tabelas em paralelo
+
+    pastas: dict nome do período -> pasta (ex.: {'Ano 2025': 'Por_Ano/2025'})
+    abrir: função que recebe a pasta e devolve o `dados` sob demanda
+    Retorna (dados_periodos, tempos), com tempos em segundos por período:
+    'abrir', 'leitura' (soma das leituras) e 'total' (até a última tabela do período).
+    """
+    tabelas = TABELAS_PRECARGA if tabelas is None else tabelas
+    inicio = time.perf_counter()
+
+    dados_periodos, tempos = {}, {}
+    for nome, pasta in pastas.items():
+        t0 = time.perf_counter()
+        dados_periodos[nome] = abrir(pasta)
+        tempos[nome] = {'abrir': time.perf_counter() - t0, 'leitura': 0.0, 'total': 0.0}
+
+    def ler(nome, chave):
+        t0 = time.perf_counter()
+        dados_periodos[nome][chave]
+        return nome, time.perf_counter() - t0, time.perf_counter() - inicio
+
+    tarefas = [
+        (nome, chave) for nome, dados in dados_periodos.items()
+        for chave in tabelas if chave in dados
+    ]
+    if tarefas:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tarefas)))) as executor:
+            for nome, duracao, fim in executor.map(lambda t: ler(*t), tarefas):
+                tempos[nome]['leitura'] += duracao
+                tempos[nome]['total'] = max(tempos[nome]['total'], fim)
+
+    return dados_periodos, tempos
+
+
+# =============================================================================
+# CACHE COMPARTILHADO DE PERÍODOS
+# =============================================================================
+# Um único cache por processo para todas as sessões: cada período é aberto uma vez
+# e as sessões recebem visões somente leitura das mesmas tabelas (sem cópia dos
+# dados). A cada acesso, se a memória das tabelas decodificadas passa do
+# orçamento, os períodos usados há mais tempo saem do cache.
+
+def tamanho_periodo(dados):
+    """Bytes das tabelas já materializadas de um período (tabelas pendentes não contam)"""
+    if isinstance(dados, pd.DataFrame):
+        return int(dados.memory_usage(index=True, deep=True).sum())
+    if isinstance(dados, TabelasLazy):
+        return sum(tamanho_periodo(dados[c]) for c in dados.carregadas())
+    if isinstance(dados, Mapping):
+        return sum(tamanho_periodo(v) for v in dados.values())
+    return 0
+
+
+def _qtd_carregadas(dados):
+    """Total de tabelas materializadas (muda quando o tamanho precisa ser recalculado)"""
+    if isinstance(dados, TabelasLazy):
+        return len(dados.carregadas()) + sum(_qtd_carregadas(dados[c]) for c in dados.carregadas())
+    if isinstance(dados, Mapping):
+        return sum(_qtd_carregadas(v) for v in dados.values())
+    return 0
+
+
+def somente_leitura(dados):
+    """Visão do período em que cada DataFrame é uma cópia rasa (os dados não são copiados)
+
+    Com copy-on-write (padrão no pandas 3), alterar a visão não altera a tabela
+    guardada no cache compartilhado; sem ele, só novas colunas ficam isoladas.
+    """
+    if isinstance(dados, pd.DataFrame):
+        return dados.copy(deep=False)
+    if isinstance(dados, Mapping):
+        return TabelasLazy({chave: partial(_visao_chave, dados, chave) for chave in dados})
+    return dados
+
+
+def _visao_chave(origem, chave):
+    return somente_leitura(origem[chave])
+
+
+class CachePeriodos:
+    """Cache LRU de períodos com orçamento de bytes, seguro entre threads/sessões"""
+
+    def __init__(self, abrir=carregar_periodo, orcamento_bytes=ORCAMENTO_CACHE_MB * 1024 ** 2):
+        self._abrir = abrir
+        self.orcamento_bytes = orcamento_bytes
+        self._periodos = OrderedDict()  # pasta -> dados (mais recente no fim)
+        self._tamanhos = {}             # pasta -> (tabelas carregadas, bytes)
+        self._trava = threading.RLock()
+        self.acertos = 0
+        self.faltas = 0
+        self.remocoes = 0
+
+    def obter(self, pasta):
+        """Visão somente leitura do período (abre na primeira vez)"""
+        with self._trava:
+            if pasta in self._periodos:
+                self.acertos += 1
+                self._periodos.move_to_end(pasta)
+            else:
+                self.faltas += 1
+                self._periodos[pasta] = self._abrir(pasta)
+            dados = self._periodos[pasta]
+            self._respeitar_orcamento(manter=pasta)
+        return somente_leitura(dados)
+
+    def _bytes(self, pasta):
+        carregadas = _qtd_carregadas(self._periodos[pasta])
+        anterior = self._tamanhos.get(pasta)
+        if anterior is None or anterior[0] != carregadas:
+            self._tamanhos[pasta] = (carregadas, tamanho_periodo(self._periodos[pasta]))
+        return self._tamanhos[pasta][1]
+
+    def _respeitar_orcamento(self, manter):
+        """Remove períodos menos usados até caber no orçamento (o período pedido fica)"""
+        total = sum(self._bytes(p) for p in self._periodos)
+        while total > self.orcamento_bytes and len(self._periodos) > 1:
+            pasta = next(p for p in self._periodos if p != manter)
+            total -= self._bytes(pasta)
+            del self._periodos[pasta]
+            del self._tamanhos[pasta]
+            self.remocoes += 1
+
+    def limpar(self):
+        with self._trava:
+            self._periodos.clear()
+            self._tamanhos.clear()
+
+    def periodos(self):
+        """[(pasta, dados)] guardados, do menos para o mais recente (os próprios objetos do cache)"""
+        with self._trava:
+            return list(self._periodos.items())
+
+    def estatisticas(self):
+        """Contadores e ocupação atual do cache"""
+        with self._trava:
+            tamanhos = {p: self._bytes(p) for p in self._periodos}
+            return {
+                'acertos': self.acertos,
+                'faltas': self.faltas,
+                'remocoes': self.remocoes,
+                'periodos': len(tamanhos),
+                'bytes': sum(tamanhos.values()),
+                'orcamento_bytes': self.orcamento_bytes,
+                'por_periodo': tamanhos,
+            }
+
+
+def compilar_bundle(base_path):
+    """Compila o bundle de um período a partir dos CSVs, com as tabelas derivadas"""
+    caminho = f'{base_path}/{ARQUIVO_BUNDLE}'
+    dados = ler_periodo_csv(base_path)
+    dados['derivados'] = calcular_derivados(dados)
+    salvar_bundle(dados, caminho)
+    return caminho
+
+
+def compilar_bundles(raiz='Resultados', forcar=False):
+    """Compila os bundles de todos os períodos listados em indice_periodos.csv"""
+    indice = pd.read_csv(f'{raiz}/indice_periodos.csv')
+    resultado = []
+    for pasta in indice['pasta']:
+        base_path = f'{raiz}/{pasta}'
+        if not os.path.exists(base_path):
+            resultado.append((pasta, 'ausente'))
+            continue
+        if not forcar and bundle_atualizado(base_path):
+            resultado.append((pasta, 'atualizado'))
+            continue
+        compilar_bundle(base_path)
+        resultado.append((pasta, 'compilado'))
+    return resultado
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compila os bundles colunares dos períodos')
+    parser.add_argument('--raiz', default='Resultados', help='Pasta raiz dos resultados')
+    parser.add_argument('--forcar', action='store_true', help='Recompila mesmo os bundles atualizados')
+    args = parser.parse_args()
+
+    for pasta, status in compilar_bundles(args.raiz, args.forcar):
+        print(f'{pasta}: {status}')
@@ -0,0 +1,735 @@
+"""
+DADOS SINTÉTICOS
+Gera uma árvore Resultados/ com o mesmo esquema da real (indice_periodos.csv,
+Completo, Por_Ano, Por_Trimestre, Por_Mes, Por_Shopping/<sigla>, RFV/,
+top_consumidores_rfv.csv e top_segmentos_por_faixa.csv) em qualquer escala, para
+rodar o benchmark das páginas e os testes de memória offline com 10x-100x a base.
+
+A base é simulada por cliente e mês (não por cupom):
+- Cliente: shopping principal (pesos tipo Zipf) e, para ~12%, um secundário;
+  gênero, idade (normal em torno de 41 anos), segmento e loja favoritos, segmento
+  secundário, ticket lognormal, frequência gamma e propensão de compra beta
+- Mês: o cliente compra com a sua propensão (sazonalidade em nov/dez) a partir
+  do mês de entrada; frequência 1 + Poisson e valor = frequência x ticket x ruído
+- Períodos (meses, trimestres, anos e Completo) agregam os meses; a recência vem
+  da última compra e o perfil histórico do valor acumulado até o fim do período
+- Turno e dia da semana são distribuídos por pesos de cada geração
+- Scores e tabelas RFV usam rfv_scores / rfv_intervalo, as mesmas regras do app
+
+Mesma semente e parâmetros geram exatamente os mesmos arquivos. Shoppings além dos
+seis reais recebem siglas S07, S08...; segmentos além dos 17 reais, 'Segmento NN'.
+Os dados pessoais de top_consumidores_rfv.csv são fictícios.
+
+Uso:
+    python dados_sinteticos.py [--saida Sintetico/Resultados] [--clientes 2500000]
+                               [--shoppings 6] [--meses 26] [--segmentos 17]
+                               [--inicio 2024-01] [--semente 42] [--bundles]
+
+O dashboard lê Resultados/ relativo à pasta de trabalho; para o benchmark:
+    python benchmark_paginas.py --dados Sintetico
+"""
+
+import os
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+import rfv_scores
+from rfv_intervalo import metricas_perfil, metricas_shopping
+from dados_periodo import (TABELAS_PERIODO, TABELAS_SHOPPING, TABELAS_SHOPPING_OPCIONAIS, TABELAS_RFV,
+                           TABELAS_RFV_OPCIONAIS, TABELAS_RFV_QUINTIS, OPCOES_LEITURA, compilar_bundles)
+
+SHOPPINGS_REAIS = [
+    ('BS', 'Balneário Shopping', 'Balneário Camboriú'),
+    ('CS', 'Continente Shopping', 'São José'),
+    ('GS', 'Garten Shopping', 'Joinville'),
+    ('NK', 'Neumarkt Shopping', 'Blumenau'),
+    ('NR', 'Norte Shopping', 'Blumenau'),
+    ('NS', 'Nações Shopping', 'Criciúma'),
+]
+
+# Segmento -> peso no valor total (R$ milhões na base real)
+SEGMENTOS_REAIS = {
+    'Moda': 191, 'Joalheria': 53, 'Calçados': 39, 'Beleza e Bem-estar': 38, 'Gastronomia': 29,
+    'Casa e Decoração': 25, 'Esportes': 24, 'Telefonia': 15, 'Moda Feminina': 13, 'Eletrônicos': 11,
+    'Eletrodomésticos': 11, 'Infantil': 8, 'Ótica': 8, 'Serviços': 5, 'Presentes e Acessórios': 3,
+    'Supermercado': 2.5, 'Calçados Femininos': 1.4,
+}
+# Multiplicador do ticket por segmento (os demais: 1)
+TICKET_SEGMENTO = {
+    'Joalheria': 3.5, 'Eletrônicos': 2.2, 'Eletrodomésticos': 2.5, 'Telefonia': 2.0, 'Ótica': 1.6,
+    'Gastronomia': 0.35, 'Supermercado': 0.6, 'Serviços': 0.8, 'Beleza e Bem-estar': 0.7,
+}
+
+GENEROS = ['Feminino', 'Masculino', 'Outro', 'Nao Informado']
+PROB_GENEROS = [0.62, 0.372, 0.005, 0.003]
+
+# Gerações (ano de nascimento mínimo) e faixas de idade (idade mínima)
+GERACOES = [
+    ('Gen Z (1997-2012)', 1997), ('Millennials (1981-1996)', 1981), ('Gen X (1965-1980)', 1965),
+    ('Boomers (1946-1964)', 1946), ('Silent (antes 1946)', 0),
+]
+FAIXAS_IDADE = [
+    ('16-24 (Gen Z)', 16), ('25-39 (Millennials)', 25), ('40-54 (Gen X)', 40),
+    ('55-69 (Boomers)', 55), ('70+ (Silent)', 70),
+]
+
+# Distribuição do valor e das transações por turno e dia da semana (uma linha por geração)
+PERIODOS_DIA = ['Manha (6h-12h)', 'Tarde (12h-18h)', 'Noite (18h-22h)']
+PESOS_PERIODO_DIA = np.array([
+    [0.12, 0.38, 0.50], [0.15, 0.37, 0.48], [0.18, 0.38, 0.44], [0.24, 0.41, 0.35], [0.30, 0.44, 0.26],
+])
+DIAS_SEMANA = ['Domingo', 'Segunda', 'Terca', 'Quarta', 'Quinta', 'Sexta', 'Sabado']
+PESOS_DIA_SEMANA = np.array([
+    [0.19, 0.10, 0.10, 0.11, 0.11, 0.15, 0.24], [0.18, 0.11, 0.11, 0.11, 0.12, 0.15, 0.22],
+    [0.17, 0.12, 0.11, 0.12, 0.12, 0.15, 0.21], [0.15, 0.13, 0.13, 0.13, 0.13, 0.14, 0.19],
+    [0.13, 0.15, 0.14, 0.14, 0.14, 0.13, 0.17],
+])
+
+SAZONALIDADE = {11: 1.1, 12: 1.4}  # mês -> multiplicador da propensão e do valor
+MESES_ABREV = ['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun', 'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez']
+
+PCT_SHOPPING_SECUNDARIO = 0.12
+FRACAO_SHOPPING_SECUNDARIO = 0.3  # fração das transações no shopping secundário
+LOJAS_POR_SEGMENTO = 8
+QUANTIL_HIGH_SPENDERS = 0.9
+METRICAS_COMPARACAO_HS = ['Qtd Clientes', 'Valor Total (R$)', 'Ticket Medio (R$)', 'Freq Media Compras',
+                          'Idade Media', '% Feminino', '% Masculino']
+# Perfil histórico pelo valor acumulado até o fim do período (R$)
+LIMITES_PERFIL_HISTORICO = [(5000, 'VIP'), (2500, 'Premium'), (1000, 'Potencial')]
+
+TOP_SEGMENTOS = 20
+TOP_LOJAS = 20
+TOP_POR_CHAVE = 5
+TOP10 = 10
+TOP_CONSUMIDORES = 150
+
+NOMES_FEMININOS = ['Ana', 'Maria', 'Juliana', 'Fernanda', 'Camila', 'Patrícia', 'Beatriz', 'Luiza', 'Carla', 'Renata']
+NOMES_MASCULINOS = ['João', 'Pedro', 'Lucas', 'Gabriel', 'Rafael', 'Carlos', 'Marcelo', 'Bruno', 'André', 'Felipe']
+SOBRENOMES = ['Silva', 'Santos', 'Oliveira', 'Souza', 'Pereira', 'Costa', 'Rodrigues', 'Almeida', 'Nascimento',
+              'Lima', 'Araújo', 'Fernandes', 'Carvalho', 'Gomes', 'Martins', 'Rocha', 'Ribeiro', 'Schmitt']
+BAIRROS = ['Centro', 'Pioneiros', 'Nações', 'Vila Nova', 'Itoupava', 'Kobrasol', 'América', 'Fazenda']
+
+
+# =============================================================================
+# CADASTROS
+# =============================================================================
+
+def cadastro_shoppings(qtd):
+    """[(sigla, nome, cidade)]: os seis reais e, acima disso, S07, S08..."""
+    extras = [(f'S{k + 1:02d}', f'Shopping {k + 1:02d}', f'Cidade {k + 1:02d}')
+              for k in range(len(SHOPPINGS_REAIS), qtd)]
+    return (SHOPPINGS_REAIS + extras)[:qtd]
+
+
+def cadastro_segmentos(qtd):
+    """(nomes, pesos, multiplicadores de ticket) dos segmentos"""
+    nomes = list(SEGMENTOS_REAIS)[:qtd] + [f'Segmento {k + 1:02d}' for k in range(len(SEGMENTOS_REAIS), qtd)]
+    pesos = np.array([SEGMENTOS_REAIS.get(n, 1.0) for n in nomes])
+    tickets = np.array([TICKET_SEGMENTO.get(n, 1.0) for n in nomes])
+    return nomes, pesos / pesos.sum(), tickets
+
+
+def _pesos_zipf(qtd, expoente):
+    pesos = 1 / np.arange(1, qtd + 1) ** expoente
+    return pesos / pesos.sum()
+
+
+def gerar_clientes(qtd, qtd_shoppings, qtd_segmentos, qtd_meses, ano_referencia, rng):
+    """Atributos fixos de cada cliente (arrays NumPy indexados pelo cliente)"""
+    _, pesos_segmento, tickets_segmento = cadastro_segmentos(qtd_segmentos)
+    pesos_loja = _pesos_zipf(LOJAS_POR_SEGMENTO, 1.0)
+
+    shopping = rng.choice(qtd_shoppings, qtd, p=_pesos_zipf(qtd_shoppings, 0.6)).astype(np.int16)
+    secundario = np.full(qtd, -1, dtype=np.int16)
+    if qtd_shoppings > 1:
+        com_secundario = rng.random(qtd) < PCT_SHOPPING_SECUNDARIO
+        deslocamento = rng.integers(1, qtd_shoppings, qtd)
+        secundario[com_secundario] = ((shopping + deslocamento) % qtd_shoppings)[com_secundario]
+
+    idade = np.clip(rng.normal(41, 13, qtd), 16, 95).astype(np.int16)
+    nascimento = ano_referencia - idade
+    geracao = np.select([nascimento >= ano for _, ano in GERACOES], range(len(GERACOES))).astype(np.int8)
+    faixa_idade = np.select([idade >= minimo for _, minimo in reversed(FAIXAS_IDADE)],
+                            range(len(FAIXAS_IDADE) - 1, -1, -1)).astype(np.int8)
+
+    segmento = rng.choice(qtd_segmentos, qtd, p=pesos_segmento).astype(np.int16)
+    ticket = rng.lognormal(4.6, 0.8, qtd) * tickets_segmento[segmento] * (1 + 0.006 * (idade - 16))
+    return {
+        'shopping': shopping,
+        'secundario': secundario,
+        'genero': rng.choice(len(GENEROS), qtd, p=PROB_GENEROS).astype(np.int8),
+        'idade': idade,
+        'geracao': geracao,
+        'faixa_idade': faixa_idade,
+        'segmento': segmento,
+        'segmento_2': rng.choice(qtd_segmentos, qtd, p=pesos_segmento).astype(np.int16),
+        'loja': rng.choice(LOJAS_POR_SEGMENTO, qtd, p=pesos_loja).astype(np.int16),
+        'loja_2': rng.choice(LOJAS_POR_SEGMENTO, qtd, p=pesos_loja).astype(np.int16),
+        'participacao': rng.beta(6, 3, qtd).astype(np.float32),  # fração no segmento principal
+        'ticket': ticket.astype(np.float32),
+        'intensidade': rng.gamma(0.6, 1.5, qtd).astype(np.float32),
+        'propensao': rng.beta(1.2, 3.5, qtd).astype(np.float32),
+        'entrada': np.where(rng.random(qtd) < 0.45, 0, rng.integers(0, qtd_meses, qtd)).astype(np.int16),
+    }
+
+
+# =============================================================================
+# SIMULAÇÃO MENSAL
+# =============================================================================
+
+def _dia(data):
+    """Dias desde 1970-01-01"""
+    return int(np.datetime64(pd.Timestamp(data).date(), 'D').astype(np.int64))
+
+
+def simular_mes(base, indice, mes, semente):
+    """Compras de um mês: (clientes ativos, frequência, valor, dia da primeira e da última compra)"""
+    rng = np.random.default_rng([semente, indice + 1])
+    sazonal = SAZONALIDADE.get(mes.month, 1.0)
+    entrada = base['entrada']
+    sorteio = rng.random(len(entrada)) < np.minimum(base['propensao'] * sazonal, 1.0)
+    # Clientes novos compram no mês de entrada; a base inicial (entrada 0) segue a propensão
+    ativos = np.flatnonzero(((entrada == indice) & (indice > 0)) | ((entrada <= indice) & sorteio))
+
+    frequencia = 1 + rng.poisson(base['intensidade'][ativos] * sazonal)
+    valor = np.round(frequencia * base['ticket'][ativos] * rng.lognormal(0, 0.35, len(ativos)) * sazonal, 2)
+
+    # Última compra mais perto do fim do mês para quem compra mais vezes
+    dias = mes.days_in_month
+    ultimo = np.ceil(dias * rng.random(len(ativos)) ** (1 / frequencia)).clip(1, dias).astype(np.int32)
+    primeiro = np.where(frequencia > 1, 1 + np.floor((ultimo - 1) * rng.random(len(ativos))), ultimo).astype(np.int32)
+    inicio = _dia(mes.start_time) - 1
+    return ativos, frequencia, valor, inicio + primeiro, inicio + ultimo
+
+
+def _novo_acumulador(qtd):
+    return {
+        'valor': np.zeros(qtd),
+        'frequencia': np.zeros(qtd, dtype=np.int32),
+        'ultimo': np.full(qtd, -1, dtype=np.int32),
+    }
+
+
+def _acumular(acumulador, ativos, frequencia, valor, ultimo):
+    acumulador['valor'][ativos] += valor
+    acumulador['frequencia'][ativos] += frequencia
+    acumulador['ultimo'][ativos] = ultimo
+
+
+def pastas_do_mes(mes):
+    """Períodos (tipo, código, nome, pasta) que contêm o mês"""
+    ano, trimestre = mes.year, (mes.month - 1) // 3 + 1
+    return [
+        ('Completo', 'Completo', 'Período Completo', 'Completo'),
+        ('Ano', str(ano), f'Ano {ano}', f'Por_Ano/{ano}'),
+        ('Trimestre', f'{ano}_Q{trimestre}', f'{ano} - Q{trimestre}', f'Por_Trimestre/{ano}_Q{trimestre}'),
+        ('Mes', f'{ano}_{mes.month:02d}', f'{MESES_ABREV[mes.month - 1]}/{ano}', f'Por_Mes/{ano}_{mes.month:02d}'),
+    ]
+
+
+# =============================================================================
+# TABELAS DE UM PERÍODO
+# =============================================================================
+
+
+def _categorica(codigos, nomes):
+    return pd.Categorical.from_codes(np.asarray(codigos), nomes)
+
+
+def _perfil_historico(valor_acumulado):
+    condicoes = [valor_acumulado >= minimo for minimo, _ in LIMITES_PERFIL_HISTORICO]
+    return np.select(condicoes, [perfil for _, perfil in LIMITES_PERFIL_HISTORICO], default=rfv_scores.PERFIL_BASE)
+
+
+def clientes_periodo(acumulador, historico, fim, base, cadastro):
+    """Uma linha por cliente ativo no período"""
+    idx = np.flatnonzero(acumulador['frequencia'] > 0)
+    return pd.DataFrame({
+        'cliente': idx,
+        'valor': acumulador['valor'][idx],
+        'transacoes': acumulador['frequencia'][idx].astype(np.int64),
+        'recencia': fim - acumulador['ultimo'][idx],
+        'perfil_historico': _perfil_historico(historico[idx]),
+        'shopping': _categorica(base['shopping'][idx], cadastro['shoppings']),
+        'genero': _categorica(base['genero'][idx], GENEROS),
+        'faixa_etaria': _categorica(base['geracao'][idx], [g for g, _ in GERACOES]),
+        'faixa_idade': _categorica(base['faixa_idade'][idx], [f for f, _ in FAIXAS_IDADE]),
+        'idade': base['idade'][idx],
+        'segmento': _categorica(base['segmento'][idx], cadastro['segmentos']),
+    })
+
+
+def _linhas_shopping(clientes, base, cadastro):
+    """Uma linha por (cliente, shopping): o secundário fica com parte das transações"""
+    transacoes = clientes['transacoes'].to_numpy()
+    secundario = base['secundario'][clientes['cliente'].to_numpy()]
+    divide = (secundario >= 0) & (transacoes >= 2)
+    trans_sec = np.where(divide, np.maximum(np.rint(transacoes * FRACAO_SHOPPING_SECUNDARIO), 1), 0).astype(np.int64)
+    fracao = trans_sec / transacoes
+
+    principal = clientes.assign(valor=clientes['valor'] * (1 - fracao), transacoes=transacoes - trans_sec)
+    extra = clientes[divide].assign(
+        shopping=_categorica(secundario[divide], cadastro['shoppings']),
+        valor=(clientes['valor'] * fracao)[divide],
+        transacoes=trans_sec[divide],
+    )
+    return pd.concat([principal, extra], ignore_index=True)
+
+
+def _partes(df, base, cadastro):
+    """Divide valor e transações de cada linha entre segmento/loja principal e secundário do cliente"""
+    cliente = df['cliente'].to_numpy()
+    transacoes = df['transacoes'].to_numpy()
+    participacao = base['participacao'][cliente].astype(np.float64)
+    principal = np.maximum(np.rint(transacoes * participacao), 1).astype(np.int64)
+    unico = (principal >= transacoes) | (base['segmento'][cliente] == base['segmento_2'][cliente])
+    principal = np.where(unico, transacoes, principal)
+    participacao = np.where(unico, 1.0, participacao)
+
+    def parte(mascara, segmento, loja, fracao, trans):
+        segmento, loja = segmento[cliente][mascara], loja[cliente][mascara]
+        return df[mascara].assign(
+            segmento=_categorica(segmento, cadastro['segmentos']),
+            loja=_categorica(segmento.astype(np.int64) * LOJAS_POR_SEGMENTO + loja, cadastro['lojas']),
+            valor=(df['valor'].to_numpy() * fracao)[mascara],
+            transacoes=trans[mascara],
+        )
+
+    todas = np.ones(len(df), dtype=bool)
+    return pd.concat([
+        parte(todas, base['segmento'], base['loja'], participacao, principal),
+        parte(~unico, base['segmento_2'], base['loja_2'], 1 - participacao, transacoes - principal),
+    ], ignore_index=True)
+
+
+def _top(df, chaves, ordem, n):
+    """n primeiras linhas de cada grupo pela coluna `ordem` (decrescente), com ranking"""
+    df = df.sort_values(chaves + [ordem], ascending=[True] * len(chaves) + [False], kind='stable')
+    df['ranking'] = df.groupby(chaves, observed=True, sort=False).cumcount() + 1
+    return df[df['ranking'] <= n].reset_index(drop=True)
+
+
+def _somar(df, chaves):
+    """Valor, clientes (linhas) e cupons (transações) por chaves categóricas, com rótulos em texto"""
+    resultado = df.groupby(chaves, observed=True).agg(
+        valor=('valor', 'sum'), clientes=('cliente', 'size'), cupons=('transacoes', 'sum'),
+    ).reset_index()
+    for chave in chaves:
+        resultado[chave] = resultado[chave].astype(str)
+    resultado['valor'] = resultado['valor'].round(2)
+    return resultado
+
+
+def _distribuir(df, chaves, pesos, nomes, coluna):
+    """Distribui valor e transações de cada geração pelos pesos (turno ou dia da semana)"""
+    grupos = df.groupby(list(dict.fromkeys(chaves + ['faixa_etaria'])), observed=True)[['valor', 'transacoes']].sum()
+    geracoes = pd.Index([g for g, _ in GERACOES]).get_indexer(grupos.index.get_level_values('faixa_etaria'))
+    partes = []
+    for i, nome in enumerate(nomes):
+        parte = grupos.mul(pesos[geracoes, i], axis=0).groupby(level=chaves, observed=True).sum().reset_index()
+        parte.insert(len(chaves), coluna, nome)
+        partes.append(parte)
+    resultado = pd.concat(partes, ignore_index=True)
+    for chave in chaves:
+        resultado[chave] = resultado[chave].astype(str)
+    resultado['valor'] = resultado['valor'].round(2)
+    resultado['transacoes'] = np.rint(resultado['transacoes']).astype(np.int64)
+    return resultado.sort_values(chaves + [coluna], kind='stable', ignore_index=True)
+
+
+def _demografico(linhas, chaves, coluna):
+    """qtd_clientes, valor_total e pct_clientes (dentro do grupo das chaves) por categoria"""
+    df = _somar(linhas, chaves + [coluna]).rename(columns={'clientes': 'qtd_clientes', 'valor': 'valor_total'})
+    total = df.groupby(chaves)['qtd_clientes'].transform('sum') if chaves else df['qtd_clientes'].sum()
+    df['pct_clientes'] = df['qtd_clientes'] / total * 100
+    return df
+
+
+def _personas(clientes, hs, cadastro):
+    """Persona de cada cliente por regras de gasto, idade, gênero e segmento favorito"""
+    idade = clientes['idade'].to_numpy()
+    transacoes = clientes['transacoes'].to_numpy()
+    genero = clientes['genero'].cat.codes.to_numpy()
+    segmento = clientes['segmento'].cat.codes.to_numpy()
+    ticket = clientes['valor'].to_numpy() / transacoes
+    codigos = {nome: i for i, nome in enumerate(cadastro['segmentos'])}
+    feminino = genero == GENEROS.index('Feminino')
+    masculino = genero == GENEROS.index('Masculino')
+
+    def favorito(nome):
+        return segmento == codigos.get(nome, -1)
+
+    regras = [
+        (hs & (idade >= 60), 'Senior VIP'),
+        (hs & feminino & favorito('Moda'), 'Fashionista Premium'),
+        (hs & feminino, 'Executiva Premium'),
+        (hs & masculino, 'Executivo Exigente'),
+        (hs, 'Cliente Premium'),
+        (favorito('Gastronomia'), 'Foodie'),
+        (favorito('Beleza e Bem-estar'), 'Beauty Lover'),
+        (favorito('Esportes'), 'Fitness'),
+        ((idade < 25) & (transacoes >= 3), 'Jovem Engajado'),
+        (idade < 25, 'Jovem Explorer'),
+        (idade >= 60, 'Senior Tradicional'),
+        (feminino & (idade >= 28) & (idade <= 45) & favorito('Infantil'), 'Mae Moderna'),
+        ((ticket >= np.quantile(ticket, 0.75)) & (transacoes == 1), 'Comprador Seletivo'),
+    ]
+    return np.select([c for c, _ in regras], [p for _, p in regras], default='Cliente Regular')
+
+
+def _indicadores_hs(clientes):
+    """Coluna de comparacao_high_spenders (na ordem de METRICAS_COMPARACAO_HS)"""
+    qtd = len(clientes)
+    valor = clientes['valor'].sum()
+    return [
+        float(qtd), valor, valor / qtd, clientes['transacoes'].mean(), clientes['idade'].mean(),
+        (clientes['genero'] == 'Feminino').mean() * 100, (clientes['genero'] == 'Masculino').mean() * 100,
+    ]
+
+
+
+def _tabelas_shoppings(linhas, partes_linhas, siglas):
+    """Tabelas de Por_Shopping/<sigla> (chaves de TABELAS_SHOPPING e hs_stats)"""
+    genero = _demografico(linhas, ['shopping'], 'genero')
+    faixa = _demografico(linhas, ['shopping'], 'faixa_etaria')
+    segmentos = _top(_somar(partes_linhas, ['shopping', 'segmento']), ['shopping'], 'valor', TOP_SEGMENTOS)
+    lojas = _top(_somar(partes_linhas, ['shopping', 'loja']), ['shopping'], 'valor', TOP_LOJAS)
+    periodo = _distribuir(linhas, ['shopping'], PESOS_PERIODO_DIA, PERIODOS_DIA, 'periodo_dia')
+    dia_semana = _distribuir(linhas, ['shopping'], PESOS_DIA_SEMANA, DIAS_SEMANA, 'dia_semana')
+
+    grupos = linhas.groupby('shopping', observed=True)
+    hs_stats = pd.DataFrame({
+        'total_clientes': grupos.size(),
+        'qtd_high_spenders': grupos['hs'].sum(),
+        'threshold': grupos['limite_hs'].first(),
+    })
+    hs_stats['pct_hs'] = hs_stats['qtd_high_spenders'] / hs_stats['total_clientes'] * 100
+    hs_stats.index = hs_stats.index.astype(str)
+
+    def do_shopping(df, shopping, colunas):
+        return df.loc[df['shopping'] == shopping, colunas].reset_index(drop=True)
+
+    tabelas = {}
+    for shopping, sigla in siglas.items():
+        if shopping not in hs_stats.index:
+            continue
+        tabelas[sigla] = {
+            'genero': do_shopping(genero, shopping, ['genero', 'qtd_clientes', 'valor_total', 'pct_clientes']),
+            'faixa': do_shopping(faixa, shopping, ['faixa_etaria', 'qtd_clientes', 'valor_total', 'pct_clientes']),
+            'segmentos': do_shopping(segmentos, shopping, ['segmento', 'valor', 'clientes']),
+            'lojas': do_shopping(lojas, shopping, ['loja', 'valor', 'clientes']),
+            'periodo': do_shopping(periodo, shopping, ['periodo_dia', 'valor', 'transacoes']),
+            'dia_semana': do_shopping(dia_semana, shopping, ['dia_semana', 'valor', 'transacoes']),
+            'hs_stats': hs_stats.loc[[shopping]].reset_index(drop=True),
+        }
+    return tabelas
+
+
+def _tabelas_rfv(clientes, partes_linhas, hs, com_clientes):
+    """(rfv, rfv_quintis, clientes pontuados nos quintis globais) do período"""
+    base_rfv = pd.DataFrame({
+        'cliente_id': clientes['cliente'].to_numpy() + 1,
+        'valor_periodo': clientes['valor'].round(2),
+        'frequencia': clientes['transacoes'],
+        'recencia_dias': clientes['recencia'],
+        'shopping_principal': clientes['shopping'].astype(str),
+        'genero': clientes['genero'].astype(str),
+        'segmento_principal': clientes['segmento'].astype(str),
+    })
+    perfis = base_rfv.assign(
+        perfil_historico=clientes['perfil_historico'].to_numpy(),
+        perfil_periodo=rfv_scores.perfil_por_valor(base_rfv['valor_periodo'].to_numpy()),
+    )
+
+    historico = metricas_shopping(perfis, 'perfil_historico', '_hist')
+    periodo = metricas_shopping(perfis, 'perfil_periodo', '_periodo')
+    shopping = historico.drop(columns='pct_valor').merge(
+        periodo[['shopping_principal'] + [c for c in periodo.columns if c.endswith('_periodo')]], on='shopping_principal'
+    )
+    shopping['high_spenders'] = shopping['shopping_principal'].map(
+        perfis[hs].groupby('shopping_principal').size()
+    ).fillna(0).astype(int)
+    shopping['pct_valor'] = historico['pct_valor']
+
+    segmentos = _somar(partes_linhas, ['shopping', 'perfil_historico', 'segmento'])
+    segmentos['pct_valor'] = (segmentos['valor'] / segmentos.groupby(['shopping', 'perfil_historico'])['valor'].transform('sum') * 100).round(2)
+    segmentos = _top(segmentos, ['shopping', 'perfil_historico'], 'valor', TOP10)
+    lojas = _somar(partes_linhas, ['perfil_historico', 'shopping', 'genero', 'loja']).rename(columns={'perfil_historico': 'perfil'})
+    lojas['pct_valor'] = (lojas['valor'] / lojas.groupby(['perfil', 'shopping', 'genero'])['valor'].transform('sum') * 100).round(2)
+    lojas = _top(lojas, ['perfil', 'shopping', 'genero'], 'valor', TOP10)
+
+    rfv = {
+        'perfil_historico': metricas_perfil(perfis, 'perfil_historico'),
+        'perfil_periodo': metricas_perfil(perfis, 'perfil_periodo'),
+        'shopping': shopping,
+        'seg_perfil_shop': segmentos[['shopping', 'perfil_historico', 'ranking', 'segmento', 'valor', 'pct_valor', 'cupons', 'clientes']],
+        'lojas': lojas[['perfil', 'shopping', 'genero', 'ranking', 'loja', 'valor', 'pct_valor', 'cupons', 'clientes']],
+        'resumo': pd.DataFrame([{
+            'total_clientes': len(perfis),
+            'valor_total': perfis['valor_periodo'].sum(),
+            'vip_historico': int((perfis['perfil_historico'] == 'VIP').sum()),
+            'vip_periodo': int((perfis['perfil_periodo'] == 'VIP').sum()),
+            'premium_historico': int((perfis['perfil_historico'] == 'Premium').sum()),
+            'premium_periodo': int((perfis['perfil_periodo'] == 'Premium').sum()),
+            'shoppings': perfis['shopping_principal'].nunique(),
+        }]),
+    }
+
+    quintis = {}
+    for escopo, por in [('global', None), ('shopping', 'shopping_principal')]:
+        pontuados = rfv_scores.pontuar(base_rfv, por)
+        if escopo == 'global':
+            pontuados_global = pontuados
+        if com_clientes:
+            quintis[f'clientes_{escopo}'] = pontuados
+        quintis[f'perfil_{escopo}'] = metricas_perfil(pontuados, 'perfil_quintis', com_scores=True)
+        quintis[f'shopping_{escopo}'] = metricas_shopping(pontuados, 'perfil_quintis', '_quintis', com_scores=True)
+        quintis[f'thresholds_{escopo}'] = rfv_scores.thresholds(base_rfv, por)
+    return rfv, quintis, pontuados_global
+
+
+def tabelas_periodo(clientes, base, cadastro, com_clientes):
+    """Tabelas do período no formato de ler_periodo_csv (raiz, por_shopping, rfv e rfv_quintis)
+
+    com_clientes: inclui os arquivos por cliente rfv_quintis_* (a base real só os tem
+    para meses e trimestres). Retorna (dados, extras); extras tem os clientes
+    pontuados e os top segmentos por faixa de idade, usados na raiz de Resultados.
+    """
+    siglas = dict(zip(cadastro['shoppings'], cadastro['siglas']))
+    linhas = _linhas_shopping(clientes, base, cadastro)
+    partes_clientes = _partes(clientes, base, cadastro)
+    partes_linhas = _partes(linhas, base, cadastro)
+
+    # High spenders: 10% de maior valor (global por cliente; por shopping nas linhas do shopping)
+    valor = clientes['valor'].to_numpy()
+    hs = valor >= np.quantile(valor, QUANTIL_HIGH_SPENDERS)
+    linhas['limite_hs'] = linhas.groupby('shopping', observed=True)['valor'].transform(
+        lambda v: v.quantile(QUANTIL_HIGH_SPENDERS)
+    )
+    linhas['hs'] = linhas['valor'] >= linhas['limite_hs']
+
+    grupos = linhas.groupby('shopping', observed=True)
+    resumo = pd.DataFrame({
+        'transacoes': grupos['transacoes'].sum(),
+        'clientes': grupos.size(),
+        'valor_total': grupos['valor'].sum().round(2),
+        'idade_media': grupos['idade'].mean(),
+        'threshold_hs': grupos['limite_hs'].first(),
+        'qtd_high_spenders': grupos['hs'].sum(),
+    }).reset_index()
+    resumo['shopping'] = resumo['shopping'].astype(str)
+    resumo.insert(1, 'sigla', resumo['shopping'].map(siglas))
+    resumo.insert(5, 'ticket_medio', resumo['valor_total'] / resumo['clientes'])
+    dados = {'resumo': resumo.sort_values('valor_total', ascending=False, ignore_index=True)}
+
+    for chave, coluna in [('genero', 'genero'), ('faixa', 'faixa_etaria')]:
+        df = _demografico(linhas, ['shopping'], coluna)
+        df.insert(0, 'sigla', df.pop('shopping').map(siglas))
+        dados[chave] = df[['sigla', coluna, 'qtd_clientes', 'pct_clientes', 'valor_total']]
+    segmentos = _somar(partes_linhas, ['shopping', 'segmento']).sort_values(['shopping', 'valor'], ascending=[True, False])
+    segmentos.insert(0, 'sigla', segmentos.pop('shopping').map(siglas))
+    dados['segmentos'] = segmentos[['sigla', 'segmento', 'valor', 'clientes']].reset_index(drop=True)
+
+    personas = clientes.assign(persona=_personas(clientes, hs, cadastro)).groupby('persona').agg(
+        qtd_clientes=('cliente', 'size'), valor_total=('valor', 'sum'),
+        freq_media=('transacoes', 'mean'), idade_media=('idade', 'mean'),
+    )
+    personas.insert(2, 'ticket_medio', personas['valor_total'] / personas['qtd_clientes'])
+    personas['pct_clientes'] = personas['qtd_clientes'] / personas['qtd_clientes'].sum() * 100
+    personas['pct_valor'] = personas['valor_total'] / personas['valor_total'].sum() * 100
+    personas['valor_total'] = personas['valor_total'].round(2)
+    dados['personas'] = personas.sort_values('valor_total', ascending=False).reset_index()
+
+    dados['comparacao_hs'] = pd.DataFrame({
+        'Metrica': METRICAS_COMPARACAO_HS,
+        'High Spenders': _indicadores_hs(clientes[hs]),
+        'Demais Clientes': _indicadores_hs(clientes[~hs]),
+    })
+    for chave, coluna in [('hs_por_genero', 'genero'), ('hs_por_faixa', 'faixa_etaria')]:
+        df = _somar(clientes[hs], [coluna]).rename(columns={'clientes': 'qtd_hs', 'valor': 'valor_total'})
+        df['ticket_medio'] = df['valor_total'] / df['qtd_hs']
+        df['pct_hs'] = df['qtd_hs'] / hs.sum() * 100
+        dados[chave] = df[[coluna, 'qtd_hs', 'valor_total', 'ticket_medio', 'pct_hs']]
+
+    matriz = _somar(clientes, ['faixa_etaria', 'genero'])
+    qtd = matriz.pivot(index='faixa_etaria', columns='genero', values='clientes').fillna(0)
+    valor_matriz = matriz.pivot(index='faixa_etaria', columns='genero', values='valor').fillna(0)
+    dados['matriz_clientes'] = qtd.astype(int).rename_axis(columns=None).reset_index()
+    dados['matriz_valor'] = valor_matriz.round(2).rename_axis(columns=None).reset_index()
+    dados['matriz_ticket'] = (valor_matriz / qtd.where(qtd > 0)).fillna(0).rename_axis(columns=None).reset_index()
+
+    for chave, coluna in [('segmentos_por_genero', 'genero'), ('segmentos_por_faixa', 'faixa_etaria')]:
+        df = _top(_somar(partes_clientes, [coluna, 'segmento']), [coluna], 'valor', TOP_POR_CHAVE)
+        dados[chave] = df[[coluna, 'segmento', 'valor', 'clientes', 'ranking']]
+
+    dados['comportamento_periodo'] = _distribuir(clientes, ['faixa_etaria'], PESOS_PERIODO_DIA, PERIODOS_DIA, 'periodo_dia')
+    dados['comportamento_dia'] = _distribuir(clientes, ['faixa_etaria'], PESOS_DIA_SEMANA, DIAS_SEMANA, 'dia_semana')
+
+    dados['por_shopping'] = _tabelas_shoppings(linhas, partes_linhas, siglas)
+    dados['rfv'], dados['rfv_quintis'], pontuados = _tabelas_rfv(clientes, partes_linhas, hs, com_clientes)
+
+    segmentos_idade = _top(_somar(partes_clientes, ['faixa_idade', 'segmento']), ['faixa_idade'], 'valor', TOP_POR_CHAVE)
+    extras = {
+        'clientes_rfv': pontuados,
+        'segmentos_por_faixa_idade': segmentos_idade.rename(columns={'faixa_idade': 'faixa_etaria'})[
+            ['faixa_etaria', 'segmento', 'valor', 'clientes', 'ranking']
+        ],
+    }
+    return dados, extras
+
+
+# =============================================================================
+# GRAVAÇÃO
+# =============================================================================
+
+def _escrever_tabelas(pasta, tabelas, arquivos):
+    os.makedirs(pasta, exist_ok=True)
+    for chave, arquivo in arquivos.items():
+        if chave in tabelas:
+            tabelas[chave].to_csv(f'{pasta}/{arquivo}', index=False, **OPCOES_LEITURA.get(arquivo, {}))
+
+
+def escrever_periodo(dados, base_path):
+    """Grava as tabelas do período com os nomes de arquivo lidos por dados_periodo"""
+    _escrever_tabelas(base_path, dados, TABELAS_PERIODO)
+    for sigla, tabelas in dados['por_shopping'].items():
+        _escrever_tabelas(f'{base_path}/Por_Shopping/{sigla}', tabelas, {**TABELAS_SHOPPING, **TABELAS_SHOPPING_OPCIONAIS})
+    _escrever_tabelas(f'{base_path}/RFV', dados['rfv'], {**TABELAS_RFV, **TABELAS_RFV_OPCIONAIS})
+    _escrever_tabelas(f'{base_path}/RFV', dados['rfv_quintis'], TABELAS_RFV_QUINTIS)
+
+
+def _data_hora(dias, rng):
+    """Dias desde 1970-01-01 -> 'AAAA-MM-DD HH:MM:SS' com horário entre 10h e 22h"""
+    momentos = pd.to_datetime(dias, unit='D') + pd.to_timedelta(rng.integers(10 * 3600, 22 * 3600, len(dias)), unit='s')
+    return momentos.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def top_consumidores(pontuados, base, primeiro, ultimo, cadastro, rng):
+    """top_consumidores_rfv.csv: os TOP_CONSUMIDORES de maior valor de cada shopping (dados pessoais fictícios)"""
+    top = _top(pontuados, ['shopping_principal'], 'valor_periodo', TOP_CONSUMIDORES)
+    idx = top['cliente_id'].to_numpy() - 1
+    qtd = len(top)
+    cidades = dict(zip(cadastro['shoppings'], cadastro['cidades']))
+    primeiros = np.where(top['genero'] == 'Masculino', rng.choice(NOMES_MASCULINOS, qtd), rng.choice(NOMES_FEMININOS, qtd))
+    nomes = [f'{n} {s1} {s2}' for n, s1, s2 in zip(primeiros, rng.choice(SOBRENOMES, qtd), rng.choice(SOBRENOMES, qtd))]
+    valor_segmento = (top['valor_periodo'].to_numpy() * base['participacao'][idx]).round(2)
+    return pd.DataFrame({
+        'Ranking': top['ranking'],
+        'Shopping': top['shopping_principal'],
+        'Cliente_ID': top['cliente_id'],
+        'Nome': nomes,
+        'CPF': rng.integers(10 ** 9, 10 ** 11, qtd),
+        'Email': [f'{n.split()[0].lower()}{c}@exemplo.com.br' for n, c in zip(nomes, top['cliente_id'])],
+        'Celular': 47990000000 + rng.integers(0, 10 ** 7, qtd),
+        'Logradouro': [f'Rua {n}' for n in rng.integers(1, 3000, qtd)],
+        'Numero': rng.integers(1, 2000, qtd),
+        'Complemento': np.where(rng.random(qtd) < 0.4, [f'apto {n}' for n in rng.integers(101, 2001, qtd)], ''),
+        'Bairro': rng.choice(BAIRROS, qtd),
+        'Cidade': top['shopping_principal'].map(cidades),
+        'Estado': 'SC',
+        'CEP': rng.integers(88000000, 89999999, qtd),
+        'Genero': top['genero'],
+        'Valor_Total': top['valor_periodo'],
+        'Frequencia_Compras': top['frequencia'],
+        'Recencia_Dias': top['recencia_dias'],
+        'Data_Primeira_Compra': _data_hora(primeiro[idx], rng),
+        'Data_Ultima_Compra': _data_hora(ultimo[idx], rng),
+        'Segmento_Principal': top['segmento_principal'],
+        'Valor_Segmento_Principal': valor_segmento,
+        'Loja_Favorita': np.asarray(cadastro['lojas'])[base['segmento'][idx].astype(np.int64) * LOJAS_POR_SEGMENTO + base['loja'][idx]],
+        'Valor_Loja_Favorita': (valor_segmento * rng.uniform(0.6, 1.0, qtd)).round(2),
+        'Score_Recencia': top['R_score'],
+        'Score_Frequencia': top['F_score'],
+        'Score_Valor': top['V_score'],
+        'Score_Total_RFV': top['score_total'],
+        'Perfil_Cliente': top['perfil_quintis'],
+    })
+
+
+# =============================================================================
+# GERAÇÃO DA ÁRVORE
+# =============================================================================
+
+def montar_cadastro(qtd_shoppings, qtd_segmentos):
+    """Rótulos de shoppings, segmentos e lojas (os códigos dos clientes indexam estas listas)"""
+    shoppings = cadastro_shoppings(qtd_shoppings)
+    segmentos, _, _ = cadastro_segmentos(qtd_segmentos)
+    return {
+        'siglas': [s for s, _, _ in shoppings],
+        'shoppings': [n for _, n, _ in shoppings],
+        'cidades': [c for _, _, c in shoppings],
+        'segmentos': segmentos,
+        'lojas': [f'{s} {k + 1:02d}' for s in segmentos for k in range(LOJAS_POR_SEGMENTO)],
+    }
+
+
+def gerar(saida, qtd_clientes, qtd_shoppings=6, qtd_meses=26, qtd_segmentos=17, inicio='2024-01',
+          semente=42, avisar=print):
+    """Gera a árvore Resultados em `saida`; retorna o índice de períodos gravado"""
+    meses = pd.period_range(inicio, periods=qtd_meses, freq='M')
+    cadastro = montar_cadastro(qtd_shoppings, qtd_segmentos)
+    base = gerar_clientes(qtd_clientes, qtd_shoppings, qtd_segmentos, qtd_meses, meses[-1].year,
+                          np.random.default_rng(semente))
+
+    # Cada período é gravado quando o seu último mês é simulado
+    ultimo_mes, indice = {}, {}
+    for i, mes in enumerate(meses):
+        for tipo, codigo, nome, pasta in pastas_do_mes(mes):
+            ultimo_mes[pasta] = i
+            indice.setdefault(pasta, {'tipo': tipo, 'codigo': codigo, 'nome': nome, 'pasta': pasta})
+
+    primeira_compra = np.full(qtd_clientes, -1, dtype=np.int32)
+    abertos = {}
+    for i, mes in enumerate(meses):
+        ativos, frequencia, valor, primeiro, ultimo = simular_mes(base, i, mes, semente)
+        novos = primeira_compra[ativos] < 0
+        primeira_compra[ativos[novos]] = primeiro[novos]
+        for _, _, _, pasta in pastas_do_mes(mes):
+            if pasta not in abertos:
+                abertos[pasta] = _novo_acumulador(qtd_clientes)
+            _acumular(abertos[pasta], ativos, frequencia, valor, ultimo)
+
+        # O Completo acumula todos os meses até aqui: é o valor histórico dos períodos que terminam no mês
+        historico = abertos['Completo']['valor']
+        fim = _dia(mes.end_time)
+        for pasta in [p for p in abertos if ultimo_mes[p] == i]:
+            t0 = time.perf_counter()
+            acumulador = abertos.pop(pasta)
+            clientes = clientes_periodo(acumulador, historico, fim, base, cadastro)
+            dados, extras = tabelas_periodo(clientes, base, cadastro, indice[pasta]['tipo'] in ('Mes', 'Trimestre'))
+            escrever_periodo(dados, f'{saida}/{pasta}')
+            if pasta == 'Completo':
+                extras['segmentos_por_faixa_idade'].to_csv(f'{saida}/top_segmentos_por_faixa.csv', index=False)
+                top_consumidores(extras['clientes_rfv'], base, primeira_compra, acumulador['ultimo'], cadastro,
+                                 np.random.default_rng([semente, 0])).to_csv(
+                    f'{saida}/top_consumidores_rfv.csv', sep=';', decimal=',', index=False, encoding='utf-8-sig'
+                )
+            avisar(f'{pasta}: {len(clientes):,} clientes em {time.perf_counter() - t0:.1f}s')
+
+    ordem_tipos = ['Completo', 'Ano', 'Trimestre', 'Mes']
+    df_indice = pd.DataFrame(sorted(indice.values(), key=lambda p: (ordem_tipos.index(p['tipo']), p['codigo'])))
+    df_indice.to_csv(f'{saida}/indice_periodos.csv', index=False)
+    return df_indice
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Gera uma árvore Resultados sintética para testes de carga')
+    parser.add_argument('--saida', default='Sintetico/Resultados', help='Pasta Resultados a gerar')
+    parser.add_argument('--clientes', type=int, default=2_500_000, help='Clientes na base (a real tem ~250 mil)')
+    parser.add_argument('--shoppings', type=int, default=6, help='Quantidade de shoppings')
+    parser.add_argument('--meses', type=int, default=26, help='Quantidade de meses')
+    parser.add_argument('--segmentos', type=int, default=17, help='Quantidade de segmentos')
+    parser.add_argument('--inicio', default='2024-01', help='Primeiro mês (AAAA-MM)')
+    parser.add_argument('--semente', type=int, default=42, help='Semente (mesma semente, mesmos arquivos)')
+    parser.add_argument('--bundles', action='store_true', help='Compila os bundles dos períodos gerados')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    indice = gerar(args.saida, args.clientes, args.shoppings, args.meses, args.segmentos, args.inicio, args.semente)
+    if args.bundles:
+        for pasta, status in compilar_bundles(args.saida, forcar=True):
+            print(f'{pasta}: bundle {status}')
+    print(f'{len(indice)} períodos em {args.saida} ({time.perf_counter() - t0:.0f}s)')
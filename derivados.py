@@ -0,0 +1,121 @@
+"""
+TABELAS DERIVADAS DO PERÍODO
+Pivôs, totais e ordenações que as páginas montavam a cada rerun a partir das
+mesmas tabelas do período (comportamento por turno/dia, faixa etária por
+shopping, percentual por gênero, resumo ordenado por valor).
+
+Cada derivada é uma função de `dados` que devolve um DataFrame pronto para o
+gráfico ou a tabela. O bundle compilado (dados_periodo.compilar_bundle) grava as
+derivadas em 'derivados/<nome>'; sem bundle atualizado, cada uma é calculada no
+primeiro acesso e fica no cache de períodos, compartilhada entre as sessões.
+Na página resta só o filtro de shoppings permitidos (filtrar_shoppings), que
+vale também para as derivadas.
+
+Os pivôs são gravados com o índice como primeira coluna (o bundle não guarda
+índice); a página faz set_index nessa coluna para o heatmap.
+"""
+
+# Muda quando alguma derivada muda: bundles com outra versão recalculam na leitura
+VERSAO_DERIVADOS = 1
+
+# Faixas etárias nos dois rótulos usados pelos resultados (idade e geração)
+ORDEM_FAIXAS = [
+    '16-24 (Gen Z)', '25-39 (Millennials)', '40-54 (Gen X)', '55-69 (Boomers)', '70+ (Silent)',
+    'Gen Z (1997-2012)', 'Millennials (1981-1996)', 'Gen X (1965-1980)', 'Boomers (1946-1964)', 'Silent (antes 1946)',
+    'Nao Informado',
+]
+ORDEM_DIAS = ['Segunda', 'Terca', 'Quarta', 'Quinta', 'Sexta', 'Sabado', 'Domingo']
+
+
+def _pivo(df, valores, linhas, colunas, ordem_linhas=None, ordem_colunas=None):
+    """pivot_table com rótulos em texto, na ordem informada, e a coluna de linhas de volta como coluna"""
+    pivo = df.pivot_table(values=valores, index=linhas, columns=colunas, fill_value=0, observed=True)
+    pivo.index = pivo.index.astype(str)
+    pivo.columns = pivo.columns.astype(str)
+    if ordem_linhas is not None:
+        pivo = pivo.reindex([f for f in ordem_linhas if f in pivo.index])
+    if ordem_colunas is not None:
+        pivo = pivo[[c for c in ordem_colunas if c in pivo.columns]]
+    return pivo.rename_axis(index=linhas, columns=None).reset_index()
+
+
+def _totais(df, chave):
+    return df.groupby(chave, observed=True)[['valor', 'transacoes']].sum().reset_index()
+
+
+# =============================================================================
+# DERIVADAS
+# =============================================================================
+
+def comportamento_periodo_total(dados):
+    """Valor e transações por turno (todas as faixas)"""
+    return _totais(dados['comportamento_periodo'], 'periodo_dia')
+
+
+def comportamento_periodo_faixa(dados):
+    """Valor por faixa etária (linhas) e turno (colunas)"""
+    return _pivo(dados['comportamento_periodo'], 'valor', 'faixa_etaria', 'periodo_dia', ORDEM_FAIXAS)
+
+
+def comportamento_dia_total(dados):
+    """Valor e transações por dia da semana, de segunda a domingo"""
+    totais = _totais(dados['comportamento_dia'], 'dia_semana')
+    ordem = totais['dia_semana'].astype(str).map({d: i for i, d in enumerate(ORDEM_DIAS)})
+    return totais.iloc[ordem.argsort(kind='stable')].reset_index(drop=True)
+
+
+def comportamento_dia_faixa(dados):
+    """Valor por faixa etária (linhas) e dia da semana (colunas, de segunda a domingo)"""
+    return _pivo(dados['comportamento_dia'], 'valor', 'faixa_etaria', 'dia_semana', ORDEM_FAIXAS, ORDEM_DIAS)
+
+
+def genero_pct_shopping(dados):
+    """% de clientes por gênero (colunas) em cada shopping (linhas)"""
+    return _pivo(dados['genero'], 'pct_clientes', 'sigla', 'genero').round(1)
+
+
+def faixa_por_shopping(dados):
+    """Tabela de faixa etária ordenada por shopping e faixa (barras empilhadas)"""
+    ordem = dados['faixa']['faixa_etaria'].astype(str).map({f: i for i, f in enumerate(ORDEM_FAIXAS)})
+    return (
+        dados['faixa'].assign(ordem=ordem)
+        .sort_values(['sigla', 'ordem'])
+        .drop(columns='ordem')
+        .reset_index(drop=True)
+    )
+
+
+def faixa_heatmap_shopping(dados):
+    """Clientes por faixa etária (linhas) e shopping (colunas)"""
+    return _pivo(dados['faixa'], 'qtd_clientes', 'faixa_etaria', 'sigla', ORDEM_FAIXAS)
+
+
+def resumo_por_valor(dados):
+    """Resumo por shopping em ordem crescente de valor (barras horizontais)"""
+    return dados['resumo'].sort_values('valor_total', ascending=True).reset_index(drop=True)
+
+
+# Nome da derivada -> função de `dados`
+DERIVADOS = {
+    'comportamento_periodo_total': comportamento_periodo_total,
+    'comportamento_periodo_faixa': comportamento_periodo_faixa,
+    'comportamento_dia_total': comportamento_dia_total,
+    'comportamento_dia_faixa': comportamento_dia_faixa,
+    'genero_pct_shopping': genero_pct_shopping,
+    'faixa_por_shopping': faixa_por_shopping,
+    'faixa_heatmap_shopping': faixa_heatmap_shopping,
+    'resumo_por_valor': resumo_por_valor,
+}
+
+# Derivadas com um shopping por coluna (as demais têm a coluna 'sigla' nas linhas)
+DERIVADOS_SHOPPING_NAS_COLUNAS = {'faixa_heatmap_shopping'}
+
+
+def calcular_derivados(dados):
+    """{nome: DataFrame} com todas as derivadas do período (compilação do bundle)"""
+    return {nome: funcao(dados) for nome, funcao in DERIVADOS.items()}
+
+
+def filtrar_colunas_shopping(df, shoppings):
+    """Derivada com shoppings nas colunas restrita aos informados (a primeira coluna é o rótulo das linhas)"""
+    return df[[df.columns[0]] + [c for c in df.columns[1:] if c in shoppings]]
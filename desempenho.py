@@ -0,0 +1,195 @@
+"""
+DESEMPENHO DOS RERUNS
+Instrumentação do script do dashboard: cada rerun cronometra suas etapas
+(autenticação, carga de dados, filtro de shoppings, logs, gráficos Plotly e o
+bloco da página) e, ao final, grava as durações no registro do processo, que
+agrega latências p50/p95 por página e etapa.
+
+Uso no script:
+    iniciar_execucao(registro)             # início do rerun
+    with medir('carregar_dados'):          # etapa com bloco
+        ...
+    with medir('plotly', acumular=True):   # etapa repetida: soma as chamadas do rerun
+        ...
+    iniciar_etapa('pagina')                # etapa aberta até o fim do rerun
+    finalizar_execucao(pagina)             # grava as etapas e o total no registro
+
+    @st.fragment
+    @medir_fragmento('🏆 Top Consumidores › lista')  # reruns só do fragmento
+    def lista(...):
+
+A execução corrente fica na thread (cada sessão do Streamlit roda o script na
+sua própria thread); medir() fora de uma execução não faz nada. Reruns
+interrompidos (st.stop, troca de widget no meio) não são gravados. Um rerun
+só de um fragmento (st.fragment) não passa pelo script: medir_fragmento abre
+a execução dele no registro do último rerun completo e grava com o nome dado.
+"""
+
+import time
+import functools
+import threading
+from datetime import datetime
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+AMOSTRAS_POR_ETAPA = 500  # últimas durações guardadas por (página, etapa)
+ETAPA_TOTAL = 'total'
+
+# Funções (pagina, duracoes) chamadas a cada rerun gravado (ex.: benchmark_paginas.py)
+OBSERVADORES = []
+
+_local = threading.local()
+_registro = None  # registro do último iniciar_execucao (usado pelos fragmentos)
+
+
+# =============================================================================
+# REGISTRO DO PROCESSO
+# =============================================================================
+
+class RegistroDesempenho:
+    """Durações das últimas AMOSTRAS_POR_ETAPA execuções de cada (página, etapa)"""
+
+    def __init__(self, amostras_por_etapa=AMOSTRAS_POR_ETAPA):
+        self.amostras_por_etapa = amostras_por_etapa
+        self._trava = threading.Lock()
+        self._amostras = {}  # (pagina, etapa) -> deque[(timestamp, ms)]
+        self.execucoes = 0
+
+    def registrar(self, pagina, duracoes):
+        """Grava as durações (etapa -> ms) de uma execução da página"""
+        momento = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with self._trava:
+            for etapa, ms in duracoes.items():
+                chave = (pagina, etapa)
+                if chave not in self._amostras:
+                    self._amostras[chave] = deque(maxlen=self.amostras_por_etapa)
+                self._amostras[chave].append((momento, ms))
+            self.execucoes += 1
+
+    def resumo(self):
+        """Uma linha por (página, etapa): amostras, média, p50, p95 e máximo em ms"""
+        with self._trava:
+            itens = [(chave, np.array([ms for _, ms in amostras])) for chave, amostras in self._amostras.items()]
+        linhas = []
+        for (pagina, etapa), ms in itens:
+            p50, p95 = np.percentile(ms, [50, 95])
+            linhas.append({
+                'pagina': pagina, 'etapa': etapa, 'amostras': len(ms),
+                'media_ms': float(ms.mean()), 'p50_ms': float(p50), 'p95_ms': float(p95), 'max_ms': float(ms.max()),
+            })
+        return sorted(linhas, key=lambda l: (l['pagina'], l['etapa'] != ETAPA_TOTAL, -l['p95_ms']))
+
+    def amostras(self):
+        """Todas as amostras guardadas: [(timestamp, pagina, etapa, ms)]"""
+        with self._trava:
+            return sorted(
+                (momento, pagina, etapa, ms)
+                for (pagina, etapa), amostras in self._amostras.items()
+                for momento, ms in amostras
+            )
+
+    def limpar(self):
+        with self._trava:
+            self._amostras.clear()
+            self.execucoes = 0
+
+
+# =============================================================================
+# EXECUÇÃO (UM RERUN)
+# =============================================================================
+
+class Execucao:
+    """Etapas cronometradas de um rerun"""
+
+    def __init__(self, registro):
+        self.registro = registro
+        self.inicio = time.perf_counter()
+        self.duracoes = {}   # etapa -> ms (ordem de início)
+        self._abertas = {}   # etapa -> perf_counter do início
+
+    @contextmanager
+    def medir(self, etapa, acumular=False):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - inicio) * 1000
+            self.duracoes[etapa] = self.duracoes.get(etapa, 0.0) + ms if acumular else ms
+
+    def iniciar_etapa(self, etapa):
+        """Abre uma etapa que vai até finalizar()"""
+        self._abertas[etapa] = time.perf_counter()
+
+    def finalizar(self, pagina):
+        """Fecha as etapas abertas, calcula o total e grava no registro"""
+        agora = time.perf_counter()
+        for etapa, inicio in self._abertas.items():
+            self.duracoes[etapa] = (agora - inicio) * 1000
+        self._abertas.clear()
+        self.duracoes[ETAPA_TOTAL] = (agora - self.inicio) * 1000
+        self.registro.registrar(pagina, self.duracoes)
+        for observador in OBSERVADORES:
+            observador(pagina, dict(self.duracoes))
+        return self.duracoes
+
+
+def iniciar_execucao(registro):
+    """Começa a cronometrar o rerun da thread atual"""
+    global _registro
+    _registro = registro
+    _local.execucao = Execucao(registro)
+    return _local.execucao
+
+
+def execucao_atual():
+    return getattr(_local, 'execucao', None)
+
+
+@contextmanager
+def medir(etapa, acumular=False):
+    """Cronometra o bloco na execução da thread (sem execução, só executa o bloco)"""
+    execucao = execucao_atual()
+    if execucao is None:
+        yield
+        return
+    with execucao.medir(etapa, acumular):
+        yield
+
+
+def iniciar_etapa(etapa):
+    execucao = execucao_atual()
+    if execucao is not None:
+        execucao.iniciar_etapa(etapa)
+
+
+def finalizar_execucao(pagina):
+    """Grava o rerun da thread no registro; retorna as durações (etapa -> ms) ou None"""
+    execucao = execucao_atual()
+    if execucao is None:
+        return None
+    _local.execucao = None
+    return execucao.finalizar(pagina)
+
+
+def medir_fragmento(pagina):
+    """Decorador do corpo de um fragmento: grava como `pagina` os reruns só do fragmento
+
+    Dentro de um rerun completo o fragmento só soma nas etapas do script.
+    """
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def envolvida(*args, **kwargs):
+            if execucao_atual() is not None or _registro is None:
+                return funcao(*args, **kwargs)
+            iniciar_execucao(_registro)
+            try:
+                resultado = funcao(*args, **kwargs)
+            except BaseException:
+                _local.execucao = None
+                raise
+            finalizar_execucao(pagina)
+            return resultado
+        return envolvida
+    return decorador
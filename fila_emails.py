@@ -0,0 +1,246 @@
+"""
+FILA DE EMAILS
+Envio em segundo plano das mensagens do formulário "Fale Conosco".
+
+enfileirar() só grava a mensagem numa fila SQLite local (EMAILS_FILA) e retorna;
+uma thread envia as pendentes pelo transporte, reaproveitando uma única conexão
+SMTP autenticada entre mensagens.
+
+- Falhas são repetidas por mensagem com espera exponencial (ESPERA_INICIAL,
+  dobrando até ESPERA_MAXIMA) por até TENTATIVAS_EMAIL vezes; depois disso a
+  mensagem fica marcada como 'falhou' com o último erro
+- Mensagens não enviadas sobrevivem a reinícios e são reenviadas
+- Ao encerrar o processo (atexit) é feita uma última rodada de envio
+
+Transportes (interface: enviar(mensagem), fechar()):
+- TransporteSMTP: conexão SMTP aberta e autenticada na primeira mensagem e
+  reaproveitada; é refeita se ficar ociosa por OCIOSIDADE_SMTP segundos ou se o
+  servidor a derrubar. Sem usuário/senha não faz login e com starttls=False não
+  negocia TLS, o que permite testar contra um servidor SMTP local (ex.: aiosmtpd)
+- Qualquer objeto com os mesmos métodos (ex.: um que guarde as mensagens em lista)
+"""
+
+import time
+import email
+import atexit
+import smtplib
+import sqlite3
+import threading
+from email import policy
+
+TENTATIVAS_EMAIL = 6
+ESPERA_INICIAL = 5.0      # segundos
+ESPERA_MAXIMA = 600.0
+OCIOSIDADE_SMTP = 60.0    # segundos sem uso antes de reabrir a conexão
+TIMEOUT_SMTP = 20.0
+INTERVALO_VERIFICACAO = 30.0  # sem novidades, a thread confere a fila nesse intervalo
+TIMEOUT_ENCERRAMENTO = 10.0
+
+PENDENTE = 'pendente'
+ENVIADO = 'enviado'
+FALHOU = 'falhou'
+
+
+# =============================================================================
+# TRANSPORTE SMTP
+# =============================================================================
+
+class TransporteSMTP:
+    """Uma conexão SMTP autenticada, reaproveitada entre mensagens"""
+
+    def __init__(self, host, porta, usuario=None, senha=None, starttls=True, timeout=TIMEOUT_SMTP):
+        self.host = host
+        self.porta = porta
+        self.usuario = usuario
+        self.senha = senha
+        self.starttls = starttls
+        self.timeout = timeout
+        self._smtp = None
+        self._ultimo_uso = 0.0
+        self.conexoes = 0
+
+    def _conectar(self):
+        smtp = smtplib.SMTP(self.host, self.porta, timeout=self.timeout)
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if self.usuario and self.senha:
+                smtp.login(self.usuario, self.senha)
+        except Exception:
+            smtp.close()
+            raise
+        self.conexoes += 1
+        return smtp
+
+    def enviar(self, mensagem):
+        if self._smtp is not None and time.monotonic() - self._ultimo_uso > OCIOSIDADE_SMTP:
+            self.fechar()
+        # Uma conexão reaproveitada pode ter sido derrubada pelo servidor: reabre uma vez
+        for reaproveitada in ([True, False] if self._smtp is not None else [False]):
+            if self._smtp is None:
+                self._smtp = self._conectar()
+            try:
+                self._smtp.send_message(mensagem)
+                self._ultimo_uso = time.monotonic()
+                return
+            except smtplib.SMTPServerDisconnected:
+                self._smtp = None
+                if not reaproveitada:
+                    raise
+            except Exception:
+                self.fechar()
+                raise
+
+    def fechar(self):
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            self._smtp.close()
+        self._smtp = None
+
+
+# =============================================================================
+# FILA PERSISTENTE
+# =============================================================================
+
+class FilaEmails:
+    """Fila SQLite de mensagens com uma thread de envio
+
+    transporte: objeto com enviar(mensagem) e fechar().
+    caminho: arquivo SQLite da fila (':memory:' não sobrevive a reinícios).
+    """
+
+    def __init__(self, transporte, caminho=':memory:', tentativas=TENTATIVAS_EMAIL,
+                 espera_inicial=ESPERA_INICIAL, espera_maxima=ESPERA_MAXIMA):
+        self.transporte = transporte
+        self.caminho = caminho
+        self.tentativas = tentativas
+        self.espera_inicial = espera_inicial
+        self.espera_maxima = espera_maxima
+
+        self._trava = threading.Lock()
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False, isolation_level=None)
+        self._conexao.execute('PRAGMA journal_mode=WAL')
+        self._conexao.execute(
+            'CREATE TABLE IF NOT EXISTS emails ('
+            'id INTEGER PRIMARY KEY, mensagem BLOB NOT NULL, criado REAL NOT NULL, '
+            "situacao TEXT NOT NULL DEFAULT 'pendente', tentativas INTEGER NOT NULL DEFAULT 0, "
+            'proxima REAL NOT NULL DEFAULT 0, erro TEXT)'
+        )
+        self._conexao.execute('CREATE INDEX IF NOT EXISTS emails_pendentes ON emails (situacao, proxima)')
+        # Pendentes de uma execução anterior são reenviados já, sem esperar o backoff antigo
+        self._conexao.execute('UPDATE emails SET proxima = 0 WHERE situacao = ?', (PENDENTE,))
+
+        self._condicao = threading.Condition()
+        self._parar = False
+        self.enviados = 0
+        self.ultimo_erro = None
+
+        self._thread = threading.Thread(target=self._executar, name='fila-emails', daemon=True)
+        self._thread.start()
+        atexit.register(self.encerrar)
+
+    def enfileirar(self, mensagem):
+        """Grava a mensagem na fila e retorna o id (o envio fica com a thread)"""
+        with self._trava:
+            cursor = self._conexao.execute(
+                'INSERT INTO emails (mensagem, criado) VALUES (?, ?)', (mensagem.as_bytes(), time.time())
+            )
+        with self._condicao:
+            self._condicao.notify()
+        return cursor.lastrowid
+
+    def situacao(self, id_):
+        """(situação, tentativas, último erro) de uma mensagem"""
+        with self._trava:
+            return self._conexao.execute(
+                'SELECT situacao, tentativas, erro FROM emails WHERE id = ?', (id_,)
+            ).fetchone()
+
+    def aguardar(self, id_, timeout):
+        """Espera a mensagem sair de 'pendente' por até `timeout` segundos; retorna a situação"""
+        limite = time.monotonic() + timeout
+        while True:
+            situacao = self.situacao(id_)
+            if situacao is None or situacao[0] != PENDENTE or time.monotonic() >= limite:
+                return situacao
+            time.sleep(0.05)
+
+    def _proximas(self):
+        with self._trava:
+            return self._conexao.execute(
+                'SELECT id, mensagem, tentativas FROM emails WHERE situacao = ? AND proxima <= ? ORDER BY id',
+                (PENDENTE, time.time())
+            ).fetchall()
+
+    def _proxima_espera(self):
+        """Segundos até a próxima mensagem em espera de nova tentativa"""
+        with self._trava:
+            proxima = self._conexao.execute(
+                'SELECT MIN(proxima) FROM emails WHERE situacao = ?', (PENDENTE,)
+            ).fetchone()[0]
+        if proxima is None:
+            return INTERVALO_VERIFICACAO
+        return min(max(proxima - time.time(), 0), INTERVALO_VERIFICACAO)
+
+    def _executar(self):
+        while True:
+            with self._condicao:
+                if not self._parar:
+                    self._condicao.wait(timeout=self._proxima_espera())
+                parar = self._parar
+            for id_, dados, tentativas in self._proximas():
+                self._enviar(id_, dados, tentativas + 1)
+                if self._parar and not parar:
+                    break
+            if parar:
+                self.transporte.fechar()
+                return
+
+    def _enviar(self, id_, dados, tentativa):
+        mensagem = email.message_from_bytes(dados, policy=policy.SMTP)
+        try:
+            self.transporte.enviar(mensagem)
+        except Exception as e:
+            self.ultimo_erro = str(e)
+            situacao = FALHOU if tentativa >= self.tentativas else PENDENTE
+            espera = min(self.espera_inicial * 2 ** (tentativa - 1), self.espera_maxima)
+            with self._trava:
+                self._conexao.execute(
+                    'UPDATE emails SET situacao = ?, tentativas = ?, proxima = ?, erro = ? WHERE id = ?',
+                    (situacao, tentativa, time.time() + espera, str(e), id_)
+                )
+            return
+        self.enviados += 1
+        self.ultimo_erro = None
+        with self._trava:
+            self._conexao.execute(
+                'UPDATE emails SET situacao = ?, tentativas = ?, erro = NULL WHERE id = ?', (ENVIADO, tentativa, id_)
+            )
+
+    def encerrar(self, timeout=TIMEOUT_ENCERRAMENTO):
+        """Faz uma última rodada de envio e finaliza a thread (o que falhar fica na fila)"""
+        with self._condicao:
+            self._parar = True
+            self._condicao.notify_all()
+        self._thread.join(timeout)
+
+    def estatisticas(self):
+        with self._trava:
+            contagem = dict(self._conexao.execute('SELECT situacao, COUNT(*) FROM emails GROUP BY situacao').fetchall())
+        return {
+            'pendentes': contagem.get(PENDENTE, 0),
+            'enviados': contagem.get(ENVIADO, 0),
+            'falhas': contagem.get(FALHOU, 0),
+            'ultimo_erro': self.ultimo_erro,
+        }
+
+
+def abrir_fila(transporte, caminho):
+    """Fila no arquivo informado; sem permissão de escrita, fica só em memória"""
+    try:
+        return FilaEmails(transporte, caminho)
+    except sqlite3.Error:
+        return FilaEmails(transporte, ':memory:')
@@ -0,0 +1,221 @@
+"""
+FORMATAÇÃO DAS TABELAS E RÓTULOS
+Formatos de exibição (moeda, milhões, percentual, contagem...) num só lugar,
+aplicados pelo navegador: o servidor não converte número em texto célula a
+célula (.apply(lambda x: f'R$ {x:,.2f}')) nem copia o DataFrame para isso.
+
+Tabelas: cada tabela exibida tem uma especificação declarativa {coluna: (rótulo,
+formato)}; exibir_tabela() a passa ao st.dataframe como column_config e
+column_order, então os valores seguem numéricos (e a ordenação por coluna
+continua numérica). Só formatos com escala (milhões, milhares) geram uma coluna
+nova, por divisão vetorizada.
+
+Rótulos de gráficos: text= recebe os valores numéricos na escala do formato
+(valores_rotulo) e rotular() aplica o texttemplate do Plotly (modelo_rotulo,
+d3-format), que formata no navegador.
+
+Uso:
+    exibir_tabela(dados['personas'], TABELA_PERSONAS)
+    fig = px.bar(df, ..., text=valores_rotulo(df['valor'], 'milhoes'))
+    rotular(fig, 'milhoes', textposition='outside')
+"""
+
+import streamlit as st
+
+# Formato -> (prefixo, casas decimais, separador de milhar, divisor, sufixo)
+FORMATOS = {
+    'moeda': ('R$ ', 2, True, 1, ''),
+    'moeda_inteira': ('R$ ', 0, True, 1, ''),
+    'milhoes': ('R$ ', 1, False, 1e6, 'M'),
+    'milhares': ('R$ ', 0, False, 1e3, 'K'),
+    'contagem': ('', 0, True, 1, ''),
+    'percentual': ('', 1, False, 1, '%'),
+    'percentual2': ('', 2, False, 1, '%'),
+    'decimal': ('', 1, False, 1, ''),
+    'vezes': ('', 1, False, 1, 'x'),
+    'anos': ('', 0, False, 1, ' anos'),
+}
+
+
+def formato_printf(formato):
+    """Formato printf do st.column_config (sprintf-js; ',' liga o separador de milhar, Streamlit >= 1.55)"""
+    prefixo, casas, milhar, _, sufixo = FORMATOS[formato]
+    return f"{prefixo}%{',' if milhar else ''}.{casas}f{sufixo.replace('%', '%%')}"
+
+
+def modelo_rotulo(formato):
+    """texttemplate do Plotly que mostra o text= do traço no formato (d3-format)"""
+    prefixo, casas, milhar, _, sufixo = FORMATOS[formato]
+    return f"{prefixo}%{{text:{',' if milhar else ''}.{casas}f}}{sufixo}"
+
+
+def valores_rotulo(serie, formato):
+    """Valores para o text= do gráfico, na escala do formato (continuam numéricos)"""
+    divisor = FORMATOS[formato][3]
+    return serie / divisor if divisor != 1 else serie
+
+
+def rotular(fig, formato, **kwargs):
+    """Mostra o text= dos traços no formato, nos rótulos e no hover (kwargs vão para update_traces)"""
+    modelo = modelo_rotulo(formato)
+    for traco in fig.data:
+        if traco.hovertemplate:
+            traco.hovertemplate = traco.hovertemplate.replace('%{text}', modelo)
+    fig.update_traces(texttemplate=modelo, **kwargs)
+    return fig
+
+
+def config_colunas(especificacao):
+    """column_config do st.dataframe: rótulo de cada coluna e formato numérico quando houver"""
+    config = {}
+    for coluna, (rotulo, formato) in especificacao.items():
+        if formato is None:
+            config[coluna] = st.column_config.Column(rotulo)
+        else:
+            config[coluna] = st.column_config.NumberColumn(rotulo, format=formato_printf(formato))
+    return config
+
+
+def exibir_tabela(df, especificacao, **kwargs):
+    """st.dataframe com as colunas, rótulos e formatos da especificação
+
+    Colunas da especificação ausentes em df são ignoradas (tabelas com colunas
+    opcionais compartilham a mesma especificação).
+    """
+    especificacao = {coluna: spec for coluna, spec in especificacao.items() if coluna in df.columns}
+    escaladas = {
+        coluna: df[coluna] / FORMATOS[formato][3]
+        for coluna, (_, formato) in especificacao.items()
+        if formato is not None and FORMATOS[formato][3] != 1
+    }
+    if escaladas:
+        df = df.assign(**escaladas)
+    kwargs.setdefault('use_container_width', True)
+    kwargs.setdefault('hide_index', True)
+    st.dataframe(
+        df,
+        column_order=list(especificacao),
+        column_config=config_colunas(especificacao),
+        **kwargs
+    )
+
+
+# =============================================================================
+# ESPECIFICAÇÕES DAS TABELAS
+# =============================================================================
+
+# Comparativo de períodos (Visão Geral, modo comparativo)
+TABELA_COMPARATIVO_PERIODOS = {
+    'Período': ('Período', None),
+    'Clientes': ('Clientes Únicos', 'contagem'),
+    'Valor Total': ('Valor Total', 'moeda'),
+    'Ticket Médio': ('Ticket Médio', 'moeda'),
+    'High Spenders': ('High Spenders', 'contagem'),
+}
+
+# resumo por shopping (Visão Geral)
+TABELA_RESUMO_SHOPPING = {
+    'shopping': ('Shopping', None),
+    'sigla': ('Sigla', None),
+    'clientes': ('Clientes*', 'contagem'),
+    'valor_total': ('Valor Total', 'moeda'),
+    'ticket_medio': ('Ticket Médio', 'moeda'),
+    'qtd_high_spenders': ('High Spenders', 'contagem'),
+}
+
+# personas (Personas)
+TABELA_PERSONAS = {
+    'persona': ('Persona', None),
+    'qtd_clientes': ('Clientes', 'contagem'),
+    'valor_total': ('Valor Total', 'moeda'),
+    'ticket_medio': ('Ticket Médio', 'moeda'),
+    'freq_media': ('Freq. Média', 'decimal'),
+    'idade_media': ('Idade Média', 'anos'),
+    'pct_clientes': ('% Clientes', 'percentual'),
+    'pct_valor': ('% Valor', 'percentual'),
+}
+
+# personas lado a lado por período (Personas, modo comparativo)
+TABELA_PERSONAS_PERIODO = {
+    'persona': ('Persona', None),
+    'qtd_clientes': ('Clientes', 'contagem'),
+    'valor_total': ('Valor', 'milhoes'),
+    'pct_valor': ('% Valor', 'percentual'),
+}
+
+# High Spenders por shopping (High Spenders)
+TABELA_HIGH_SPENDERS_SHOPPING = {
+    'sigla': ('Sigla', None),
+    'shopping': ('Shopping', None),
+    'clientes': ('Total Clientes', 'contagem'),
+    'qtd_high_spenders': ('High Spenders', 'contagem'),
+    'threshold_hs': ('Threshold', 'moeda'),
+    'pct_hs': ('% HS', 'percentual'),
+}
+
+# hs_por_genero e hs_por_faixa (High Spenders)
+TABELA_HIGH_SPENDERS_GRUPO = {
+    'genero': ('Gênero', None),
+    'faixa_etaria': ('Faixa Etária', None),
+    'qtd_hs': ('Qtd HS', 'contagem'),
+    'valor_total': ('Valor Total', 'moeda'),
+    'ticket_medio': ('Ticket Médio', 'moeda'),
+    'pct_hs': ('% do Total', 'percentual2'),
+}
+
+# segmentos_por_genero (Segmentos)
+TABELA_SEGMENTOS_GENERO = {
+    'genero': ('Gênero', None),
+    'segmento': ('Segmento', None),
+    'valor': ('Valor', 'moeda'),
+    'clientes': ('Clientes', 'contagem'),
+    'ranking': ('Ranking', None),
+}
+
+# RFV por shopping, geral ou de um perfil (RFV; colunas já com os rótulos da página)
+TABELA_RFV_SHOPPING = {
+    'Shopping': ('Shopping', None),
+    'Total Clientes': ('Total Clientes', 'contagem'),
+    'Clientes': ('Clientes', 'contagem'),
+    'Valor Total': ('Valor Total', 'moeda'),
+    'Ticket Médio': ('Ticket Médio', 'moeda'),
+    'VIP': ('VIP', 'contagem'),
+    'Premium': ('Premium', 'contagem'),
+    'Potencial': ('Potencial', 'contagem'),
+    'Pontual': ('Pontual', 'contagem'),
+    'High Spenders': ('High Spenders', 'contagem'),
+    '% Valor': ('% Valor', 'percentual'),
+}
+
+# resumo por perfil RFV (RFV)
+TABELA_RFV_PERFIS = {
+    'perfil_cliente': ('Perfil', None),
+    'qtd_clientes': ('Clientes', 'contagem'),
+    'valor_total': ('Valor Total', 'moeda'),
+    'ticket_medio': ('Ticket Médio', 'moeda'),
+    'pct_clientes': ('% Clientes', 'percentual'),
+    'pct_valor': ('% Valor', 'percentual'),
+}
+
+# top segmentos por perfil RFV (RFV)
+TABELA_RFV_SEGMENTOS = {
+    'shopping': ('Shopping', None),
+    'perfil_historico': ('Perfil', None),
+    'segmento': ('Segmento', None),
+    'valor': ('Valor', 'moeda'),
+    'cupons': ('Cupons', 'contagem'),
+    'clientes': ('Clientes', 'contagem'),
+    'pct_valor': ('% Valor', 'percentual'),
+}
+
+# top lojas por perfil RFV (RFV)
+TABELA_RFV_LOJAS = {
+    'perfil': ('Perfil', None),
+    'shopping': ('Shopping', None),
+    'genero': ('Gênero', None),
+    'loja': ('Loja', None),
+    'valor': ('Valor', 'moeda'),
+    'cupons': ('Cupons', 'contagem'),
+    'clientes': ('Clientes', 'contagem'),
+    'pct_valor': ('% Valor', 'percentual'),
+}
@@ -0,0 +1,691 @@
+"""
+LOGS DE AUDITORIA
+Gravação em segundo plano dos logs de uso (logins, navegação, filtros, downloads).
+
+As funções registrar_* do dashboard só gravam o evento num spool SQLite local
+(LOGS_SPOOL, append com WAL, sem esperar a rede) e retornam. Uma thread lê os
+eventos pendentes, agrupa por aba e os envia ao destino (Google Sheets) com uma
+chamada append_rows por aba, a cada INTERVALO_ENVIO segundos ou quando há
+LOTE_ENVIO pendentes; os entregues são marcados no spool.
+
+- Falhas de envio são repetidas com espera exponencial (ESPERA_INICIAL, dobrando
+  até ESPERA_MAXIMA) por até TENTATIVAS_ENVIO vezes; o que não foi entregue
+  continua no spool e volta a ser enviado (inclusive depois de um reinício)
+- O spool é limitado (LIMITE_FILA pendentes): se o destino ficar fora do ar por
+  muito tempo, os eventos mais antigos são descartados e contados em 'descartados'
+- Os últimos RETENCAO_SPOOL eventos entregues ficam no spool para leitura local
+- A cada ciclo a thread soma os eventos novos a contadores diários no spool
+  (AgregadosUso: usuários ativos, acessos por página, filtros por página,
+  downloads por usuário), lidos pelo painel em O(dias) e não O(eventos)
+- Ao encerrar o processo (atexit) é feito um último envio
+
+Destinos (mesma interface: validar_abas, anexar, ler_recentes, abas, titulo):
+- ClienteSheets: um único cliente gspread autorizado por processo, com a planilha
+  e as abas abertas uma vez e reaproveitadas (o token é renovado só ao expirar).
+  A leitura baixa só o fim da aba e, depois, só as linhas novas
+- ClienteSQLite: arquivo SQLite local com as mesmas abas, para rodar e testar
+  sem rede (variável de ambiente LOGS_SQLITE com o caminho do arquivo)
+"""
+
+import os
+import json
+import time
+import atexit
+import sqlite3
+import threading
+from datetime import timedelta
+
+import gspread
+from google.oauth2.service_account import Credentials
+
+LOTE_ENVIO = 50
+INTERVALO_ENVIO = 5.0     # segundos
+LIMITE_FILA = 100000      # eventos pendentes no spool
+RETENCAO_SPOOL = 50000    # eventos já entregues mantidos para leitura local
+MAXIMO_POR_CICLO = 5000   # eventos enviados por ciclo
+TENTATIVAS_ENVIO = 5
+ESPERA_INICIAL = 1.0      # segundos
+ESPERA_MAXIMA = 30.0
+TIMEOUT_ENCERRAMENTO = 10.0
+
+# Abas de log -> colunas (cabeçalho da planilha / tabela SQLite)
+ABAS_LOGS = {
+    'logins': ['timestamp', 'usuario', 'nome', 'perfil', 'ip'],
+    'navegacao': ['timestamp', 'usuario', 'pagina', 'sessao_id'],
+    'filtros': ['timestamp', 'usuario', 'pagina', 'filtro', 'valor'],
+    'downloads': ['timestamp', 'usuario', 'arquivo', 'registros', 'pagina'],
+}
+
+ESCOPOS_SHEETS = [
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+]
+# Leitura incremental da planilha: linhas por página e folga de linhas vazias no fim da grade
+PAGINA_LEITURA = 1000
+FOLGA_GRADE = 1000
+CACHE_LINHAS_ABA = 50000
+
+CAMPOS_CREDENCIAIS = [
+    'type', 'project_id', 'private_key_id', 'private_key', 'client_email', 'client_id',
+    'auth_uri', 'token_uri', 'auth_provider_x509_cert_url', 'client_x509_cert_url',
+]
+
+
+def limites_data(desde=None, ate=None):
+    """Datas (inclusive) -> limites de texto do timestamp 'AAAA-MM-DD HH:MM:SS' [inicio, fim)"""
+    inicio = desde.strftime('%Y-%m-%d') if desde else None
+    fim = (ate + timedelta(days=1)).strftime('%Y-%m-%d') if ate else None
+    return inicio, fim
+
+
+def filtrar_linhas(linhas, usuario=None, desde=None, ate=None):
+    """Filtra linhas de log [timestamp, usuario, ...] por usuário e intervalo de datas"""
+    inicio, fim = limites_data(desde, ate)
+    return [
+        linha for linha in linhas
+        if (usuario is None or str(linha[1]) == usuario)
+        and (inicio is None or str(linha[0]) >= inicio)
+        and (fim is None or str(linha[0]) < fim)
+    ]
+
+
+# =============================================================================
+# SPOOL LOCAL
+# =============================================================================
+
+class SpoolLogs:
+    """Fila durável de eventos num SQLite local (write-ahead log dos registros)
+
+    Cada evento é gravado com entregue=0 e marcado entregue=1 quando o destino
+    confirma o envio. Eventos não entregues sobrevivem a reinícios e são
+    reenviados. Acima de `limite` pendentes, os mais antigos são descartados.
+    """
+
+    def __init__(self, caminho=':memory:', limite=LIMITE_FILA, retencao=RETENCAO_SPOOL):
+        self.caminho = caminho
+        self.limite = limite
+        self.retencao = retencao
+        self._trava = threading.Lock()
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False, isolation_level=None)
+        self._conexao.execute('PRAGMA journal_mode=WAL')
+        self._conexao.execute('PRAGMA synchronous=NORMAL')  # WAL + NORMAL: sem fsync por evento
+        self._conexao.execute(
+            'CREATE TABLE IF NOT EXISTS eventos ('
+            'id INTEGER PRIMARY KEY, aba TEXT NOT NULL, linha TEXT NOT NULL, '
+            'criado REAL NOT NULL, entregue INTEGER NOT NULL DEFAULT 0)'
+        )
+        self._conexao.execute('CREATE INDEX IF NOT EXISTS eventos_pendentes ON eventos (entregue, id)')
+        # Leitura por aba / usuário / data sem varrer o arquivo (linha[0] = timestamp, linha[1] = usuario)
+        self._conexao.execute('CREATE INDEX IF NOT EXISTS eventos_aba ON eventos (aba, id)')
+        self._conexao.execute(
+            "CREATE INDEX IF NOT EXISTS eventos_usuario ON eventos (aba, json_extract(linha, '$[1]'), id)"
+        )
+        self._conexao.execute(
+            "CREATE INDEX IF NOT EXISTS eventos_data ON eventos (aba, json_extract(linha, '$[0]'))"
+        )
+        self._pendentes = self._conexao.execute('SELECT COUNT(*) FROM eventos WHERE entregue = 0').fetchone()[0]
+        self.descartados = 0
+
+    def registrar(self, aba, linha):
+        """Grava um evento pendente; retorna a quantidade de pendentes"""
+        with self._trava:
+            self._conexao.execute(
+                'INSERT INTO eventos (aba, linha, criado) VALUES (?, ?, ?)',
+                (aba, json.dumps(list(linha), ensure_ascii=False, default=str), time.time())
+            )
+            self._pendentes += 1
+            if self._pendentes > self.limite:
+                excesso = self._pendentes - self.limite
+                self._conexao.execute(
+                    'DELETE FROM eventos WHERE id IN '
+                    '(SELECT id FROM eventos WHERE entregue = 0 ORDER BY id LIMIT ?)', (excesso,)
+                )
+                self._pendentes -= excesso
+                self.descartados += excesso
+            return self._pendentes
+
+    def pendentes(self, limite=None):
+        """Eventos não entregues [(id, aba, linha)] em ordem de chegada"""
+        with self._trava:
+            cursor = self._conexao.execute(
+                'SELECT id, aba, linha FROM eventos WHERE entregue = 0 ORDER BY id LIMIT ?',
+                (-1 if limite is None else limite,)
+            )
+            return [(id_, aba, json.loads(linha)) for id_, aba, linha in cursor.fetchall()]
+
+    def qtd_pendentes(self):
+        return self._pendentes
+
+    def marcar_entregues(self, ids):
+        """Marca eventos como entregues e apaga os entregues além da retenção"""
+        if not ids:
+            return
+        with self._trava:
+            self._conexao.execute('BEGIN')
+            self._conexao.executemany('UPDATE eventos SET entregue = 1 WHERE id = ? AND entregue = 0', [(i,) for i in ids])
+            self._pendentes = self._conexao.execute('SELECT COUNT(*) FROM eventos WHERE entregue = 0').fetchone()[0]
+            self._conexao.execute(
+                'DELETE FROM eventos WHERE entregue = 1 AND id <= '
+                '(SELECT id FROM eventos WHERE entregue = 1 ORDER BY id DESC LIMIT 1 OFFSET ?)', (self.retencao,)
+            )
+            self._conexao.execute('COMMIT')
+
+    def recentes(self, aba, limite=100, usuario=None, desde=None, ate=None, antes_de=None):
+        """Últimos eventos de uma aba (entregues ou não), mais recentes primeiro
+
+        Filtros aplicados no SQLite: usuario, desde / ate (datas, inclusive) e
+        antes_de (id, para paginar). Retorna [(id, linha, entregue)].
+        """
+        condicoes, parametros = ['aba = ?'], [aba]
+        inicio, fim = limites_data(desde, ate)
+        if usuario is not None:
+            condicoes.append("json_extract(linha, '$[1]') = ?")
+            parametros.append(usuario)
+        if inicio is not None:
+            condicoes.append("json_extract(linha, '$[0]') >= ?")
+            parametros.append(inicio)
+        if fim is not None:
+            condicoes.append("json_extract(linha, '$[0]') < ?")
+            parametros.append(fim)
+        if antes_de is not None:
+            condicoes.append('id < ?')
+            parametros.append(antes_de)
+        with self._trava:
+            cursor = self._conexao.execute(
+                f'SELECT id, linha, entregue FROM eventos WHERE {" AND ".join(condicoes)} ORDER BY id DESC LIMIT ?',
+                parametros + [limite]
+            )
+            return [(id_, json.loads(linha), bool(entregue)) for id_, linha, entregue in cursor.fetchall()]
+
+    def usuarios(self, aba):
+        """Usuários distintos de uma aba (pelo índice, sem ler as linhas)"""
+        with self._trava:
+            cursor = self._conexao.execute(
+                "SELECT DISTINCT json_extract(linha, '$[1]') FROM eventos WHERE aba = ? ORDER BY 1", (aba,)
+            )
+            return [linha[0] for linha in cursor.fetchall() if linha[0] is not None]
+
+
+def abrir_spool(caminho):
+    """Spool no arquivo informado; sem permissão de escrita, fica só em memória"""
+    try:
+        return SpoolLogs(caminho)
+    except sqlite3.Error:
+        return SpoolLogs(':memory:')
+
+
+# =============================================================================
+# AGREGADOS DE USO
+# =============================================================================
+
+# Tabela de agregado -> (aba de origem, colunas-chave tiradas da linha, contadores)
+# Chaves e contadores são expressões SQL sobre a linha JSON do evento
+# ($[0] = timestamp, $[1] = usuario; dia = AAAA-MM-DD do timestamp).
+_DIA = "substr(json_extract(linha, '$[0]'), 1, 10)"
+AGREGADOS_USO = {
+    'uso_usuarios': (None, {'dia': _DIA, 'usuario': "json_extract(linha, '$[1]')"}, {
+        'eventos': 'COUNT(*)',
+        'acessos': "SUM(aba = 'navegacao')",
+        'logins': "SUM(aba = 'logins')",
+    }),
+    'uso_paginas': ('navegacao', {'dia': _DIA, 'pagina': "json_extract(linha, '$[2]')"}, {
+        'acessos': 'COUNT(*)',
+    }),
+    'uso_filtros': ('filtros', {'dia': _DIA, 'pagina': "json_extract(linha, '$[2]')", 'filtro': "json_extract(linha, '$[3]')"}, {
+        'usos': 'COUNT(*)',
+    }),
+    'uso_downloads': ('downloads', {'dia': _DIA, 'usuario': "json_extract(linha, '$[1]')"}, {
+        'downloads': 'COUNT(*)',
+        'registros': "SUM(CAST(json_extract(linha, '$[3]') AS INTEGER))",
+    }),
+}
+
+
+class AgregadosUso:
+    """Contadores diários de uso mantidos no próprio arquivo do spool
+
+    atualizar() soma aos agregados os eventos que chegaram desde a última
+    chamada (marca do último id agregado em uso_controle), então as consultas
+    leem uma linha por dia (x usuário / página / filtro) em vez dos eventos.
+    Os eventos continuam sujeitos à retenção do spool; os agregados, não.
+    """
+
+    def __init__(self, spool):
+        self._spool = spool
+        with spool._trava:
+            conexao = spool._conexao
+            conexao.execute('CREATE TABLE IF NOT EXISTS uso_controle (chave TEXT PRIMARY KEY, valor INTEGER NOT NULL)')
+            for tabela, (_, chaves, contadores) in AGREGADOS_USO.items():
+                colunas = [f'{c} TEXT NOT NULL' for c in chaves] + [f'{c} INTEGER NOT NULL' for c in contadores]
+                conexao.execute(
+                    f'CREATE TABLE IF NOT EXISTS {tabela} ({", ".join(colunas)}, '
+                    f'PRIMARY KEY ({", ".join(chaves)})) WITHOUT ROWID'
+                )
+
+    def atualizar(self):
+        """Agrega os eventos novos do spool; retorna quantos foram agregados"""
+        with self._spool._trava:
+            conexao = self._spool._conexao
+            conexao.execute('BEGIN')
+            try:
+                marca = conexao.execute("SELECT valor FROM uso_controle WHERE chave = 'ultimo_id'").fetchone()
+                marca = marca[0] if marca else 0
+                ultimo, qtd = conexao.execute('SELECT MAX(id), COUNT(*) FROM eventos WHERE id > ?', (marca,)).fetchone()
+                if qtd:
+                    for tabela, (aba, chaves, contadores) in AGREGADOS_USO.items():
+                        filtro_aba = 'AND aba = ?' if aba else ''
+                        selecao = ', '.join([f'{e} AS {c}' for c, e in chaves.items()] +
+                                            [f'COALESCE({e}, 0) AS {c}' for c, e in contadores.items()])
+                        conexao.execute(
+                            f'INSERT INTO {tabela} ({", ".join([*chaves, *contadores])}) '
+                            f'SELECT * FROM (SELECT {selecao} FROM eventos WHERE id > ? AND id <= ? {filtro_aba} '
+                            f'GROUP BY {", ".join(chaves)}) WHERE {" AND ".join(f"{c} IS NOT NULL" for c in chaves)} '
+                            f'ON CONFLICT ({", ".join(chaves)}) DO UPDATE SET '
+                            + ', '.join(f'{c} = {c} + excluded.{c}' for c in contadores),
+                            (marca, ultimo, aba) if aba else (marca, ultimo)
+                        )
+                    conexao.execute(
+                        "INSERT INTO uso_controle VALUES ('ultimo_id', ?) "
+                        'ON CONFLICT (chave) DO UPDATE SET valor = excluded.valor', (ultimo,)
+                    )
+                conexao.execute('COMMIT')
+            except Exception:
+                conexao.execute('ROLLBACK')
+                raise
+            return qtd
+
+    def _consultar(self, sql, parametros, desde=None, ate=None, usuario=None):
+        condicoes = ['1 = 1']
+        inicio, fim = limites_data(desde, ate)
+        if inicio is not None:
+            condicoes.append('dia >= ?')
+            parametros = parametros + [inicio]
+        if fim is not None:
+            condicoes.append('dia < ?')
+            parametros = parametros + [fim]
+        if usuario is not None:
+            condicoes.append('usuario = ?')
+            parametros = parametros + [usuario]
+        with self._spool._trava:
+            cursor = self._spool._conexao.execute(sql.format(where=' AND '.join(condicoes)), parametros)
+            colunas = [c[0] for c in cursor.description]
+            return [dict(zip(colunas, linha)) for linha in cursor.fetchall()]
+
+    def por_dia(self, desde=None, ate=None, usuario=None):
+        """Usuários ativos, eventos, acessos e logins por dia"""
+        return self._consultar(
+            'SELECT dia, COUNT(*) AS usuarios_ativos, SUM(eventos) AS eventos, SUM(acessos) AS acessos, '
+            'SUM(logins) AS logins FROM uso_usuarios WHERE {where} GROUP BY dia ORDER BY dia', [],
+            desde, ate, usuario
+        )
+
+    def totais(self, desde=None, ate=None, usuario=None):
+        """Usuários únicos, acessos, logins, downloads e registros baixados no período"""
+        uso = self._consultar(
+            'SELECT COUNT(DISTINCT usuario) AS usuarios, COALESCE(SUM(acessos), 0) AS acessos, '
+            'COALESCE(SUM(logins), 0) AS logins FROM uso_usuarios WHERE {where}', [], desde, ate, usuario
+        )[0]
+        downloads = self._consultar(
+            'SELECT COALESCE(SUM(downloads), 0) AS downloads, COALESCE(SUM(registros), 0) AS registros '
+            'FROM uso_downloads WHERE {where}', [], desde, ate, usuario
+        )[0]
+        return {**uso, **downloads}
+
+    def paginas(self, desde=None, ate=None):
+        """Acessos por página, mais acessadas primeiro"""
+        return self._consultar(
+            'SELECT pagina, SUM(acessos) AS acessos FROM uso_paginas WHERE {where} '
+            'GROUP BY pagina ORDER BY acessos DESC', [], desde, ate
+        )
+
+    def filtros(self, desde=None, ate=None):
+        """Usos de cada filtro por página, mais usados primeiro"""
+        return self._consultar(
+            'SELECT pagina, filtro, SUM(usos) AS usos FROM uso_filtros WHERE {where} '
+            'GROUP BY pagina, filtro ORDER BY usos DESC', [], desde, ate
+        )
+
+    def downloads(self, desde=None, ate=None, usuario=None):
+        """Downloads e registros baixados por usuário"""
+        return self._consultar(
+            'SELECT usuario, SUM(downloads) AS downloads, SUM(registros) AS registros FROM uso_downloads '
+            'WHERE {where} GROUP BY usuario ORDER BY downloads DESC', [], desde, ate, usuario
+        )
+
+
+# =============================================================================
+# GRAVADOR EM SEGUNDO PLANO
+# =============================================================================
+
+class GravadorLogs:
+    """Thread que reenvia os eventos pendentes do spool ao destino, em lotes por aba
+
+    destino: função (aba, linhas) que grava as linhas e levanta exceção em falha.
+    spool: SpoolLogs onde registrar() grava (padrão: SQLite em memória).
+    """
+
+    def __init__(self, destino, spool=None, lote=LOTE_ENVIO, intervalo=INTERVALO_ENVIO,
+                 tentativas=TENTATIVAS_ENVIO, espera_inicial=ESPERA_INICIAL, espera_maxima=ESPERA_MAXIMA):
+        self._destino = destino
+        self.spool = spool if spool is not None else SpoolLogs()
+        self.agregados = AgregadosUso(self.spool)
+        self.lote = lote
+        self.intervalo = intervalo
+        self.tentativas = tentativas
+        self.espera_inicial = espera_inicial
+        self.espera_maxima = espera_maxima
+
+        self._condicao = threading.Condition()
+        self._em_envio = False
+        self._descarregar = False
+        self._parar = False
+
+        self.enviados = 0
+        self.falhas = 0
+        self.ultimo_erro = None
+
+        self._thread = threading.Thread(target=self._executar, name='gravador-logs', daemon=True)
+        self._thread.start()
+        atexit.register(self.encerrar)
+
+    @property
+    def descartados(self):
+        return self.spool.descartados
+
+    def registrar(self, aba, linha):
+        """Grava o evento no spool local e retorna (o envio fica com a thread)"""
+        pendentes = self.spool.registrar(aba, linha)
+        if pendentes >= self.lote:
+            with self._condicao:
+                self._condicao.notify()
+
+    def pendentes(self):
+        return self.spool.qtd_pendentes()
+
+    def _executar(self):
+        espera_falha = 0
+        while True:
+            with self._condicao:
+                self._condicao.wait_for(
+                    lambda: self._parar or self._descarregar or (not espera_falha and self.spool.qtd_pendentes() >= self.lote),
+                    timeout=max(self.intervalo, espera_falha)
+                )
+                parar = self._parar
+                self._em_envio = True
+            # Agrega antes de enviar: eventos entregues podem sair do spool pela retenção
+            try:
+                self.agregados.atualizar()
+            except sqlite3.Error as e:
+                self.ultimo_erro = f'agregados: {e}'
+            eventos = self.spool.pendentes(MAXIMO_POR_CICLO)
+            entregues = self._enviar(eventos) if eventos else []
+            self.spool.marcar_entregues(entregues)
+            # Destino fora do ar: os eventos ficam no spool e o próximo ciclo espera mais
+            espera_falha = 0 if len(entregues) == len(eventos) else min(max(espera_falha * 2, self.espera_inicial), self.espera_maxima)
+            with self._condicao:
+                self._em_envio = False
+                if not self.spool.qtd_pendentes() or espera_falha:
+                    self._descarregar = False
+                self._condicao.notify_all()
+            if parar:
+                return
+
+    def _enviar(self, eventos):
+        """Envia os eventos agrupados por aba; retorna os ids entregues"""
+        entregues = []
+        grupos = {}
+        for id_, aba, linha in eventos:
+            grupos.setdefault(aba, []).append((id_, linha))
+        for aba, itens in grupos.items():
+            espera = self.espera_inicial
+            for tentativa in range(1, self.tentativas + 1):
+                try:
+                    self._destino(aba, [linha for _, linha in itens])
+                    entregues.extend(id_ for id_, _ in itens)
+                    self.enviados += len(itens)
+                    self.ultimo_erro = None
+                    break
+                except Exception as e:
+                    self.ultimo_erro = f'{aba}: {e}'
+                    # No encerramento não há espera: uma tentativa só
+                    if tentativa == self.tentativas or self._parar:
+                        self.falhas += len(itens)
+                        break
+                    time.sleep(espera)
+                    espera = min(espera * 2, self.espera_maxima)
+        return entregues
+
+    def descarregar(self, timeout=None):
+        """Envia os pendentes agora e espera o ciclo terminar (True se não sobrou nada)"""
+        with self._condicao:
+            self._descarregar = True
+            self._condicao.notify_all()
+            self._condicao.wait_for(lambda: not self._descarregar and not self._em_envio, timeout=timeout)
+            return self.spool.qtd_pendentes() == 0
+
+    def encerrar(self, timeout=TIMEOUT_ENCERRAMENTO):
+        """Faz um último envio e finaliza a thread (o que falhar fica no spool)"""
+        with self._condicao:
+            self._parar = True
+            self._condicao.notify_all()
+        self._thread.join(timeout)
+
+    def estatisticas(self):
+        return {
+            'pendentes': self.pendentes(),
+            'enviados': self.enviados,
+            'falhas': self.falhas,
+            'descartados': self.descartados,
+            'ultimo_erro': self.ultimo_erro,
+        }
+
+
+# =============================================================================
+# DESTINOS DOS LOGS
+# =============================================================================
+
+class ClienteSheets:
+    """Cliente gspread do processo com planilha e abas reaproveitadas"""
+
+    def __init__(self, config):
+        self._config = dict(config)
+        self._trava = threading.RLock()
+        self._planilha = None
+        self._abas = {}
+        self._validado = False
+        self._linhas = {}  # aba -> {'primeira': nº da 1ª linha em cache, 'valores': [...]}
+
+    def _abrir(self):
+        """Autoriza e abre a planilha na primeira vez (o gspread renova o token quando expira)"""
+        with self._trava:
+            if self._planilha is None:
+                credenciais = Credentials.from_service_account_info(
+                    {campo: self._config[campo] for campo in CAMPOS_CREDENCIAIS}, scopes=ESCOPOS_SHEETS
+                )
+                self._planilha = gspread.authorize(credenciais).open_by_key(self._config['spreadsheet_id'])
+            return self._planilha
+
+    def _aba(self, aba):
+        with self._trava:
+            if not self._validado:
+                self.validar_abas()
+            if aba not in self._abas:
+                self._abas[aba] = self._abrir().worksheet(aba)
+            return self._abas[aba]
+
+    def _descartar(self):
+        """Esquece planilha, abas e linhas em cache (reabertas na próxima chamada, ex.: aba apagada)"""
+        with self._trava:
+            self._planilha = None
+            self._abas = {}
+            self._linhas = {}
+
+    def validar_abas(self):
+        """Cria as abas de log que faltam (uma listagem por processo)"""
+        with self._trava:
+            planilha = self._abrir()
+            existentes = {ws.title: ws for ws in planilha.worksheets()}
+            for aba, colunas in ABAS_LOGS.items():
+                if aba not in existentes:
+                    existentes[aba] = planilha.add_worksheet(title=aba, rows=1000, cols=len(colunas))
+                    existentes[aba].append_row(colunas)
+                self._abas[aba] = existentes[aba]
+            self._validado = True
+
+    def anexar(self, aba, linhas):
+        try:
+            self._aba(aba).append_rows(linhas)
+        except Exception:
+            self._descartar()
+            raise
+
+    def _intervalo(self, aba, inicio, fim=None):
+        """Valores das linhas inicio..fim (fim aberto: até a última preenchida)"""
+        ultima_coluna = chr(ord('A') + len(ABAS_LOGS[aba]) - 1)
+        faixa = f'A{inicio}:{ultima_coluna}{fim or ""}'
+        valores = self._aba(aba).get(faixa)
+        largura = len(ABAS_LOGS[aba])
+        return [list(v) + [''] * (largura - len(v)) for v in valores]
+
+    def _qtd_linhas_grade(self, aba):
+        metadados = self._abrir().fetch_sheet_metadata(params={'fields': 'sheets.properties'})
+        for folha in metadados['sheets']:
+            if folha['properties']['title'] == aba:
+                return folha['properties']['gridProperties']['rowCount']
+        raise ValueError(f'Aba não encontrada: {aba}')
+
+    def _atualizar_cache(self, aba, minimo):
+        """Traz só as linhas novas (ou, na primeira vez, o fim da aba) para o cache
+
+        Na primeira leitura o tamanho da grade dá o ponto de partida: a faixa
+        lida cobre as últimas `minimo` linhas mais a folga de linhas vazias.
+        """
+        cache = self._linhas.get(aba)
+        if cache is None:
+            fim_grade = self._qtd_linhas_grade(aba)
+            inicio = max(2, fim_grade - minimo - FOLGA_GRADE + 1)
+            valores = self._intervalo(aba, inicio)
+            while not valores and inicio > 2:  # Grade com mais linhas vazias que a folga
+                inicio = max(2, inicio - PAGINA_LEITURA)
+                valores = self._intervalo(aba, inicio)
+            cache = {'primeira': inicio, 'valores': valores}
+        else:
+            cache['valores'].extend(self._intervalo(aba, cache['primeira'] + len(cache['valores'])))
+        # Limite de memória: descarta as linhas mais antigas do cache
+        excesso = len(cache['valores']) - CACHE_LINHAS_ABA
+        if excesso > 0:
+            cache['primeira'] += excesso
+            del cache['valores'][:excesso]
+        self._linhas[aba] = cache
+        return cache
+
+    def _carregar_anteriores(self, aba, cache, desde=None):
+        """Traz uma página de linhas anteriores às do cache (False se não há o que buscar)
+
+        As páginas dobram de tamanho a cada chamada (no máximo o limite do cache).
+        Com `desde`, para quando a linha mais antiga do cache já é anterior à data:
+        a aba é gravada em ordem cronológica.
+        """
+        qtd = len(cache['valores'])
+        if cache['primeira'] <= 2 or qtd >= CACHE_LINHAS_ABA:
+            return False
+        inicio_data, _ = limites_data(desde)
+        if inicio_data and qtd and str(cache['valores'][0][0]) < inicio_data:
+            return False
+        pagina = min(max(PAGINA_LEITURA, qtd), CACHE_LINHAS_ABA - qtd)
+        inicio = max(2, cache['primeira'] - pagina)
+        cache['valores'][:0] = self._intervalo(aba, inicio, cache['primeira'] - 1)
+        cache['primeira'] = inicio
+        return True
+
+    def ler_recentes(self, aba, limite=100, usuario=None, desde=None, ate=None):
+        """Últimas `limite` linhas (filtradas), mais recentes primeiro, como dicts
+
+        Só linhas ainda não vistas são baixadas; os filtros rodam sobre o cache e
+        páginas anteriores são buscadas apenas enquanto faltarem resultados.
+        """
+        try:
+            with self._trava:
+                cache = self._atualizar_cache(aba, limite)
+                while True:
+                    linhas = filtrar_linhas(cache['valores'], usuario, desde, ate)
+                    if len(linhas) >= limite or not self._carregar_anteriores(aba, cache, desde):
+                        break
+        except Exception:
+            self._descartar()
+            raise
+        colunas = ABAS_LOGS[aba]
+        return [dict(zip(colunas, linha)) for linha in reversed(linhas[-limite:])]
+
+    def abas(self):
+        return [ws.title for ws in self._abrir().worksheets()]
+
+    def titulo(self):
+        return self._abrir().title
+
+
+class ClienteSQLite:
+    """Destino local com a mesma interface do ClienteSheets (uma tabela por aba)"""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._trava = threading.Lock()
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+
+    def validar_abas(self):
+        with self._trava, self._conexao:
+            for aba, colunas in ABAS_LOGS.items():
+                definicao = ', '.join(f'"{c}" TEXT' for c in colunas)
+                self._conexao.execute(f'CREATE TABLE IF NOT EXISTS "{aba}" ({definicao})')
+                self._conexao.execute(f'CREATE INDEX IF NOT EXISTS "{aba}_usuario" ON "{aba}" (usuario)')
+                self._conexao.execute(f'CREATE INDEX IF NOT EXISTS "{aba}_timestamp" ON "{aba}" (timestamp)')
+
+    def anexar(self, aba, linhas):
+        colunas = ABAS_LOGS[aba]
+        marcadores = ', '.join('?' for _ in colunas)
+        with self._trava, self._conexao:
+            self._conexao.executemany(
+                f'INSERT INTO "{aba}" VALUES ({marcadores})',
+                [[None if v is None else str(v) for v in linha] for linha in linhas]
+            )
+
+    def ler_recentes(self, aba, limite=100, usuario=None, desde=None, ate=None):
+        colunas = ABAS_LOGS[aba]
+        condicoes, parametros = ['1 = 1'], []
+        inicio, fim = limites_data(desde, ate)
+        if usuario is not None:
+            condicoes.append('usuario = ?')
+            parametros.append(usuario)
+        if inicio is not None:
+            condicoes.append('timestamp >= ?')
+            parametros.append(inicio)
+        if fim is not None:
+            condicoes.append('timestamp < ?')
+            parametros.append(fim)
+        with self._trava:
+            cursor = self._conexao.execute(
+                f'SELECT * FROM "{aba}" WHERE {" AND ".join(condicoes)} ORDER BY rowid DESC LIMIT ?',
+                parametros + [limite]
+            )
+            return [dict(zip(colunas, linha)) for linha in cursor.fetchall()]
+
+    def abas(self):
+        with self._trava:
+            cursor = self._conexao.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")
+            return [linha[0] for linha in cursor.fetchall()]
+
+    def titulo(self):
+        return f'SQLite local ({self.caminho})'
+
+
+def criar_cliente_logs(config=None, caminho_sqlite=None):
+    """Destino dos logs: SQLite local se houver caminho (ou LOGS_SQLITE), senão Google Sheets
+
+    Retorna None quando nenhum destino está configurado.
+    """
+    caminho_sqlite = caminho_sqlite or os.environ.get('LOGS_SQLITE')
+    if caminho_sqlite:
+        return ClienteSQLite(caminho_sqlite)
+    if config is None:
+        return None
+    return ClienteSheets(config)
@@ -0,0 +1,167 @@
+"""
+MEMÓRIA DOS PERÍODOS
+Diagnóstico da memória ocupada pelos `dados` de cada período (resultado de
+carregar_dados): bytes reais (memory_usage deep) por tabela, por período e no
+total do cache compartilhado, com sugestões de tipos compactos por coluna.
+
+As sugestões são as conversões sem perda de dados_periodo.compactar_coluna
+(texto repetitivo -> categórica, int64 -> int32, float64 -> float32 quando
+exato); o modo de carga OTIMIZAR_TIPOS=1 aplica essas conversões em cada tabela
+lida e registra a economia em `dados.economia_tipos`.
+
+Uso offline (lê todas as tabelas de cada período nos dois modos e compara):
+    python memoria_periodos.py [--periodos Completo,Por_Mes/2025_01] [--raiz Resultados] [--sugestoes 20]
+"""
+
+import argparse
+from collections.abc import Mapping
+
+import pandas as pd
+
+from dados_periodo import TabelasLazy, carregar_periodo, compactar_coluna
+
+
+def tabelas_carregadas(dados, prefixo=''):
+    """{caminho: DataFrame} das tabelas já materializadas (as pendentes não são lidas)"""
+    if isinstance(dados, pd.DataFrame):
+        return {prefixo: dados}
+    if isinstance(dados, TabelasLazy):
+        chaves = dados.carregadas()
+    elif isinstance(dados, Mapping):
+        chaves = list(dados)
+    else:
+        return {}
+    tabelas = {}
+    for chave in chaves:
+        tabelas.update(tabelas_carregadas(dados[chave], f'{prefixo}/{chave}' if prefixo else chave))
+    return tabelas
+
+
+def carregar_tudo(dados):
+    """Materializa todas as tabelas do período (inclusive por_shopping, rfv e rfv_quintis)"""
+    if isinstance(dados, Mapping):
+        for chave in list(dados):
+            carregar_tudo(dados[chave])
+    return dados
+
+
+def _bytes_colunas(df):
+    return df.memory_usage(index=False, deep=True)
+
+
+def uso_memoria(dados):
+    """Uma linha por tabela carregada: linhas, colunas, bytes, bytes em texto e bytes com tipos compactos"""
+    linhas = []
+    for caminho, df in tabelas_carregadas(dados).items():
+        por_coluna = _bytes_colunas(df)
+        texto = [c for c in df.columns if pd.api.types.is_string_dtype(df[c]) and not isinstance(df[c].dtype, pd.CategoricalDtype)]
+        compacto = 0
+        for coluna in df.columns:
+            nova = compactar_coluna(df[coluna])
+            compacto += int(nova.memory_usage(index=False, deep=True)) if nova is not None else int(por_coluna[coluna])
+        indice = int(df.index.memory_usage(deep=True))
+        linhas.append({
+            'tabela': caminho,
+            'linhas': len(df),
+            'colunas': len(df.columns),
+            'bytes': int(por_coluna.sum()) + indice,
+            'bytes_texto': int(por_coluna[texto].sum()),
+            'bytes_compacto': compacto + indice,
+        })
+    df = pd.DataFrame(linhas, columns=['tabela', 'linhas', 'colunas', 'bytes', 'bytes_texto', 'bytes_compacto'])
+    df['economia'] = df['bytes'] - df['bytes_compacto']
+    return df.sort_values('bytes', ascending=False, ignore_index=True)
+
+
+def sugestoes_tipos(dados):
+    """Uma linha por coluna que ganha com tipo compacto: tabela, coluna, tipos e bytes antes/depois"""
+    linhas = []
+    for caminho, df in tabelas_carregadas(dados).items():
+        por_coluna = _bytes_colunas(df)
+        for coluna in df.columns:
+            nova = compactar_coluna(df[coluna])
+            if nova is None:
+                continue
+            depois = int(nova.memory_usage(index=False, deep=True))
+            linhas.append({
+                'tabela': caminho, 'coluna': coluna,
+                'tipo_atual': str(df[coluna].dtype), 'tipo_sugerido': str(nova.dtype.name),
+                'bytes': int(por_coluna[coluna]), 'bytes_sugerido': depois, 'economia': int(por_coluna[coluna]) - depois,
+            })
+    df = pd.DataFrame(linhas, columns=['tabela', 'coluna', 'tipo_atual', 'tipo_sugerido', 'bytes', 'bytes_sugerido', 'economia'])
+    return df.sort_values('economia', ascending=False, ignore_index=True)
+
+
+def economia_carga(dados):
+    """Economia registrada pelo modo de tipos compactos (vazio se o período não foi aberto nesse modo)"""
+    economia = getattr(dados, 'economia_tipos', None) or {}
+    df = pd.DataFrame(
+        [(tabela, antes, depois) for tabela, (antes, depois) in economia.items()],
+        columns=['tabela', 'bytes_lidos', 'bytes_compactos'],
+    )
+    df['economia'] = df['bytes_lidos'] - df['bytes_compactos']
+    return df.sort_values('economia', ascending=False, ignore_index=True)
+
+
+def uso_memoria_cache(cache):
+    """uso_memoria de todos os períodos do cache compartilhado, com a coluna 'periodo'"""
+    partes = [uso_memoria(dados).assign(periodo=pasta) for pasta, dados in cache.periodos()]
+    if not partes:
+        return uso_memoria({}).assign(periodo=pd.Series(dtype=str))
+    return pd.concat(partes, ignore_index=True)
+
+
+def resumo_por_periodo(uso):
+    """Totais por período de um DataFrame de uso_memoria_cache"""
+    return (
+        uso.groupby('periodo', sort=False)[['bytes', 'bytes_texto', 'bytes_compacto', 'economia']].sum()
+        .assign(tabelas=uso.groupby('periodo', sort=False).size())
+        .sort_values('bytes', ascending=False)
+        .reset_index()
+    )
+
+
+# =============================================================================
+# RELATÓRIO OFFLINE
+# =============================================================================
+
+def _mb(valor):
+    return f'{valor / 1024 ** 2:,.1f} MB'
+
+
+def relatorio(pastas, raiz='Resultados', qtd_sugestoes=20):
+    """Carrega cada período por completo nos dois modos e imprime memória, sugestões e economia"""
+    total_normal = total_compacto = 0
+    for pasta in pastas:
+        dados = carregar_tudo(carregar_periodo(f'{raiz}/{pasta}'))
+        uso = uso_memoria(dados)
+        compacto = economia_carga(carregar_tudo(carregar_periodo(f'{raiz}/{pasta}', otimizar=True)))
+        total_normal += uso['bytes'].sum()
+        total_compacto += compacto['bytes_compactos'].sum()
+
+        print(f'\n=== {pasta}: {_mb(uso["bytes"].sum())} em {len(uso)} tabelas '
+              f'(modo compacto: {_mb(compacto["bytes_compactos"].sum())})')
+        maiores = uso.head(10).assign(MB=lambda d: d['bytes'] / 1024 ** 2, MB_compacto=lambda d: d['bytes_compacto'] / 1024 ** 2)
+        print(maiores[['tabela', 'linhas', 'colunas', 'MB', 'MB_compacto']].to_string(index=False, float_format=lambda x: f'{x:.2f}'))
+        sugestoes = sugestoes_tipos(dados).head(qtd_sugestoes)
+        if len(sugestoes):
+            print('\nSugestões de tipos:')
+            print(sugestoes.assign(KB=sugestoes['economia'] / 1024)[['tabela', 'coluna', 'tipo_atual', 'tipo_sugerido', 'KB']]
+                  .to_string(index=False, float_format=lambda x: f'{x:,.0f}'))
+
+    print(f'\nTotal: {_mb(total_normal)} -> {_mb(total_compacto)} com OTIMIZAR_TIPOS=1 '
+          f'({(1 - total_compacto / total_normal) if total_normal else 0:.0%} a menos)')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Memória por tabela e período, com sugestões de tipos')
+    parser.add_argument('--raiz', default='Resultados', help='Pasta raiz dos resultados')
+    parser.add_argument('--periodos', help='Pastas separadas por vírgula; padrão: todas de indice_periodos.csv')
+    parser.add_argument('--sugestoes', type=int, default=20, help='Sugestões de tipo listadas por período')
+    args = parser.parse_args()
+
+    if args.periodos:
+        pastas = args.periodos.split(',')
+    else:
+        pastas = pd.read_csv(f'{args.raiz}/indice_periodos.csv')['pasta'].tolist()
+    relatorio(pastas, args.raiz, args.sugestoes)
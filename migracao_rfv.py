@@ -0,0 +1,72 @@
+"""
+MIGRAÇÃO DE PERFIS RFV ENTRE PERÍODOS
+Matriz de transição de perfis (VIP -> Premium, Potencial -> VIP, ...) cruzando os
+clientes (cliente_id) de rfv_quintis_global.csv de dois períodos.
+
+Clientes só do período de origem saem como 'Inativo'; clientes só do período de
+destino entram como 'Novo'. O join é feito por busca binária em arrays ordenados
+de cliente_id (O(n log n), sem hash de pandas).
+"""
+
+import numpy as np
+import pandas as pd
+
+import rfv_scores
+
+PERFIS = ['VIP', 'Premium', 'Potencial', 'Pontual']
+NOVO = 'Novo'
+INATIVO = 'Inativo'
+
+# Método -> função que classifica os clientes de um período
+METODOS_MIGRACAO = {
+    'quintis': lambda clientes: clientes['perfil_quintis'].astype(str).to_numpy(),
+    'valor': lambda clientes: rfv_scores.perfil_por_valor(clientes['valor_periodo'].to_numpy()),
+}
+
+
+def _ids_e_perfis(clientes, metodo):
+    """cliente_id ordenado e código do perfil (posição em PERFIS) de cada cliente"""
+    ids = clientes['cliente_id'].to_numpy()
+    codigos = pd.Categorical(METODOS_MIGRACAO[metodo](clientes), categories=PERFIS).codes.astype(np.int64)
+    if not np.all(ids[:-1] <= ids[1:]):
+        ordem = np.argsort(ids, kind='stable')
+        ids, codigos = ids[ordem], codigos[ordem]
+    return ids, codigos
+
+
+def matriz_migracao(clientes_origem, clientes_destino, metodo='quintis'):
+    """Matriz de clientes por (perfil na origem, perfil no destino)
+
+    Linhas: PERFIS + 'Novo'; colunas: PERFIS + 'Inativo'.
+    """
+    ids_a, perfil_a = _ids_e_perfis(clientes_origem, metodo)
+    ids_b, perfil_b = _ids_e_perfis(clientes_destino, metodo)
+
+    # Join por busca binária: posição de cada cliente da origem no destino
+    pos = np.searchsorted(ids_b, ids_a)
+    pos_valida = np.minimum(pos, max(len(ids_b) - 1, 0))
+    encontrado = (pos < len(ids_b)) & (ids_b[pos_valida] == ids_a) if len(ids_b) else np.zeros(len(ids_a), bool)
+    no_destino = np.zeros(len(ids_b), dtype=bool)
+    no_destino[pos[encontrado]] = True
+
+    n = len(PERFIS)  # índice extra: Novo (linha) / Inativo (coluna)
+    origem = np.concatenate([perfil_a, np.full((~no_destino).sum(), n)])
+    destino = np.concatenate([np.where(encontrado, perfil_b[pos_valida], n), perfil_b[~no_destino]])
+    contagem = np.bincount(origem * (n + 1) + destino, minlength=(n + 1) ** 2).reshape(n + 1, n + 1)
+
+    matriz = pd.DataFrame(contagem, index=PERFIS + [NOVO], columns=PERFIS + [INATIVO])
+    matriz.loc[NOVO, INATIVO] = 0  # combinação impossível
+    return matriz
+
+
+def resumo_migracao(matriz):
+    """Totais de retidos, upgrades, downgrades, novos e inativos"""
+    perfis = matriz.loc[PERFIS, PERFIS].to_numpy()
+    return {
+        'retidos': int(perfis.sum()),
+        'mesmo_perfil': int(np.trace(perfis)),
+        'upgrades': int(np.tril(perfis, -1).sum()),    # PERFIS vai do melhor para o pior
+        'downgrades': int(np.triu(perfis, 1).sum()),
+        'novos': int(matriz.loc[NOVO, PERFIS].sum()),
+        'inativos': int(matriz.loc[PERFIS, INATIVO].sum()),
+    }
@@ -0,0 +1,59 @@
+"""
+PÁGINAS DO DASHBOARD
+Registro das páginas do menu: cada página é um módulo deste pacote com
+render(ctx), importado só quando é escolhida (uma vez por processo) e executado
+só no rerun em que está selecionada.
+
+O script principal resolve autenticação, períodos, filtro de shoppings e menu,
+monta um ContextoPagina e chama executar_pagina(); a página lê do contexto o que
+usa. Carregadores memorizados de uma única página (cubo mensal, coortes, RFV
+de intervalo) ficam no módulo da página, junto com os imports que só ela usa.
+"""
+
+import importlib
+from types import SimpleNamespace
+
+PAGINA_ADMIN = "⚙️ Administração"
+
+# Rótulo do menu -> módulo do pacote (na ordem do menu)
+PAGINAS = {
+    "📊 Visão Geral": 'visao_geral',
+    "🎭 Personas": 'personas',
+    "🏬 Por Shopping": 'por_shopping',
+    "👥 Perfil Demográfico": 'perfil_demografico',
+    "⭐ High Spenders": 'high_spenders',
+    "🏆 Top Consumidores": 'top_consumidores',
+    "🛒 Segmentos": 'segmentos',
+    "🎯 RFV": 'rfv',
+    "⏰ Comportamento": 'comportamento',
+    "📈 Comparativo": 'comparativo',
+    "📆 Evolução": 'evolucao',
+    "🔁 Retenção": 'retencao',
+    "📥 Exportar Dados": 'exportar_dados',
+    "🤖 Assistente": 'assistente',
+    "📚 Documentação": 'documentacao',
+    PAGINA_ADMIN: 'administracao',
+}
+
+
+class ContextoPagina(SimpleNamespace):
+    """Estado do rerun compartilhado com a página
+
+    - Dados: dados, dados_periodos, indice_periodos, periodo_selecionado,
+      periodos_selecionados, periodo_pasta, periodos_pasta, modo_comparativo
+    - Permissões: username, is_admin, shoppings_permitidos_filtro
+    - Apresentação: CORES_SHOPPING, NOMES_SHOPPING, CORES_PERIODOS, CORES_PERFIL, ORDEM_PERFIL
+    - Funções do script: plotly_chart, figura (gráfico pelo cache de figuras),
+      filtrar_opcoes_shopping, registrar_filtro, registrar_download, enviar_email,
+      calcular_migracao e os recursos do processo usados pela Administração
+      (cache_periodos, cache_figuras, fila_emails, logs...)
+    """
+
+
+def modulo_pagina(pagina):
+    """Módulo da página (importado na primeira vez que é pedido)"""
+    return importlib.import_module(f'{__name__}.{PAGINAS[pagina]}')
+
+
+def executar_pagina(pagina, ctx):
+    modulo_pagina(pagina).render(ctx)
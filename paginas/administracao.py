@@ -0,0 +1,596 @@
+"""
+PÁGINA: ADMINISTRAÇÃO (apenas para admins)
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit_authenticator as stauth
+from datetime import datetime
+from dados_periodo import OTIMIZAR_TIPOS
+from memoria_periodos import uso_memoria_cache, resumo_por_periodo, sugestoes_tipos, economia_carga
+from desempenho import ETAPA_TOTAL
+
+
+def render(ctx):
+    username = ctx.username
+    dados = ctx.dados
+    is_admin = ctx.is_admin
+    plotly_chart = ctx.plotly_chart
+    registrar_filtro = ctx.registrar_filtro
+    cache_periodos = ctx.cache_periodos
+    cache_figuras = ctx.cache_figuras
+    fila_emails = ctx.fila_emails
+    registro_desempenho = ctx.registro_desempenho
+    carregar_logs = ctx.carregar_logs
+    cliente_logs = ctx.cliente_logs
+    gravador_logs = ctx.gravador_logs
+    get_gsheets_connection = ctx.get_gsheets_connection
+    carregar_config_auth = ctx.carregar_config_auth
+
+    if not is_admin():
+        st.error("❌ Acesso negado. Esta página é exclusiva para administradores.")
+        st.stop()
+
+    st.markdown('<p class="main-header">⚙️ Painel de Administração</p>', unsafe_allow_html=True)
+
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["👥 Usuários", "📊 Logs de Acesso", "⚙️ Configurações", "📋 Instruções", "⏱️ Desempenho"])
+
+    with tab1:
+        st.subheader("👥 Gerenciamento de Usuários")
+
+        st.info("""
+        **Como gerenciar usuários:**
+
+        Os usuários são configurados no arquivo `secrets.toml` do Streamlit Cloud.
+        Para adicionar, editar ou remover usuários, acesse:
+
+        1. [Streamlit Cloud](https://share.streamlit.io/)
+        2. Selecione o app `dashboard-perfil-cliente`
+        3. Clique em **Settings** → **Secrets**
+        4. Edite a configuração conforme instruções abaixo
+        """)
+
+        st.markdown("### Usuários Atuais")
+
+        # Mostrar lista de usuários (sem senhas)
+        config = carregar_config_auth()
+        if config and 'credentials' in config and 'usernames' in config['credentials']:
+            usuarios = []
+            for username, user_data in config['credentials']['usernames'].items():
+                usuarios.append({
+                    'Usuário': username,
+                    'Nome': user_data.get('name', 'N/A'),
+                    'Email': user_data.get('email', 'N/A'),
+                    'Perfil': 'Administrador' if user_data.get('role', 'viewer') == 'admin' else 'Visualizador'
+                })
+
+            df_usuarios = pd.DataFrame(usuarios)
+            st.dataframe(df_usuarios, use_container_width=True, hide_index=True)
+
+            st.metric("Total de Usuários", len(usuarios))
+
+            # Estatísticas
+            col1, col2 = st.columns(2)
+            with col1:
+                admins = len([u for u in usuarios if u['Perfil'] == 'Administrador'])
+                st.metric("Administradores", admins)
+            with col2:
+                viewers = len([u for u in usuarios if u['Perfil'] == 'Visualizador'])
+                st.metric("Visualizadores", viewers)
+        else:
+            st.warning("Não foi possível carregar a lista de usuários.")
+
+        st.markdown("---")
+
+        st.markdown("### Gerar Hash de Senha")
+        st.caption("Use esta ferramenta para gerar o hash de uma nova senha")
+
+        nova_senha = st.text_input("Digite a nova senha:", type="password", key="nova_senha_hash")
+        if st.button("Gerar Hash"):
+            if nova_senha:
+                # Gerar hash da senha (API v0.3+)
+                hashed = stauth.Hasher.hash(nova_senha)
+                st.code(hashed, language=None)
+                st.success("✅ Hash gerado! Copie e cole no secrets.toml")
+            else:
+                st.warning("Digite uma senha para gerar o hash")
+
+    with tab2:
+        st.subheader("📊 Logs de Acesso")
+
+        # Verificar se Google Sheets está configurado
+        if cliente_logs() is None:
+            st.warning("""
+            **Logs de acesso** não estão configurados.
+
+            Para ativar, configure as credenciais do Google Sheets no secrets.toml
+            (ou a variável de ambiente LOGS_SQLITE para gravar num arquivo local).
+            """)
+        else:
+            # Debug: Mostrar erros se houver
+            if st.session_state.get('gsheets_error'):
+                st.error(f"⚠️ Erro Google Sheets: {st.session_state.get('gsheets_error')}")
+
+            # Botões de teste
+            col_test1, col_test2, col_test3 = st.columns([1, 1, 2])
+            with col_test1:
+                if st.button("🔄 Testar Conexão"):
+                    with st.spinner("Testando..."):
+                        try:
+                            cliente = get_gsheets_connection()
+                            st.success(f"✅ Conectado! Planilha: {cliente.titulo()}")
+                            st.info(f"Abas encontradas: {', '.join(cliente.abas())}")
+                        except Exception as e:
+                            st.error(f"❌ Falha na conexão: {str(e)}")
+
+            with col_test2:
+                if st.button("📝 Testar Registro Filtro"):
+                    resultado = registrar_filtro(username, "Teste Admin", "Filtro Teste", "Valor Teste")
+                    falhas_antes = gravador_logs().falhas if resultado else 0
+                    # Envia a fila agora para confirmar a gravação na planilha
+                    if resultado and gravador_logs().descarregar(timeout=30) and gravador_logs().falhas == falhas_antes:
+                        st.success("✅ Filtro de teste registrado!")
+                    else:
+                        st.error(f"❌ Falha: {st.session_state.get('gsheets_error') or gravador_logs().ultimo_erro or 'Erro desconhecido'}")
+
+            # Fila do gravador em segundo plano
+            gravador = gravador_logs()
+            if gravador is not None:
+                estatisticas_logs = gravador.estatisticas()
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("Eventos na fila", estatisticas_logs['pendentes'])
+                col2.metric("Enviados", estatisticas_logs['enviados'])
+                col3.metric("Falhas de envio", estatisticas_logs['falhas'])
+                col4.metric("Descartados (fila cheia)", estatisticas_logs['descartados'])
+
+            st.markdown("---")
+
+            # Filtros em linha
+            col_filtro1, col_filtro2, col_filtro3 = st.columns(3)
+
+            with col_filtro3:
+                fonte_log = st.radio(
+                    "Fonte:",
+                    ["local", "planilha"],
+                    format_func=lambda x: {"local": "💾 Spool local", "planilha": "📗 Google Sheets"}.get(x, x),
+                    horizontal=True,
+                    help="O spool local tem os eventos mais recentes, inclusive os ainda não enviados à planilha."
+                )
+
+            with col_filtro1:
+                tipo_log = st.selectbox(
+                    "Tipo de log:",
+                    ["logins", "navegacao", "filtros", "downloads"],
+                    format_func=lambda x: {
+                        "logins": "🔐 Logins",
+                        "navegacao": "📄 Navegação",
+                        "filtros": "🔍 Filtros",
+                        "downloads": "⬇️ Downloads"
+                    }.get(x, x)
+                )
+
+            # Filtro de usuário (lista pelo índice do spool, sem ler os registros)
+            with col_filtro2:
+                usuarios_disponiveis = ['Todos'] + gravador_logs().spool.usuarios(tipo_log)
+                usuario_filtro = st.selectbox("Usuário:", usuarios_disponiveis)
+
+            col_filtro1, col_filtro2 = st.columns(2)
+            with col_filtro1:
+                datas_log = st.date_input("Período:", value=(), format="DD/MM/YYYY", help="Vazio: sem filtro de data")
+            with col_filtro2:
+                limite_log = st.selectbox("Registros:", [100, 500, 1000, 5000], index=1)
+
+            desde_log = datas_log[0] if len(datas_log) > 0 else None
+            ate_log = datas_log[1] if len(datas_log) > 1 else desde_log
+
+            # Carregar logs (filtros aplicados na leitura)
+            with st.spinner("Carregando logs..."):
+                df_logs = carregar_logs(
+                    tipo_log,
+                    limite=limite_log,
+                    fonte=fonte_log,
+                    usuario=None if usuario_filtro == 'Todos' else usuario_filtro,
+                    desde=desde_log,
+                    ate=ate_log
+                )
+
+            # Métricas do período pelos agregados diários (todos os eventos, não só os carregados)
+            agregados = gravador_logs().agregados
+            agregados.atualizar()
+            usuario_agregado = None if usuario_filtro == 'Todos' else usuario_filtro
+            totais_uso = agregados.totais(desde_log, ate_log, usuario_agregado)
+
+            st.markdown(f"### Resumo - {tipo_log.capitalize()}")
+            st.caption("Contadores diários de todos os eventos registrados neste servidor no período selecionado.")
+
+            if tipo_log == "logins":
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Total de Logins", f"{totais_uso['logins']:,}")
+                with col2:
+                    st.metric("Usuários Únicos", totais_uso['usuarios'])
+                with col3:
+                    if df_logs is not None and len(df_logs) > 0 and 'timestamp' in df_logs.columns:
+                        ultimo = str(df_logs.iloc[0]['timestamp'])
+                        st.metric("Último Login", ultimo[:16] if len(ultimo) > 16 else ultimo)
+
+            elif tipo_log == "navegacao":
+                paginas_uso = agregados.paginas(desde_log, ate_log)
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Total de Acessos", f"{totais_uso['acessos']:,}")
+                with col2:
+                    if paginas_uso:
+                        st.metric("Página Mais Acessada", paginas_uso[0]['pagina'][:20])
+                with col3:
+                    st.metric("Usuários Ativos", totais_uso['usuarios'])
+                if paginas_uso:
+                    fig = px.bar(pd.DataFrame(paginas_uso), x='acessos', y='pagina', orientation='h', title="Acessos por Página")
+                    fig.update_layout(height=max(300, 30 * len(paginas_uso)), yaxis={'categoryorder': 'total ascending'})
+                    plotly_chart(fig, use_container_width=True)
+
+            elif tipo_log == "filtros":
+                filtros_uso = agregados.filtros(desde_log, ate_log)
+                if filtros_uso:
+                    df_filtros_uso = pd.DataFrame(filtros_uso)
+                    st.metric("Filtros Aplicados", f"{int(df_filtros_uso['usos'].sum()):,}")
+                    fig = px.bar(df_filtros_uso, x='usos', y='filtro', color='pagina', orientation='h', title="Uso de Filtros por Página")
+                    fig.update_layout(height=max(300, 30 * df_filtros_uso['filtro'].nunique()), yaxis={'categoryorder': 'total ascending'})
+                    plotly_chart(fig, use_container_width=True)
+
+            elif tipo_log == "downloads":
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Total de Downloads", f"{totais_uso['downloads']:,}")
+                with col2:
+                    st.metric("Registros Baixados", f"{int(totais_uso['registros']):,}")
+                downloads_uso = agregados.downloads(desde_log, ate_log, usuario_agregado)
+                if downloads_uso:
+                    st.dataframe(
+                        pd.DataFrame(downloads_uso).rename(columns={'usuario': 'Usuário', 'downloads': 'Downloads', 'registros': 'Registros'}),
+                        use_container_width=True, hide_index=True
+                    )
+
+            # Gráfico de atividade (para logins e navegação)
+            if tipo_log in ["logins", "navegacao"]:
+                atividade_dia = pd.DataFrame(agregados.por_dia(desde_log, ate_log, usuario_agregado))
+                if len(atividade_dia) > 0:
+                    st.markdown("### Atividade por Dia")
+                    coluna_atividade = 'logins' if tipo_log == "logins" else 'acessos'
+                    fig = px.bar(atividade_dia, x='dia', y=coluna_atividade, title="Acessos por Dia" if tipo_log == "navegacao" else "Logins por Dia")
+                    fig.add_scatter(x=atividade_dia['dia'], y=atividade_dia['usuarios_ativos'], mode='lines+markers', name='Usuários ativos')
+                    fig.update_layout(height=300)
+                    plotly_chart(fig, use_container_width=True)
+
+            st.markdown("---")
+
+            if df_logs is not None and len(df_logs) > 0:
+                # Tabela de logs
+                st.markdown(f"### Últimos {len(df_logs)} Registros")
+                st.dataframe(df_logs, use_container_width=True, hide_index=True, height=400)
+
+                # Botão para baixar logs
+                csv_logs = df_logs.to_csv(index=False, sep=';', encoding='utf-8-sig')
+                st.download_button(
+                    label=f"⬇️ Baixar Logs ({tipo_log})",
+                    data=csv_logs,
+                    file_name=f"logs_{tipo_log}_{datetime.now().strftime('%Y%m%d')}.csv",
+                    mime="text/csv"
+                )
+            else:
+                st.info(f"Nenhum registro encontrado para **{tipo_log}**.")
+
+        st.markdown("---")
+
+        # Informações da sessão atual
+        st.markdown("### Sessão Atual")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Usuário", st.session_state.get('username', 'N/A'))
+        with col2:
+            st.metric("Nome", st.session_state.get('name', 'N/A'))
+        with col3:
+            st.metric("Perfil", "Admin" if st.session_state.get('role') == 'admin' else "Viewer")
+
+    with tab3:
+        st.subheader("⚙️ Configurações do Sistema")
+
+        st.markdown("### Informações do Dashboard")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Clientes Únicos", f"{dados['clientes_unicos']:,}")
+            st.metric("Valor Total", f"R$ {dados['resumo']['valor_total'].sum()/1e6:.1f}M")
+        with col2:
+            st.metric("Shoppings", len(dados['resumo']))
+            st.metric("Personas", len(dados['personas']))
+
+        st.markdown("---")
+
+        st.markdown("### Cache de Períodos")
+        estatisticas_cache = cache_periodos().estatisticas()
+        consultas_cache = estatisticas_cache['acertos'] + estatisticas_cache['faltas']
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Períodos em memória", estatisticas_cache['periodos'])
+        col2.metric(
+            "Memória usada",
+            f"{estatisticas_cache['bytes'] / 1024**2:,.0f} MB",
+            delta=f"de {estatisticas_cache['orcamento_bytes'] / 1024**2:,.0f} MB",
+            delta_color="off"
+        )
+        col3.metric("Taxa de acerto", f"{estatisticas_cache['acertos'] / consultas_cache:.1%}" if consultas_cache else "-")
+        col4.metric("Remoções (LRU)", estatisticas_cache['remocoes'])
+        if estatisticas_cache['por_periodo']:
+            df_cache = pd.DataFrame(
+                [(pasta, b / 1024**2) for pasta, b in estatisticas_cache['por_periodo'].items()],
+                columns=['Período', 'MB']
+            ).iloc[::-1]
+            st.dataframe(df_cache.round(1), use_container_width=True, hide_index=True)
+            st.caption("Do mais recente para o menos recente. Orçamento configurável pela variável de ambiente ORCAMENTO_CACHE_MB.")
+        if st.button("🗑️ Limpar cache de períodos"):
+            cache_periodos().limpar()
+            st.rerun()
+
+        if st.toggle("Memória por tabela", key="admin_memoria_tabelas"):
+            uso_cache = uso_memoria_cache(cache_periodos())
+            if uso_cache.empty:
+                st.info("Nenhum período em memória.")
+            else:
+                resumo_memoria = resumo_por_periodo(uso_cache)
+                col1, col2, col3 = st.columns(3)
+                col1.metric("Tabelas carregadas", len(uso_cache))
+                col2.metric("Memória real (deep)", f"{uso_cache['bytes'].sum() / 1024**2:,.1f} MB")
+                col3.metric("Com tipos compactos", f"{uso_cache['bytes_compacto'].sum() / 1024**2:,.1f} MB")
+                st.dataframe(
+                    resumo_memoria.assign(
+                        MB=resumo_memoria['bytes'] / 1024**2,
+                        MB_texto=resumo_memoria['bytes_texto'] / 1024**2,
+                        MB_compacto=resumo_memoria['bytes_compacto'] / 1024**2,
+                    )[['periodo', 'tabelas', 'MB', 'MB_texto', 'MB_compacto']].round(2).rename(columns={
+                        'periodo': 'Período', 'tabelas': 'Tabelas', 'MB_texto': 'MB em texto', 'MB_compacto': 'MB compacto'
+                    }),
+                    use_container_width=True, hide_index=True
+                )
+                st.dataframe(
+                    uso_cache.assign(KB=uso_cache['bytes'] / 1024, KB_compacto=uso_cache['bytes_compacto'] / 1024)
+                    [['periodo', 'tabela', 'linhas', 'colunas', 'KB', 'KB_compacto']].head(50).round(1)
+                    .rename(columns={'periodo': 'Período', 'tabela': 'Tabela', 'linhas': 'Linhas',
+                                     'colunas': 'Colunas', 'KB_compacto': 'KB compacto'}),
+                    use_container_width=True, hide_index=True
+                )
+
+                periodos_cache = dict(cache_periodos().periodos())
+                periodo_memoria = st.selectbox("Sugestões de tipos do período", list(periodos_cache), key="admin_memoria_periodo")
+                sugestoes = sugestoes_tipos(periodos_cache[periodo_memoria])
+                if sugestoes.empty:
+                    st.caption("Nenhuma coluna carregada ganha com tipo menor.")
+                else:
+                    st.dataframe(
+                        sugestoes.assign(KB_economia=sugestoes['economia'] / 1024)
+                        [['tabela', 'coluna', 'tipo_atual', 'tipo_sugerido', 'KB_economia']].head(30).round(1)
+                        .rename(columns={'tabela': 'Tabela', 'coluna': 'Coluna', 'tipo_atual': 'Tipo atual',
+                                         'tipo_sugerido': 'Tipo sugerido', 'KB_economia': 'KB a menos'}),
+                        use_container_width=True, hide_index=True
+                    )
+                economia = economia_carga(periodos_cache[periodo_memoria])
+                if OTIMIZAR_TIPOS and not economia.empty:
+                    st.success(
+                        f"Carga com tipos compactos: {economia['bytes_lidos'].sum() / 1024**2:,.2f} MB lidos → "
+                        f"{economia['bytes_compactos'].sum() / 1024**2:,.2f} MB em memória "
+                        f"({economia['economia'].sum() / 1024**2:,.2f} MB economizados)."
+                    )
+                elif not OTIMIZAR_TIPOS:
+                    st.caption("Defina OTIMIZAR_TIPOS=1 para carregar as tabelas já com categóricas e inteiros/floats menores.")
+
+        st.markdown("---")
+
+        st.markdown("### Cache de Figuras")
+        estatisticas_figuras = cache_figuras().estatisticas()
+        consultas_figuras = estatisticas_figuras['acertos'] + estatisticas_figuras['faltas']
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Figuras em memória", estatisticas_figuras['figuras'])
+        col2.metric(
+            "Memória usada",
+            f"{estatisticas_figuras['bytes'] / 1024**2:,.1f} MB",
+            delta=f"de {estatisticas_figuras['orcamento_bytes'] / 1024**2:,.0f} MB",
+            delta_color="off"
+        )
+        col3.metric("Taxa de acerto", f"{estatisticas_figuras['acertos'] / consultas_figuras:.1%}" if consultas_figuras else "-")
+        col4.metric("Remoções (LRU)", estatisticas_figuras['remocoes'])
+        if estatisticas_figuras['por_pagina']:
+            df_figuras = pd.DataFrame(
+                sorted(estatisticas_figuras['por_pagina'].items(), key=lambda item: -item[1]),
+                columns=['Página', 'Figuras']
+            )
+            st.dataframe(df_figuras, use_container_width=True, hide_index=True)
+        st.caption("Gráficos guardados por período, página, filtros e shoppings do usuário. Orçamento configurável pela variável de ambiente ORCAMENTO_FIGURAS_MB.")
+        if st.button("🗑️ Limpar cache de figuras"):
+            cache_figuras().limpar()
+            st.rerun()
+
+        st.markdown("---")
+
+        st.markdown("### Fila de Emails (Fale Conosco)")
+        fila = fila_emails()
+        if fila is None:
+            st.info("SMTP não configurado (secrets SMTP_EMAIL e SMTP_PASSWORD).")
+        else:
+            estatisticas_emails = fila.estatisticas()
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Na fila", estatisticas_emails['pendentes'])
+            col2.metric("Enviados", estatisticas_emails['enviados'])
+            col3.metric("Falharam", estatisticas_emails['falhas'])
+            if estatisticas_emails['ultimo_erro']:
+                st.warning(f"Último erro de envio: {estatisticas_emails['ultimo_erro']}")
+
+        st.markdown("---")
+
+        st.markdown("### Links Úteis")
+        st.markdown("""
+        - [Streamlit Cloud - Configurações](https://share.streamlit.io/)
+        - [GitHub - Repositório](https://github.com/carlosgravi/dashboard-perfil-cliente)
+        - [Documentação Streamlit Authenticator](https://github.com/mkhorasani/Streamlit-Authenticator)
+        """)
+
+    with tab4:
+        st.subheader("📋 Instruções de Configuração")
+
+        st.markdown("""
+        ## Como Adicionar Novos Usuários
+
+        ### 1. Gerar Hash da Senha
+
+        Use a ferramenta na aba **"Usuários"** ou execute localmente:
+
+        ```python
+        import streamlit_authenticator as stauth
+        hashed = stauth.Hasher.hash('senha123')
+        print(hashed)
+        ```
+
+        ### 2. Editar secrets.toml no Streamlit Cloud
+
+        Acesse: **Settings → Secrets** no Streamlit Cloud e adicione:
+
+        ```toml
+        [credentials]
+        [credentials.usernames]
+
+        [credentials.usernames.novo_usuario]
+        name = "Nome do Usuário"
+        email = "email@empresa.com"
+        password = "$2b$12$hash_gerado_aqui"
+        role = "viewer"  # ou "admin"
+
+        [cookie]
+        name = "dashboard_perfil_cliente"
+        key = "sua_chave_secreta_aqui"
+        expiry_days = 30
+
+        [preauthorized]
+        emails = []
+        ```
+
+        ### 3. Níveis de Acesso
+
+        | Perfil | Permissões |
+        |--------|------------|
+        | **admin** | Acesso total + Painel de Administração |
+        | **viewer** | Visualização de todas as páginas (exceto Admin) |
+
+        ### 4. Exemplo Completo
+
+        ```toml
+        [credentials]
+        [credentials.usernames]
+
+        [credentials.usernames.admin]
+        name = "Administrador"
+        email = "admin@almeidajunior.com.br"
+        password = "$2b$12$..."
+        role = "admin"
+
+        [credentials.usernames.maria]
+        name = "Maria Silva"
+        email = "maria.silva@almeidajunior.com.br"
+        password = "$2b$12$..."
+        role = "viewer"
+
+        [credentials.usernames.joao]
+        name = "João Santos"
+        email = "joao.santos@almeidajunior.com.br"
+        password = "$2b$12$..."
+        role = "viewer"
+
+        [cookie]
+        name = "dashboard_perfil_cliente"
+        key = "chave_secreta_muito_longa_e_aleatoria_123456"
+        expiry_days = 30
+
+        [preauthorized]
+        emails = []
+        ```
+
+        ### 5. Remover Usuário
+
+        Simplesmente delete o bloco do usuário no secrets.toml.
+
+        ### 6. Alterar Senha
+
+        1. Gere novo hash com a ferramenta
+        2. Substitua o campo `password` do usuário
+
+        ---
+
+        **Importante:**
+        - Nunca compartilhe senhas em texto claro
+        - Use senhas fortes (mínimo 8 caracteres, letras, números e símbolos)
+        - O cookie permite login automático por 30 dias
+        """)
+
+    with tab5:
+        st.subheader("⏱️ Desempenho por Página")
+        st.markdown("""
+        Tempo de cada rerun do script, por página e etapa: autenticação, carga de dados,
+        filtro de shoppings, gravação de logs, envio dos gráficos Plotly e o bloco da página
+        (que inclui a montagem dos gráficos). Guarda as últimas execuções de cada página
+        neste servidor; o rerun desta aba só entra depois de terminar.
+        """)
+
+        registro = registro_desempenho()
+        resumo_desempenho = pd.DataFrame(registro.resumo())
+
+        col1, col2 = st.columns([1, 3])
+        col1.metric("Reruns registrados", f"{registro.execucoes:,}")
+        with col2:
+            st.toggle("Mostrar tempos do rerun no rodapé", key='mostrar_tempos_rerun')
+
+        if len(resumo_desempenho) == 0:
+            st.info("Nenhum rerun registrado ainda. Navegue pelas páginas e volte aqui.")
+        else:
+            totais_pagina = resumo_desempenho[resumo_desempenho['etapa'] == ETAPA_TOTAL].sort_values('p95_ms', ascending=False)
+            fig = go.Figure([
+                go.Bar(name='p50', x=totais_pagina['pagina'], y=totais_pagina['p50_ms']),
+                go.Bar(name='p95', x=totais_pagina['pagina'], y=totais_pagina['p95_ms']),
+            ])
+            fig.update_layout(title="Latência total do rerun por página (ms)", barmode='group', height=400)
+            plotly_chart(fig, use_container_width=True)
+
+            etapas = resumo_desempenho[resumo_desempenho['etapa'] != ETAPA_TOTAL]
+            fig = px.bar(
+                etapas, x='pagina', y='p50_ms', color='etapa',
+                title="Composição do rerun por etapa (p50, ms)",
+                labels={'pagina': 'Página', 'p50_ms': 'ms', 'etapa': 'Etapa'}
+            )
+            fig.update_layout(height=400)
+            plotly_chart(fig, use_container_width=True)
+
+            st.dataframe(
+                resumo_desempenho.rename(columns={
+                    'pagina': 'Página', 'etapa': 'Etapa', 'amostras': 'Amostras', 'media_ms': 'Média (ms)',
+                    'p50_ms': 'p50 (ms)', 'p95_ms': 'p95 (ms)', 'max_ms': 'Máx (ms)'
+                }).round(1),
+                use_container_width=True, hide_index=True
+            )
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.download_button(
+                    label="⬇️ Baixar Resumo (CSV)",
+                    data=resumo_desempenho.to_csv(index=False, sep=';', encoding='utf-8-sig'),
+                    file_name=f"desempenho_resumo_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                    mime="text/csv"
+                )
+            with col2:
+                amostras_desempenho = pd.DataFrame(registro.amostras(), columns=['timestamp', 'pagina', 'etapa', 'ms'])
+                st.download_button(
+                    label="⬇️ Baixar Amostras (CSV)",
+                    data=amostras_desempenho.to_csv(index=False, sep=';', encoding='utf-8-sig'),
+                    file_name=f"desempenho_amostras_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                    mime="text/csv"
+                )
+            with col3:
+                if st.button("🗑️ Limpar medições"):
+                    registro.limpar()
+                    st.rerun()
@@ -0,0 +1,115 @@
+"""
+PÁGINA: COMPARATIVO
+"""
+
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from formatacao import valores_rotulo, rotular
+
+
+def render(ctx):
+    dados = ctx.dados
+    periodo_selecionado = ctx.periodo_selecionado
+    periodos_selecionados = ctx.periodos_selecionados
+    modo_comparativo = ctx.modo_comparativo
+    username = ctx.username
+    shoppings_permitidos_filtro = ctx.shoppings_permitidos_filtro
+    CORES_SHOPPING = ctx.CORES_SHOPPING
+    NOMES_SHOPPING = ctx.NOMES_SHOPPING
+    plotly_chart = ctx.plotly_chart
+    filtrar_opcoes_shopping = ctx.filtrar_opcoes_shopping
+    registrar_filtro = ctx.registrar_filtro
+
+    st.markdown('<p class="main-header">📈 Comparativo entre Shoppings</p>', unsafe_allow_html=True)
+    if modo_comparativo:
+        st.markdown(f"**Comparando períodos:** {' vs '.join(periodos_selecionados)}")
+    else:
+        st.markdown(f"**Período selecionado:** {periodo_selecionado}")
+
+    # Seletor de shoppings para comparar (filtrado por permissões)
+    opcoes_comparativo = filtrar_opcoes_shopping(list(NOMES_SHOPPING.keys()), shoppings_permitidos_filtro)
+    # Definir default apenas com shoppings permitidos
+    default_comparativo = [s for s in ['BS', 'CS', 'NK'] if s in opcoes_comparativo]
+    if len(default_comparativo) < 2:
+        default_comparativo = opcoes_comparativo[:2] if len(opcoes_comparativo) >= 2 else opcoes_comparativo
+    shoppings_comparar = st.multiselect(
+        "Selecione os shoppings para comparar:",
+        options=opcoes_comparativo,
+        default=default_comparativo,
+        format_func=lambda x: f"{x} - {NOMES_SHOPPING[x]}"
+    )
+
+    # Registrar filtro de comparação (quando muda)
+    shoppings_str = ', '.join(sorted(shoppings_comparar))
+    chave_anterior = 'anterior_comparativo'
+    if st.session_state.get(chave_anterior) != shoppings_str:
+        registrar_filtro(username, "Comparativo", "Shoppings", shoppings_str)
+        st.session_state[chave_anterior] = shoppings_str
+
+    if len(shoppings_comparar) >= 2:
+        df_comp = dados['resumo'][dados['resumo']['sigla'].isin(shoppings_comparar)]
+
+        # Radar chart
+        st.subheader("Comparativo de Métricas (Normalizado)")
+
+        # Normalizar métricas para radar
+        df_radar = df_comp[['sigla', 'clientes', 'valor_total', 'ticket_medio', 'qtd_high_spenders']].copy()
+        for col in ['clientes', 'valor_total', 'ticket_medio', 'qtd_high_spenders']:
+            max_val = df_radar[col].max()
+            df_radar[col] = (df_radar[col] / max_val * 100).round(1)
+
+        fig = go.Figure()
+
+        categories = ['Clientes', 'Valor Total', 'Ticket Médio', 'High Spenders']
+
+        for _, row in df_radar.iterrows():
+            fig.add_trace(go.Scatterpolar(
+                r=[row['clientes'], row['valor_total'], row['ticket_medio'], row['qtd_high_spenders']],
+                theta=categories,
+                fill='toself',
+                name=row['sigla'],
+                line_color=CORES_SHOPPING.get(row['sigla'], '#7F8C8D')
+            ))
+
+        fig.update_layout(
+            polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+            showlegend=True,
+            height=500
+        )
+        plotly_chart(fig, use_container_width=True)
+
+        # Comparativo de barras
+        st.subheader("Comparativo de Valores Absolutos")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fig = px.bar(
+                df_comp,
+                x='sigla',
+                y='valor_total',
+                color='sigla',
+                color_discrete_map=CORES_SHOPPING,
+                title='Valor Total',
+                text=valores_rotulo(df_comp['valor_total'], 'milhoes')
+            )
+            fig.update_layout(showlegend=False)
+            rotular(fig, 'milhoes', textposition='outside')
+            plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            fig = px.bar(
+                df_comp,
+                x='sigla',
+                y='ticket_medio',
+                color='sigla',
+                color_discrete_map=CORES_SHOPPING,
+                title='Ticket Médio',
+                text=valores_rotulo(df_comp['ticket_medio'], 'moeda_inteira')
+            )
+            fig.update_layout(showlegend=False)
+            rotular(fig, 'moeda_inteira', textposition='outside')
+            plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("Selecione pelo menos 2 shoppings para comparar.")
@@ -0,0 +1,149 @@
+"""
+PÁGINA: COMPORTAMENTO
+"""
+
+import streamlit as st
+import plotly.express as px
+from formatacao import valores_rotulo, rotular
+
+
+def render(ctx):
+    dados = ctx.dados
+    periodo_selecionado = ctx.periodo_selecionado
+    periodos_selecionados = ctx.periodos_selecionados
+    modo_comparativo = ctx.modo_comparativo
+    plotly_chart = ctx.plotly_chart
+    figura = ctx.figura
+
+    st.markdown('<p class="main-header">⏰ Comportamento de Compra</p>', unsafe_allow_html=True)
+    if modo_comparativo:
+        st.markdown(f"**Comparando:** {' vs '.join(periodos_selecionados)}")
+    else:
+        st.markdown(f"**Período selecionado:** {periodo_selecionado}")
+
+    st.markdown("""
+    Análise do **comportamento de compra** dos clientes por período do dia e dia da semana,
+    segmentado por faixa etária.
+    """)
+
+    tab1, tab2 = st.tabs(["🌅 Período do Dia", "📅 Dia da Semana"])
+
+    with tab1:
+        st.subheader("Comportamento por Período do Dia")
+
+        df_periodo_total = dados['derivados']['comportamento_periodo_total']
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            def grafico_valor_por_periodo_dia():
+                fig = px.pie(
+                    df_periodo_total,
+                    values='valor',
+                    names='periodo_dia',
+                    title='Valor por Período',
+                    color='periodo_dia',
+                    color_discrete_map={
+                        'Manha (6h-12h)': '#FFC107',
+                        'Tarde (12h-18h)': '#FF9800',
+                        'Noite (18h-22h)': '#673AB7'
+                    }
+                )
+                return fig
+
+            plotly_chart(figura('valor_por_periodo_dia', grafico_valor_por_periodo_dia), use_container_width=True)
+
+        with col2:
+            def grafico_transacoes_por_periodo_dia():
+                fig = px.pie(
+                    df_periodo_total,
+                    values='transacoes',
+                    names='periodo_dia',
+                    title='Transações por Período',
+                    color='periodo_dia',
+                    color_discrete_map={
+                        'Manha (6h-12h)': '#FFC107',
+                        'Tarde (12h-18h)': '#FF9800',
+                        'Noite (18h-22h)': '#673AB7'
+                    }
+                )
+                return fig
+
+            plotly_chart(figura('transacoes_por_periodo_dia', grafico_transacoes_por_periodo_dia), use_container_width=True)
+
+        st.markdown("---")
+        st.subheader("Período por Faixa Etária")
+
+        # Heatmap período x faixa
+        def grafico_heatmap_faixa_periodo_dia():
+            fig = px.imshow(
+                dados['derivados']['comportamento_periodo_faixa'].set_index('faixa_etaria'),
+                labels={'x': 'periodo_dia'},
+                color_continuous_scale='YlOrRd',
+                aspect='auto',
+                text_auto='.2s',
+                title='Valor por Faixa Etária e Período'
+            )
+            fig.update_layout(height=400)
+            return fig
+
+        plotly_chart(figura('heatmap_faixa_periodo_dia', grafico_heatmap_faixa_periodo_dia), use_container_width=True)
+
+    with tab2:
+        st.subheader("Comportamento por Dia da Semana")
+
+        df_dia_total = dados['derivados']['comportamento_dia_total']
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            def grafico_valor_por_dia_semana():
+                fig = px.bar(
+                    df_dia_total,
+                    x='dia_semana',
+                    y='valor',
+                    color='valor',
+                    color_continuous_scale='Blues',
+                    title='Valor por Dia da Semana',
+                    text=valores_rotulo(df_dia_total['valor'], 'milhoes')
+                )
+                fig.update_layout(showlegend=False)
+                rotular(fig, 'milhoes', textposition='outside')
+                return fig
+
+            plotly_chart(figura('valor_por_dia_semana', grafico_valor_por_dia_semana), use_container_width=True)
+
+        with col2:
+            def grafico_transacoes_por_dia_semana():
+                fig = px.bar(
+                    df_dia_total,
+                    x='dia_semana',
+                    y='transacoes',
+                    color='transacoes',
+                    color_continuous_scale='Greens',
+                    title='Transações por Dia da Semana',
+                    text='transacoes'
+                )
+                fig.update_layout(showlegend=False)
+                fig.update_traces(textposition='outside')
+                return fig
+
+            plotly_chart(figura('transacoes_por_dia_semana', grafico_transacoes_por_dia_semana), use_container_width=True)
+
+        st.markdown("---")
+        st.subheader("Dia da Semana por Faixa Etária")
+
+        # Heatmap dia x faixa
+        def grafico_heatmap_faixa_dia_semana():
+            fig = px.imshow(
+                dados['derivados']['comportamento_dia_faixa'].set_index('faixa_etaria'),
+                labels={'x': 'dia_semana'},
+                color_continuous_scale='Purples',
+                aspect='auto',
+                text_auto='.2s',
+                title='Valor por Faixa Etária e Dia da Semana'
+            )
+            fig.update_layout(height=400)
+            return fig
+
+        plotly_chart(figura('heatmap_faixa_dia_semana', grafico_heatmap_faixa_dia_semana), use_container_width=True)
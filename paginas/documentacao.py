@@ -0,0 +1,395 @@
+"""
+PÁGINA: DOCUMENTAÇÃO
+"""
+
+import streamlit as st
+
+
+def render(ctx):
+    dados = ctx.dados
+
+    st.markdown('<p class="main-header">📚 Documentação do Dashboard</p>', unsafe_allow_html=True)
+
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["📋 Visão Geral", "📊 Métricas", "🎯 RFV", "🎭 Personas & HS", "📁 Dados", "❓ Glossário"])
+
+    with tab1:
+        # Calcular valores dinâmicos para documentação
+        hs_unicos_doc = int(dados['comparacao_hs'].loc[dados['comparacao_hs']['Metrica'] == 'Qtd Clientes', 'High Spenders'].values[0])
+        ticket_medio_doc = dados['resumo']['valor_total'].sum() / dados['clientes_unicos']
+        transacoes_doc = int(dados['resumo']['transacoes'].sum())
+        diff_clientes_doc = dados['clientes_por_shopping'] - dados['clientes_unicos']
+
+        st.markdown(f"""
+        ## Sobre o Dashboard
+
+        O **Dashboard de Perfil de Cliente** é uma ferramenta de Business Intelligence desenvolvida para analisar
+        o comportamento de consumo dos clientes da rede **Almeida Junior Shoppings**.
+
+        ### Período dos Dados
+        **Base completa:** 11/12/2022 a 28/01/2026
+
+        **Filtros disponíveis:** Período Completo, Por Ano, Por Trimestre, Por Mês
+
+        ### Shoppings Analisados
+
+        | Sigla | Shopping | Cidade/Região |
+        |-------|----------|---------------|
+        | BS | Balneário Shopping | Balneário Camboriú |
+        | CS | Continente Shopping | São José |
+        | GS | Garten Shopping | Joinville |
+        | NK | Neumarkt Shopping | Blumenau |
+        | NR | Norte Shopping | Blumenau |
+        | NS | Nações Shopping | Criciúma |
+
+        ### Resumo Geral
+
+        | Métrica | Valor | Observação |
+        |---------|-------|------------|
+        | Clientes Únicos | {dados['clientes_unicos']:,} | Cada cliente contado uma vez |
+        | Clientes por Shopping | {dados['clientes_por_shopping']:,} | Soma inclui quem compra em múltiplos shoppings |
+        | Total de Transações | {transacoes_doc:,} | |
+        | Valor Total | R$ {dados['resumo']['valor_total'].sum():,.0f} | |
+        | Ticket Médio | R$ {ticket_medio_doc:,.0f} | Valor Total ÷ Clientes Únicos |
+        | High Spenders | {hs_unicos_doc:,} (10%) | Top 10% de cada shopping |
+
+        > 🔄 **{diff_clientes_doc:,}** clientes frequentam mais de 1 shopping
+
+        ### Páginas do Dashboard
+
+        1. **📊 Visão Geral** - Panorama consolidado de todos os shoppings
+        2. **🎭 Personas** - 14 perfis comportamentais de clientes
+        3. **🏬 Por Shopping** - Análise detalhada de cada unidade
+        4. **👥 Perfil Demográfico** - Distribuição por gênero e faixa etária
+        5. **⭐ High Spenders** - Clientes top 10% em valor
+        6. **🏆 Top Consumidores** - Top 150 consumidores por shopping com dados de contato
+        7. **🛒 Segmentos** - Análise por categoria de produto
+        8. **🎯 RFV** - Análise de Recência, Frequência e Valor
+        9. **⏰ Comportamento** - Padrões temporais de compra
+        10. **📈 Comparativo** - Comparação entre shoppings
+        11. **📆 Evolução** - Série mensal de todos os meses disponíveis
+        12. **🔁 Retenção** - Coortes de clientes pelo mês da primeira compra
+        13. **📥 Exportar Dados** - Download de relatórios em CSV e Excel
+        14. **🤖 Assistente** - Chat para dúvidas e sugestões
+        15. **📚 Documentação** - Documentação completa do dashboard
+        """)
+
+    with tab2:
+        st.markdown("""
+        ## Cálculo das Métricas
+
+        ### Métricas Básicas
+
+        | Métrica | Fórmula |
+        |---------|---------|
+        | **Total Clientes** | Contagem de clientes únicos |
+        | **Valor Total** | Soma de todas as transações |
+        | **Ticket Médio** | Valor Total ÷ Total de Clientes |
+        | **Frequência Média** | Total Transações ÷ Total Clientes |
+
+        ### Distribuições Demográficas
+
+        **Por Gênero:**
+        ```
+        % Gênero = (Clientes do Gênero / Total Clientes) × 100
+        ```
+
+        **Por Faixa Etária:**
+
+        | Faixa | Idade | Geração Aproximada |
+        |-------|-------|-------------------|
+        | Gen Z | Menos de 25 anos | Geração Z |
+        | Millennials | 25 a 39 anos | Millennials |
+        | Gen X | 40 a 54 anos | Geração X |
+        | Boomers | 55 a 69 anos | Baby Boomers |
+        | Silent | 70 anos ou mais | Geração Silenciosa |
+
+        ### Métricas de Segmentos
+
+        Os segmentos são definidos pela categoria da loja:
+        - **Moda** - Vestuário, acessórios
+        - **Beleza e Bem-estar** - Cosméticos, perfumaria
+        - **Calçados** - Sapatos, tênis, sandálias
+        - **Joalheria** - Joias, relógios, óticas
+        - **Gastronomia** - Restaurantes, fast-food
+        - **Telefonia** - Celulares, acessórios
+        - **Eletrônicos** - Informática, eletrodomésticos
+        - **Casa e Decoração** - Móveis, decoração
+
+        ### Comportamento Temporal
+
+        **Períodos do Dia (baseados na hora da transação):**
+        - Manhã: 0h às 11:59
+        - Tarde: 12h às 17:59
+        - Noite: 18h às 23:59
+
+        **Dias da Semana:**
+        - Segunda a Domingo
+        """)
+
+    with tab3:
+        st.markdown("""
+        ## Análise RFV - Segmentação por Valor
+
+        A análise classifica clientes em **4 perfis** utilizando **faixas de valor fixas (thresholds)**.
+
+        ### Método Aplicado
+
+        A segmentação é baseada exclusivamente no **Valor** gasto pelo cliente.
+        As métricas de Recência (dias desde a última compra) e Frequência (quantidade de compras)
+        são calculadas e armazenadas, mas **não são utilizadas como critério de classificação**.
+
+        **Não é utilizado scoring por quintis (R1-R5, F1-F5, V1-V5).**
+
+        ---
+
+        ### Classificação Histórica (Valor Total Acumulado)
+
+        | Perfil | Faixa de Valor | Descrição | Estratégia Recomendada |
+        |--------|----------------|-----------|------------------------|
+        | **VIP** | >= R$ 5.000 | Altíssimo valor, responsáveis pela maior parte do faturamento | Retenção prioritária, benefícios exclusivos |
+        | **Premium** | R$ 2.500 a R$ 4.999 | Alto valor com potencial de se tornarem VIP | Programas de upgrade, incentivos para aumentar ticket |
+        | **Potencial** | R$ 1.000 a R$ 2.499 | Bom potencial de crescimento | Campanhas de engajamento, cross-sell |
+        | **Pontual** | < R$ 1.000 | Clientes ocasionais ou novos | Campanhas de ativação |
+
+        ### Classificação por Período (Valor no Período Selecionado)
+
+        | Perfil | Faixa de Valor | Descrição |
+        |--------|----------------|-----------|
+        | **VIP** | >= R$ 2.000 | Alto gasto no período selecionado |
+        | **Premium** | R$ 1.000 a R$ 1.999 | Gasto relevante no período |
+        | **Potencial** | R$ 500 a R$ 999 | Gasto moderado no período |
+        | **Pontual** | < R$ 500 | Baixo gasto no período |
+
+        ---
+
+        ### Métricas Calculadas por Cliente
+
+        | Métrica | Descrição | Uso na Classificação |
+        |---------|-----------|----------------------|
+        | **Valor Total** | Soma de todas as transações do cliente | Sim - critério de classificação |
+        | **Valor no Período** | Soma das transações no período selecionado | Sim - classificação por período |
+        | **Recência** | Dias desde a última compra até o final do período | Calculado, não usado na classificação |
+        | **Frequência** | Quantidade de transações no período | Calculado, não usado na classificação |
+        | **Ticket Médio** | Valor Total / Quantidade de Clientes | Exibido nos relatórios |
+
+        ---
+
+        ### Quando usar cada classificação?
+
+        - **Histórica:** Segmentação estratégica de longo prazo, programas de fidelidade, identificação de clientes fiéis
+        - **Por Período:** Campanhas táticas, análise de sazonalidade, ativação de clientes recentes
+
+        ---
+
+        ### Princípio de Pareto
+
+        A análise confirma o **Princípio de Pareto** (80/20):
+
+        > **~10% dos clientes (VIP + Premium) geram ~55% do faturamento**
+
+        ---
+
+        ### Arquivos RFV Gerados por Período
+
+        | Arquivo | Conteúdo |
+        |---------|----------|
+        | `metricas_perfil_historico.csv` | Métricas agregadas por perfil (classificação histórica) |
+        | `metricas_perfil_periodo.csv` | Métricas agregadas por perfil (classificação por período) |
+        | `metricas_shopping_rfv.csv` | Métricas por shopping com valor e ticket por perfil |
+        | `TOP10_SEGMENTOS_POR_PERFIL_SHOPPING.csv` | Top 10 segmentos por perfil e shopping |
+        | `TOP10_LOJAS_POR_GENERO_SHOPPING_PERFIL.csv` | Top 10 lojas por gênero, shopping e perfil |
+        | `resumo_rfv.csv` | Resumo geral do RFV |
+        """)
+
+    with tab4:
+        st.markdown("""
+        ## Personas de Clientes
+
+        ### Método Aplicado
+
+        As personas foram identificadas através de **classificação baseada em regras (if/elif)**,
+        avaliando sequencialmente os seguintes critérios para cada cliente:
+
+        1. Se é **High Spender** (top 10% de valor por shopping) - classifica nas personas HS
+        2. **Gênero** e **faixa etária**
+        3. **Frequência de compras** (quantidade de transações)
+        4. **Segmento de consumo principal** (categoria da loja mais frequentada)
+        5. **Valor total gasto** (percentil 75 para Comprador Seletivo)
+
+        A classificação é **determinística e hierárquica**: cada cliente recebe a primeira persona
+        cujos critérios satisfaz, na ordem definida abaixo.
+
+        ### 14 Personas Identificadas
+
+        **HIGH SPENDERS (Top 10% de valor por shopping):**
+        | Persona | Critério |
+        |---------|----------|
+        | **Fashionista Premium** | Mulheres < 25 ou 25-39, High Spender |
+        | **Executiva Premium** | Mulheres 40-54, High Spender |
+        | **Senior VIP** | 55+ anos, High Spender |
+        | **Executivo Exigente** | Homens, High Spender |
+        | **Cliente Premium** | High Spender (demais) |
+
+        **CLIENTES REGULARES (avaliados nesta ordem):**
+        | Persona | Critério |
+        |---------|----------|
+        | **Jovem Engajado** | < 30 anos, frequência >= 5 |
+        | **Mãe Moderna** | Mulheres 30-49, freq >= 3, segmento Moda/Infantil/Calçados |
+        | **Beauty Lover** | Mulheres 25-54, freq >= 3, segmento Beleza |
+        | **Foodie** | Freq >= 3, segmento Gastronomia |
+        | **Fitness** | Freq >= 3, segmento Esportes |
+        | **Comprador Seletivo** | Valor >= percentil 75, freq <= 3 |
+        | **Senior Tradicional** | 55+ anos |
+        | **Jovem Explorer** | < 30 anos |
+        | **Cliente Regular** | Demais clientes (fallback) |
+
+        ---
+
+        ## High Spenders
+
+        ### Definição
+        Um cliente é **High Spender** se está no **percentil 90** de valor total gasto no seu shopping.
+        O threshold é calculado **individualmente por shopping**.
+
+        ### Cálculo
+        ```
+        Para cada shopping:
+          threshold = percentil 90 do valor_total dos clientes daquele shopping
+          high_spender = cliente com valor_total >= threshold
+        ```
+
+        ### Observações
+        - Os thresholds variam por shopping conforme o perfil de consumo da região
+        - Um cliente é avaliado apenas no shopping onde mais compra (shopping preferido)
+        - Os valores dos thresholds são recalculados a cada atualização dos dados
+        """)
+
+    with tab5:
+        st.markdown("""
+        ## Arquivos de Dados
+
+        ### Dados Consolidados (Resultados/)
+
+        | Arquivo | Descrição |
+        |---------|-----------|
+        | `resumo_por_shopping.csv` | Métricas consolidadas por shopping |
+        | `personas_clientes.csv` | 14 personas identificadas |
+        | `comparacao_high_spenders.csv` | HS vs Demais Clientes |
+        | `high_spenders_por_genero.csv` | HS por gênero |
+        | `high_spenders_por_faixa.csv` | HS por faixa etária |
+        | `matriz_clientes_genero_idade.csv` | Matriz cruzada clientes |
+        | `matriz_valor_genero_idade.csv` | Matriz cruzada valor |
+        | `matriz_ticket_genero_idade.csv` | Matriz cruzada ticket |
+        | `top_segmentos_por_genero.csv` | Top 5 segmentos/gênero |
+        | `top_segmentos_por_faixa.csv` | Top segmentos/faixa |
+        | `comportamento_periodo_dia.csv` | Dados por período |
+        | `comportamento_dia_semana.csv` | Dados por dia |
+        | `consolidado_genero_por_shopping.csv` | Gênero por shopping |
+        | `consolidado_faixa_etaria_por_shopping.csv` | Faixa por shopping |
+
+        ### Top Consumidores (Resultados/)
+
+        | Arquivo | Descrição |
+        |---------|-----------|
+        | `top_consumidores_rfv.csv` | Top 150 consumidores por shopping com dados de contato |
+
+        **Colunas do arquivo:**
+        - Ranking, Shopping, Cliente_ID, Nome, CPF, Email, Celular
+        - Logradouro, Numero, Complemento, Bairro, Cidade, Estado, CEP
+        - Genero, Valor_Total, Frequencia_Compras, Recencia_Dias
+        - Data_Primeira_Compra, Data_Ultima_Compra
+        - Segmento_Principal, Valor_Segmento_Principal
+        - Loja_Favorita, Valor_Loja_Favorita
+        - Score_Recencia, Score_Frequencia, Score_Valor, Score_Total_RFV, Perfil_Cliente
+
+        **Observação:** Colaboradores dos shoppings são excluídos da lista.
+
+        ### Dados RFV (Resultados/RFV/)
+
+        | Arquivo | Descrição |
+        |---------|-----------|
+        | `metricas_perfil_historico.csv` | Classificação por valor total acumulado |
+        | `metricas_perfil_periodo.csv` | Classificação por valor do período |
+        | `metricas_shopping_rfv.csv` | Métricas RFV agregadas por shopping |
+        | `TOP10_SEGMENTOS_POR_PERFIL_SHOPPING.csv` | Top segmentos por perfil e shopping |
+        | `TOP10_LOJAS_POR_GENERO_SHOPPING_PERFIL.csv` | Top lojas por gênero, shopping e perfil |
+        | `resumo_rfv.csv` | Resumo geral da classificação RFV |
+
+        ### Dados por Shopping (Resultados/Por_Shopping/{SIGLA}/)
+
+        Cada shopping possui:
+        - `perfil_genero.csv`
+        - `perfil_faixa_etaria.csv`
+        - `top_segmentos.csv`
+        - `top_lojas.csv`
+        - `comportamento_periodo.csv`
+        - `comportamento_dia_semana.csv`
+        - `high_spenders_stats.csv`
+        - `lista_high_spenders.csv`
+        - `base_clientes.csv`
+
+        ### Tecnologias
+
+        | Tecnologia | Uso |
+        |------------|-----|
+        | Python 3.11+ | Linguagem principal |
+        | Streamlit 1.28+ | Framework web |
+        | Plotly 5.18+ | Gráficos interativos |
+        | Pandas 2.0+ | Manipulação de dados |
+        """)
+
+    with tab6:
+        st.markdown("""
+        ## Glossário de Termos
+
+        ### Métricas Gerais
+        | Termo | Definição |
+        |-------|-----------|
+        | **Ticket Médio** | Valor médio gasto por cliente (Valor Total / Clientes) |
+        | **High Spender** | Cliente no top 10% de gastos do shopping |
+        | **Threshold** | Valor mínimo para ser High Spender |
+        | **Persona** | Perfil comportamental de cliente baseado em regras hierárquicas (gênero, idade, gasto, frequência) |
+        | **Frequência** | Número médio de compras por cliente |
+        | **Segmento** | Categoria de produto/serviço da loja |
+
+        ### RFV (Classificação por Valor)
+        | Termo | Definição |
+        |-------|-----------|
+        | **RFV** | Metodologia de segmentação baseada em faixas de valor de compra |
+        | **Classificação Histórica** | Perfil baseado no valor total acumulado do cliente |
+        | **Classificação por Período** | Perfil baseado no valor gasto no período selecionado |
+        | **VIP** | Perfil de cliente com valor histórico ≥ R$ 5.000 (ou ≥ R$ 2.000 no período) |
+        | **Premium** | Perfil de cliente com valor histórico R$ 2.500-R$ 4.999 (ou R$ 1.000-R$ 1.999 no período) |
+        | **Potencial** | Perfil de cliente com valor histórico R$ 1.000-R$ 2.499 (ou R$ 500-R$ 999 no período) |
+        | **Pontual** | Perfil de cliente com valor histórico < R$ 1.000 (ou < R$ 500 no período) |
+
+        ### Faixas Etárias
+        | Termo | Definição |
+        |-------|-----------|
+        | **Faixa Etária** | Agrupamento de clientes por idade (calculada a partir da data de nascimento) |
+        | **Gen Z** | Menos de 25 anos |
+        | **Millennials** | 25 a 39 anos |
+        | **Gen X** | 40 a 54 anos |
+        | **Boomers** | 55 a 69 anos |
+        | **Silent** | 70 anos ou mais |
+
+        ### Visualizações
+        | Termo | Definição |
+        |-------|-----------|
+        | **Matriz Cruzada** | Tabela que cruza duas dimensões (ex: gênero x idade) |
+        | **Heatmap** | Mapa de calor visual para identificar padrões |
+        | **Radar Chart** | Gráfico radar para comparar múltiplas métricas |
+        | **Treemap** | Visualização hierárquica de proporções |
+
+        ---
+
+        ## Contato
+
+        **Desenvolvido para:** Almeida Junior Shoppings
+
+        **Repositório:** [github.com/carlosgravi/dashboard-perfil-cliente](https://github.com/carlosgravi/dashboard-perfil-cliente)
+
+        ---
+
+        *Documentação atualizada em Janeiro/2026*
+        """)
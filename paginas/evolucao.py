@@ -0,0 +1,171 @@
+"""
+PÁGINA: EVOLUÇÃO
+"""
+
+import os
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from cubo_mensal import ler_cubo, consultar_cubo, METRICAS_SOMAVEIS, ARQUIVO_CUBO
+from rollup import compor_tabela
+from formatacao import valores_rotulo, rotular
+
+
+CAMINHO_CUBO = f'Resultados/{ARQUIVO_CUBO}'
+
+
+# Cubo mensal gerado offline (python cubo_mensal.py); a data de modificação na
+# chave faz um cubo regravado entrar sem reiniciar. A página só lê o arquivo.
+@st.cache_resource(max_entries=1)
+def carregar_cubo_mensal(modificado):
+    cubo, _ = ler_cubo(CAMINHO_CUBO)
+    return cubo
+
+
+def render(ctx):
+    indice_periodos = ctx.indice_periodos
+    username = ctx.username
+    shoppings_permitidos_filtro = ctx.shoppings_permitidos_filtro
+    CORES_SHOPPING = ctx.CORES_SHOPPING
+    NOMES_SHOPPING = ctx.NOMES_SHOPPING
+    plotly_chart = ctx.plotly_chart
+    filtrar_opcoes_shopping = ctx.filtrar_opcoes_shopping
+    registrar_filtro = ctx.registrar_filtro
+
+    st.markdown('<p class="main-header">📆 Evolução Mensal</p>', unsafe_allow_html=True)
+    st.markdown("**Todos os meses disponíveis** (independe do período selecionado na barra lateral)")
+
+    if not os.path.exists(CAMINHO_CUBO):
+        st.info(f"Cubo mensal não encontrado em {CAMINHO_CUBO}. Gere-o com `python cubo_mensal.py`.")
+        return
+    cubo = carregar_cubo_mensal(os.path.getmtime(CAMINHO_CUBO))
+
+    if cubo is None or len(cubo) == 0:
+        st.warning("Nenhum dado mensal disponível em Resultados/Por_Mes.")
+    else:
+        # Rótulos dos meses (ex.: 2025_01 -> Jan/2025) a partir do índice de períodos
+        nomes_meses = {}
+        if indice_periodos is not None:
+            df_meses = indice_periodos[indice_periodos['tipo'] == 'Mes']
+            nomes_meses = dict(zip(df_meses['codigo'].astype(str), df_meses['nome']))
+
+        dimensoes_evolucao = {
+            'Por Shopping': 'sigla',
+            'Por Gênero': 'genero',
+            'Por Faixa Etária': 'faixa_etaria',
+        }
+        metricas_evolucao = {
+            'valor_total': 'Valor Total',
+            'clientes': 'Clientes',
+            'ticket_medio': 'Ticket Médio',
+            'transacoes': 'Transações',
+            'qtd_high_spenders': 'High Spenders',
+            'idade_media': 'Idade Média',
+        }
+
+        col1, col2 = st.columns(2)
+        with col1:
+            dimensao_label = st.radio("Agrupar:", list(dimensoes_evolucao.keys()), horizontal=True)
+        dimensao = dimensoes_evolucao[dimensao_label]
+        if dimensao == 'sigla':
+            opcoes_metrica = list(metricas_evolucao.keys())
+        else:
+            # Gênero e faixa etária somam os shoppings selecionados
+            opcoes_metrica = ['valor_total', 'clientes', 'ticket_medio']
+        with col2:
+            metrica = st.selectbox("Métrica:", opcoes_metrica, format_func=lambda m: metricas_evolucao[m])
+
+        opcoes_evolucao = filtrar_opcoes_shopping(list(NOMES_SHOPPING.keys()), shoppings_permitidos_filtro)
+        shoppings_evolucao = st.multiselect(
+            "Shoppings:",
+            options=opcoes_evolucao,
+            default=opcoes_evolucao,
+            format_func=lambda x: f"{x} - {NOMES_SHOPPING[x]}"
+        )
+
+        # Registrar filtro (quando muda)
+        filtro_str = f"{dimensao_label} | {metricas_evolucao[metrica]} | {', '.join(sorted(shoppings_evolucao))}"
+        chave_anterior = 'anterior_evolucao'
+        if st.session_state.get(chave_anterior) != filtro_str:
+            registrar_filtro(username, "Evolução", "Dimensão/Métrica/Shoppings", filtro_str)
+            st.session_state[chave_anterior] = filtro_str
+
+        if not shoppings_evolucao:
+            st.warning("Selecione pelo menos 1 shopping.")
+        else:
+            df_serie = consultar_cubo(cubo, metrica, por=dimensao, siglas=shoppings_evolucao)
+            df_serie.columns = df_serie.columns.astype(str)
+            df_serie.index = df_serie.index.astype(str)
+            df_serie = df_serie.sort_index()
+            rotulos = [nomes_meses.get(m, m) for m in df_serie.index]
+
+            # KPIs: último mês vs mês anterior (total dos shoppings selecionados)
+            if metrica in METRICAS_SOMAVEIS and len(df_serie) >= 2:
+                total_mes = df_serie.sum(axis=1)
+                atual, anterior = total_mes.iloc[-1], total_mes.iloc[-2]
+                variacao = (atual / anterior - 1) * 100 if anterior else 0
+                prefixo = 'R$ ' if metrica == 'valor_total' else ''
+                col1, col2, col3 = st.columns(3)
+                col1.metric(f"{metricas_evolucao[metrica]} - {rotulos[-1]}", f"{prefixo}{atual:,.0f}", delta=f"{variacao:+.1f}% vs {rotulos[-2]}")
+                col2.metric(f"Média mensal ({len(df_serie)} meses)", f"{prefixo}{total_mes.mean():,.0f}")
+                col3.metric(f"Maior mês: {nomes_meses.get(total_mes.idxmax(), total_mes.idxmax())}", f"{prefixo}{total_mes.max():,.0f}")
+
+            df_plot = df_serie.reset_index().melt(id_vars='mes', var_name=dimensao, value_name='valor')
+            df_plot['data'] = pd.to_datetime(df_plot['mes'], format='%Y_%m')
+
+            fig = px.line(
+                df_plot,
+                x='data',
+                y='valor',
+                color=dimensao,
+                markers=True,
+                color_discrete_map=CORES_SHOPPING if dimensao == 'sigla' else None,
+                title=f"{metricas_evolucao[metrica]} por mês - {dimensao_label}",
+                labels={'data': 'Mês', 'valor': metricas_evolucao[metrica], dimensao: dimensao_label.replace('Por ', '')}
+            )
+            fig.update_layout(height=500, hovermode='x unified')
+            fig.update_xaxes(dtick='M1', tickformat='%b/%Y')
+            plotly_chart(fig, use_container_width=True)
+
+            # Tabela mês a mês
+            st.subheader("📋 Tabela Mensal")
+            df_tabela = df_serie.copy()
+            df_tabela.index = rotulos
+            casas = 2 if metrica in ['ticket_medio', 'idade_media'] else 0
+            st.dataframe(df_tabela.round(casas), use_container_width=True)
+
+            # Acumulado de um intervalo arbitrário de meses (rollup das tabelas mensais)
+            st.markdown("---")
+            st.subheader("📦 Acumulado do Intervalo")
+            meses_cubo = list(df_serie.index)
+            mes_inicio, mes_fim = st.select_slider(
+                "Intervalo de meses:",
+                options=meses_cubo,
+                value=(meses_cubo[max(0, len(meses_cubo) - 3)], meses_cubo[-1]),
+                format_func=lambda m: nomes_meses.get(m, m)
+            )
+            meses_intervalo = meses_cubo[meses_cubo.index(mes_inicio):meses_cubo.index(mes_fim) + 1]
+            df_intervalo = compor_tabela('resumo', meses_intervalo)
+            df_intervalo = df_intervalo[df_intervalo['sigla'].isin(shoppings_evolucao)]
+
+            col1, col2 = st.columns(2)
+            col1.metric(f"Valor Total ({len(meses_intervalo)} meses)", f"R$ {df_intervalo['valor_total'].sum():,.0f}")
+            col2.metric("Transações", f"{int(df_intervalo['transacoes'].sum()):,}")
+
+            fig = px.bar(
+                df_intervalo,
+                x='sigla',
+                y='valor_total',
+                color='sigla',
+                color_discrete_map=CORES_SHOPPING,
+                title=f"Valor Total - {nomes_meses.get(mes_inicio, mes_inicio)} a {nomes_meses.get(mes_fim, mes_fim)}",
+                text=valores_rotulo(df_intervalo['valor_total'], 'milhoes')
+            )
+            fig.update_layout(showlegend=False)
+            rotular(fig, 'milhoes', textposition='outside')
+            plotly_chart(fig, use_container_width=True)
+            st.caption(
+                "ℹ️ O acumulado soma apenas métricas aditivas (valor e transações). "
+                "Clientes únicos, ticket médio e high spenders dependem do período inteiro "
+                "(um cliente pode comprar em vários meses): para eles, selecione o período na barra lateral."
+            )
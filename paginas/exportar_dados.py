@@ -0,0 +1,544 @@
+"""
+PÁGINA: EXPORTAR DADOS
+"""
+
+import streamlit as st
+import pandas as pd
+
+
+def render(ctx):
+    dados = ctx.dados
+    periodo_selecionado = ctx.periodo_selecionado
+    periodo_pasta = ctx.periodo_pasta
+    username = ctx.username
+    shoppings_permitidos_filtro = ctx.shoppings_permitidos_filtro
+    NOMES_SHOPPING = ctx.NOMES_SHOPPING
+    filtrar_opcoes_shopping = ctx.filtrar_opcoes_shopping
+    registrar_filtro = ctx.registrar_filtro
+
+    st.markdown('<p class="main-header">📥 Exportar Relatórios</p>', unsafe_allow_html=True)
+
+    st.markdown(f"**Período selecionado:** {periodo_selecionado}")
+
+    st.markdown("""
+    Nesta página você pode baixar os **relatórios completos** que alimentam o dashboard.
+    Os dados são exportados em formato CSV, compatível com Excel e outras ferramentas de análise.
+    """)
+
+    st.markdown("---")
+
+    # Função para converter DataFrame para CSV
+    @st.cache_data
+    def converter_para_csv(df):
+        return df.to_csv(index=False, encoding='utf-8-sig').encode('utf-8-sig')
+
+    # Função para criar Excel com múltiplas abas
+    @st.cache_data
+    def criar_excel_completo(dados_dict, periodo):
+        import io
+        output = io.BytesIO()
+        with pd.ExcelWriter(output, engine='openpyxl') as writer:
+            for nome, df in dados_dict.items():
+                # Limitar nome da aba a 31 caracteres
+                sheet_name = nome[:31]
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+        return output.getvalue()
+
+    # ========== SEÇÃO 1: RELATÓRIO COMPLETO (EXCEL) ==========
+    st.subheader("📊 Relatório Completo (Excel)")
+    st.markdown("Arquivo Excel com **todas as análises** em abas separadas.")
+
+    # Preparar dados para Excel completo
+    dados_excel = {
+        'Resumo por Shopping': dados['resumo'],
+        'Personas': dados['personas'],
+        'Genero por Shopping': dados['genero'],
+        'Faixa Etaria por Shopping': dados['faixa'],
+        'Segmentos por Shopping': dados['segmentos'],
+        'High Spenders por Genero': dados['hs_por_genero'],
+        'High Spenders por Faixa': dados['hs_por_faixa'],
+        'Comparacao HS vs Demais': dados['comparacao_hs'],
+        'Matriz Clientes': dados['matriz_clientes'],
+        'Matriz Valor': dados['matriz_valor'],
+        'Matriz Ticket': dados['matriz_ticket'],
+        'Segmentos por Genero': dados['segmentos_por_genero'],
+        'Segmentos por Faixa': dados['segmentos_por_faixa'],
+        'Comportamento Periodo': dados['comportamento_periodo'],
+        'Comportamento Dia Semana': dados['comportamento_dia']
+    }
+
+    # Adicionar dados RFV ao Excel se disponíveis
+    dados_rfv_excel = dados.get('rfv')
+    if dados_rfv_excel is not None:
+        if dados_rfv_excel.get('perfil_historico') is not None:
+            dados_excel['RFV Perfil Historico'] = dados_rfv_excel['perfil_historico']
+        if dados_rfv_excel.get('perfil_periodo') is not None:
+            dados_excel['RFV Perfil Periodo'] = dados_rfv_excel['perfil_periodo']
+        if dados_rfv_excel.get('shopping') is not None:
+            dados_excel['RFV por Shopping'] = dados_rfv_excel['shopping']
+        if dados_rfv_excel.get('seg_perfil_shop') is not None:
+            dados_excel['RFV Segmentos Perfil Shop'] = dados_rfv_excel['seg_perfil_shop']
+        if dados_rfv_excel.get('lojas') is not None:
+            dados_excel['RFV Lojas Genero Perfil'] = dados_rfv_excel['lojas']
+        if dados_rfv_excel.get('resumo') is not None:
+            dados_excel['RFV Resumo'] = dados_rfv_excel['resumo']
+
+    excel_completo = criar_excel_completo(dados_excel, periodo_selecionado)
+
+    st.download_button(
+        label="⬇️ Baixar Relatório Completo (Excel)",
+        data=excel_completo,
+        file_name=f"relatorio_perfil_cliente_{periodo_pasta}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        help="Download do arquivo Excel com todas as análises"
+    )
+
+    st.markdown("---")
+
+    # ========== SEÇÃO 2: RELATÓRIOS INDIVIDUAIS ==========
+    st.subheader("📁 Relatórios Individuais (CSV)")
+    st.markdown("Baixe cada relatório separadamente conforme sua necessidade.")
+
+    # Organizar em tabs
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Resumos", "👥 Demografia", "⭐ High Spenders", "🛒 Comportamento", "🎯 RFV"])
+
+    with tab1:
+        st.markdown("#### Resumos Gerais")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("**Resumo por Shopping**")
+            st.caption("Métricas consolidadas de cada shopping")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['resumo']),
+                file_name="resumo_por_shopping.csv",
+                mime="text/csv",
+                key="download_resumo"
+            )
+
+            st.markdown("**Personas de Clientes**")
+            st.caption("9 perfis comportamentais identificados")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['personas']),
+                file_name="personas_clientes.csv",
+                mime="text/csv",
+                key="download_personas"
+            )
+
+        with col2:
+            st.markdown("**Segmentos por Shopping**")
+            st.caption("Top segmentos de cada shopping")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['segmentos']),
+                file_name="segmentos_por_shopping.csv",
+                mime="text/csv",
+                key="download_segmentos"
+            )
+
+    with tab2:
+        st.markdown("#### Análises Demográficas")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("**Distribuição por Gênero**")
+            st.caption("Clientes por gênero em cada shopping")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['genero']),
+                file_name="distribuicao_genero.csv",
+                mime="text/csv",
+                key="download_genero"
+            )
+
+            st.markdown("**Matriz Clientes (Gênero x Idade)**")
+            st.caption("Quantidade de clientes por combinação")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['matriz_clientes']),
+                file_name="matriz_clientes_genero_idade.csv",
+                mime="text/csv",
+                key="download_matriz_cli"
+            )
+
+        with col2:
+            st.markdown("**Distribuição por Faixa Etária**")
+            st.caption("Clientes por geração em cada shopping")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['faixa']),
+                file_name="distribuicao_faixa_etaria.csv",
+                mime="text/csv",
+                key="download_faixa"
+            )
+
+            st.markdown("**Matriz Valor (Gênero x Idade)**")
+            st.caption("Valor total por combinação")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['matriz_valor']),
+                file_name="matriz_valor_genero_idade.csv",
+                mime="text/csv",
+                key="download_matriz_val"
+            )
+
+            st.markdown("**Matriz Ticket Médio (Gênero x Idade)**")
+            st.caption("Ticket médio por combinação")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['matriz_ticket']),
+                file_name="matriz_ticket_genero_idade.csv",
+                mime="text/csv",
+                key="download_matriz_ticket"
+            )
+
+    with tab3:
+        st.markdown("#### Análises de High Spenders")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("**High Spenders por Gênero**")
+            st.caption("Distribuição dos top 10% por gênero")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['hs_por_genero']),
+                file_name="high_spenders_por_genero.csv",
+                mime="text/csv",
+                key="download_hs_genero"
+            )
+
+            st.markdown("**Comparação HS vs Demais**")
+            st.caption("Métricas comparativas")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['comparacao_hs']),
+                file_name="comparacao_high_spenders.csv",
+                mime="text/csv",
+                key="download_hs_comp"
+            )
+
+        with col2:
+            st.markdown("**High Spenders por Faixa Etária**")
+            st.caption("Distribuição dos top 10% por idade")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['hs_por_faixa']),
+                file_name="high_spenders_por_faixa.csv",
+                mime="text/csv",
+                key="download_hs_faixa"
+            )
+
+    with tab4:
+        st.markdown("#### Análises de Comportamento")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("**Comportamento por Período do Dia**")
+            st.caption("Manhã, Tarde e Noite")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['comportamento_periodo']),
+                file_name="comportamento_periodo_dia.csv",
+                mime="text/csv",
+                key="download_periodo"
+            )
+
+            st.markdown("**Segmentos por Gênero**")
+            st.caption("Top 5 segmentos preferidos por gênero")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['segmentos_por_genero']),
+                file_name="segmentos_por_genero.csv",
+                mime="text/csv",
+                key="download_seg_genero"
+            )
+
+        with col2:
+            st.markdown("**Comportamento por Dia da Semana**")
+            st.caption("Segunda a Domingo")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['comportamento_dia']),
+                file_name="comportamento_dia_semana.csv",
+                mime="text/csv",
+                key="download_dia"
+            )
+
+            st.markdown("**Segmentos por Faixa Etária**")
+            st.caption("Top segmentos por geração")
+            st.download_button(
+                label="⬇️ Baixar CSV",
+                data=converter_para_csv(dados['segmentos_por_faixa']),
+                file_name="segmentos_por_faixa.csv",
+                mime="text/csv",
+                key="download_seg_faixa"
+            )
+
+    with tab5:
+        st.markdown("#### Análise RFV (Recência, Frequência, Valor)")
+
+        dados_rfv_export = dados.get('rfv')
+
+        if dados_rfv_export is not None:
+            col1, col2 = st.columns(2)
+
+            with col1:
+                if dados_rfv_export.get('perfil_historico') is not None:
+                    st.markdown("**Perfil Histórico (Valor Total)**")
+                    st.caption("Classificação por valor total acumulado do cliente")
+                    st.download_button(
+                        label="⬇️ Baixar CSV",
+                        data=converter_para_csv(dados_rfv_export['perfil_historico']),
+                        file_name="metricas_perfil_historico.csv",
+                        mime="text/csv",
+                        key="download_rfv_hist"
+                    )
+
+                if dados_rfv_export.get('perfil_periodo') is not None:
+                    st.markdown("**Perfil por Período (Valor do Período)**")
+                    st.caption("Classificação por valor gasto no período selecionado")
+                    st.download_button(
+                        label="⬇️ Baixar CSV",
+                        data=converter_para_csv(dados_rfv_export['perfil_periodo']),
+                        file_name="metricas_perfil_periodo.csv",
+                        mime="text/csv",
+                        key="download_rfv_periodo"
+                    )
+
+                if dados_rfv_export.get('shopping') is not None:
+                    st.markdown("**Métricas por Shopping**")
+                    st.caption("Clientes, valor e ticket médio por perfil e shopping")
+                    st.download_button(
+                        label="⬇️ Baixar CSV",
+                        data=converter_para_csv(dados_rfv_export['shopping']),
+                        file_name="metricas_shopping_rfv.csv",
+                        mime="text/csv",
+                        key="download_rfv_shopping"
+                    )
+
+            with col2:
+                if dados_rfv_export.get('seg_perfil_shop') is not None:
+                    st.markdown("**Top Segmentos por Perfil e Shopping**")
+                    st.caption("Top 10 segmentos para cada perfil em cada shopping")
+                    st.download_button(
+                        label="⬇️ Baixar CSV",
+                        data=converter_para_csv(dados_rfv_export['seg_perfil_shop']),
+                        file_name="top10_segmentos_por_perfil_shopping.csv",
+                        mime="text/csv",
+                        key="download_rfv_seg"
+                    )
+
+                if dados_rfv_export.get('lojas') is not None:
+                    st.markdown("**Top Lojas por Gênero, Shopping e Perfil**")
+                    st.caption("Top 10 lojas por combinação de perfil, shopping e gênero")
+                    st.download_button(
+                        label="⬇️ Baixar CSV",
+                        data=converter_para_csv(dados_rfv_export['lojas']),
+                        file_name="top10_lojas_por_genero_shopping_perfil.csv",
+                        mime="text/csv",
+                        key="download_rfv_lojas"
+                    )
+
+                if dados_rfv_export.get('resumo') is not None:
+                    st.markdown("**Resumo RFV**")
+                    st.caption("Resumo geral com totais de clientes e valores")
+                    st.download_button(
+                        label="⬇️ Baixar CSV",
+                        data=converter_para_csv(dados_rfv_export['resumo']),
+                        file_name="resumo_rfv.csv",
+                        mime="text/csv",
+                        key="download_rfv_resumo"
+                    )
+
+            # Dados de Quintis (se disponíveis)
+            dados_rfv_quintis_export = dados.get('rfv_quintis')
+            if dados_rfv_quintis_export:
+                st.markdown("---")
+                st.markdown("#### 📈 Dados RFV por Quintis (Scores R+F+V)")
+
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    if dados_rfv_quintis_export.get('clientes_global') is not None:
+                        st.markdown("**Clientes com Scores (Escopo Global)**")
+                        st.caption("Lista de clientes com scores R, F, V e perfil quintis")
+                        st.download_button(
+                            label="⬇️ Baixar CSV",
+                            data=converter_para_csv(dados_rfv_quintis_export['clientes_global']),
+                            file_name="rfv_quintis_global.csv",
+                            mime="text/csv",
+                            key="download_quintis_clientes_global"
+                        )
+
+                    if dados_rfv_quintis_export.get('perfil_global') is not None:
+                        st.markdown("**Métricas por Perfil (Escopo Global)**")
+                        st.caption("Agregado por perfil com scores médios")
+                        st.download_button(
+                            label="⬇️ Baixar CSV",
+                            data=converter_para_csv(dados_rfv_quintis_export['perfil_global']),
+                            file_name="metricas_perfil_quintis_global.csv",
+                            mime="text/csv",
+                            key="download_quintis_perfil_global"
+                        )
+
+                    if dados_rfv_quintis_export.get('shopping_global') is not None:
+                        st.markdown("**Por Shopping (Escopo Global)**")
+                        st.caption("Métricas por shopping com perfis quintis")
+                        st.download_button(
+                            label="⬇️ Baixar CSV",
+                            data=converter_para_csv(dados_rfv_quintis_export['shopping_global']),
+                            file_name="metricas_shopping_quintis_global.csv",
+                            mime="text/csv",
+                            key="download_quintis_shopping_global"
+                        )
+
+                with col2:
+                    if dados_rfv_quintis_export.get('clientes_shopping') is not None:
+                        st.markdown("**Clientes com Scores (Por Shopping)**")
+                        st.caption("Quintis calculados dentro de cada shopping")
+                        st.download_button(
+                            label="⬇️ Baixar CSV",
+                            data=converter_para_csv(dados_rfv_quintis_export['clientes_shopping']),
+                            file_name="rfv_quintis_por_shopping.csv",
+                            mime="text/csv",
+                            key="download_quintis_clientes_shopping"
+                        )
+
+                    if dados_rfv_quintis_export.get('perfil_shopping') is not None:
+                        st.markdown("**Métricas por Perfil (Por Shopping)**")
+                        st.caption("Agregado por perfil com escopo por shopping")
+                        st.download_button(
+                            label="⬇️ Baixar CSV",
+                            data=converter_para_csv(dados_rfv_quintis_export['perfil_shopping']),
+                            file_name="metricas_perfil_quintis_shopping.csv",
+                            mime="text/csv",
+                            key="download_quintis_perfil_shopping"
+                        )
+
+                    if dados_rfv_quintis_export.get('thresholds_global') is not None:
+                        st.markdown("**Thresholds dos Quintis**")
+                        st.caption("Valores de corte dos quintis para auditoria")
+                        st.download_button(
+                            label="⬇️ Baixar CSV",
+                            data=converter_para_csv(dados_rfv_quintis_export['thresholds_global']),
+                            file_name="quintile_thresholds.csv",
+                            mime="text/csv",
+                            key="download_quintis_thresholds"
+                        )
+        else:
+            st.warning("⚠️ Dados RFV não disponíveis para este período. Execute o script `gerar_rfv_por_periodo.py`.")
+
+    st.markdown("---")
+
+    # ========== SEÇÃO 3: DADOS POR SHOPPING ==========
+    st.subheader("🏬 Dados por Shopping")
+    st.markdown("Baixe os dados detalhados de cada shopping individualmente.")
+
+    opcoes_export = filtrar_opcoes_shopping(list(NOMES_SHOPPING.keys()), shoppings_permitidos_filtro)
+    shopping_export = st.selectbox(
+        "Selecione o Shopping:",
+        options=opcoes_export,
+        format_func=lambda x: f"{x} - {NOMES_SHOPPING[x]}",
+        key="shopping_export"
+    )
+
+    # Registrar filtro de shopping para exportação
+    if st.session_state.get('anterior_export_shopping') != shopping_export:
+        registrar_filtro(username, "Exportar Dados", "Shopping", NOMES_SHOPPING.get(shopping_export, shopping_export))
+        st.session_state['anterior_export_shopping'] = shopping_export
+
+    if shopping_export in dados['por_shopping']:
+        shop_data = dados['por_shopping'][shopping_export]
+
+        # Criar Excel com dados do shopping
+        dados_shop_excel = {
+            'Perfil Genero': shop_data['genero'],
+            'Perfil Faixa Etaria': shop_data['faixa'],
+            'Top Segmentos': shop_data['segmentos'],
+            'Top Lojas': shop_data['lojas'],
+            'Comportamento Periodo': shop_data['periodo'],
+            'Comportamento Dia Semana': shop_data['dia_semana']
+        }
+        if shop_data.get('hs_stats') is not None:
+            dados_shop_excel['High Spenders Stats'] = shop_data['hs_stats']
+
+        excel_shopping = criar_excel_completo(dados_shop_excel, shopping_export)
+
+        # Excel completo
+        st.download_button(
+            label=f"⬇️ Relatório Completo {shopping_export} (Excel)",
+            data=excel_shopping,
+            file_name=f"relatorio_{shopping_export}_{periodo_pasta}.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            key="download_shop_excel"
+        )
+
+        # CSVs individuais
+        st.markdown("**Arquivos individuais (CSV):**")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.download_button(
+                label=f"⬇️ Perfil Gênero",
+                data=converter_para_csv(shop_data['genero']),
+                file_name=f"perfil_genero_{shopping_export}.csv",
+                mime="text/csv",
+                key="download_shop_genero"
+            )
+            st.download_button(
+                label=f"⬇️ Top Lojas",
+                data=converter_para_csv(shop_data['lojas']),
+                file_name=f"top_lojas_{shopping_export}.csv",
+                mime="text/csv",
+                key="download_shop_lojas"
+            )
+
+        with col2:
+            st.download_button(
+                label=f"⬇️ Perfil Faixa Etária",
+                data=converter_para_csv(shop_data['faixa']),
+                file_name=f"perfil_faixa_etaria_{shopping_export}.csv",
+                mime="text/csv",
+                key="download_shop_faixa"
+            )
+            st.download_button(
+                label=f"⬇️ Comportamento Período",
+                data=converter_para_csv(shop_data['periodo']),
+                file_name=f"comportamento_periodo_{shopping_export}.csv",
+                mime="text/csv",
+                key="download_shop_periodo"
+            )
+
+        with col3:
+            st.download_button(
+                label=f"⬇️ Top Segmentos",
+                data=converter_para_csv(shop_data['segmentos']),
+                file_name=f"top_segmentos_{shopping_export}.csv",
+                mime="text/csv",
+                key="download_shop_seg"
+            )
+            st.download_button(
+                label=f"⬇️ Comportamento Dia Semana",
+                data=converter_para_csv(shop_data['dia_semana']),
+                file_name=f"comportamento_dia_semana_{shopping_export}.csv",
+                mime="text/csv",
+                key="download_shop_dia"
+            )
+
+        if shop_data.get('hs_stats') is not None:
+            st.download_button(
+                label=f"⬇️ High Spenders Stats {shopping_export}",
+                data=converter_para_csv(shop_data['hs_stats']),
+                file_name=f"high_spenders_stats_{shopping_export}.csv",
+                mime="text/csv",
+                key="download_shop_hs"
+            )
+
+    st.markdown("---")
+    st.info("💡 **Dica:** Os arquivos CSV podem ser abertos diretamente no Excel. Para melhores resultados, use 'Dados > De Texto/CSV' no Excel.")
@@ -0,0 +1,295 @@
+"""
+PÁGINA: HIGH SPENDERS
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from formatacao import exibir_tabela, valores_rotulo, rotular, TABELA_HIGH_SPENDERS_GRUPO, TABELA_HIGH_SPENDERS_SHOPPING
+
+
+def render(ctx):
+    dados = ctx.dados
+    dados_periodos = ctx.dados_periodos
+    periodo_selecionado = ctx.periodo_selecionado
+    periodos_selecionados = ctx.periodos_selecionados
+    modo_comparativo = ctx.modo_comparativo
+    CORES_SHOPPING = ctx.CORES_SHOPPING
+    CORES_PERIODOS = ctx.CORES_PERIODOS
+    plotly_chart = ctx.plotly_chart
+
+    st.markdown('<p class="main-header">⭐ High Spenders</p>', unsafe_allow_html=True)
+
+    st.markdown("""
+    **High Spenders** são os clientes no **Top 10%** em valor de compras de cada shopping.
+    Eles representam aproximadamente **40% do faturamento total**.
+    """)
+
+    if modo_comparativo:
+        # === MODO COMPARATIVO ===
+        st.markdown(f"**Comparando:** {' vs '.join(periodos_selecionados)}")
+
+        # Preparar dados comparativos
+        df_hs_comp = []
+        for nome_p in periodos_selecionados:
+            d = dados_periodos[nome_p]
+            total_hs = d['resumo']['qtd_high_spenders'].sum()
+            total_cli = d['resumo']['clientes'].sum()
+            df_hs_comp.append({
+                'Período': nome_p,
+                'High Spenders': total_hs,
+                '% do Total': total_hs / total_cli * 100,
+                'Total Clientes': total_cli
+            })
+        df_hs = pd.DataFrame(df_hs_comp)
+
+        # Métricas lado a lado
+        cols = st.columns(len(periodos_selecionados))
+        for i, nome_p in enumerate(periodos_selecionados):
+            with cols[i]:
+                d = dados_periodos[nome_p]
+                total_hs = d['resumo']['qtd_high_spenders'].sum()
+                total_cli = d['resumo']['clientes'].sum()
+                st.markdown(f"**{nome_p}**")
+                st.metric("High Spenders", f"{total_hs:,}")
+                st.metric("% do Total", f"{total_hs/total_cli*100:.1f}%")
+
+        st.markdown("---")
+
+        # Gráfico comparativo
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("⭐ High Spenders por Período")
+            fig = px.bar(
+                df_hs,
+                x='Período',
+                y='High Spenders',
+                color='Período',
+                color_discrete_sequence=CORES_PERIODOS[:len(periodos_selecionados)],
+                text=valores_rotulo(df_hs['High Spenders'], 'contagem')
+            )
+            fig.update_layout(showlegend=False, height=400)
+            rotular(fig, 'contagem', textposition='outside')
+            plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            st.subheader("📊 % High Spenders por Período")
+            fig = px.bar(
+                df_hs,
+                x='Período',
+                y='% do Total',
+                color='Período',
+                color_discrete_sequence=CORES_PERIODOS[:len(periodos_selecionados)],
+                text=valores_rotulo(df_hs['% do Total'], 'percentual')
+            )
+            fig.update_layout(showlegend=False, height=400)
+            rotular(fig, 'percentual', textposition='outside')
+            plotly_chart(fig, use_container_width=True)
+
+        st.markdown("---")
+
+        # HS por Shopping comparativo
+        st.subheader("🏬 High Spenders por Shopping - Comparativo")
+        df_hs_shop = []
+        for nome_p in periodos_selecionados:
+            d = dados_periodos[nome_p]
+            for _, row in d['resumo'].iterrows():
+                df_hs_shop.append({
+                    'Período': nome_p,
+                    'Shopping': row['sigla'],
+                    'High Spenders': row['qtd_high_spenders']
+                })
+        df_hs_s = pd.DataFrame(df_hs_shop)
+
+        fig = px.bar(
+            df_hs_s,
+            x='Shopping',
+            y='High Spenders',
+            color='Período',
+            barmode='group',
+            color_discrete_sequence=CORES_PERIODOS[:len(periodos_selecionados)],
+            text=valores_rotulo(df_hs_s['High Spenders'], 'contagem')
+        )
+        fig.update_layout(height=450)
+        rotular(fig, 'contagem', textposition='outside')
+        plotly_chart(fig, use_container_width=True)
+
+    else:
+        # === MODO NORMAL (1 período) ===
+        st.markdown(f"**Período selecionado:** {periodo_selecionado}")
+
+        # Métricas gerais
+        col1, col2, col3, col4 = st.columns(4)
+
+        # HS únicos vem do comparacao_high_spenders (cliente contado uma vez)
+        hs_unicos = int(dados['comparacao_hs'].loc[dados['comparacao_hs']['Metrica'] == 'Qtd Clientes', 'High Spenders'].values[0])
+        # HS por shopping (soma, inclui duplicação)
+        hs_por_shopping = dados['resumo']['qtd_high_spenders'].sum()
+        clientes_unicos = dados['clientes_unicos']
+
+        with col1:
+            st.metric("High Spenders Únicos", f"{hs_unicos:,}",
+                     delta=f"Por shopping: {hs_por_shopping:,}",
+                     help="HS únicos: cada cliente contado uma vez. Por shopping: soma inclui quem é HS em múltiplos shoppings")
+        with col2:
+            st.metric("% dos Clientes", f"{hs_unicos/clientes_unicos*100:.1f}%",
+                     help=f"Percentual sobre {clientes_unicos:,} clientes únicos")
+        with col3:
+            st.metric("Média por Shopping", f"{hs_por_shopping//6:,}")
+        with col4:
+            st.metric("Clientes Únicos", f"{clientes_unicos:,}",
+                     delta=f"Por shopping: {dados['clientes_por_shopping']:,}",
+                     help="Clientes únicos: cada cliente contado uma vez. Por shopping: soma inclui quem compra em múltiplos shoppings")
+
+        st.markdown("---")
+
+        # Gráfico de HS por shopping
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("High Spenders por Shopping")
+            fig = px.bar(
+                dados['resumo'].sort_values('qtd_high_spenders', ascending=True),
+                x='qtd_high_spenders',
+                y='sigla',
+                orientation='h',
+                color='sigla',
+                color_discrete_map=CORES_SHOPPING,
+                text='qtd_high_spenders'
+            )
+            fig.update_layout(showlegend=False, height=400)
+            fig.update_traces(textposition='outside')
+            plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            st.subheader("Threshold High Spender (R$)")
+            fig = px.bar(
+                dados['resumo'].sort_values('threshold_hs', ascending=True),
+                x='threshold_hs',
+                y='sigla',
+                orientation='h',
+                color='sigla',
+                color_discrete_map=CORES_SHOPPING,
+                text=valores_rotulo(dados['resumo'].sort_values('threshold_hs', ascending=True)['threshold_hs'], 'moeda_inteira')
+            )
+            fig.update_layout(showlegend=False, height=400)
+            rotular(fig, 'moeda_inteira', textposition='outside')
+            plotly_chart(fig, use_container_width=True)
+
+        # Tabela comparativa
+        st.subheader("📋 Resumo High Spenders por Shopping")
+        df_hs = dados['resumo'].assign(pct_hs=dados['resumo']['qtd_high_spenders'] / dados['resumo']['clientes'] * 100)
+        exibir_tabela(df_hs, TABELA_HIGH_SPENDERS_SHOPPING)
+
+        st.markdown("---")
+
+        # Tabs para análises detalhadas
+        tab1, tab2, tab3 = st.tabs(["👥 Por Gênero", "📊 Por Faixa Etária", "🔄 HS vs Demais"])
+
+        with tab1:
+            st.subheader("High Spenders por Gênero")
+            col1, col2 = st.columns(2)
+
+            with col1:
+                fig = px.pie(
+                    dados['hs_por_genero'],
+                    values='qtd_hs',
+                    names='genero',
+                    color='genero',
+                    color_discrete_map={'Feminino': '#E91E63', 'Masculino': '#2196F3', 'Nao Informado': '#9E9E9E', 'Outro': '#4CAF50'},
+                    title='Distribuição por Gênero'
+                )
+                plotly_chart(fig, use_container_width=True)
+
+            with col2:
+                fig = px.bar(
+                    dados['hs_por_genero'].sort_values('valor_total', ascending=True),
+                    x='valor_total',
+                    y='genero',
+                    orientation='h',
+                    color='genero',
+                    color_discrete_map={'Feminino': '#E91E63', 'Masculino': '#2196F3', 'Nao Informado': '#9E9E9E', 'Outro': '#4CAF50'},
+                    title='Valor Total por Gênero',
+                    text=valores_rotulo(dados['hs_por_genero'].sort_values('valor_total', ascending=True)['valor_total'], 'milhoes')
+                )
+                fig.update_layout(showlegend=False)
+                rotular(fig, 'milhoes', textposition='outside')
+                plotly_chart(fig, use_container_width=True)
+
+            # Tabela
+            exibir_tabela(dados['hs_por_genero'], TABELA_HIGH_SPENDERS_GRUPO)
+
+        with tab2:
+            st.subheader("High Spenders por Faixa Etária")
+            col1, col2 = st.columns(2)
+
+            with col1:
+                fig = px.pie(
+                    dados['hs_por_faixa'],
+                    values='qtd_hs',
+                    names='faixa_etaria',
+                    title='Distribuição por Faixa Etária'
+                )
+                plotly_chart(fig, use_container_width=True)
+
+            with col2:
+                fig = px.bar(
+                    dados['hs_por_faixa'],
+                    x='faixa_etaria',
+                    y='ticket_medio',
+                    color='ticket_medio',
+                    color_continuous_scale='Greens',
+                    title='Ticket Médio por Faixa Etária',
+                    text=valores_rotulo(dados['hs_por_faixa']['ticket_medio'], 'moeda_inteira')
+                )
+                fig.update_layout(showlegend=False, xaxis_tickangle=-45)
+                rotular(fig, 'moeda_inteira', textposition='outside')
+                plotly_chart(fig, use_container_width=True)
+
+            # Tabela
+            exibir_tabela(dados['hs_por_faixa'], TABELA_HIGH_SPENDERS_GRUPO)
+
+        with tab3:
+            st.subheader("Comparação: High Spenders vs Demais Clientes")
+
+            # Preparar dados para comparação
+            comp = dados['comparacao_hs'].set_index('Metrica')
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown("**High Spenders**")
+                st.metric("Quantidade", f"{comp.loc['Qtd Clientes', 'High Spenders']:,.0f}")
+                st.metric("Valor Total", f"R$ {comp.loc['Valor Total (R$)', 'High Spenders']/1e6:.1f}M")
+                st.metric("Ticket Médio", f"R$ {comp.loc['Ticket Medio (R$)', 'High Spenders']:,.0f}")
+                st.metric("Freq. Média", f"{comp.loc['Freq Media Compras', 'High Spenders']:.1f} compras")
+                st.metric("% Feminino", f"{comp.loc['% Feminino', 'High Spenders']:.1f}%")
+
+            with col2:
+                st.markdown("**Demais Clientes**")
+                st.metric("Quantidade", f"{comp.loc['Qtd Clientes', 'Demais Clientes']:,.0f}")
+                st.metric("Valor Total", f"R$ {comp.loc['Valor Total (R$)', 'Demais Clientes']/1e6:.1f}M")
+                st.metric("Ticket Médio", f"R$ {comp.loc['Ticket Medio (R$)', 'Demais Clientes']:,.0f}")
+                st.metric("Freq. Média", f"{comp.loc['Freq Media Compras', 'Demais Clientes']:.1f} compras")
+                st.metric("% Feminino", f"{comp.loc['% Feminino', 'Demais Clientes']:.1f}%")
+
+            st.markdown("---")
+
+            # Gráfico comparativo
+            st.subheader("Comparativo Visual")
+            metricas_comp = ['Ticket Medio (R$)', 'Freq Media Compras', 'Idade Media']
+            df_comp_chart = dados['comparacao_hs'][dados['comparacao_hs']['Metrica'].isin(metricas_comp)].melt(
+                id_vars='Metrica', var_name='Grupo', value_name='Valor'
+            )
+
+            fig = px.bar(
+                df_comp_chart,
+                x='Metrica',
+                y='Valor',
+                color='Grupo',
+                barmode='group',
+                color_discrete_map={'High Spenders': '#E74C3C', 'Demais Clientes': '#3498DB'}
+            )
+            fig.update_layout(height=400)
+            plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,78 @@
+"""
+PÁGINA: PERFIL DEMOGRÁFICO
+"""
+
+import streamlit as st
+import plotly.express as px
+from derivados import ORDEM_FAIXAS
+
+
+def render(ctx):
+    dados = ctx.dados
+    periodo_selecionado = ctx.periodo_selecionado
+    periodos_selecionados = ctx.periodos_selecionados
+    modo_comparativo = ctx.modo_comparativo
+    plotly_chart = ctx.plotly_chart
+    figura = ctx.figura
+
+    st.markdown('<p class="main-header">👥 Perfil Demográfico</p>', unsafe_allow_html=True)
+    if modo_comparativo:
+        st.markdown(f"**Comparando:** {' vs '.join(periodos_selecionados)}")
+    else:
+        st.markdown(f"**Período selecionado:** {periodo_selecionado}")
+
+    tab1, tab2 = st.tabs(["Por Gênero", "Por Faixa Etária"])
+
+    with tab1:
+        st.subheader("Distribuição por Gênero - Todos os Shoppings")
+
+        def grafico_genero():
+            fig = px.bar(
+                dados['genero'],
+                x='sigla',
+                y='qtd_clientes',
+                color='genero',
+                barmode='group',
+                color_discrete_map={'Feminino': '#E91E63', 'Masculino': '#2196F3', 'Nao Informado': '#9E9E9E', 'Outro': '#4CAF50'}
+            )
+            fig.update_layout(height=500)
+            return fig
+
+        plotly_chart(figura('genero_por_shopping', grafico_genero), use_container_width=True)
+
+        # Percentual por shopping
+        st.subheader("Percentual por Gênero")
+        st.dataframe(dados['derivados']['genero_pct_shopping'], use_container_width=True, hide_index=True)
+
+    with tab2:
+        st.subheader("Distribuição por Faixa Etária - Todos os Shoppings")
+
+        def grafico_faixa():
+            fig = px.bar(
+                dados['derivados']['faixa_por_shopping'],
+                x='sigla',
+                y='qtd_clientes',
+                color='faixa_etaria',
+                barmode='stack',
+                category_orders={'faixa_etaria': ORDEM_FAIXAS}
+            )
+            fig.update_layout(height=500)
+            return fig
+
+        plotly_chart(figura('faixa_por_shopping', grafico_faixa), use_container_width=True)
+
+        # Heatmap
+        st.subheader("Mapa de Calor - Clientes por Faixa Etária")
+
+        def grafico_heatmap_faixa():
+            fig = px.imshow(
+                dados['derivados']['faixa_heatmap_shopping'].set_index('faixa_etaria'),
+                labels={'x': 'sigla'},
+                color_continuous_scale='Blues',
+                aspect='auto',
+                text_auto=True
+            )
+            fig.update_layout(height=400)
+            return fig
+
+        plotly_chart(figura('heatmap_faixa', grafico_heatmap_faixa), use_container_width=True)
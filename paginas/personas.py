@@ -0,0 +1,212 @@
+"""
+PÁGINA: PERSONAS
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from formatacao import exibir_tabela, valores_rotulo, rotular, TABELA_PERSONAS, TABELA_PERSONAS_PERIODO
+
+
+def render(ctx):
+    dados = ctx.dados
+    dados_periodos = ctx.dados_periodos
+    periodo_selecionado = ctx.periodo_selecionado
+    periodos_selecionados = ctx.periodos_selecionados
+    modo_comparativo = ctx.modo_comparativo
+    CORES_PERIODOS = ctx.CORES_PERIODOS
+    plotly_chart = ctx.plotly_chart
+    figura = ctx.figura
+
+    st.markdown('<p class="main-header">🎭 Personas de Clientes</p>', unsafe_allow_html=True)
+
+    st.markdown("""
+    As **14 Personas** representam perfis comportamentais de clientes, classificados por regras baseadas em
+    gênero, faixa etária, nível de gasto (High Spender ou não) e frequência de compras.
+    """)
+
+    if modo_comparativo:
+        # === MODO COMPARATIVO ===
+        st.markdown(f"**Comparando:** {' vs '.join(periodos_selecionados)}")
+
+        # Comparar valor total por persona entre períodos
+        st.subheader("📊 Valor por Persona - Comparativo entre Períodos")
+
+        df_personas_comp = []
+        for nome_p in periodos_selecionados:
+            d = dados_periodos[nome_p]
+            for _, row in d['personas'].iterrows():
+                df_personas_comp.append({
+                    'Período': nome_p,
+                    'Persona': row['persona'],
+                    'Clientes': row['qtd_clientes'],
+                    'Valor': row['valor_total'],
+                    'Ticket': row['ticket_medio']
+                })
+        df_pers = pd.DataFrame(df_personas_comp)
+
+        # Top 5 personas por valor (baseado no primeiro período)
+        top_personas = dados['personas'].nlargest(5, 'valor_total')['persona'].tolist()
+        df_pers_top = df_pers[df_pers['Persona'].isin(top_personas)]
+
+        def grafico_valor_top_personas_por_periodo():
+            fig = px.bar(
+                df_pers_top,
+                x='Persona',
+                y='Valor',
+                color='Período',
+                barmode='group',
+                color_discrete_sequence=CORES_PERIODOS[:len(periodos_selecionados)],
+                text=valores_rotulo(df_pers_top['Valor'], 'milhoes')
+            )
+            fig.update_layout(height=450)
+            rotular(fig, 'milhoes', textposition='outside')
+            return fig
+
+        plotly_chart(figura('valor_top_personas_por_periodo', grafico_valor_top_personas_por_periodo, todos_periodos=True), use_container_width=True)
+
+        st.markdown("---")
+
+        # Comparar clientes por persona
+        st.subheader("👥 Clientes por Persona - Comparativo")
+
+        def grafico_clientes_top_personas_por_periodo():
+            fig = px.bar(
+                df_pers_top,
+                x='Persona',
+                y='Clientes',
+                color='Período',
+                barmode='group',
+                color_discrete_sequence=CORES_PERIODOS[:len(periodos_selecionados)],
+                text=valores_rotulo(df_pers_top['Clientes'], 'contagem')
+            )
+            fig.update_layout(height=450)
+            rotular(fig, 'contagem', textposition='outside')
+            return fig
+
+        plotly_chart(figura('clientes_top_personas_por_periodo', grafico_clientes_top_personas_por_periodo, todos_periodos=True), use_container_width=True)
+
+        st.markdown("---")
+
+        # Tabelas lado a lado
+        st.subheader("📋 Detalhes por Período")
+        cols = st.columns(len(periodos_selecionados))
+        for i, nome_p in enumerate(periodos_selecionados):
+            with cols[i]:
+                st.markdown(f"**{nome_p}**")
+                exibir_tabela(dados_periodos[nome_p]['personas'].head(6), TABELA_PERSONAS_PERIODO)
+
+    else:
+        # === MODO NORMAL (1 período) ===
+        st.markdown(f"**Período selecionado:** {periodo_selecionado}")
+
+        # Métricas das principais personas
+        col1, col2, col3 = st.columns(3)
+        top3 = dados['personas'].head(3)
+
+        with col1:
+            st.metric(
+                top3.iloc[0]['persona'],
+                f"{top3.iloc[0]['pct_clientes']:.1f}% dos clientes",
+                delta=f"R$ {top3.iloc[0]['ticket_medio']:,.0f} ticket médio"
+            )
+        with col2:
+            st.metric(
+                top3.iloc[1]['persona'],
+                f"{top3.iloc[1]['pct_clientes']:.1f}% dos clientes",
+                delta=f"R$ {top3.iloc[1]['ticket_medio']:,.0f} ticket médio"
+            )
+        with col3:
+            st.metric(
+                top3.iloc[2]['persona'],
+                f"{top3.iloc[2]['pct_clientes']:.1f}% dos clientes",
+                delta=f"R$ {top3.iloc[2]['ticket_medio']:,.0f} ticket médio"
+            )
+
+        st.markdown("---")
+
+        # Gráficos
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("📊 Distribuição de Clientes por Persona")
+
+            def grafico_clientes_por_persona():
+                fig = px.pie(
+                    dados['personas'],
+                    values='qtd_clientes',
+                    names='persona',
+                    hole=0.4
+                )
+                fig.update_layout(height=450)
+                return fig
+
+            plotly_chart(figura('clientes_por_persona', grafico_clientes_por_persona), use_container_width=True)
+
+        with col2:
+            st.subheader("💰 Valor Total por Persona")
+
+            def grafico_valor_por_persona():
+                fig = px.bar(
+                    dados['personas'].sort_values('valor_total', ascending=True),
+                    x='valor_total',
+                    y='persona',
+                    orientation='h',
+                    color='valor_total',
+                    color_continuous_scale='Blues',
+                    text=valores_rotulo(dados['personas'].sort_values('valor_total', ascending=True)['valor_total'], 'milhoes')
+                )
+                fig.update_layout(height=450, showlegend=False)
+                rotular(fig, 'milhoes', textposition='outside')
+                return fig
+
+            plotly_chart(figura('valor_por_persona', grafico_valor_por_persona), use_container_width=True)
+
+        st.markdown("---")
+
+        # Comparativo de métricas por persona
+        st.subheader("📈 Comparativo de Métricas por Persona")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("**Ticket Médio por Persona**")
+
+            def grafico_ticket_por_persona():
+                fig = px.bar(
+                    dados['personas'].sort_values('ticket_medio', ascending=True),
+                    x='ticket_medio',
+                    y='persona',
+                    orientation='h',
+                    color='ticket_medio',
+                    color_continuous_scale='Greens',
+                    text=valores_rotulo(dados['personas'].sort_values('ticket_medio', ascending=True)['ticket_medio'], 'moeda_inteira')
+                )
+                fig.update_layout(height=400, showlegend=False)
+                rotular(fig, 'moeda_inteira', textposition='outside')
+                return fig
+
+            plotly_chart(figura('ticket_por_persona', grafico_ticket_por_persona), use_container_width=True)
+
+        with col2:
+            st.markdown("**Frequência Média de Compras**")
+
+            def grafico_frequencia_por_persona():
+                fig = px.bar(
+                    dados['personas'].sort_values('freq_media', ascending=True),
+                    x='freq_media',
+                    y='persona',
+                    orientation='h',
+                    color='freq_media',
+                    color_continuous_scale='Oranges',
+                    text=valores_rotulo(dados['personas'].sort_values('freq_media', ascending=True)['freq_media'], 'vezes')
+                )
+                fig.update_layout(height=400, showlegend=False)
+                rotular(fig, 'vezes', textposition='outside')
+                return fig
+
+            plotly_chart(figura('frequencia_por_persona', grafico_frequencia_por_persona), use_container_width=True)
+
+        # Tabela detalhada
+        st.subheader("📋 Detalhes das Personas")
+        exibir_tabela(dados['personas'], TABELA_PERSONAS)
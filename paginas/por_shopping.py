@@ -0,0 +1,161 @@
+"""
+PÁGINA: POR SHOPPING
+"""
+
+import streamlit as st
+import plotly.express as px
+
+
+def render(ctx):
+    dados = ctx.dados
+    periodo_selecionado = ctx.periodo_selecionado
+    periodos_selecionados = ctx.periodos_selecionados
+    modo_comparativo = ctx.modo_comparativo
+    username = ctx.username
+    shoppings_permitidos_filtro = ctx.shoppings_permitidos_filtro
+    NOMES_SHOPPING = ctx.NOMES_SHOPPING
+    plotly_chart = ctx.plotly_chart
+    filtrar_opcoes_shopping = ctx.filtrar_opcoes_shopping
+    registrar_filtro = ctx.registrar_filtro
+
+    st.markdown('<p class="main-header">🏬 Análise por Shopping</p>', unsafe_allow_html=True)
+    if modo_comparativo:
+        st.markdown(f"**Comparando:** {' vs '.join(periodos_selecionados)}")
+        st.info("Para análise detalhada por shopping, selecione apenas 1 período.")
+    else:
+        st.markdown(f"**Período selecionado:** {periodo_selecionado}")
+
+    # Seletor de shopping (filtrado por permissões)
+    opcoes_shopping_page = filtrar_opcoes_shopping(list(NOMES_SHOPPING.keys()), shoppings_permitidos_filtro)
+    shopping_selecionado = st.selectbox(
+        "Selecione o Shopping:",
+        options=opcoes_shopping_page,
+        format_func=lambda x: f"{x} - {NOMES_SHOPPING[x]}"
+    )
+
+    # Registrar filtro de shopping (quando muda)
+    chave_anterior = 'anterior_porshopping'
+    if st.session_state.get(chave_anterior) != shopping_selecionado:
+        registrar_filtro(username, "Por Shopping", "Shopping", NOMES_SHOPPING.get(shopping_selecionado, shopping_selecionado))
+        st.session_state[chave_anterior] = shopping_selecionado
+
+    if shopping_selecionado in dados['por_shopping']:
+        shop_data = dados['por_shopping'][shopping_selecionado]
+        resumo_shop = dados['resumo'][dados['resumo']['sigla'] == shopping_selecionado].iloc[0]
+
+        st.markdown(f"### {NOMES_SHOPPING[shopping_selecionado]}")
+
+        # Métricas do shopping
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Clientes", f"{resumo_shop['clientes']:,}")
+        with col2:
+            st.metric("Valor Total", f"R$ {resumo_shop['valor_total']/1e6:.1f}M")
+        with col3:
+            st.metric("Ticket Médio", f"R$ {resumo_shop['ticket_medio']:,.0f}")
+        with col4:
+            st.metric("High Spenders", f"{resumo_shop['qtd_high_spenders']:,}")
+
+        st.markdown("---")
+
+        # Tabs para diferentes análises
+        tab1, tab2, tab3, tab4 = st.tabs(["👥 Demografia", "🏪 Lojas & Segmentos", "⏰ Comportamento", "📊 Detalhes"])
+
+        with tab1:
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.subheader("Por Gênero")
+                fig = px.pie(
+                    shop_data['genero'],
+                    values='qtd_clientes',
+                    names='genero',
+                    color='genero',
+                    color_discrete_map={'Feminino': '#E91E63', 'Masculino': '#2196F3', 'Nao Informado': '#9E9E9E'}
+                )
+                plotly_chart(fig, use_container_width=True)
+
+            with col2:
+                st.subheader("Por Faixa Etária")
+                fig = px.bar(
+                    shop_data['faixa'],
+                    x='faixa_etaria',
+                    y='qtd_clientes',
+                    color='faixa_etaria',
+                    text='qtd_clientes'
+                )
+                fig.update_layout(showlegend=False, xaxis_tickangle=-45)
+                plotly_chart(fig, use_container_width=True)
+
+        with tab2:
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.subheader("Top 10 Segmentos")
+                fig = px.bar(
+                    shop_data['segmentos'].head(10),
+                    x='valor',
+                    y='segmento',
+                    orientation='h',
+                    color='valor',
+                    color_continuous_scale='Blues'
+                )
+                fig.update_layout(height=400, yaxis={'categoryorder': 'total ascending'})
+                plotly_chart(fig, use_container_width=True)
+
+            with col2:
+                st.subheader("Top 10 Lojas")
+                fig = px.bar(
+                    shop_data['lojas'].head(10),
+                    x='valor',
+                    y='loja',
+                    orientation='h',
+                    color='valor',
+                    color_continuous_scale='Greens'
+                )
+                fig.update_layout(height=400, yaxis={'categoryorder': 'total ascending'})
+                plotly_chart(fig, use_container_width=True)
+
+        with tab3:
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.subheader("Por Período do Dia")
+                fig = px.pie(
+                    shop_data['periodo'],
+                    values='valor',
+                    names='periodo_dia',
+                    color='periodo_dia',
+                    color_discrete_map={
+                        'Manha (6h-12h)': '#FFC107',
+                        'Tarde (12h-18h)': '#FF9800',
+                        'Noite (18h-22h)': '#673AB7'
+                    }
+                )
+                plotly_chart(fig, use_container_width=True)
+
+            with col2:
+                st.subheader("Por Dia da Semana")
+                ordem_dias = ['Segunda', 'Terca', 'Quarta', 'Quinta', 'Sexta', 'Sabado', 'Domingo']
+                df_dia = shop_data['dia_semana'].copy()
+                df_dia['ordem'] = df_dia['dia_semana'].map({d: i for i, d in enumerate(ordem_dias)})
+                df_dia = df_dia.sort_values('ordem')
+
+                fig = px.bar(
+                    df_dia,
+                    x='dia_semana',
+                    y='valor',
+                    color='valor',
+                    color_continuous_scale='Oranges'
+                )
+                fig.update_layout(showlegend=False)
+                plotly_chart(fig, use_container_width=True)
+
+        with tab4:
+            st.subheader("Dados Detalhados")
+
+            st.markdown("**Perfil por Gênero**")
+            st.dataframe(shop_data['genero'], use_container_width=True, hide_index=True)
+
+            st.markdown("**Perfil por Faixa Etária**")
+            st.dataframe(shop_data['faixa'], use_container_width=True, hide_index=True)
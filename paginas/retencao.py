@@ -0,0 +1,155 @@
+"""
+PÁGINA: RETENÇÃO (COORTES)
+"""
+
+import os
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from coortes import ler_coortes, retencao, curva_retencao, ARQUIVO_COORTES
+
+CAMINHO_COORTES = f'Resultados/{ARQUIVO_COORTES}'
+
+
+# Mapa de coortes cliente x mês gerado offline (python coortes.py); a data de
+# modificação na chave faz um mapa regravado entrar sem reiniciar. A página só lê o arquivo.
+@st.cache_resource(max_entries=1)
+def carregar_coortes(modificado):
+    return ler_coortes(CAMINHO_COORTES)
+
+
+def render(ctx):
+    indice_periodos = ctx.indice_periodos
+    username = ctx.username
+    shoppings_permitidos_filtro = ctx.shoppings_permitidos_filtro
+    CORES_SHOPPING = ctx.CORES_SHOPPING
+    NOMES_SHOPPING = ctx.NOMES_SHOPPING
+    CORES_PERFIL = ctx.CORES_PERFIL
+    ORDEM_PERFIL = ctx.ORDEM_PERFIL
+    plotly_chart = ctx.plotly_chart
+    filtrar_opcoes_shopping = ctx.filtrar_opcoes_shopping
+    registrar_filtro = ctx.registrar_filtro
+
+    st.markdown('<p class="main-header">🔁 Retenção de Clientes</p>', unsafe_allow_html=True)
+    st.markdown("**Coortes pelo mês da primeira compra** (independe do período selecionado na barra lateral)")
+
+    if not os.path.exists(CAMINHO_COORTES):
+        st.info(f"Mapa de coortes não encontrado em {CAMINHO_COORTES}. Gere-o com `python coortes.py`.")
+        return
+    coortes = carregar_coortes(os.path.getmtime(CAMINHO_COORTES))
+
+    if len(coortes['ids']) == 0:
+        st.warning("Nenhum arquivo de clientes RFV mensal disponível em Resultados/Por_Mes.")
+    else:
+        nomes_meses = {}
+        if indice_periodos is not None:
+            df_meses = indice_periodos[indice_periodos['tipo'] == 'Mes']
+            nomes_meses = dict(zip(df_meses['codigo'].astype(str), df_meses['nome']))
+
+        agrupamentos_retencao = {
+            'Geral': None,
+            'Por Shopping': 'shopping',
+            'Por Perfil RFV': 'perfil',
+        }
+
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            agrupamento_label = st.radio("Agrupar:", list(agrupamentos_retencao.keys()), horizontal=True, key='retencao_agrupar')
+        with col2:
+            opcoes_retencao = filtrar_opcoes_shopping(list(NOMES_SHOPPING.keys()), shoppings_permitidos_filtro)
+            shoppings_retencao = st.multiselect(
+                "Shoppings (da primeira compra):",
+                options=opcoes_retencao,
+                default=opcoes_retencao,
+                format_func=lambda x: f"{x} - {NOMES_SHOPPING[x]}",
+                key='retencao_shoppings'
+            )
+
+        # Registrar filtro (quando muda)
+        filtro_str = f"{agrupamento_label} | {', '.join(sorted(shoppings_retencao))}"
+        if st.session_state.get('anterior_retencao') != filtro_str:
+            registrar_filtro(username, "Retenção", "Agrupamento/Shoppings", filtro_str)
+            st.session_state['anterior_retencao'] = filtro_str
+
+        if not shoppings_retencao:
+            st.warning("Selecione pelo menos 1 shopping.")
+        else:
+            nomes_retencao = [NOMES_SHOPPING[s] for s in shoppings_retencao]
+            por = agrupamentos_retencao[agrupamento_label]
+            df_retencao = retencao(coortes, por=por, shoppings=nomes_retencao)
+            df_geral = df_retencao if por is None else retencao(coortes, shoppings=nomes_retencao)
+            # Só a primeira coorte com dados (ex.: um único mês) -> ainda não há curva
+            curva_geral = curva_retencao(df_geral).get('Todos', pd.Series(dtype='float64'))
+
+            # KPIs: retenção média ponderada (sem a primeira coorte, que é a base já existente)
+            novos_clientes = int(df_geral[(df_geral['mes_relativo'] == 0) & (df_geral['coorte'] != coortes['meses'][0])]['clientes'].sum())
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Clientes novos acompanhados", f"{novos_clientes:,}")
+            for col, k in zip([col2, col3, col4], [1, 3, 6]):
+                valor_k = curva_geral.get(k)
+                col.metric(f"Retenção M+{k}", f"{valor_k:.1%}" if valor_k is not None and pd.notna(valor_k) else "-")
+
+            # Curvas médias de retenção
+            siglas_por_nome = {v: k for k, v in NOMES_SHOPPING.items()}
+            curvas = curva_retencao(df_retencao)
+            if por == 'perfil':
+                curvas = curvas[[p for p in ORDEM_PERFIL if p in curvas.columns]]
+            elif por == 'shopping':
+                curvas.columns = [siglas_por_nome.get(c, c) for c in curvas.columns]
+
+            if curvas.empty:
+                st.info("Ainda não há coortes de clientes novos com meses seguintes para calcular a retenção média.")
+            else:
+                df_curvas = curvas.iloc[1:].reset_index().melt(id_vars='mes_relativo', var_name='grupo', value_name='retencao')
+
+                fig = px.line(
+                    df_curvas,
+                    x='mes_relativo',
+                    y='retencao',
+                    color='grupo',
+                    markers=True,
+                    color_discrete_map=CORES_SHOPPING if por == 'shopping' else CORES_PERFIL if por == 'perfil' else None,
+                    title=f"Retenção média por mês após a primeira compra - {agrupamento_label}",
+                    labels={'mes_relativo': 'Meses após a primeira compra', 'retencao': 'Clientes ativos (%)', 'grupo': ''}
+                )
+                fig.update_layout(height=450, yaxis_tickformat='.0%', hovermode='x unified')
+                plotly_chart(fig, use_container_width=True)
+
+            # Matriz de coortes
+            st.subheader("🗓️ Matriz de Coortes")
+            if por is None:
+                grupos_matriz = ['Todos']
+            elif not curvas.empty:
+                grupos_matriz = list(curvas.columns)
+            else:
+                grupos_matriz = [siglas_por_nome.get(g, g) if por == 'shopping' else g for g in df_retencao['grupo'].unique()]
+            if por is not None:
+                grupo_matriz = st.selectbox("Grupo:", grupos_matriz, key='retencao_grupo')
+                if por == 'shopping':
+                    grupo_matriz = NOMES_SHOPPING.get(grupo_matriz, grupo_matriz)
+                df_matriz = df_retencao[df_retencao['grupo'] == grupo_matriz]
+            else:
+                df_matriz = df_retencao
+
+            matriz_coortes = df_matriz.pivot(index='coorte', columns='mes_relativo', values='retencao').sort_index()
+            tamanhos = df_matriz[df_matriz['mes_relativo'] == 0].set_index('coorte')['clientes']
+            matriz_coortes.index = [f"{nomes_meses.get(c, c)} ({tamanhos.get(c, 0):,})" for c in matriz_coortes.index]
+
+            fig = px.imshow(
+                matriz_coortes,
+                text_auto='.0%',
+                color_continuous_scale='Blues',
+                zmin=0,
+                zmax=max(0.01, float(matriz_coortes.iloc[:, 1:].max().max() if matriz_coortes.shape[1] > 1 else 1)),
+                labels=dict(x="Meses após a primeira compra", y="Coorte (clientes)", color="Retenção"),
+                aspect='auto'
+            )
+            fig.update_layout(height=max(400, 24 * len(matriz_coortes)))
+            plotly_chart(fig, use_container_width=True)
+
+            meses_sem_dados = [nomes_meses.get(m, m) for m, ok in zip(coortes['meses'], coortes['com_dados']) if not ok]
+            st.caption(
+                f"ℹ️ A coorte de {nomes_meses.get(coortes['meses'][0], coortes['meses'][0])} reúne toda a base ativa no primeiro mês "
+                "disponível (não só clientes novos) e não entra nas médias. Shopping e perfil são os do mês da primeira compra."
+                + (f" Meses sem arquivo de clientes ficam em branco: {', '.join(meses_sem_dados)}." if meses_sem_dados else "")
+            )
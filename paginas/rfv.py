@@ -0,0 +1,1208 @@
+"""
+PÁGINA: RFV (Recência, Frequência, Valor)
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from cubo_mensal import meses_disponiveis
+from rfv_intervalo import rfv_intervalo, meses_sem_clientes
+from migracao_rfv import resumo_migracao, NOVO, INATIVO
+from desempenho import medir_fragmento
+from formatacao import exibir_tabela, TABELA_RFV_LOJAS, TABELA_RFV_PERFIS, TABELA_RFV_SEGMENTOS, TABELA_RFV_SHOPPING
+
+
+# RFV de um intervalo personalizado de meses (memorizado por intervalo; _abrir,
+# o cache de períodos, fica fora da chave)
+@st.cache_data(max_entries=16)
+def calcular_rfv_intervalo(meses, _abrir):
+    return rfv_intervalo(list(meses), 'Resultados', _abrir)
+
+
+# Filtros da aba Por Shopping e das subabas de Segmentos & Lojas: cada seção é um
+# fragmento, então trocar um filtro reroda só a seção (gráfico e tabela dela).
+# fonte_rfv: meses do intervalo personalizado (None = dados do período)
+@st.fragment
+@medir_fragmento("🎯 RFV › por shopping")
+def rfv_por_shopping(df_shopping, sufixo, perfis_cols, tem_perfis, tipo_rfv_label, fonte_rfv, ctx):
+    shoppings_permitidos_filtro = ctx.shoppings_permitidos_filtro
+    CORES_PERFIL = ctx.CORES_PERFIL
+    ORDEM_PERFIL = ctx.ORDEM_PERFIL
+    plotly_chart = ctx.plotly_chart
+    figura = ctx.figura
+    filtrar_opcoes_shopping = ctx.filtrar_opcoes_shopping
+
+    # Filtros
+    col_filtro1, col_filtro2 = st.columns(2)
+    with col_filtro1:
+        opcoes_shopping_rfv = ["Todos"] + list(df_shopping['shopping_principal'].unique())
+        opcoes_shopping_rfv = filtrar_opcoes_shopping(opcoes_shopping_rfv, shoppings_permitidos_filtro)
+        shopping_selecionado = st.selectbox(
+            "Filtrar por Shopping:",
+            opcoes_shopping_rfv,
+            key='rfv_shopping_filter'
+        )
+    with col_filtro2:
+        perfil_filtro_shop = st.selectbox(
+            "Filtrar por Perfil:",
+            ["Todos", "VIP", "Premium", "Potencial", "Pontual"],
+            key='rfv_perfil_shop_filter'
+        )
+
+    if shopping_selecionado != "Todos":
+        df_shopping = df_shopping[df_shopping['shopping_principal'] == shopping_selecionado]
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Valor por shopping
+        def grafico_rfv_valor_por_shopping():
+            fig_shop_valor = px.bar(
+                df_shopping.sort_values('valor_total', ascending=True),
+                x='valor_total',
+                y='shopping_principal',
+                orientation='h',
+                title='Valor Total por Shopping',
+                color='valor_total',
+                color_continuous_scale='Blues'
+            )
+            fig_shop_valor.update_layout(showlegend=False, yaxis_title='', xaxis_title='Valor (R$)')
+            return fig_shop_valor
+
+        plotly_chart(figura('rfv_valor_por_shopping', grafico_rfv_valor_por_shopping, fonte_rfv, tipo_rfv_label, shopping_selecionado), use_container_width=True)
+
+    with col2:
+        # Distribuição de perfis por shopping (gráfico de barras empilhadas)
+        if tem_perfis:
+            def grafico_rfv_perfis_por_shopping():
+                # Preparar dados para gráfico empilhado
+                df_perfis_shop = df_shopping[['shopping_principal'] + perfis_cols].copy()
+                df_perfis_shop.columns = ['Shopping', 'VIP', 'Premium', 'Potencial', 'Pontual']
+
+                # Filtrar perfis se selecionado
+                if perfil_filtro_shop != "Todos":
+                    perfis_mostrar = [perfil_filtro_shop]
+                else:
+                    perfis_mostrar = ['VIP', 'Premium', 'Potencial', 'Pontual']
+
+                df_melted = df_perfis_shop.melt(
+                    id_vars=['Shopping'],
+                    value_vars=perfis_mostrar,
+                    var_name='Perfil',
+                    value_name='Clientes'
+                )
+
+                titulo_grafico = f'Distribuição de Perfis por Shopping ({tipo_rfv_label})'
+                if perfil_filtro_shop != "Todos":
+                    titulo_grafico = f'Clientes {perfil_filtro_shop} por Shopping ({tipo_rfv_label})'
+
+                fig_perfis = px.bar(
+                    df_melted,
+                    x='Shopping',
+                    y='Clientes',
+                    color='Perfil',
+                    title=titulo_grafico,
+                    color_discrete_map=CORES_PERFIL,
+                    category_orders={'Perfil': ORDEM_PERFIL}
+                )
+                fig_perfis.update_layout(xaxis_tickangle=-45, barmode='stack')
+                return fig_perfis
+
+            plotly_chart(figura('rfv_perfis_por_shopping', grafico_rfv_perfis_por_shopping, fonte_rfv, tipo_rfv_label, shopping_selecionado, perfil_filtro_shop), use_container_width=True)
+        else:
+            st.info("Dados de perfis por shopping não disponíveis. Execute novamente o script de geração.")
+
+    # KPIs por perfil (apenas se temos os dados)
+    if tem_perfis:
+        titulo_kpi = "Total de Clientes por Perfil"
+        if shopping_selecionado != "Todos":
+            titulo_kpi += f" - {shopping_selecionado}"
+        st.subheader(titulo_kpi)
+
+        totais = {
+            'VIP': int(df_shopping[f'vip{sufixo}'].sum()),
+            'Premium': int(df_shopping[f'premium{sufixo}'].sum()),
+            'Potencial': int(df_shopping[f'potencial{sufixo}'].sum()),
+            'Pontual': int(df_shopping[f'pontual{sufixo}'].sum())
+        }
+        total_geral = sum(totais.values())
+
+        # Se filtro de perfil está ativo, mostrar métricas detalhadas do perfil
+        if perfil_filtro_shop != "Todos":
+            perfil = perfil_filtro_shop
+            perfil_lower = perfil.lower()
+            qtd = totais[perfil]
+            pct = (qtd / total_geral * 100) if total_geral > 0 else 0
+            icone = "🏆" if perfil == 'VIP' else "⭐" if perfil == 'Premium' else "🎯" if perfil == 'Potencial' else "👤"
+
+            # Verificar se temos as colunas de valor e ticket por perfil
+            col_valor = f'{perfil_lower}_valor{sufixo}'
+            tem_valor = col_valor in df_shopping.columns
+
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric(f"{icone} Clientes {perfil}", f"{qtd:,}", f"{pct:.1f}% do total")
+            with col2:
+                if tem_valor:
+                    valor_perfil = df_shopping[col_valor].sum()
+                    st.metric(f"Valor {perfil}", f"R$ {valor_perfil:,.2f}")
+                else:
+                    st.metric("Total de Clientes", f"{total_geral:,}")
+            with col3:
+                if tem_valor and qtd > 0:
+                    valor_perfil = df_shopping[col_valor].sum()
+                    ticket_perfil = valor_perfil / qtd
+                    st.metric(f"Ticket Médio {perfil}", f"R$ {ticket_perfil:,.2f}")
+                else:
+                    valor_total = df_shopping['valor_total'].sum()
+                    st.metric("Valor Total", f"R$ {valor_total:,.2f}")
+            with col4:
+                if tem_valor:
+                    valor_perfil = df_shopping[col_valor].sum()
+                    valor_total = df_shopping['valor_total'].sum()
+                    pct_valor = (valor_perfil / valor_total * 100) if valor_total > 0 else 0
+                    st.metric(f"% do Faturamento", f"{pct_valor:.1f}%")
+                else:
+                    st.metric("High Spenders", f"{int(df_shopping['high_spenders'].sum()):,}")
+        else:
+            col1, col2, col3, col4 = st.columns(4)
+            for i, (perfil, qtd) in enumerate(totais.items()):
+                pct = (qtd / total_geral * 100) if total_geral > 0 else 0
+                icone = "🏆" if perfil == 'VIP' else "⭐" if perfil == 'Premium' else "🎯" if perfil == 'Potencial' else "👤"
+                with [col1, col2, col3, col4][i]:
+                    st.metric(f"{icone} {perfil}", f"{qtd:,}", f"{pct:.1f}%")
+
+    # Tabela detalhada com todos os perfis
+    st.subheader("Métricas Detalhadas por Shopping")
+    df_shop_display = df_shopping
+
+    # Verificar se temos as colunas de valor e ticket por perfil
+    perfil_lower = perfil_filtro_shop.lower() if perfil_filtro_shop != "Todos" else None
+    tem_metricas_perfil = perfil_lower and f'{perfil_lower}_valor{sufixo}' in df_shop_display.columns
+
+    if perfil_filtro_shop != "Todos" and tem_metricas_perfil:
+        # Mostrar dados filtrados pelo perfil selecionado
+        colunas_exibir = [
+            'shopping_principal',
+            f'{perfil_lower}{sufixo}',
+            f'{perfil_lower}_valor{sufixo}',
+            f'{perfil_lower}_ticket{sufixo}'
+        ]
+        nomes_colunas = ['Shopping', 'Clientes', 'Valor Total', 'Ticket Médio']
+
+        df_shop_display = df_shop_display[colunas_exibir].set_axis(nomes_colunas, axis=1)
+
+        # Calcular % do valor total
+        total_valor_perfil = df_shop_display['Valor Total'].sum()
+        df_shop_display['% Valor'] = (df_shop_display['Valor Total'] / total_valor_perfil * 100).round(1)
+
+        st.caption(f"Mostrando dados do perfil **{perfil_filtro_shop}** ({tipo_rfv_label})")
+    else:
+        # Mostrar visão geral com todos os perfis
+        colunas_exibir = ['shopping_principal', 'qtd_clientes', 'valor_total', 'ticket_medio']
+        nomes_colunas = ['Shopping', 'Total Clientes', 'Valor Total', 'Ticket Médio']
+
+        if tem_perfis:
+            colunas_exibir.extend(perfis_cols)
+            nomes_colunas.extend(['VIP', 'Premium', 'Potencial', 'Pontual'])
+
+        # High spenders só existe no método Por Valor
+        if 'high_spenders' in df_shop_display.columns:
+            colunas_exibir.append('high_spenders')
+            nomes_colunas.append('High Spenders')
+
+        colunas_exibir.append('pct_valor')
+        nomes_colunas.append('% Valor')
+
+        df_shop_display = df_shop_display[colunas_exibir].set_axis(nomes_colunas, axis=1)
+
+    exibir_tabela(df_shop_display, TABELA_RFV_SHOPPING)
+
+
+@st.fragment
+@medir_fragmento("🎯 RFV › segmentos")
+def rfv_segmentos(df_seg_perfil_shop, fonte_rfv, ctx):
+    shoppings_permitidos_filtro = ctx.shoppings_permitidos_filtro
+    plotly_chart = ctx.plotly_chart
+    figura = ctx.figura
+    filtrar_opcoes_shopping = ctx.filtrar_opcoes_shopping
+
+    # Filtros
+    col1, col2 = st.columns(2)
+    with col1:
+        perfil_filtro = st.selectbox(
+            "Filtrar por Perfil:",
+            ["Todos", "VIP", "Premium", "Potencial", "Pontual"],
+            key='rfv_perfil_seg'
+        )
+    with col2:
+        opcoes_shopping_seg = ["Todos"] + list(df_seg_perfil_shop['shopping'].unique())
+        opcoes_shopping_seg = filtrar_opcoes_shopping(opcoes_shopping_seg, shoppings_permitidos_filtro)
+        shopping_filtro = st.selectbox(
+            "Filtrar por Shopping:",
+            opcoes_shopping_seg,
+            key='rfv_shopping_seg'
+        )
+
+    df_seg = df_seg_perfil_shop.copy()
+
+    if perfil_filtro != "Todos":
+        df_seg = df_seg[df_seg['perfil_historico'] == perfil_filtro]
+    if shopping_filtro != "Todos":
+        df_seg = df_seg[df_seg['shopping'] == shopping_filtro]
+
+    if len(df_seg) > 0:
+        # Top 10 segmentos
+        def grafico_rfv_top_segmentos():
+            df_seg_top = df_seg.groupby('segmento', observed=True).agg({
+                'valor': 'sum',
+                'cupons': 'sum',
+                'clientes': 'sum'
+            }).reset_index().sort_values('valor', ascending=False).head(10)
+
+            fig_seg = px.bar(
+                df_seg_top,
+                x='segmento',
+                y='valor',
+                title=f'Top 10 Segmentos por Valor{" - " + perfil_filtro if perfil_filtro != "Todos" else ""}{" - " + shopping_filtro if shopping_filtro != "Todos" else ""}',
+                color='valor',
+                color_continuous_scale='Viridis'
+            )
+            fig_seg.update_layout(xaxis_tickangle=-45)
+            return fig_seg
+
+        plotly_chart(figura('rfv_top_segmentos', grafico_rfv_top_segmentos, fonte_rfv, perfil_filtro, shopping_filtro), use_container_width=True)
+
+        # Tabela detalhada
+        exibir_tabela(df_seg.head(20), TABELA_RFV_SEGMENTOS)
+    else:
+        st.info("Nenhum dado encontrado com os filtros selecionados.")
+
+
+@st.fragment
+@medir_fragmento("🎯 RFV › lojas")
+def rfv_lojas(df_lojas_rfv, fonte_rfv, ctx):
+    shoppings_permitidos_filtro = ctx.shoppings_permitidos_filtro
+    plotly_chart = ctx.plotly_chart
+    figura = ctx.figura
+    filtrar_opcoes_shopping = ctx.filtrar_opcoes_shopping
+
+    # Filtros para lojas
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        perfil_filtro_loja = st.selectbox(
+            "Filtrar por Perfil:",
+            ["Todos", "VIP", "Premium", "Potencial", "Pontual"],
+            key='rfv_perfil_loja'
+        )
+    with col2:
+        opcoes_shopping_loja = ["Todos"] + list(df_lojas_rfv['shopping'].unique())
+        opcoes_shopping_loja = filtrar_opcoes_shopping(opcoes_shopping_loja, shoppings_permitidos_filtro)
+        shopping_filtro_loja = st.selectbox(
+            "Filtrar por Shopping:",
+            opcoes_shopping_loja,
+            key='rfv_shopping_loja'
+        )
+    with col3:
+        genero_filtro = st.selectbox(
+            "Filtrar por Gênero:",
+            ["Todos", "Feminino", "Masculino"],
+            key='rfv_genero_loja'
+        )
+
+    df_lojas = df_lojas_rfv.copy()
+
+    if perfil_filtro_loja != "Todos":
+        df_lojas = df_lojas[df_lojas['perfil'] == perfil_filtro_loja]
+    if shopping_filtro_loja != "Todos":
+        df_lojas = df_lojas[df_lojas['shopping'] == shopping_filtro_loja]
+    if genero_filtro != "Todos":
+        df_lojas = df_lojas[df_lojas['genero'] == genero_filtro]
+
+    if len(df_lojas) > 0:
+        # Top 10 lojas
+        def grafico_rfv_top_lojas():
+            df_lojas_top = df_lojas.groupby('loja').agg({
+                'valor': 'sum',
+                'cupons': 'sum',
+                'clientes': 'sum'
+            }).reset_index().sort_values('valor', ascending=False).head(10)
+
+            fig_lojas = px.bar(
+                df_lojas_top,
+                x='loja',
+                y='valor',
+                title='Top 10 Lojas por Valor',
+                color='valor',
+                color_continuous_scale='Oranges'
+            )
+            fig_lojas.update_layout(xaxis_tickangle=-45)
+            return fig_lojas
+
+        plotly_chart(figura('rfv_top_lojas', grafico_rfv_top_lojas, fonte_rfv, perfil_filtro_loja, shopping_filtro_loja, genero_filtro), use_container_width=True)
+
+        # Tabela detalhada
+        exibir_tabela(df_lojas.head(20), TABELA_RFV_LOJAS)
+    else:
+        st.info("Nenhum dado encontrado com os filtros selecionados.")
+
+
+def render(ctx):
+    dados = ctx.dados
+    dados_periodos = ctx.dados_periodos
+    indice_periodos = ctx.indice_periodos
+    periodo_selecionado = ctx.periodo_selecionado
+    periodos_selecionados = ctx.periodos_selecionados
+    periodos_pasta = ctx.periodos_pasta
+    modo_comparativo = ctx.modo_comparativo
+    username = ctx.username
+    shoppings_permitidos_filtro = ctx.shoppings_permitidos_filtro
+    NOMES_SHOPPING = ctx.NOMES_SHOPPING
+    CORES_PERFIL = ctx.CORES_PERFIL
+    ORDEM_PERFIL = ctx.ORDEM_PERFIL
+    plotly_chart = ctx.plotly_chart
+    filtrar_opcoes_shopping = ctx.filtrar_opcoes_shopping
+    registrar_filtro = ctx.registrar_filtro
+    cache_periodos = ctx.cache_periodos
+    calcular_migracao = ctx.calcular_migracao
+
+    st.markdown('<p class="main-header">🎯 Análise RFV - Recência, Frequência e Valor</p>', unsafe_allow_html=True)
+
+    # Intervalo personalizado (apenas período único): RFV recalculado a partir das linhas por cliente
+    rfv_personalizado = None
+    if not modo_comparativo:
+        usar_intervalo = st.toggle(
+            "📆 Intervalo personalizado de meses",
+            help="Recalcula perfis, scores e métricas por shopping para qualquer intervalo de meses, somando os clientes dos meses escolhidos.",
+            key='rfv_intervalo_personalizado'
+        )
+        if usar_intervalo:
+            meses_rfv = meses_disponiveis('Resultados')
+            nomes_meses_rfv = {}
+            if indice_periodos is not None:
+                df_meses_rfv = indice_periodos[indice_periodos['tipo'] == 'Mes']
+                nomes_meses_rfv = dict(zip(df_meses_rfv['codigo'].astype(str), df_meses_rfv['nome']))
+            # Padrão: até 6 meses seguidos com dados de clientes, terminando no mais recente
+            abrir_mes = cache_periodos().obter
+            sem_clientes = set(meses_sem_clientes(meses_rfv, 'Resultados', abrir_mes))
+            fim_padrao = max([i for i, m in enumerate(meses_rfv) if m not in sem_clientes], default=len(meses_rfv) - 1)
+            inicio_padrao = fim_padrao
+            while inicio_padrao > 0 and fim_padrao - inicio_padrao < 5 and meses_rfv[inicio_padrao - 1] not in sem_clientes:
+                inicio_padrao -= 1
+            mes_inicio_rfv, mes_fim_rfv = st.select_slider(
+                "Intervalo de meses:",
+                options=meses_rfv,
+                value=(meses_rfv[inicio_padrao], meses_rfv[fim_padrao]),
+                format_func=lambda m: nomes_meses_rfv.get(m, m),
+                key='rfv_intervalo_meses'
+            )
+            meses_escolhidos = meses_rfv[meses_rfv.index(mes_inicio_rfv):meses_rfv.index(mes_fim_rfv) + 1]
+            intervalo_label = f"{nomes_meses_rfv.get(mes_inicio_rfv, mes_inicio_rfv)} a {nomes_meses_rfv.get(mes_fim_rfv, mes_fim_rfv)}"
+
+            # Registrar filtro de intervalo
+            if st.session_state.get('anterior_rfv_intervalo') != intervalo_label:
+                registrar_filtro(username, "RFV", "Intervalo personalizado", intervalo_label)
+                st.session_state['anterior_rfv_intervalo'] = intervalo_label
+
+            meses_faltantes = [m for m in meses_escolhidos if m in sem_clientes]
+            if meses_faltantes:
+                st.warning(f"⚠️ Sem dados de clientes RFV para: {', '.join(nomes_meses_rfv.get(m, m) for m in meses_faltantes)}. Escolha um intervalo sem esses meses.")
+            else:
+                with st.spinner("Calculando RFV do intervalo..."):
+                    rfv_personalizado = calcular_rfv_intervalo(tuple(meses_escolhidos), abrir_mes)
+
+    # Mostrar período selecionado
+    if modo_comparativo:
+        st.markdown(f"**Comparando:** {' vs '.join(periodos_selecionados)}")
+    elif rfv_personalizado is not None:
+        st.markdown(f"**Intervalo personalizado:** {intervalo_label} ({len(meses_escolhidos)} {'mês' if len(meses_escolhidos) == 1 else 'meses'})")
+    else:
+        st.markdown(f"**Período selecionado:** {periodo_selecionado}")
+
+    # =========================================================================
+    # TOGGLE PRINCIPAL: MÉTODO DE CLASSIFICAÇÃO
+    # =========================================================================
+    st.markdown("### Método de Classificação")
+
+    # Verificar se dados de quintis estão disponíveis
+    if rfv_personalizado is not None:
+        tem_quintis = True
+    else:
+        tem_quintis = dados.get('rfv_quintis') is not None and len(dados.get('rfv_quintis', {})) > 0
+
+    col_metodo1, col_metodo2 = st.columns([3, 1])
+    with col_metodo1:
+        metodo_rfv = st.radio(
+            "Selecione o método:",
+            ["Por Valor (R$)", "Por Quintis (R+F+V)"],
+            horizontal=True,
+            help="""
+            **Por Valor (R$):** Classificação baseada em thresholds fixos de valor em reais.
+            **Por Quintis (R+F+V):** Classificação baseada na soma de scores de Recência, Frequência e Valor (cada um de 1-5).
+            """,
+            key='rfv_metodo_principal'
+        )
+
+    usar_quintis = metodo_rfv == "Por Quintis (R+F+V)"
+
+    # Registrar filtro de método RFV
+    if st.session_state.get('anterior_rfv_metodo') != metodo_rfv:
+        registrar_filtro(username, "RFV", "Método", metodo_rfv)
+        st.session_state['anterior_rfv_metodo'] = metodo_rfv
+
+    # Toggle de escopo (apenas para método Quintis)
+    escopo_quintis = "Global"
+    if usar_quintis:
+        with col_metodo2:
+            escopo_quintis = st.radio(
+                "Escopo:",
+                ["Global", "Por Shopping"],
+                horizontal=False,
+                help="""
+                **Global:** Quintis calculados sobre todos os clientes (comparação justa entre shoppings).
+                **Por Shopping:** Quintis calculados dentro de cada shopping (cada shopping tem seus "melhores").
+                """,
+                key='rfv_escopo_quintis'
+            )
+
+        # Registrar filtro de escopo
+        if st.session_state.get('anterior_rfv_escopo') != escopo_quintis:
+            registrar_filtro(username, "RFV", "Escopo", escopo_quintis)
+            st.session_state['anterior_rfv_escopo'] = escopo_quintis
+
+    # Descrição dinâmica do método
+    if usar_quintis:
+        if not tem_quintis:
+            st.warning("⚠️ Dados de Quintis não disponíveis para este período. Execute o script `gerar_rfv_por_periodo.py` para gerar os dados. Usando método Por Valor.")
+            usar_quintis = False
+        else:
+            st.markdown(f"""
+            **Método selecionado: Por Quintis ({escopo_quintis})**
+
+            Cada cliente recebe scores de 1-5 em cada dimensão (R, F, V):
+            - **Recência (R):** Score 5 = comprou recentemente, Score 1 = não compra há muito tempo
+            - **Frequência (F):** Score 5 = muitas compras, Score 1 = poucas compras
+            - **Valor (V):** Score 5 = alto valor gasto, Score 1 = baixo valor gasto
+
+            | Score Total (R+F+V) | Perfil | Descrição |
+            |---------------------|--------|-----------|
+            | 13 a 15 | **VIP** | Excelente em todas as dimensões |
+            | 10 a 12 | **Premium** | Bom desempenho geral |
+            | 7 a 9 | **Potencial** | Médio, com espaço para crescer |
+            | 3 a 6 | **Pontual** | Baixo engajamento |
+            """)
+
+    if not usar_quintis:
+        st.markdown("""
+        **Método selecionado: Por Valor (R$)**
+
+        Classificação baseada em **thresholds fixos** de valor:
+        - **Classificação Histórica:** baseada no valor total acumulado do cliente
+        - **Classificação por Período:** baseada no valor gasto no período selecionado
+
+        As métricas de Recência e Frequência são calculadas, mas a segmentação usa apenas o Valor.
+        """)
+
+    # Verificar se há dados RFV disponíveis
+    dados_rfv_disponivel = dados.get('rfv') is not None or rfv_personalizado is not None
+
+    if not dados_rfv_disponivel and not modo_comparativo:
+        st.warning("⚠️ Dados RFV não encontrados para este período. Execute o script `gerar_rfv_por_periodo.py` para gerar os dados.")
+        st.stop()
+
+    # Modo comparativo
+    if modo_comparativo:
+        # Verificar quais períodos têm dados RFV
+        periodos_com_rfv = {nome: dados_periodos[nome].get('rfv') for nome in periodos_selecionados if dados_periodos[nome].get('rfv') is not None}
+
+        if len(periodos_com_rfv) == 0:
+            st.warning("⚠️ Nenhum dos períodos selecionados possui dados RFV. Execute o script `gerar_rfv_por_periodo.py` para gerar os dados.")
+            st.stop()
+
+        if len(periodos_com_rfv) < len(periodos_selecionados):
+            st.info(f"ℹ️ Mostrando dados RFV de {len(periodos_com_rfv)} de {len(periodos_selecionados)} períodos selecionados.")
+
+        # Toggle para tipo de classificação
+        tipo_rfv = st.radio(
+            "Tipo de Classificação:",
+            ["Histórica (Valor Total)", "Por Período (Valor do Período)"],
+            horizontal=True,
+            key='rfv_tipo_comparativo'
+        )
+        usar_historico = tipo_rfv == "Histórica (Valor Total)"
+
+        st.subheader("Comparação de Perfis RFV entre Períodos")
+
+        # Coletar dados de todos os períodos
+        dados_comparacao = []
+        for nome_periodo, rfv_data in periodos_com_rfv.items():
+            df_perfil = rfv_data['perfil_historico' if usar_historico else 'perfil_periodo'].copy()
+            df_perfil['periodo'] = nome_periodo
+            dados_comparacao.append(df_perfil)
+
+        df_comparacao = pd.concat(dados_comparacao, ignore_index=True)
+
+        # Gráfico comparativo de clientes por perfil
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fig_comp_cli = px.bar(
+                df_comparacao,
+                x='perfil_cliente',
+                y='qtd_clientes',
+                color='periodo',
+                barmode='group',
+                title='Clientes por Perfil - Comparativo',
+                color_discrete_sequence=px.colors.qualitative.Set2,
+                category_orders={'perfil_cliente': ORDEM_PERFIL}
+            )
+            fig_comp_cli.update_layout(xaxis_title='Perfil', yaxis_title='Clientes')
+            plotly_chart(fig_comp_cli, use_container_width=True)
+
+        with col2:
+            fig_comp_valor = px.bar(
+                df_comparacao,
+                x='perfil_cliente',
+                y='valor_total',
+                color='periodo',
+                barmode='group',
+                title='Valor por Perfil - Comparativo',
+                color_discrete_sequence=px.colors.qualitative.Set2,
+                category_orders={'perfil_cliente': ORDEM_PERFIL}
+            )
+            fig_comp_valor.update_layout(xaxis_title='Perfil', yaxis_title='Valor (R$)')
+            plotly_chart(fig_comp_valor, use_container_width=True)
+
+        # Tabela comparativa
+        st.subheader("Tabela Comparativa")
+        df_pivot = df_comparacao.pivot_table(
+            values=['qtd_clientes', 'valor_total', 'pct_valor'],
+            index='perfil_cliente',
+            columns='periodo',
+            aggfunc='sum'
+        ).round(2)
+
+        # Reordenar índice
+        df_pivot = df_pivot.reindex(ORDEM_PERFIL)
+        st.dataframe(df_pivot, use_container_width=True)
+
+        # Evolução de VIPs
+        st.subheader("Evolução de Clientes VIP")
+        vips_por_periodo = df_comparacao[df_comparacao['perfil_cliente'] == 'VIP'][['periodo', 'qtd_clientes', 'valor_total']].copy()
+        vips_por_periodo['ticket_medio'] = vips_por_periodo['valor_total'] / vips_por_periodo['qtd_clientes']
+
+        col1, col2, col3 = st.columns(3)
+        for i, (_, row) in enumerate(vips_por_periodo.iterrows()):
+            with [col1, col2, col3][i % 3]:
+                st.metric(
+                    f"🏆 VIP - {row['periodo']}",
+                    f"{int(row['qtd_clientes']):,}",
+                    f"Ticket: R$ {row['ticket_medio']:,.2f}"
+                )
+
+        # Migração de perfis entre dois períodos (join por cliente_id)
+        st.subheader("🔀 Migração de Perfis entre Períodos")
+        periodos_com_clientes = [
+            nome for nome in periodos_selecionados
+            if dados_periodos[nome].get('rfv_quintis') is not None and 'clientes_global' in dados_periodos[nome]['rfv_quintis']
+        ]
+
+        if len(periodos_com_clientes) < 2:
+            st.info("ℹ️ A migração precisa de 2 períodos com dados de clientes RFV (quintis).")
+        else:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                periodo_origem = st.selectbox("Período de origem:", periodos_com_clientes, index=0, key='rfv_migracao_origem')
+            with col2:
+                opcoes_destino = [p for p in periodos_com_clientes if p != periodo_origem]
+                periodo_destino = st.selectbox("Período de destino:", opcoes_destino, index=0, key='rfv_migracao_destino')
+            with col3:
+                metodo_migracao = st.radio(
+                    "Classificação:",
+                    ["Por Quintis (R+F+V)", "Por Valor do Período"],
+                    key='rfv_migracao_metodo'
+                )
+
+            # Registrar filtro de migração
+            filtro_migracao = f"{periodo_origem} -> {periodo_destino} | {metodo_migracao}"
+            if st.session_state.get('anterior_rfv_migracao') != filtro_migracao:
+                registrar_filtro(username, "RFV", "Migração", filtro_migracao)
+                st.session_state['anterior_rfv_migracao'] = filtro_migracao
+
+            # Restringir aos shoppings permitidos do usuário
+            shoppings_migracao = None
+            if shoppings_permitidos_filtro is not None:
+                shoppings_migracao = tuple(NOMES_SHOPPING[s] for s in shoppings_permitidos_filtro if s in NOMES_SHOPPING)
+
+            matriz = calcular_migracao(
+                periodos_pasta[periodo_origem],
+                periodos_pasta[periodo_destino],
+                'quintis' if metodo_migracao.startswith('Por Quintis') else 'valor',
+                shoppings_migracao
+            )
+            resumo_mig = resumo_migracao(matriz)
+
+            col1, col2, col3, col4, col5 = st.columns(5)
+            col1.metric("Mesmo perfil", f"{resumo_mig['mesmo_perfil']:,}")
+            col2.metric("⬆️ Subiram", f"{resumo_mig['upgrades']:,}")
+            col3.metric("⬇️ Caíram", f"{resumo_mig['downgrades']:,}")
+            col4.metric("🆕 Novos", f"{resumo_mig['novos']:,}")
+            col5.metric("💤 Inativos", f"{resumo_mig['inativos']:,}")
+
+            tab_mig1, tab_mig2 = st.tabs(["🔥 Matriz", "🔀 Fluxo (Sankey)"])
+
+            with tab_mig1:
+                fig_mig = px.imshow(
+                    matriz,
+                    text_auto=',',
+                    color_continuous_scale='Blues',
+                    labels=dict(x=f"Perfil em {periodo_destino}", y=f"Perfil em {periodo_origem}", color="Clientes"),
+                    aspect='auto'
+                )
+                fig_mig.update_layout(height=450)
+                plotly_chart(fig_mig, use_container_width=True)
+                st.caption(f"**{NOVO}:** cliente sem compras em {periodo_origem}. **{INATIVO}:** cliente sem compras em {periodo_destino}.")
+
+            with tab_mig2:
+                origens = list(matriz.index)
+                destinos = list(matriz.columns)
+                fluxos = matriz.stack()
+                fluxos = fluxos[fluxos > 0]
+                cores_nos = [CORES_PERFIL.get(n, '#BDC3C7') for n in origens + destinos]
+                fig_sankey = go.Figure(go.Sankey(
+                    node=dict(
+                        label=[f"{n} ({periodo_origem})" for n in origens] + [f"{n} ({periodo_destino})" for n in destinos],
+                        color=cores_nos,
+                        pad=15
+                    ),
+                    link=dict(
+                        source=[origens.index(o) for o, _ in fluxos.index],
+                        target=[len(origens) + destinos.index(d) for _, d in fluxos.index],
+                        value=fluxos.values.tolist()
+                    )
+                ))
+                fig_sankey.update_layout(height=550)
+                plotly_chart(fig_sankey, use_container_width=True)
+
+    else:
+        # Modo período único
+        if rfv_personalizado is not None:
+            dados_rfv, dados_rfv_quintis = rfv_personalizado
+        else:
+            dados_rfv = dados['rfv']
+            dados_rfv_quintis = dados.get('rfv_quintis')
+        # Origem dos dados nas chaves do cache de figuras (o intervalo personalizado não é o período)
+        fonte_rfv = tuple(meses_escolhidos) if rfv_personalizado is not None else None
+
+        # =====================================================================
+        # LÓGICA PARA SELECIONAR DADOS CONFORME MÉTODO
+        # =====================================================================
+        if usar_quintis and dados_rfv_quintis:
+            # MÉTODO POR QUINTIS
+            # Selecionar dados conforme escopo
+            if escopo_quintis == "Global":
+                df_perfil = dados_rfv_quintis.get('perfil_global', pd.DataFrame()).copy()
+                df_shopping_quintis = dados_rfv_quintis.get('shopping_global', pd.DataFrame())
+                df_clientes_quintis = dados_rfv_quintis.get('clientes_global', pd.DataFrame())
+            else:
+                df_perfil = dados_rfv_quintis.get('perfil_shopping', pd.DataFrame()).copy()
+                df_shopping_quintis = dados_rfv_quintis.get('shopping_shopping', pd.DataFrame())
+                df_clientes_quintis = dados_rfv_quintis.get('clientes_shopping', pd.DataFrame())
+
+            # Usar tipo_rfv_label para exibição
+            tipo_rfv_label = f"Quintis ({escopo_quintis})"
+            # Definir usar_historico como False para quintis (não aplicável)
+            usar_historico = False
+
+            if df_perfil.empty:
+                st.warning("⚠️ Dados de quintis não disponíveis. Usando método Por Valor.")
+                usar_quintis = False
+
+        if not usar_quintis:
+            # MÉTODO POR VALOR (existente)
+            # Toggle para tipo de classificação (Histórica vs Período)
+            # Intervalo personalizado: a classificação histórica não é recalculável a partir dos meses
+            opcoes_tipo_rfv = ["Histórica (Valor Total)", "Por Período (Valor do Período)"]
+            if rfv_personalizado is not None:
+                opcoes_tipo_rfv = opcoes_tipo_rfv[1:]
+            tipo_rfv = st.radio(
+                "Tipo de Classificação:",
+                opcoes_tipo_rfv,
+                horizontal=True,
+                help="**Histórica:** classifica pelo valor total acumulado do cliente. **Por Período:** classifica pelo valor gasto no período selecionado.",
+                key='rfv_tipo_unico'
+            )
+            usar_historico = tipo_rfv == "Histórica (Valor Total)"
+
+            # Selecionar dados conforme tipo
+            df_perfil = dados_rfv['perfil_historico' if usar_historico else 'perfil_periodo'].copy()
+            tipo_rfv_label = tipo_rfv.split(' (')[0]
+
+        # Garantir ordenação correta
+        df_perfil['ordem'] = df_perfil['perfil_cliente'].map({p: i for i, p in enumerate(ORDEM_PERFIL)})
+        df_perfil = df_perfil.sort_values('ordem')
+
+        # Tabs principais - adicionar tab de Scores se usando quintis
+        if usar_quintis:
+            tab1, tab2, tab3, tab4, tab5 = st.tabs(["📊 Visão Geral", "📈 Scores R/F/V", "🏬 Por Shopping", "🛒 Segmentos & Lojas", "📋 Resumo"])
+        else:
+            tab1, tab2, tab3, tab4 = st.tabs(["📊 Visão Geral", "🏬 Por Shopping", "🛒 Segmentos & Lojas", "📋 Resumo"])
+
+        with tab1:
+            # Filtro de shopping
+            shoppings_disponiveis = ["Todos"]
+            # Usar dados de shopping conforme método
+            if usar_quintis and 'df_shopping_quintis' in dir() and not df_shopping_quintis.empty:
+                shoppings_disponiveis += list(df_shopping_quintis['shopping_principal'].unique())
+                df_shop_vg = df_shopping_quintis
+                sufixo_vg = '_quintis'
+            elif 'shopping' in dados_rfv and dados_rfv['shopping'] is not None:
+                shoppings_disponiveis += list(dados_rfv['shopping']['shopping_principal'].unique())
+                df_shop_vg = dados_rfv['shopping']
+                sufixo_vg = '_hist' if usar_historico else '_periodo'
+            else:
+                df_shop_vg = None
+                sufixo_vg = '_hist'
+
+            # Filtrar opções conforme permissões do usuário
+            shoppings_disponiveis = filtrar_opcoes_shopping(shoppings_disponiveis, shoppings_permitidos_filtro)
+
+            shopping_visao = st.selectbox(
+                "Filtrar por Shopping:",
+                shoppings_disponiveis,
+                key='rfv_shopping_visao_geral'
+            )
+
+            # Montar dados de perfil conforme filtro de shopping
+            if shopping_visao != "Todos" and df_shop_vg is not None:
+                row_shop = df_shop_vg[df_shop_vg['shopping_principal'] == shopping_visao]
+
+                if not row_shop.empty:
+                    row = row_shop.iloc[0]
+                    dados_perfil_list = []
+                    for perfil in ORDEM_PERFIL:
+                        p = perfil.lower()
+                        qtd = int(row.get(f'{p}{sufixo_vg}', 0))
+                        valor = float(row.get(f'{p}_valor{sufixo_vg}', 0))
+                        ticket = valor / qtd if qtd > 0 else 0
+                        dados_perfil_list.append({
+                            'perfil_cliente': perfil,
+                            'qtd_clientes': qtd,
+                            'valor_total': valor,
+                            'ticket_medio': ticket
+                        })
+                    df_perfil_filtrado = pd.DataFrame(dados_perfil_list)
+                    total_cli = df_perfil_filtrado['qtd_clientes'].sum()
+                    total_val = df_perfil_filtrado['valor_total'].sum()
+                    df_perfil_filtrado['pct_clientes'] = (df_perfil_filtrado['qtd_clientes'] / total_cli * 100).round(2) if total_cli > 0 else 0
+                    df_perfil_filtrado['pct_valor'] = (df_perfil_filtrado['valor_total'] / total_val * 100).round(2) if total_val > 0 else 0
+                else:
+                    df_perfil_filtrado = df_perfil.copy()
+
+                st.subheader(f"Distribuição por Perfil - {shopping_visao} ({tipo_rfv_label})")
+            else:
+                df_perfil_filtrado = df_perfil.copy()
+                st.subheader(f"Distribuição por Perfil de Cliente ({tipo_rfv_label})")
+
+            # KPIs
+            col1, col2, col3, col4 = st.columns(4)
+            for i, perfil in enumerate(ORDEM_PERFIL):
+                dados_p = df_perfil_filtrado[df_perfil_filtrado['perfil_cliente'] == perfil]
+                if not dados_p.empty:
+                    qtd = int(dados_p['qtd_clientes'].values[0])
+                    pct_valor = dados_p['pct_valor'].values[0] if isinstance(dados_p['pct_valor'].values[0], (int, float)) else 0
+                    with [col1, col2, col3, col4][i]:
+                        icone = "🏆" if perfil == 'VIP' else "⭐" if perfil == 'Premium' else "🎯" if perfil == 'Potencial' else "👤"
+                        st.metric(
+                            f"{icone} {perfil}",
+                            f"{qtd:,}",
+                            f"{pct_valor:.1f}% do valor"
+                        )
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                # Gráfico de pizza - distribuição de clientes
+                fig_pizza = px.pie(
+                    df_perfil_filtrado,
+                    values='qtd_clientes',
+                    names='perfil_cliente',
+                    title='Distribuição de Clientes por Perfil',
+                    color='perfil_cliente',
+                    color_discrete_map=CORES_PERFIL,
+                    hole=0.4,
+                    category_orders={'perfil_cliente': ORDEM_PERFIL}
+                )
+                fig_pizza.update_traces(textposition='inside', textinfo='percent+label')
+                plotly_chart(fig_pizza, use_container_width=True)
+
+            with col2:
+                # Gráfico de pizza - distribuição de valor
+                fig_valor = px.pie(
+                    df_perfil_filtrado,
+                    values='valor_total',
+                    names='perfil_cliente',
+                    title='Distribuição de Valor por Perfil',
+                    color='perfil_cliente',
+                    color_discrete_map=CORES_PERFIL,
+                    hole=0.4,
+                    category_orders={'perfil_cliente': ORDEM_PERFIL}
+                )
+                fig_valor.update_traces(textposition='inside', textinfo='percent+label')
+                plotly_chart(fig_valor, use_container_width=True)
+
+            # Tabela resumo
+            st.subheader("Resumo por Perfil")
+            exibir_tabela(df_perfil_filtrado, TABELA_RFV_PERFIS)
+
+            # Insight dinâmico
+            vip_data = df_perfil_filtrado[df_perfil_filtrado['perfil_cliente'] == 'VIP']
+            if not vip_data.empty:
+                pct_cli_vip = vip_data['pct_clientes'].values[0] if isinstance(vip_data['pct_clientes'].values[0], (int, float)) else 0
+                pct_val_vip = vip_data['pct_valor'].values[0] if isinstance(vip_data['pct_valor'].values[0], (int, float)) else 0
+                label_shop = f" no **{shopping_visao}**" if shopping_visao != "Todos" else ""
+                st.info(f"""
+                💡 **Princípio de Pareto:** Os clientes **VIP**{label_shop} representam {pct_cli_vip:.1f}% da base,
+                mas geram **{pct_val_vip:.1f}%** do faturamento. Investir na retenção desses clientes é fundamental.
+                """)
+
+        # =====================================================================
+        # TAB SCORES R/F/V (apenas para método Quintis)
+        # =====================================================================
+        if usar_quintis:
+            with tab2:
+                st.subheader(f"📈 Distribuição de Scores R/F/V ({escopo_quintis})")
+
+                if 'df_clientes_quintis' in dir() and not df_clientes_quintis.empty:
+                    # Distribuição de scores por dimensão
+                    col1, col2, col3 = st.columns(3)
+
+                    with col1:
+                        # Histograma de Recência
+                        fig_r = px.histogram(
+                            df_clientes_quintis,
+                            x='R_score',
+                            nbins=5,
+                            title='Distribuição Score Recência (R)',
+                            color_discrete_sequence=['#E74C3C'],
+                            labels={'R_score': 'Score R', 'count': 'Clientes'}
+                        )
+                        fig_r.update_layout(bargap=0.1, xaxis=dict(tickmode='linear', tick0=1, dtick=1))
+                        plotly_chart(fig_r, use_container_width=True)
+
+                        # Estatísticas R
+                        r_stats = df_clientes_quintis['R_score'].describe()
+                        st.caption(f"Média: {r_stats['mean']:.2f} | Mediana: {r_stats['50%']:.0f}")
+
+                    with col2:
+                        # Histograma de Frequência
+                        fig_f = px.histogram(
+                            df_clientes_quintis,
+                            x='F_score',
+                            nbins=5,
+                            title='Distribuição Score Frequência (F)',
+                            color_discrete_sequence=['#3498DB'],
+                            labels={'F_score': 'Score F', 'count': 'Clientes'}
+                        )
+                        fig_f.update_layout(bargap=0.1, xaxis=dict(tickmode='linear', tick0=1, dtick=1))
+                        plotly_chart(fig_f, use_container_width=True)
+
+                        # Estatísticas F
+                        f_stats = df_clientes_quintis['F_score'].describe()
+                        st.caption(f"Média: {f_stats['mean']:.2f} | Mediana: {f_stats['50%']:.0f}")
+
+                    with col3:
+                        # Histograma de Valor
+                        fig_v = px.histogram(
+                            df_clientes_quintis,
+                            x='V_score',
+                            nbins=5,
+                            title='Distribuição Score Valor (V)',
+                            color_discrete_sequence=['#2ECC71'],
+                            labels={'V_score': 'Score V', 'count': 'Clientes'}
+                        )
+                        fig_v.update_layout(bargap=0.1, xaxis=dict(tickmode='linear', tick0=1, dtick=1))
+                        plotly_chart(fig_v, use_container_width=True)
+
+                        # Estatísticas V
+                        v_stats = df_clientes_quintis['V_score'].describe()
+                        st.caption(f"Média: {v_stats['mean']:.2f} | Mediana: {v_stats['50%']:.0f}")
+
+                    # Distribuição do Score Total
+                    st.subheader("Distribuição do Score Total (R+F+V)")
+                    col1, col2 = st.columns([2, 1])
+
+                    with col1:
+                        fig_total = px.histogram(
+                            df_clientes_quintis,
+                            x='score_total',
+                            nbins=13,
+                            title='Distribuição do Score Total (3-15)',
+                            color_discrete_sequence=['#9B59B6'],
+                            labels={'score_total': 'Score Total', 'count': 'Clientes'}
+                        )
+                        # Adicionar linhas de corte dos perfis
+                        fig_total.add_vline(x=6.5, line_dash="dash", line_color="gray", annotation_text="Pontual/Potencial")
+                        fig_total.add_vline(x=9.5, line_dash="dash", line_color="gray", annotation_text="Potencial/Premium")
+                        fig_total.add_vline(x=12.5, line_dash="dash", line_color="gray", annotation_text="Premium/VIP")
+                        fig_total.update_layout(bargap=0.1, xaxis=dict(tickmode='linear', tick0=3, dtick=1))
+                        plotly_chart(fig_total, use_container_width=True)
+
+                    with col2:
+                        # Contagem por faixa de score
+                        st.markdown("**Distribuição por Faixa:**")
+                        faixas = {
+                            '3-6 (Pontual)': len(df_clientes_quintis[df_clientes_quintis['score_total'] <= 6]),
+                            '7-9 (Potencial)': len(df_clientes_quintis[(df_clientes_quintis['score_total'] >= 7) & (df_clientes_quintis['score_total'] <= 9)]),
+                            '10-12 (Premium)': len(df_clientes_quintis[(df_clientes_quintis['score_total'] >= 10) & (df_clientes_quintis['score_total'] <= 12)]),
+                            '13-15 (VIP)': len(df_clientes_quintis[df_clientes_quintis['score_total'] >= 13])
+                        }
+                        total = sum(faixas.values())
+                        for faixa, qtd in faixas.items():
+                            pct = (qtd / total * 100) if total > 0 else 0
+                            st.markdown(f"- **{faixa}:** {qtd:,} ({pct:.1f}%)")
+
+                    # Radar Chart - Scores médios por Perfil
+                    st.subheader("Radar Chart - Scores Médios por Perfil")
+
+                    # Calcular médias por perfil
+                    medias_perfil = df_clientes_quintis.groupby('perfil_quintis').agg({
+                        'R_score': 'mean',
+                        'F_score': 'mean',
+                        'V_score': 'mean'
+                    }).reset_index()
+
+                    # Criar radar chart
+                    fig_radar = go.Figure()
+
+                    cores_radar = {'VIP': '#9B59B6', 'Premium': '#3498DB', 'Potencial': '#2ECC71', 'Pontual': '#95A5A6'}
+
+                    for _, row in medias_perfil.iterrows():
+                        perfil = row['perfil_quintis']
+                        fig_radar.add_trace(go.Scatterpolar(
+                            r=[row['R_score'], row['F_score'], row['V_score'], row['R_score']],
+                            theta=['Recência (R)', 'Frequência (F)', 'Valor (V)', 'Recência (R)'],
+                            fill='toself',
+                            name=perfil,
+                            line_color=cores_radar.get(perfil, '#888888'),
+                            opacity=0.7
+                        ))
+
+                    fig_radar.update_layout(
+                        polar=dict(
+                            radialaxis=dict(visible=True, range=[0, 5])
+                        ),
+                        showlegend=True,
+                        title='Comparação de Scores Médios entre Perfis'
+                    )
+                    plotly_chart(fig_radar, use_container_width=True)
+
+                    st.info("""
+                    💡 **Interpretação do Radar Chart:**
+                    - Perfis **VIP** devem ter scores altos em todas as dimensões (área maior)
+                    - Perfis **Pontual** têm scores baixos em geral (área menor)
+                    - Perfis **desequilibrados** (ex: alto em V, baixo em R) indicam oportunidades de ação
+                    """)
+
+                    # Tabela com scores detalhados
+                    st.subheader("Tabela de Scores por Perfil")
+                    df_scores_tabela = medias_perfil.copy()
+                    df_scores_tabela.columns = ['Perfil', 'R Médio', 'F Médio', 'V Médio']
+                    df_scores_tabela['Score Total Médio'] = df_scores_tabela['R Médio'] + df_scores_tabela['F Médio'] + df_scores_tabela['V Médio']
+                    df_scores_tabela = df_scores_tabela.round(2)
+
+                    # Ordenar por perfil
+                    ordem = {'VIP': 0, 'Premium': 1, 'Potencial': 2, 'Pontual': 3}
+                    df_scores_tabela['ordem'] = df_scores_tabela['Perfil'].map(ordem)
+                    df_scores_tabela = df_scores_tabela.sort_values('ordem').drop('ordem', axis=1)
+
+                    st.dataframe(df_scores_tabela, use_container_width=True, hide_index=True)
+                else:
+                    st.warning("Dados de clientes com scores não disponíveis.")
+
+            # Definir tab de shopping como tab3 quando usando quintis
+            tab_shopping = tab3
+            tab_segmentos = tab4
+            tab_resumo = tab5
+        else:
+            # Quando não usa quintis, manter as tabs originais
+            tab_shopping = tab2
+            tab_segmentos = tab3
+            tab_resumo = tab4
+
+        with tab_shopping:
+            st.subheader("Análise RFV por Shopping")
+
+            # Selecionar dados de shopping conforme método
+            if usar_quintis and 'df_shopping_quintis' in dir() and not df_shopping_quintis.empty:
+                df_shopping = df_shopping_quintis.copy()
+                sufixo = '_quintis'
+                perfis_cols = ['vip_quintis', 'premium_quintis', 'potencial_quintis', 'pontual_quintis']
+                tem_perfis = all(col in df_shopping.columns for col in perfis_cols)
+            elif 'shopping' in dados_rfv and dados_rfv['shopping'] is not None:
+                df_shopping = dados_rfv['shopping'].copy()
+                # Definir sufixo baseado no tipo de classificação
+                sufixo = '_hist' if usar_historico else '_periodo'
+                perfis_cols = [f'vip{sufixo}', f'premium{sufixo}', f'potencial{sufixo}', f'pontual{sufixo}']
+                tem_perfis = all(col in df_shopping.columns for col in perfis_cols)
+            else:
+                df_shopping = None
+                tem_perfis = False
+
+            if df_shopping is not None:
+                rfv_por_shopping(df_shopping, sufixo, perfis_cols, tem_perfis, tipo_rfv_label, fonte_rfv, ctx)
+            else:
+                st.warning("Dados de shopping não disponíveis para este período.")
+
+        with tab_segmentos:
+            st.subheader("Segmentos e Lojas por Perfil")
+
+            # Sub-tabs para segmentos e lojas
+            subtab1, subtab2 = st.tabs(["🏷️ Segmentos", "🏪 Lojas"])
+
+            with subtab1:
+                if 'seg_perfil_shop' in dados_rfv and dados_rfv['seg_perfil_shop'] is not None:
+                    rfv_segmentos(dados_rfv['seg_perfil_shop'], fonte_rfv, ctx)
+                else:
+                    st.warning("Dados de segmentos não disponíveis para este período.")
+
+            with subtab2:
+                if 'lojas' in dados_rfv and dados_rfv['lojas'] is not None:
+                    rfv_lojas(dados_rfv['lojas'], fonte_rfv, ctx)
+                else:
+                    st.warning("Dados de lojas não disponíveis para este período.")
+
+        with tab_resumo:
+            st.subheader("Resumo RFV")
+
+            st.info("""
+            📋 A lista completa de clientes RFV está disponível para download na página **Exportar Dados**.
+            Aqui você pode visualizar um resumo das métricas por perfil e shopping.
+            """)
+
+            # Resumo cruzado Perfil x Shopping
+            if 'seg_perfil_shop' in dados_rfv and dados_rfv['seg_perfil_shop'] is not None:
+                st.subheader("Matriz: Perfil x Shopping")
+
+                df_seg_shop = dados_rfv['seg_perfil_shop'].copy()
+
+                # Criar matriz pivoteada
+                matriz = df_seg_shop.groupby(['shopping', 'perfil_historico']).agg({
+                    'valor': 'sum',
+                    'clientes': 'sum'
+                }).reset_index()
+
+                # Pivot para clientes
+                matriz_clientes = matriz.pivot(index='shopping', columns='perfil_historico', values='clientes').fillna(0)
+                matriz_clientes = matriz_clientes.reindex(columns=['VIP', 'Premium', 'Potencial', 'Pontual'], fill_value=0)
+
+                # Pivot para valor
+                matriz_valor = matriz.pivot(index='shopping', columns='perfil_historico', values='valor').fillna(0)
+                matriz_valor = matriz_valor.reindex(columns=['VIP', 'Premium', 'Potencial', 'Pontual'], fill_value=0)
+
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    st.markdown("**Quantidade de Clientes**")
+                    fig_heat_cli = px.imshow(
+                        matriz_clientes,
+                        labels=dict(x="Perfil", y="Shopping", color="Clientes"),
+                        color_continuous_scale='Blues',
+                        text_auto=True
+                    )
+                    fig_heat_cli.update_layout(height=400)
+                    plotly_chart(fig_heat_cli, use_container_width=True)
+
+                with col2:
+                    st.markdown("**Valor Total (R$)**")
+                    fig_heat_val = px.imshow(
+                        matriz_valor / 1e6,
+                        labels=dict(x="Perfil", y="Shopping", color="Valor (M)"),
+                        color_continuous_scale='Greens',
+                        text_auto='.1f'
+                    )
+                    fig_heat_val.update_layout(height=400)
+                    plotly_chart(fig_heat_val, use_container_width=True)
+
+            # Metodologia
+            with st.expander("📖 Metodologia RFV"):
+                st.markdown("""
+                ## Métodos de Classificação Disponíveis
+
+                Este dashboard oferece **dois métodos** de classificação de clientes:
+
+                ---
+
+                ### 1️⃣ Método Por Valor (R$) - Thresholds Fixos
+
+                A segmentação utiliza **faixas de valor fixas (thresholds)** para classificar cada cliente
+                em um dos 4 perfis. A classificação é baseada exclusivamente no **Valor** gasto.
+
+                As métricas de Recência e Frequência são calculadas, mas **não são utilizadas como critério**.
+
+                #### Classificação Histórica (Valor Total Acumulado)
+
+                | Perfil | Faixa de Valor | Descrição |
+                |--------|----------------|-----------|
+                | **VIP** | >= R$ 5.000 | Clientes de altíssimo valor |
+                | **Premium** | R$ 2.500 a R$ 4.999 | Alto valor, potencial VIP |
+                | **Potencial** | R$ 1.000 a R$ 2.499 | Bom potencial de crescimento |
+                | **Pontual** | < R$ 1.000 | Ocasionais ou novos |
+
+                #### Classificação Por Período
+
+                | Perfil | Faixa de Valor | Descrição |
+                |--------|----------------|-----------|
+                | **VIP** | >= R$ 2.000 | Alto gasto no período |
+                | **Premium** | R$ 1.000 a R$ 1.999 | Gasto relevante |
+                | **Potencial** | R$ 500 a R$ 999 | Gasto moderado |
+                | **Pontual** | < R$ 500 | Baixo gasto |
+
+                ---
+
+                ### 2️⃣ Método Por Quintis (R+F+V) - Scores Dinâmicos
+
+                A segmentação utiliza **quintis dinâmicos** que se adaptam à distribuição dos dados.
+                Cada cliente recebe scores de **1 a 5** em cada dimensão:
+
+                - **Recência (R):** Score 5 = comprou recentemente, Score 1 = há muito tempo
+                - **Frequência (F):** Score 5 = muitas compras, Score 1 = poucas compras
+                - **Valor (V):** Score 5 = alto valor, Score 1 = baixo valor
+
+                #### Classificação por Soma de Scores (R+F+V = 3 a 15)
+
+                | Score Total | Perfil | Descrição |
+                |-------------|--------|-----------|
+                | 13 a 15 | **VIP** | Excelente em todas as dimensões |
+                | 10 a 12 | **Premium** | Bom desempenho geral |
+                | 7 a 9 | **Potencial** | Médio, espaço para crescer |
+                | 3 a 6 | **Pontual** | Baixo engajamento |
+
+                #### Escopos Disponíveis
+
+                - **Global:** Quintis calculados sobre todos os clientes (comparação justa entre shoppings)
+                - **Por Shopping:** Quintis calculados dentro de cada shopping (cada um tem seus "melhores")
+
+                ---
+
+                ### 📊 Comparativo dos Métodos
+
+                | Aspecto | Por Valor (R$) | Por Quintis (R+F+V) |
+                |---------|----------------|---------------------|
+                | Dimensões | Apenas Valor | Recência + Frequência + Valor |
+                | Critério | Thresholds fixos em R$ | Distribuição percentual |
+                | Adaptabilidade | Pode ficar defasado | Ajusta automaticamente |
+                | Distribuição | Variável | ~20% por quintil |
+
+                ### 💡 Quando usar cada método?
+
+                - **Por Valor:** Análises históricas, comparação entre períodos diferentes, consistência de critérios.
+                - **Por Quintis:** Segmentação relativa, identificação de risco de churn (R baixo), análise multidimensional.
+
+                ### Cálculo do Ticket Médio
+
+                ```
+                Ticket Médio = Valor Total do Perfil / Quantidade de Clientes do Perfil
+                ```
+                """)
@@ -0,0 +1,155 @@
+"""
+PÁGINA: SEGMENTOS
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from formatacao import exibir_tabela, valores_rotulo, rotular, TABELA_SEGMENTOS_GENERO
+
+
+def render(ctx):
+    dados = ctx.dados
+    periodo_selecionado = ctx.periodo_selecionado
+    periodos_selecionados = ctx.periodos_selecionados
+    modo_comparativo = ctx.modo_comparativo
+    plotly_chart = ctx.plotly_chart
+    figura = ctx.figura
+
+    st.markdown('<p class="main-header">🛒 Análise por Segmentos</p>', unsafe_allow_html=True)
+    if modo_comparativo:
+        st.markdown(f"**Comparando:** {' vs '.join(periodos_selecionados)}")
+    else:
+        st.markdown(f"**Período selecionado:** {periodo_selecionado}")
+
+    st.markdown("""
+    Análise detalhada dos **segmentos de consumo** por gênero e faixa etária,
+    mostrando as preferências de compra de cada grupo demográfico.
+    """)
+
+    tab1, tab2, tab3 = st.tabs(["👫 Por Gênero", "📊 Por Faixa Etária", "🔥 Matrizes Cruzadas"])
+
+    with tab1:
+        st.subheader("Top 5 Segmentos por Gênero")
+
+        # Filtrar apenas os principais gêneros
+        generos_principais = ['Feminino', 'Masculino']
+
+        for genero in generos_principais:
+            df_gen = dados['segmentos_por_genero'][dados['segmentos_por_genero']['genero'] == genero]
+
+            st.markdown(f"**{genero}**")
+
+            def grafico_top_segmentos_genero():
+                fig = px.bar(
+                    df_gen,
+                    x='valor',
+                    y='segmento',
+                    orientation='h',
+                    color='valor',
+                    color_continuous_scale='Blues' if genero == 'Masculino' else 'RdPu',
+                    text=valores_rotulo(df_gen['valor'], 'milhoes')
+                )
+                fig.update_layout(height=250, showlegend=False, yaxis={'categoryorder': 'total ascending'})
+                rotular(fig, 'milhoes', textposition='outside')
+                return fig
+
+            plotly_chart(figura('top_segmentos_genero', grafico_top_segmentos_genero, genero), use_container_width=True)
+
+        # Tabela completa
+        st.subheader("📋 Detalhes por Gênero")
+        exibir_tabela(dados['segmentos_por_genero'], TABELA_SEGMENTOS_GENERO)
+
+    with tab2:
+        st.subheader("Top Segmentos por Faixa Etária")
+
+        # Ler dados de segmentos por faixa
+        try:
+            df_seg_faixa = pd.read_csv('Resultados/top_segmentos_por_faixa.csv')
+
+            # Usar as faixas existentes no arquivo
+            ordem_faixas = ['16-24 (Gen Z)', '25-39 (Millennials)', '40-54 (Gen X)', '55-69 (Boomers)', '70+ (Silent)']
+
+            # Cores para cada faixa
+            cores_faixas = {
+                '16-24 (Gen Z)': 'Purples',
+                '25-39 (Millennials)': 'Blues',
+                '40-54 (Gen X)': 'Greens',
+                '55-69 (Boomers)': 'Oranges',
+                '70+ (Silent)': 'Reds'
+            }
+
+            for faixa in ordem_faixas:
+                df_f = df_seg_faixa[df_seg_faixa['faixa_etaria'] == faixa].head(5)
+                if len(df_f) > 0:
+                    st.markdown(f"**{faixa}**")
+
+                    def grafico_top_segmentos_faixa():
+                        fig = px.bar(
+                            df_f,
+                            x='valor',
+                            y='segmento',
+                            orientation='h',
+                            color='valor',
+                            color_continuous_scale=cores_faixas.get(faixa, 'Oranges'),
+                            text=valores_rotulo(df_f['valor'], 'milhoes')
+                        )
+                        fig.update_layout(height=200, showlegend=False, yaxis={'categoryorder': 'total ascending'})
+                        rotular(fig, 'milhoes', textposition='outside')
+                        return fig
+
+                    plotly_chart(figura('top_segmentos_faixa', grafico_top_segmentos_faixa, faixa), use_container_width=True)
+        except Exception as e:
+            st.info(f"Dados de segmentos por faixa etária não disponíveis. Erro: {e}")
+
+    with tab3:
+        st.subheader("Matrizes Cruzadas: Gênero x Faixa Etária")
+
+        st.markdown("**Quantidade de Clientes**")
+
+        def grafico_matriz_clientes():
+            df_matriz_cli = dados['matriz_clientes'].set_index('faixa_etaria')
+            fig = px.imshow(
+                df_matriz_cli,
+                color_continuous_scale='Blues',
+                aspect='auto',
+                text_auto=True
+            )
+            fig.update_layout(height=350)
+            return fig
+
+        plotly_chart(figura('matriz_clientes', grafico_matriz_clientes), use_container_width=True)
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("**Valor Total (R$)**")
+
+            def grafico_matriz_valor():
+                df_matriz_val = dados['matriz_valor'].set_index('faixa_etaria')
+                fig = px.imshow(
+                    df_matriz_val,
+                    color_continuous_scale='Greens',
+                    aspect='auto',
+                    text_auto='.2s'
+                )
+                fig.update_layout(height=300)
+                return fig
+
+            plotly_chart(figura('matriz_valor', grafico_matriz_valor), use_container_width=True)
+
+        with col2:
+            st.markdown("**Ticket Médio (R$)**")
+
+            def grafico_matriz_ticket():
+                df_matriz_tick = dados['matriz_ticket'].set_index('faixa_etaria')
+                fig = px.imshow(
+                    df_matriz_tick,
+                    color_continuous_scale='Oranges',
+                    aspect='auto',
+                    text_auto='.0f'
+                )
+                fig.update_layout(height=300)
+                return fig
+
+            plotly_chart(figura('matriz_ticket', grafico_matriz_ticket), use_container_width=True)
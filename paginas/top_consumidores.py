@@ -0,0 +1,277 @@
+"""
+PÁGINA: TOP CONSUMIDORES
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import os
+from desempenho import medir_fragmento
+from formatacao import valores_rotulo, rotular
+
+
+# Botão de download
+@st.cache_data
+def converter_para_csv_top(df):
+    return df.to_csv(index=False, encoding='utf-8-sig', sep=';', decimal=',').encode('utf-8-sig')
+
+
+@st.fragment
+@medir_fragmento("🏆 Top Consumidores › lista")
+def lista_filtrada(df_top, ctx):
+    """Filtros de shopping, perfil e segmento com a lista e os downloads"""
+    username = ctx.username
+    shoppings_permitidos_filtro = ctx.shoppings_permitidos_filtro
+    filtrar_opcoes_shopping = ctx.filtrar_opcoes_shopping
+    registrar_filtro = ctx.registrar_filtro
+    registrar_download = ctx.registrar_download
+
+    # Filtros
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        # Filtrar opções de shopping pelas permissões do usuário
+        opcoes_shopping = ["Todos"] + sorted(df_top['Shopping'].unique().tolist())
+        opcoes_shopping = filtrar_opcoes_shopping(opcoes_shopping, shoppings_permitidos_filtro)
+        shopping_filtro = st.selectbox(
+            "Filtrar por Shopping:",
+            opcoes_shopping,
+            key="top_shopping_filtro"
+        )
+    with col2:
+        perfil_filtro = st.selectbox(
+            "Filtrar por Perfil:",
+            ["Todos"] + sorted(df_top['Perfil_Cliente'].unique().tolist()),
+            key="top_perfil_filtro"
+        )
+    with col3:
+        segmento_filtro = st.selectbox(
+            "Filtrar por Segmento:",
+            ["Todos"] + sorted(df_top['Segmento_Principal'].dropna().unique().tolist()),
+            key="top_segmento_filtro"
+        )
+
+    # Aplicar filtros
+    df_filtrado = df_top.copy()
+
+    # Registrar mudanças de filtro
+    if st.session_state.get('anterior_top_shopping') != shopping_filtro:
+        if shopping_filtro != "Todos":
+            registrar_filtro(username, "Top Consumidores", "Shopping", shopping_filtro)
+        st.session_state['anterior_top_shopping'] = shopping_filtro
+
+    if st.session_state.get('anterior_top_perfil') != perfil_filtro:
+        if perfil_filtro != "Todos":
+            registrar_filtro(username, "Top Consumidores", "Perfil", perfil_filtro)
+        st.session_state['anterior_top_perfil'] = perfil_filtro
+
+    if st.session_state.get('anterior_top_segmento') != segmento_filtro:
+        if segmento_filtro != "Todos":
+            registrar_filtro(username, "Top Consumidores", "Segmento", segmento_filtro)
+        st.session_state['anterior_top_segmento'] = segmento_filtro
+
+    # Aplicar filtros nos dados
+    if shopping_filtro != "Todos":
+        df_filtrado = df_filtrado[df_filtrado['Shopping'] == shopping_filtro]
+    if perfil_filtro != "Todos":
+        df_filtrado = df_filtrado[df_filtrado['Perfil_Cliente'] == perfil_filtro]
+    if segmento_filtro != "Todos":
+        df_filtrado = df_filtrado[df_filtrado['Segmento_Principal'] == segmento_filtro]
+
+    st.markdown(f"**Exibindo {len(df_filtrado):,} clientes**")
+
+    # Colunas para exibição
+    colunas_exibir = [
+        'Ranking', 'Shopping', 'Nome', 'Logradouro', 'Numero', 'Complemento', 'Bairro',
+        'Cidade', 'Estado', 'CEP', 'Valor_Total', 'Frequencia_Compras',
+        'Perfil_Cliente', 'Segmento_Principal', 'Loja_Favorita',
+        'Data_Primeira_Compra', 'Data_Ultima_Compra'
+    ]
+
+    # Exibir tabela
+    st.dataframe(
+        df_filtrado[colunas_exibir],
+        use_container_width=True,
+        hide_index=True,
+        height=500
+    )
+
+    st.markdown("---")
+
+    # Botão de download
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if st.download_button(
+            label="⬇️ Baixar Lista Filtrada (CSV)",
+            data=converter_para_csv_top(df_filtrado),
+            file_name="top_consumidores_filtrado.csv",
+            mime="text/csv",
+            help="Download da lista com os filtros aplicados",
+            key="download_top_filtrado"
+        ):
+            registrar_download(username, "top_consumidores_filtrado.csv", len(df_filtrado), "Top Consumidores")
+
+    with col2:
+        if st.download_button(
+            label="⬇️ Baixar Lista Completa (CSV)",
+            data=converter_para_csv_top(df_top),
+            file_name="top_consumidores_completo.csv",
+            mime="text/csv",
+            help="Download da lista completa (900 clientes)",
+            key="download_top_completo"
+        ):
+            registrar_download(username, "top_consumidores_completo.csv", len(df_top), "Top Consumidores")
+
+
+def render(ctx):
+    shoppings_permitidos_filtro = ctx.shoppings_permitidos_filtro
+    plotly_chart = ctx.plotly_chart
+
+    st.markdown('<p class="main-header">🏆 Top 150 Consumidores por Shopping</p>', unsafe_allow_html=True)
+
+    st.markdown("""
+    Lista dos **150 maiores consumidores** de cada shopping, ordenados por valor total de compras.
+    Inclui dados de contato, métricas RFV e informações de comportamento de compra.
+
+    **Nota:** Colaboradores dos shoppings foram excluídos desta lista.
+    """)
+
+    # Carregar arquivo de top consumidores
+    arquivo_top = 'Resultados/top_consumidores_rfv.csv'
+
+    if os.path.exists(arquivo_top):
+        df_top = pd.read_csv(arquivo_top, sep=';', decimal=',', encoding='utf-8-sig')
+
+        # Filtrar dados pelos shoppings permitidos ao usuário
+        if shoppings_permitidos_filtro is not None:
+            # Mapear nomes de shopping para siglas
+            mapa_shopping_sigla = {
+                'Balneário Shopping': 'BS', 'Balneario Shopping': 'BS', 'Balneario': 'BS',
+                'Continente Shopping': 'CS', 'Continente': 'CS',
+                'Garten Shopping': 'GS', 'Garten': 'GS',
+                'Neumarkt Shopping': 'NK', 'Neumarkt': 'NK',
+                'Norte Shopping': 'NR', 'Norte': 'NR',
+                'Nações Shopping': 'NS', 'Nacoes Shopping': 'NS', 'Nacoes': 'NS', 'Nações': 'NS',
+            }
+            # Filtrar: manter apenas shoppings cuja sigla está nas permissões
+            df_top = df_top[df_top['Shopping'].apply(
+                lambda x: x in shoppings_permitidos_filtro or mapa_shopping_sigla.get(x, '') in shoppings_permitidos_filtro
+            )]
+
+        # Métricas gerais
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total na Lista", f"{len(df_top):,}")
+        with col2:
+            st.metric("Shoppings", f"{df_top['Shopping'].nunique()}")
+        with col3:
+            st.metric("Valor Total", f"R$ {df_top['Valor_Total'].sum()/1e6:.1f}M")
+        with col4:
+            pct_vip = len(df_top[df_top['Perfil_Cliente'] == 'VIP']) / len(df_top) * 100
+            st.metric("% VIP", f"{pct_vip:.1f}%")
+
+        st.markdown("---")
+
+        # Filtros, lista e downloads (fragmento: trocar um filtro reroda só este trecho)
+        lista_filtrada(df_top, ctx)
+
+        # Análises adicionais
+        st.markdown("---")
+        st.subheader("📊 Análises")
+
+        tab1, tab2, tab3 = st.tabs(["Por Shopping", "Por Perfil", "Por Segmento"])
+
+        with tab1:
+            col1, col2 = st.columns(2)
+            with col1:
+                # Valor por shopping
+                df_shop = df_top.groupby('Shopping').agg({
+                    'Valor_Total': 'sum',
+                    'Cliente_ID': 'count'
+                }).reset_index()
+                df_shop.columns = ['Shopping', 'Valor_Total', 'Qtd_Clientes']
+
+                fig = px.bar(
+                    df_shop.sort_values('Valor_Total', ascending=True),
+                    x='Valor_Total',
+                    y='Shopping',
+                    orientation='h',
+                    title='Valor Total por Shopping',
+                    text=valores_rotulo(df_shop.sort_values('Valor_Total', ascending=True)['Valor_Total'], 'milhoes')
+                )
+                fig.update_layout(showlegend=False, height=400)
+                rotular(fig, 'milhoes', textposition='outside')
+                plotly_chart(fig, use_container_width=True)
+
+            with col2:
+                # Top 10 geral
+                df_top10 = df_top.nlargest(10, 'Valor_Total')
+                fig = px.bar(
+                    df_top10,
+                    x='Valor_Total',
+                    y='Nome',
+                    orientation='h',
+                    color='Shopping',
+                    title='Top 10 Consumidores (Geral)',
+                    text=valores_rotulo(df_top10['Valor_Total'], 'milhares')
+                )
+                fig.update_layout(height=400, yaxis={'categoryorder': 'total ascending'})
+                rotular(fig, 'milhares', textposition='outside')
+                plotly_chart(fig, use_container_width=True)
+
+        with tab2:
+            col1, col2 = st.columns(2)
+            with col1:
+                # Distribuição por perfil
+                df_perfil = df_top['Perfil_Cliente'].value_counts().reset_index()
+                df_perfil.columns = ['Perfil', 'Quantidade']
+                fig = px.pie(
+                    df_perfil,
+                    values='Quantidade',
+                    names='Perfil',
+                    title='Distribuição por Perfil RFV',
+                    color='Perfil',
+                    color_discrete_map={'VIP': '#FFD700', 'Premium': '#C0C0C0', 'Potencial': '#CD7F32', 'Pontual': '#808080'}
+                )
+                plotly_chart(fig, use_container_width=True)
+
+            with col2:
+                # Valor médio por perfil
+                df_perfil_valor = df_top.groupby('Perfil_Cliente')['Valor_Total'].mean().reset_index()
+                df_perfil_valor.columns = ['Perfil', 'Valor_Medio']
+                fig = px.bar(
+                    df_perfil_valor.sort_values('Valor_Medio', ascending=True),
+                    x='Valor_Medio',
+                    y='Perfil',
+                    orientation='h',
+                    title='Valor Médio por Perfil',
+                    text=valores_rotulo(df_perfil_valor.sort_values('Valor_Medio', ascending=True)['Valor_Medio'], 'milhares')
+                )
+                fig.update_layout(showlegend=False, height=400)
+                rotular(fig, 'milhares', textposition='outside')
+                plotly_chart(fig, use_container_width=True)
+
+        with tab3:
+            # Top segmentos
+            df_seg = df_top.groupby('Segmento_Principal').agg({
+                'Valor_Total': 'sum',
+                'Cliente_ID': 'count'
+            }).reset_index()
+            df_seg.columns = ['Segmento', 'Valor_Total', 'Qtd_Clientes']
+            df_seg = df_seg.nlargest(10, 'Valor_Total')
+
+            fig = px.bar(
+                df_seg.sort_values('Valor_Total', ascending=True),
+                x='Valor_Total',
+                y='Segmento',
+                orientation='h',
+                title='Top 10 Segmentos (por Valor)',
+                text=valores_rotulo(df_seg.sort_values('Valor_Total', ascending=True)['Valor_Total'], 'milhoes')
+            )
+            fig.update_layout(showlegend=False, height=450)
+            rotular(fig, 'milhoes', textposition='outside')
+            plotly_chart(fig, use_container_width=True)
+
+    else:
+        st.error(f"Arquivo de top consumidores não encontrado: {arquivo_top}")
+        st.info("Execute o script `gerar_top_consumidores_rfv.py` para gerar a lista.")
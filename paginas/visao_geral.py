@@ -0,0 +1,255 @@
+"""
+PÁGINA: VISÃO GERAL
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from formatacao import exibir_tabela, valores_rotulo, rotular, TABELA_COMPARATIVO_PERIODOS, TABELA_RESUMO_SHOPPING
+
+
+def render(ctx):
+    dados = ctx.dados
+    dados_periodos = ctx.dados_periodos
+    periodo_selecionado = ctx.periodo_selecionado
+    periodos_selecionados = ctx.periodos_selecionados
+    modo_comparativo = ctx.modo_comparativo
+    CORES_SHOPPING = ctx.CORES_SHOPPING
+    CORES_PERIODOS = ctx.CORES_PERIODOS
+    plotly_chart = ctx.plotly_chart
+    figura = ctx.figura
+
+    st.markdown('<p class="main-header">📊 Visão Geral - Perfil de Cliente</p>', unsafe_allow_html=True)
+
+    if modo_comparativo:
+        # === MODO COMPARATIVO ===
+        st.markdown(f"**Comparando:** {' vs '.join(periodos_selecionados)}")
+
+        # Preparar dados para comparação
+        df_comparativo = []
+        for nome_p in periodos_selecionados:
+            d = dados_periodos[nome_p]
+            df_comparativo.append({
+                'Período': nome_p,
+                'Clientes': d['clientes_unicos'],
+                'Valor Total': d['resumo']['valor_total'].sum(),
+                'Ticket Médio': d['resumo']['valor_total'].sum() / d['clientes_unicos'],
+                'High Spenders': d['resumo']['qtd_high_spenders'].sum()
+            })
+        df_comp = pd.DataFrame(df_comparativo)
+
+        # Métricas comparativas
+        st.subheader("📊 Comparativo de Métricas")
+        cols = st.columns(len(periodos_selecionados))
+        for i, nome_p in enumerate(periodos_selecionados):
+            with cols[i]:
+                d = dados_periodos[nome_p]
+                st.markdown(f"**{nome_p}**")
+                st.metric("Clientes Únicos", f"{d['clientes_unicos']:,}")
+                st.metric("Valor Total", f"R$ {d['resumo']['valor_total'].sum()/1e6:.1f}M")
+                ticket = d['resumo']['valor_total'].sum() / d['clientes_unicos']
+                st.metric("Ticket Médio", f"R$ {ticket:,.0f}")
+                st.metric("High Spenders", f"{d['resumo']['qtd_high_spenders'].sum():,}")
+
+        st.markdown("---")
+
+        # Gráficos comparativos
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("💰 Valor Total por Período")
+
+            def grafico_valor_por_periodo():
+                fig = px.bar(
+                    df_comp,
+                    x='Período',
+                    y='Valor Total',
+                    color='Período',
+                    color_discrete_sequence=CORES_PERIODOS[:len(periodos_selecionados)],
+                    text=valores_rotulo(df_comp['Valor Total'], 'milhoes')
+                )
+                fig.update_layout(showlegend=False, height=400)
+                rotular(fig, 'milhoes', textposition='outside')
+                return fig
+
+            plotly_chart(figura('valor_por_periodo', grafico_valor_por_periodo, todos_periodos=True), use_container_width=True)
+
+        with col2:
+            st.subheader("👥 Clientes Únicos por Período")
+
+            def grafico_clientes_por_periodo():
+                fig = px.bar(
+                    df_comp,
+                    x='Período',
+                    y='Clientes',
+                    color='Período',
+                    color_discrete_sequence=CORES_PERIODOS[:len(periodos_selecionados)],
+                    text=valores_rotulo(df_comp['Clientes'], 'contagem')
+                )
+                fig.update_layout(showlegend=False, height=400)
+                rotular(fig, 'contagem', textposition='outside')
+                return fig
+
+            plotly_chart(figura('clientes_por_periodo', grafico_clientes_por_periodo, todos_periodos=True), use_container_width=True)
+
+        st.markdown("---")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("🎫 Ticket Médio por Período")
+
+            def grafico_ticket_por_periodo():
+                fig = px.bar(
+                    df_comp,
+                    x='Período',
+                    y='Ticket Médio',
+                    color='Período',
+                    color_discrete_sequence=CORES_PERIODOS[:len(periodos_selecionados)],
+                    text=valores_rotulo(df_comp['Ticket Médio'], 'moeda_inteira')
+                )
+                fig.update_layout(showlegend=False, height=400)
+                rotular(fig, 'moeda_inteira', textposition='outside')
+                return fig
+
+            plotly_chart(figura('ticket_por_periodo', grafico_ticket_por_periodo, todos_periodos=True), use_container_width=True)
+
+        with col2:
+            st.subheader("⭐ High Spenders por Período")
+
+            def grafico_hs_por_periodo():
+                fig = px.bar(
+                    df_comp,
+                    x='Período',
+                    y='High Spenders',
+                    color='Período',
+                    color_discrete_sequence=CORES_PERIODOS[:len(periodos_selecionados)],
+                    text=valores_rotulo(df_comp['High Spenders'], 'contagem')
+                )
+                fig.update_layout(showlegend=False, height=400)
+                rotular(fig, 'contagem', textposition='outside')
+                return fig
+
+            plotly_chart(figura('hs_por_periodo', grafico_hs_por_periodo, todos_periodos=True), use_container_width=True)
+
+        st.markdown("---")
+
+        # Comparativo por Shopping
+        st.subheader("🏬 Valor por Shopping - Comparativo entre Períodos")
+
+        def grafico_valor_shopping_por_periodo():
+            df_shop = pd.concat([
+                pd.DataFrame({
+                    'Período': nome_p,
+                    'Shopping': dados_periodos[nome_p]['resumo']['sigla'].astype(str),
+                    'Valor': dados_periodos[nome_p]['resumo']['valor_total']
+                })
+                for nome_p in periodos_selecionados
+            ], ignore_index=True)
+
+            fig = px.bar(
+                df_shop,
+                x='Shopping',
+                y='Valor',
+                color='Período',
+                barmode='group',
+                color_discrete_sequence=CORES_PERIODOS[:len(periodos_selecionados)],
+                text=valores_rotulo(df_shop['Valor'], 'milhoes')
+            )
+            fig.update_layout(height=450)
+            rotular(fig, 'milhoes', textposition='outside')
+            return fig
+
+        plotly_chart(figura('valor_shopping_por_periodo', grafico_valor_shopping_por_periodo, todos_periodos=True), use_container_width=True)
+
+        # Tabela resumo
+        st.subheader("📋 Tabela Comparativa")
+        exibir_tabela(df_comp, TABELA_COMPARATIVO_PERIODOS)
+
+    else:
+        # === MODO NORMAL (1 período) ===
+        st.markdown(f"**Período selecionado:** {periodo_selecionado}")
+
+        # Métricas principais
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric(
+                "Clientes Únicos",
+                f"{dados['clientes_unicos']:,}",
+                delta=f"Por shopping: {dados['clientes_por_shopping']:,}",
+                help="Clientes únicos: cada pessoa contada uma vez. Por shopping: soma dos clientes de cada shopping (inclui quem compra em múltiplos shoppings)"
+            )
+
+        with col2:
+            st.metric(
+                "Valor Total",
+                f"R$ {dados['resumo']['valor_total'].sum()/1e6:.1f}M",
+                delta=f"Ticket: R$ {dados['resumo']['valor_total'].sum()/dados['clientes_unicos']:,.0f}"
+            )
+
+        with col3:
+            hs_unicos_visao = int(dados['comparacao_hs'].loc[dados['comparacao_hs']['Metrica'] == 'Qtd Clientes', 'High Spenders'].values[0])
+            hs_por_shopping_visao = int(dados['resumo']['qtd_high_spenders'].sum())
+            st.metric(
+                "High Spenders",
+                f"{hs_unicos_visao:,}",
+                delta=f"Por shopping: {hs_por_shopping_visao:,}",
+                help="HS únicos: cada cliente contado uma vez. Por shopping: soma inclui quem é HS em múltiplos shoppings"
+            )
+
+        with col4:
+            ticket_medio_geral = dados['resumo']['valor_total'].sum() / dados['clientes_unicos']
+            st.metric(
+                "Ticket Médio",
+                f"R$ {ticket_medio_geral:,.0f}",
+                delta="valor total / clientes únicos"
+            )
+
+        st.markdown("---")
+
+        # Gráficos lado a lado
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("💰 Valor Total por Shopping")
+
+            def grafico_valor_por_shopping():
+                df_resumo_valor = dados['derivados']['resumo_por_valor']
+                fig = px.bar(
+                    df_resumo_valor,
+                    x='valor_total',
+                    y='sigla',
+                    orientation='h',
+                    color='sigla',
+                    color_discrete_map=CORES_SHOPPING,
+                    text=valores_rotulo(df_resumo_valor['valor_total'], 'milhoes')
+                )
+                fig.update_layout(showlegend=False, height=400)
+                rotular(fig, 'milhoes', textposition='outside')
+                return fig
+
+            plotly_chart(figura('valor_por_shopping', grafico_valor_por_shopping), use_container_width=True)
+
+        with col2:
+            st.subheader("👥 Clientes por Shopping")
+
+            def grafico_clientes_por_shopping():
+                fig = px.pie(
+                    dados['resumo'],
+                    values='clientes',
+                    names='sigla',
+                    color='sigla',
+                    color_discrete_map=CORES_SHOPPING,
+                    hole=0.4
+                )
+                fig.update_layout(height=400)
+                return fig
+
+            plotly_chart(figura('clientes_por_shopping', grafico_clientes_por_shopping), use_container_width=True)
+            st.caption("⚠️ Soma inclui clientes que frequentam múltiplos shoppings")
+
+        # Tabela resumo
+        st.subheader("📋 Resumo por Shopping")
+        exibir_tabela(dados['resumo'], TABELA_RESUMO_SHOPPING)
+        st.caption("*Clientes por shopping: um cliente que compra em 2 shoppings é contado em ambos. Clientes únicos: {:,}".format(dados['clientes_unicos']))
@@ -0,0 +1,151 @@
+"""
+RFV POR INTERVALO DE MESES
+Recalcula as tabelas RFV de um intervalo arbitrário de meses (ex.: Mar-Ago/2025)
+a partir das linhas por cliente (rfv_quintis_global.csv) dos meses que o compõem,
+sem rodar o pipeline offline.
+
+Composição por cliente no intervalo:
+- valor_periodo e frequencia: soma dos meses
+- recencia_dias: menor recência, levada para o fim do intervalo
+  (recência do mês + dias entre o fim daquele mês e o fim do intervalo)
+- shopping_principal, genero, segmento_principal: do mês de maior valor do cliente
+
+A classificação histórica (valor acumulado de toda a base) não é reproduzível a
+partir dos meses e não é gerada.
+
+Os meses são abertos por `abrir` (pasta relativa a `raiz`, ex.: 'Por_Mes/2025_01');
+o dashboard passa o cache de períodos (cache_periodos().obter), então os meses
+usam os bundles e entram no orçamento de memória. Sem `abrir`, lê do disco.
+"""
+
+import pandas as pd
+
+from dados_periodo import carregar_periodo
+import rfv_scores
+
+PERFIS = ['VIP', 'Premium', 'Potencial', 'Pontual']
+
+COLUNAS_CLIENTE = ['cliente_id', 'valor_periodo', 'frequencia', 'recencia_dias',
+                   'shopping_principal', 'genero', 'segmento_principal']
+
+
+def fim_do_mes(mes):
+    """Data de referência de um mês AAAA_MM (último dia)"""
+    return pd.Period(mes.replace('_', '-'), freq='M').end_time.normalize()
+
+
+def _abridor(raiz, abrir):
+    """Função que abre um período pela pasta relativa a `raiz`"""
+    return abrir if abrir is not None else (lambda pasta: carregar_periodo(f'{raiz}/{pasta}'))
+
+
+def meses_sem_clientes(meses, raiz='Resultados', abrir=None):
+    """Meses do intervalo sem o arquivo de clientes RFV"""
+    abrir = _abridor(raiz, abrir)
+    return [m for m in meses if not _tem_clientes(abrir, m)]
+
+
+def _tem_clientes(abrir, mes):
+    quintis = abrir(f'Por_Mes/{mes}').get('rfv_quintis')
+    return quintis is not None and 'clientes_global' in quintis
+
+
+def clientes_intervalo(meses, raiz='Resultados', abrir=None):
+    """Uma linha por cliente com valor, frequência e recência compostos no intervalo"""
+    abrir = _abridor(raiz, abrir)
+    referencia = fim_do_mes(max(meses))
+    partes = []
+    for mes in meses:
+        df = abrir(f'Por_Mes/{mes}')['rfv_quintis']['clientes_global']
+        df = df[COLUNAS_CLIENTE].astype({c: str for c in ['shopping_principal', 'genero', 'segmento_principal']})
+        df['recencia_dias'] = df['recencia_dias'] + (referencia - fim_do_mes(mes)).days
+        partes.append(df)
+    linhas = pd.concat(partes, ignore_index=True)
+
+    # Atributos do mês de maior valor do cliente (última linha após ordenar por valor)
+    linhas = linhas.sort_values(['cliente_id', 'valor_periodo'], kind='stable')
+    grupos = linhas.groupby('cliente_id', sort=True)
+    clientes = grupos[['shopping_principal', 'genero', 'segmento_principal']].last()
+    clientes['valor_periodo'] = grupos['valor_periodo'].sum()
+    clientes['frequencia'] = grupos['frequencia'].sum()
+    clientes['recencia_dias'] = grupos['recencia_dias'].min()
+    return clientes.reset_index()[COLUNAS_CLIENTE]
+
+
+def pontuar_quintis(clientes, por=None):
+    """Scores R/F/V, score_total e perfil_quintis (global ou dentro de cada grupo `por`)
+
+    Retorna (clientes pontuados, thresholds no formato quintile_thresholds_*.csv).
+    """
+    return rfv_scores.pontuar(clientes, por), rfv_scores.thresholds(clientes, por)
+
+
+def metricas_perfil(clientes, coluna_perfil, com_scores=False):
+    """Tabela por perfil (formato metricas_perfil_periodo / metricas_perfil_quintis_*)"""
+    agregacoes = {
+        'qtd_clientes': ('cliente_id', 'count'),
+        'valor_total': ('valor_periodo', 'sum'),
+        'frequencia_media': ('frequencia', 'mean'),
+    }
+    if com_scores:
+        agregacoes.update({
+            'R_score_medio': ('R_score', 'mean'),
+            'F_score_medio': ('F_score', 'mean'),
+            'V_score_medio': ('V_score', 'mean'),
+            'score_total_medio': ('score_total', 'mean'),
+        })
+    df = clientes.groupby(coluna_perfil).agg(**agregacoes).reindex(PERFIS).dropna(subset=['qtd_clientes'])
+    df['ticket_medio'] = df['valor_total'] / df['qtd_clientes']
+    df['pct_clientes'] = (df['qtd_clientes'] / df['qtd_clientes'].sum() * 100).round(2)
+    df['pct_valor'] = (df['valor_total'] / df['valor_total'].sum() * 100).round(2)
+    df['qtd_clientes'] = df['qtd_clientes'].astype(int)
+    df = df.rename_axis('perfil_cliente').reset_index()
+    if not com_scores:
+        colunas = ['perfil_cliente', 'qtd_clientes', 'valor_total', 'ticket_medio', 'frequencia_media', 'pct_clientes', 'pct_valor']
+        df = df[colunas]
+    return df
+
+
+def metricas_shopping(clientes, coluna_perfil, sufixo, com_scores=False):
+    """Tabela por shopping (formato metricas_shopping_rfv / metricas_shopping_quintis_*)"""
+    grupos = clientes.groupby('shopping_principal')
+    df = pd.DataFrame({
+        'qtd_clientes': grupos['cliente_id'].count(),
+        'valor_total': grupos['valor_periodo'].sum(),
+    })
+    if com_scores:
+        for col in ['R_score', 'F_score', 'V_score', 'score_total']:
+            df[f'{col}_medio'] = grupos[col].mean()
+    df['ticket_medio'] = df['valor_total'] / df['qtd_clientes']
+
+    por_perfil = clientes.groupby(['shopping_principal', coluna_perfil])['valor_periodo'].agg(['count', 'sum'])
+    for perfil in PERFIS:
+        p = perfil.lower()
+        dados_perfil = por_perfil.xs(perfil, level=1) if perfil in por_perfil.index.get_level_values(1) else None
+        qtd = dados_perfil['count'] if dados_perfil is not None else pd.Series(dtype=float)
+        valor = dados_perfil['sum'] if dados_perfil is not None else pd.Series(dtype=float)
+        df[f'{p}{sufixo}'] = qtd.reindex(df.index).fillna(0).astype(int)
+        df[f'{p}_valor{sufixo}'] = valor.reindex(df.index).fillna(0)
+        df[f'{p}_ticket{sufixo}'] = df[f'{p}_valor{sufixo}'] / df[f'{p}{sufixo}'].where(df[f'{p}{sufixo}'] > 0)
+    df['pct_valor'] = (df['valor_total'] / df['valor_total'].sum() * 100).round(2)
+    return df.sort_values('valor_total', ascending=False).reset_index()
+
+
+def rfv_intervalo(meses, raiz='Resultados', abrir=None):
+    """Tabelas RFV de um intervalo de meses no mesmo formato de dados['rfv'] / dados['rfv_quintis']"""
+    clientes = clientes_intervalo(meses, raiz, abrir)
+    clientes['perfil_periodo'] = rfv_scores.perfil_por_valor(clientes['valor_periodo'])
+
+    rfv = {
+        'perfil_periodo': metricas_perfil(clientes, 'perfil_periodo'),
+        'shopping': metricas_shopping(clientes, 'perfil_periodo', '_periodo'),
+    }
+
+    quintis = {}
+    for escopo, por in [('global', None), ('shopping', 'shopping_principal')]:
+        pontuados, thresholds = pontuar_quintis(clientes.drop(columns='perfil_periodo'), por=por)
+        quintis[f'clientes_{escopo}'] = pontuados
+        quintis[f'perfil_{escopo}'] = metricas_perfil(pontuados, 'perfil_quintis', com_scores=True)
+        quintis[f'shopping_{escopo}'] = metricas_shopping(pontuados, 'perfil_quintis', '_quintis', com_scores=True)
+        quintis[f'thresholds_{escopo}'] = thresholds
+    return rfv, quintis
@@ -0,0 +1,209 @@
+"""
+MOTOR DE SCORES RFV (QUINTIS)
+Recalcula, de forma vetorizada (NumPy), os thresholds de quintis e os scores
+R/F/V / perfil_quintis de qualquer subconjunto de clientes: um gênero, um grupo
+de shoppings, um intervalo de meses...
+
+Regras (as mesmas do pipeline que gera rfv_quintis_*.csv):
+- Score de 1 a 5 pelo quintil do ranking do cliente; empates desfeitos pela
+  ordem das linhas (equivalente a qcut(rank(method='first'), 5))
+- Recência é invertida: menor recência -> score 5
+- Thresholds: quantis 20/40/60/80% com interpolação linear
+- Perfil pelo score total (R+F+V): 13-15 VIP, 10-12 Premium, 7-9 Potencial, 3-6 Pontual
+
+Benchmark de consistência contra os CSVs publicados:
+    python rfv_scores.py [--raiz Resultados] [--linhas 250000]
+"""
+
+import os
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from dados_periodo import carregar_periodo
+
+QUANTIS = np.array([0.2, 0.4, 0.6, 0.8])
+PERFIS_SCORE = [(13, 'VIP'), (10, 'Premium'), (7, 'Potencial')]
+PERFIS_VALOR_PERIODO = [(2000, 'VIP'), (1000, 'Premium'), (500, 'Potencial')]  # R$ no período
+PERFIL_BASE = 'Pontual'
+
+# Coluna de entrada -> (coluna de score, inverter)
+DIMENSOES_RFV = {
+    'recencia_dias': ('R_score', True),
+    'frequencia': ('F_score', False),
+    'valor_periodo': ('V_score', False),
+}
+
+
+def _grupos(n, grupos):
+    """Códigos inteiros dos grupos (0 para todos quando não há agrupamento)"""
+    if grupos is None:
+        return np.zeros(n, dtype=np.int64), 1
+    codigos, uniques = pd.factorize(np.asarray(grupos), sort=False)
+    return codigos.astype(np.int64), len(uniques)
+
+
+def scores_quintil(valores, grupos=None, inverter=False):
+    """Scores 1-5 por quintil de ranking dentro de cada grupo
+
+    valores: array 1D; grupos: array de rótulos (mesmo tamanho) ou None.
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    n = len(valores)
+    codigos, qtd_grupos = _grupos(n, grupos)
+
+    # Ordena por (grupo, valor) mantendo a ordem das linhas nos empates
+    ordem = np.lexsort((np.arange(n), valores, codigos))
+    tamanhos = np.bincount(codigos, minlength=qtd_grupos)
+    inicios = np.concatenate(([0], np.cumsum(tamanhos)[:-1]))
+
+    # rank(method='first') dentro do grupo: 1..n_g
+    rank = np.empty(n, dtype=np.float64)
+    rank[ordem] = np.arange(n) - inicios[codigos[ordem]] + 1
+
+    # qcut em 5 partes iguais sobre 1..n_g: bordas internas 1 + k*(n_g-1)/5
+    n_g = tamanhos[codigos].astype(np.float64)
+    score = np.ones(n, dtype=np.int64)
+    for k in range(1, 5):
+        score += rank > 1 + k * (n_g - 1) / 5
+    return 6 - score if inverter else score
+
+
+def limites_quintis(valores, grupos=None):
+    """Thresholds 20/40/60/80% (interpolação linear) por grupo
+
+    Retorna (rótulos dos grupos, matriz grupos x 4).
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    codigos, qtd_grupos = _grupos(len(valores), grupos)
+    rotulos = ['Global'] if grupos is None else list(pd.unique(np.asarray(grupos)))
+
+    ordem = np.lexsort((valores, codigos))
+    ordenados = valores[ordem]
+    tamanhos = np.bincount(codigos, minlength=qtd_grupos)
+    inicios = np.concatenate(([0], np.cumsum(tamanhos)[:-1]))
+
+    # Posição fracionária de cada quantil em cada grupo (método linear do NumPy)
+    pos = (tamanhos[:, None] - 1) * QUANTIS[None, :]
+    baixo = np.floor(pos).astype(np.int64)
+    alto = np.minimum(baixo + 1, np.maximum(tamanhos[:, None] - 1, 0))
+    frac = pos - baixo
+    v_baixo = ordenados[inicios[:, None] + baixo]
+    v_alto = ordenados[inicios[:, None] + alto]
+    return rotulos, v_baixo + (v_alto - v_baixo) * frac
+
+
+def _perfil_por_limites(valores, limites):
+    valores = np.asarray(valores)
+    condicoes = [valores >= minimo for minimo, _ in limites]
+    return np.select(condicoes, [perfil for _, perfil in limites], default=PERFIL_BASE)
+
+
+def perfil_por_score(score_total):
+    """perfil_quintis a partir do score total"""
+    return _perfil_por_limites(score_total, PERFIS_SCORE)
+
+
+def perfil_por_valor(valor_periodo):
+    """Perfil pelo valor gasto no período (classificação 'Por Período')"""
+    return _perfil_por_limites(valor_periodo, PERFIS_VALOR_PERIODO)
+
+
+def pontuar(clientes, por=None):
+    """Scores R/F/V, score_total e perfil_quintis para um DataFrame de clientes
+
+    clientes: colunas recencia_dias, frequencia, valor_periodo (ordem das linhas
+    define o desempate). por: coluna de agrupamento (ex.: 'shopping_principal')
+    ou None para quintis globais.
+    """
+    grupos = clientes[por].to_numpy() if por is not None else None
+    resultado = clientes.copy()
+    for coluna, (coluna_score, inverter) in DIMENSOES_RFV.items():
+        resultado[coluna_score] = scores_quintil(clientes[coluna].to_numpy(), grupos, inverter)
+    resultado['score_total'] = resultado['R_score'] + resultado['F_score'] + resultado['V_score']
+    resultado['perfil_quintis'] = perfil_por_score(resultado['score_total'].to_numpy())
+    return resultado
+
+
+def thresholds(clientes, por=None):
+    """Thresholds no formato de quintile_thresholds_*.csv"""
+    grupos = clientes[por].to_numpy() if por is not None else None
+    colunas = {}
+    for coluna in DIMENSOES_RFV:
+        rotulos, limites = limites_quintis(clientes[coluna].to_numpy(), grupos)
+        colunas[coluna] = limites.ravel()
+    return pd.DataFrame({
+        'quantil': [f'{int(q * 100)}%' for q in QUANTIS] * len(rotulos),
+        **colunas,
+        'escopo': np.repeat(rotulos, len(QUANTIS)),
+    })
+
+
+# =============================================================================
+# BENCHMARK DE CONSISTÊNCIA
+# =============================================================================
+
+def comparar_com_publicado(clientes, limites_publicados, por=None):
+    """Fração de scores iguais e maior diferença de threshold contra um arquivo publicado"""
+    t0 = time.perf_counter()
+    pontuados = pontuar(clientes, por)
+    limites = thresholds(clientes, por)
+    duracao = time.perf_counter() - t0
+
+    iguais = {c: float((pontuados[c].to_numpy() == clientes[c].to_numpy()).mean())
+              for c in ['R_score', 'F_score', 'V_score', 'perfil_quintis']}
+    publicados = limites_publicados.set_index(['escopo', 'quantil'])
+    calculados = limites.set_index(['escopo', 'quantil']).reindex(publicados.index)
+    dif_limites = float(np.max(np.abs(calculados[list(DIMENSOES_RFV)].to_numpy() - publicados[list(DIMENSOES_RFV)].to_numpy())))
+    return {'linhas': len(clientes), 'segundos': duracao, **iguais, 'dif_threshold': dif_limites}
+
+
+def benchmark(raiz='Resultados', linhas=None):
+    """Confere o motor contra todos os períodos com rfv_quintis e mede o tempo"""
+    indice = pd.read_csv(f'{raiz}/indice_periodos.csv')
+    resultados = []
+    for pasta in indice['pasta']:
+        if not os.path.exists(f'{raiz}/{pasta}'):
+            continue
+        quintis = carregar_periodo(f'{raiz}/{pasta}').get('rfv_quintis')
+        if not quintis:
+            continue
+        for escopo, por in [('global', None), ('shopping', 'shopping_principal')]:
+            if f'clientes_{escopo}' not in quintis or f'thresholds_{escopo}' not in quintis:
+                continue
+            clientes = quintis[f'clientes_{escopo}']
+            clientes = clientes.astype({c: str for c in ['shopping_principal', 'perfil_quintis']})
+            r = comparar_com_publicado(clientes, quintis[f'thresholds_{escopo}'], por)
+            resultados.append({'pasta': pasta, 'escopo': escopo, **r})
+
+    df = pd.DataFrame(resultados)
+
+    # Tempo em escala: replica os clientes do maior arquivo até `linhas`
+    if linhas and len(df):
+        maior = df.loc[df['linhas'].idxmax(), 'pasta']
+        base = carregar_periodo(f'{raiz}/{maior}')['rfv_quintis']['clientes_global']
+        reps = int(np.ceil(linhas / len(base)))
+        grande = pd.concat([base] * reps, ignore_index=True).iloc[:linhas]
+        t0 = time.perf_counter()
+        pontuar(grande)
+        pontuar(grande, 'shopping_principal')
+        df.attrs['escala'] = (linhas, time.perf_counter() - t0)
+    return df
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark de consistência do motor de scores RFV')
+    parser.add_argument('--raiz', default='Resultados', help='Pasta raiz dos resultados')
+    parser.add_argument('--linhas', type=int, default=250000, help='Linhas do teste de escala (0 desativa)')
+    args = parser.parse_args()
+
+    df = benchmark(args.raiz, args.linhas)
+    pd.set_option('display.width', 200)
+    print(df.to_string(index=False, float_format=lambda x: f'{x:.4f}'))
+    print(f'\nMenor concordância de scores: {df[["R_score", "F_score", "V_score"]].min().min():.4%}')
+    print(f'Maior diferença de threshold: {df["dif_threshold"].max():.6f}')
+    if 'escala' in df.attrs:
+        linhas, segundos = df.attrs['escala']
+        print(f'Escala: {linhas:,} clientes pontuados (global + por shopping) em {segundos:.3f}s')
@@ -0,0 +1,233 @@
+"""
+ROLLUP DE PERÍODOS
+Compõe trimestres, anos e intervalos arbitrários de meses somando as tabelas
+mensais de Resultados/Por_Mes, sem ler Por_Trimestre / Por_Ano.
+
+Só as métricas aditivas (valor, transações) são compostas. Métricas que dependem
+de clientes únicos no período (clientes, ticket médio, idade média, thresholds,
+high spenders, personas, quintis RFV, rankings top N) NÃO são a soma dos meses:
+elas ficam marcadas como "requer a fonte" e continuam vindo da pasta do período.
+
+A composição é incremental: cada trimestre completo é composto uma vez e
+reaproveitado nos anos e intervalos que o contêm. O cache de composições inclui a
+assinatura (mtime, tamanho) do CSV de cada mês: um mês regravado é composto de novo.
+
+Uso offline (confere os rollups contra as pastas materializadas):
+    python rollup.py [--raiz Resultados]
+"""
+
+import os
+import argparse
+from functools import lru_cache
+
+import pandas as pd
+
+from dados_periodo import carregar_periodo, siglas_periodo, TABELAS_PERIODO, TABELAS_SHOPPING
+from cubo_mensal import meses_disponiveis, assinatura_mes
+
+# Especificação de aditividade: dimensões da linha, colunas somáveis entre meses e
+# colunas das tabelas mensais que não são somáveis (descartadas, vêm da pasta do período).
+# 'somaveis': None indica que todas as colunas fora das dimensões são somáveis.
+_DEMOGRAFICAS_NAO_ADITIVAS = ['qtd_clientes', 'pct_clientes']
+ESPEC_ROLLUP = {
+    'resumo': {
+        'dimensoes': ['shopping', 'sigla'], 'somaveis': ['transacoes', 'valor_total'],
+        'requer_fonte': ['clientes', 'ticket_medio', 'idade_media', 'threshold_hs', 'qtd_high_spenders'],
+    },
+    'genero': {'dimensoes': ['sigla', 'genero'], 'somaveis': ['valor_total'], 'requer_fonte': _DEMOGRAFICAS_NAO_ADITIVAS},
+    'faixa': {'dimensoes': ['sigla', 'faixa_etaria'], 'somaveis': ['valor_total'], 'requer_fonte': _DEMOGRAFICAS_NAO_ADITIVAS},
+    'matriz_valor': {'dimensoes': ['faixa_etaria'], 'somaveis': None, 'requer_fonte': []},
+    'comportamento_periodo': {'dimensoes': ['faixa_etaria', 'periodo_dia'], 'somaveis': ['valor', 'transacoes'], 'requer_fonte': []},
+    'comportamento_dia': {'dimensoes': ['faixa_etaria', 'dia_semana'], 'somaveis': ['valor', 'transacoes'], 'requer_fonte': []},
+    'por_shopping/genero': {'dimensoes': ['genero'], 'somaveis': ['valor_total'], 'requer_fonte': _DEMOGRAFICAS_NAO_ADITIVAS},
+    'por_shopping/faixa': {'dimensoes': ['faixa_etaria'], 'somaveis': ['valor_total'], 'requer_fonte': _DEMOGRAFICAS_NAO_ADITIVAS},
+    'por_shopping/periodo': {'dimensoes': ['periodo_dia'], 'somaveis': ['valor', 'transacoes'], 'requer_fonte': []},
+    'por_shopping/dia_semana': {'dimensoes': ['dia_semana'], 'somaveis': ['valor', 'transacoes'], 'requer_fonte': []},
+}
+
+# Tabelas inteiras que dependem de clientes únicos, classificações ou top N do período
+REQUER_FONTE = [
+    'personas', 'comparacao_hs', 'hs_por_genero', 'hs_por_faixa', 'segmentos',
+    'matriz_clientes', 'matriz_ticket', 'segmentos_por_genero', 'segmentos_por_faixa',
+    'por_shopping/segmentos', 'por_shopping/lojas', 'por_shopping/hs_stats',
+    'rfv', 'rfv_quintis',
+]
+
+MESES_TRIMESTRE = {1: ['01', '02', '03'], 2: ['04', '05', '06'], 3: ['07', '08', '09'], 4: ['10', '11', '12']}
+
+
+def _tipo_tabela(chave):
+    """'por_shopping/BS/genero' -> 'por_shopping/genero'; tabelas da raiz ficam iguais"""
+    partes = chave.split('/')
+    if partes[0] == 'por_shopping' and len(partes) == 3:
+        return f'por_shopping/{partes[2]}'
+    return partes[0]
+
+
+def requer_fonte(chave):
+    """Indica se a tabela inteira precisa ser lida da pasta do período"""
+    return _tipo_tabela(chave) in REQUER_FONTE or _tipo_tabela(chave) not in ESPEC_ROLLUP
+
+
+def _arquivo_tabela(chave):
+    """CSV da tabela relativo à pasta do mês ('por_shopping/BS/genero' -> 'Por_Shopping/BS/perfil_genero.csv')"""
+    partes = chave.split('/')
+    if partes[0] == 'por_shopping':
+        return f'Por_Shopping/{partes[1]}/{TABELAS_SHOPPING[partes[2]]}'
+    return TABELAS_PERIODO[chave]
+
+
+def meses_da_pasta(pasta, raiz='Resultados'):
+    """Meses (AAAA_MM) cobertos por uma pasta de período
+
+    Retorna (meses disponíveis em Por_Mes, meses do período ausentes em Por_Mes).
+    Com meses ausentes o rollup não reproduz a pasta do período (ex.: 2023_Q4
+    começa em outubro, mas Por_Mes começa em novembro).
+    """
+    disponiveis = meses_disponiveis(raiz)
+    tipo, _, codigo = pasta.partition('/')
+    if tipo == 'Completo':
+        return disponiveis, []
+    if tipo == 'Por_Mes':
+        meses = [codigo]
+    elif tipo == 'Por_Trimestre':
+        ano, trimestre = codigo.split('_Q')
+        meses = [f'{ano}_{m}' for m in MESES_TRIMESTRE[int(trimestre)]]
+    elif tipo == 'Por_Ano':
+        meses = [f'{codigo}_{m:02d}' for m in range(1, 13)]
+    else:
+        raise ValueError(f'Pasta de período desconhecida: {pasta}')
+    # Período corrente: só até o último mês disponível
+    meses = [m for m in meses if not disponiveis or m <= disponiveis[-1]]
+    return [m for m in meses if m in disponiveis], [m for m in meses if m not in disponiveis]
+
+
+def _ler_mes(raiz, mes, chave):
+    """Tabela de um mês pelo caminho do manifesto (ex.: 'por_shopping/BS/genero')"""
+    dados = carregar_periodo(f'{raiz}/Por_Mes/{mes}')
+    valor = dados
+    for parte in chave.split('/'):
+        if parte not in valor:
+            return None  # Tabela ausente neste mês (ex.: shopping sem movimento)
+        valor = valor[parte]
+    return valor
+
+
+def _somar(partes, chave):
+    """Soma tabelas parciais (meses ou trimestres) pelas dimensões da especificação"""
+    espec = ESPEC_ROLLUP[_tipo_tabela(chave)]
+    dimensoes = espec['dimensoes']
+    partes = [p for p in partes if p is not None and len(p)]
+    if not partes:
+        return pd.DataFrame(columns=dimensoes + list(espec['somaveis'] or []))
+
+    somaveis = espec['somaveis']
+    if somaveis is None:
+        # Colunas podem variar entre meses (ex.: gênero sem clientes no mês)
+        somaveis = list(dict.fromkeys(c for p in partes for c in p.columns if c not in dimensoes))
+    # Dimensões como texto: categóricas de meses diferentes não se combinam no concat
+    df = pd.concat(
+        [p.reindex(columns=dimensoes + somaveis, fill_value=0).astype({d: str for d in dimensoes}) for p in partes],
+        ignore_index=True
+    )
+    return df.groupby(dimensoes, sort=False)[somaveis].sum().reset_index()
+
+
+@lru_cache(maxsize=512)
+def _compor_cache(raiz, chave, meses, assinaturas):
+    """Composição memorizada de uma tupla de meses (trimestres são reaproveitados)
+
+    assinaturas: assinatura do CSV da tabela em cada mês (alinhada a meses); faz
+    parte da chave, então um mês regravado gera outra entrada (as antigas saem pelo LRU).
+    """
+    trimestres = {}
+    for mes, assinatura in zip(meses, assinaturas):
+        ano, m = mes.split('_')
+        trimestres.setdefault((ano, (int(m) - 1) // 3), []).append((mes, assinatura))
+
+    if len(trimestres) == 1:
+        partes = [_ler_mes(raiz, mes, chave) for mes in meses]
+    else:
+        # Cada trimestre vira um bloco em cache, somado aos demais
+        partes = [
+            _compor_cache(raiz, chave, *(tuple(coluna) for coluna in zip(*bloco)))
+            for bloco in trimestres.values()
+        ]
+    return _somar(partes, chave)
+
+
+def compor_tabela(chave, meses, raiz='Resultados'):
+    """Compõe uma tabela aditiva para o intervalo de meses
+
+    chave: caminho da tabela ('resumo', 'por_shopping/BS/periodo', ...)
+    Colunas não aditivas da tabela original são descartadas e listadas em
+    df.attrs['requer_fonte']. Tabelas inteiramente não aditivas geram ValueError.
+    """
+    if requer_fonte(chave):
+        raise ValueError(f'A tabela {chave} não é aditiva entre meses: use a pasta do período')
+    meses = tuple(sorted(meses))
+    arquivo = [_arquivo_tabela(chave)]
+    assinaturas = tuple(
+        tuple(tuple(item) for item in assinatura_mes(raiz, mes, arquivo)) for mes in meses
+    )
+    df = _compor_cache(raiz, chave, meses, assinaturas).copy()
+    df.attrs['requer_fonte'] = list(ESPEC_ROLLUP[_tipo_tabela(chave)]['requer_fonte'])
+    return df
+
+
+def compor_periodo(pasta, raiz='Resultados', chaves=None):
+    """Compõe as tabelas aditivas de uma pasta de período a partir dos meses"""
+    meses, ausentes = meses_da_pasta(pasta, raiz)
+    if ausentes:
+        raise ValueError(f'{pasta}: meses ausentes em Por_Mes ({", ".join(ausentes)})')
+    if chaves is None:
+        chaves = [c for c in TABELAS_PERIODO if not requer_fonte(c)]
+        siglas = list(dict.fromkeys(s for mes in meses for s in siglas_periodo(f'{raiz}/Por_Mes/{mes}')))
+        chaves += [
+            f'por_shopping/{sigla}/{c}' for sigla in siglas for c in TABELAS_SHOPPING
+            if not requer_fonte(f'por_shopping/{sigla}/{c}')
+        ]
+    return {chave: compor_tabela(chave, meses, raiz) for chave in chaves}
+
+
+def verificar_rollup(pasta, raiz='Resultados'):
+    """Compara os rollups com as tabelas materializadas da pasta (maior erro relativo)"""
+    fonte = carregar_periodo(f'{raiz}/{pasta}')
+    resultado = []
+    for chave, composta in compor_periodo(pasta, raiz).items():
+        original = fonte
+        for parte in chave.split('/'):
+            original = original[parte] if original is not None and parte in original else None
+        if original is None:
+            continue
+        dimensoes = ESPEC_ROLLUP[_tipo_tabela(chave)]['dimensoes']
+        original = original.astype({d: str for d in dimensoes}).set_index(dimensoes)
+        composta = composta.set_index(dimensoes)
+        for col in composta.columns:
+            base = original[col].reindex(composta.index)
+            erro = ((composta[col] - base).abs() / base.abs().where(base != 0)).max()
+            resultado.append({'pasta': pasta, 'tabela': chave, 'coluna': col, 'erro_relativo': float(erro or 0)})
+    return pd.DataFrame(resultado)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Confere os rollups mensais contra Por_Trimestre e Por_Ano')
+    parser.add_argument('--raiz', default='Resultados', help='Pasta raiz dos resultados')
+    args = parser.parse_args()
+
+    pastas = [
+        f'{tipo}/{codigo}' for tipo in ('Por_Trimestre', 'Por_Ano')
+        if os.path.exists(f'{args.raiz}/{tipo}')
+        for codigo in sorted(os.listdir(f'{args.raiz}/{tipo}'))
+    ]
+    for pasta in pastas:
+        ausentes = meses_da_pasta(pasta, args.raiz)[1]
+        if ausentes:
+            print(f'{pasta}: meses ausentes em Por_Mes ({", ".join(ausentes)}), rollup não aplicável')
+            continue
+        df = verificar_rollup(pasta, args.raiz)
+        pior = df.loc[df['erro_relativo'].idxmax()] if len(df) else None
+        if pior is None:
+            print(f'{pasta}: sem tabelas aditivas')
+        else:
+            print(f'{pasta}: {len(df)} colunas | maior erro relativo {pior["erro_relativo"]:.2e} ({pior["tabela"]}.{pior["coluna"]})')